@@ -0,0 +1,164 @@
+"""Shared helpers for running the benchmarks."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import gc
+import sys
+import timeit
+import tracemalloc
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Globals
+
+RESULTS: dict[str, dict[str, float]] = {}
+"""The metrics recorded for each benchmark, used by run.py to check for regressions."""
+
+# Benchmarks may replace sys.stdout so keep the original for printing results.
+_OUTPUT = sys.stdout
+
+# Functions
+
+
+def _reference() -> str:
+    """A fixed pure Python workload used to scale times to the current machine speed.
+
+    Returns:
+        The formatted values.
+    """
+    values = {"name": "reference", "lineno": 10}
+
+    return "{name}:{lineno}".format(**values)
+
+
+def measure(func: Callable[[], object], *, number: int = 10000, repeat: int = 5) -> float:
+    """Measure the best per-call time of a callable.
+
+    Args:
+        func:
+            The callable to time.
+        number:
+            The number of calls per timing run.
+        repeat:
+            The number of timing runs.
+
+    Returns:
+        The fastest per-call time, in seconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def measure_allocations(func: Callable[[], object], *, number: int = 10000) -> tuple[float, int]:
+    """Measure the memory allocated by calls to a callable.
+
+    Args:
+        func:
+            The callable to measure.
+        number:
+            The number of calls to make.
+
+    Returns:
+        The bytes still allocated after the calls, per call, and the peak number of
+        bytes allocated at once while making the calls.
+    """
+    # Make a call first so any lazily created state isn't counted.
+    func()
+    gc.collect()
+
+    tracemalloc.start()
+
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+
+        for _ in range(number):
+            func()
+
+        current, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return (current - start) / number, peak - start
+
+
+def reference_time(*, number: int = 10000, repeat: int = 5) -> float:
+    """Measure the per-call time of the reference workload.
+
+    Args:
+        number:
+            The number of calls per timing run.
+        repeat:
+            The number of timing runs.
+
+    Returns:
+        The fastest per-call time, in seconds.
+    """
+    return measure(_reference, number=number, repeat=repeat)
+
+
+def record(name: str, **metrics: float) -> None:
+    """Record and print the metrics of a benchmark.
+
+    Lower values of every metric are considered better.
+
+    Args:
+        name:
+            The benchmark name.
+        **metrics:
+            The metric values.
+    """
+    RESULTS[name] = metrics
+
+    values = "  ".join(f"{metric}={value:.2f}" for metric, value in metrics.items())
+
+    print(f"{name:<50}  {values}", file=_OUTPUT)
+
+
+def run(
+    benchmarks: dict[str, Callable[[], object]],
+    *,
+    number: int = 10000,
+    repeat: int = 5,
+    allocations: bool = True,
+) -> dict[str, float]:
+    """Run a set of benchmarks and record their per-call times and allocations.
+
+    Times are also recorded relative to a reference workload timed just before, so
+    that results can be compared when the machine is more or less loaded.
+
+    Args:
+        benchmarks:
+            Mapping of benchmark names to the callables to time.
+        number:
+            The number of calls per timing run.
+        repeat:
+            The number of timing runs.
+        allocations:
+            Whether to measure allocations, which should be disabled when they depend
+            on the timing of other threads.
+
+    Returns:
+        The per-call time of each benchmark, in seconds.
+    """
+    results = {}
+
+    for name, func in benchmarks.items():
+        reference = reference_time(number=number, repeat=repeat)
+        per_call = measure(func, number=number, repeat=repeat)
+
+        results[name] = per_call
+
+        metrics = {"ns_per_call": per_call * 1e9, "relative_time": per_call / reference}
+
+        if allocations:
+            retained, peak = measure_allocations(func, number=min(number, 10000))
+
+            metrics.update(retained_bytes_per_call=retained, peak_bytes=peak)
+
+        record(name, **metrics)
+
+    return results
@@ -0,0 +1,99 @@
+"""Benchmarks for houdini_logging_tools.context.
+
+Run with hython, or as part of the suite with benchmarks/run.py:
+
+    hython benchmarks/bench_context.py
+"""
+
+# Standard Library
+import itertools
+import logging
+
+# Third Party
+import _harness
+
+# Houdini Logging Tools
+from houdini_logging_tools.adapters.loggeradapter import HoudiniLoggerAdapter
+from houdini_logging_tools.context import LogContext
+from houdini_logging_tools.nodes import NODE_PATH_CACHE
+
+# Houdini
+import hou
+
+# Functions
+
+
+def bench_network(node_count: int = 1000, calls_per_node: int = 3) -> None:
+    """Time logging for each node of a network, as a tool checking every node would.
+
+    Each timed call visits the next node of the network and logs several messages for
+    it, either through an adapter created for the node, by passing the node to each
+    call or inside a LogContext for the node.
+
+    Args:
+        node_count:
+            The number of nodes in the network.
+        calls_per_node:
+            The number of messages logged for each node.
+    """
+    logger = logging.getLogger("bench.context")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    network = hou.node("/obj").createNode("subnet", "bench_context")
+    nodes = itertools.cycle([network.createNode("null") for _ in range(node_count)])
+
+    adapter = HoudiniLoggerAdapter(logger)
+    calls = range(calls_per_node)
+
+    def _adapter_per_node() -> None:
+        node_adapter = HoudiniLoggerAdapter(logger, next(nodes))
+
+        for _ in calls:
+            node_adapter.info("Checked %s", "parm")
+
+    def _node_kwarg() -> None:
+        node = next(nodes)
+
+        for _ in calls:
+            adapter.info("Checked %s", "parm", node=node)
+
+    def _log_context() -> None:
+        with LogContext(next(nodes)):
+            for _ in calls:
+                adapter.info("Checked %s", "parm")
+
+    try:
+        _harness.run(
+            {
+                f"network walk, adapter per node ({node_count} nodes)": _adapter_per_node,
+                f"network walk, node kwarg ({node_count} nodes)": _node_kwarg,
+                f"network walk, LogContext ({node_count} nodes)": _log_context,
+            },
+            number=20000,
+        )
+
+    finally:
+        NODE_PATH_CACHE.clear()
+        network.destroy()
+
+
+def bench_no_context() -> None:
+    """Time plain log calls made outside of a LogContext, which only check it is unset, and inside one."""
+    logger = logging.getLogger("bench.context.plain")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    adapter = HoudiniLoggerAdapter(logger)
+
+    _harness.run({"info() (no LogContext)": lambda: adapter.info("message %s", "arg")}, number=50000)
+
+    with LogContext(tool="bench"):
+        _harness.run({"info() (LogContext with extra data)": lambda: adapter.info("message %s", "arg")}, number=50000)
+
+
+if __name__ == "__main__":
+    bench_network()
+    bench_no_context()
@@ -0,0 +1,69 @@
+"""Benchmarks for houdini_logging_tools.filters.
+
+Run with hython, or as part of the suite with benchmarks/run.py:
+
+    hython benchmarks/bench_filters.py
+"""
+
+# Standard Library
+import logging
+
+# Third Party
+import _harness
+
+# Houdini Logging Tools
+from houdini_logging_tools.adapters.loggeradapter import HoudiniLoggerAdapter, HoudiniLoggerAdapterOptions
+from houdini_logging_tools.filters import CallSiteRateLimitFilter
+
+# Functions
+
+
+def bench_filter() -> None:
+    """Time checking records which are allowed and records which are suppressed."""
+    record = logging.LogRecord("bench.filter", logging.WARNING, "/path/bench.py", 10, "point %d", (42,), None)
+
+    allowing = CallSiteRateLimitFilter(rate=1e12, burst=1000000)
+    suppressing = CallSiteRateLimitFilter(rate=0, burst=1)
+    suppressing.filter(record)
+
+    _harness.run(
+        {
+            "rate limit filter (allowed)": lambda: allowing.filter(record),
+            "rate limit filter (suppressed)": lambda: suppressing.filter(record),
+        },
+        number=200000,
+    )
+
+
+def bench_flood() -> None:
+    """Time a warning logged for every point of a cook, with and without a rate limit.
+
+    Without a limit every record is created and handled.  With one, nearly every call is
+    suppressed by the adapter before a record is created.
+    """
+    logger = logging.getLogger("bench.flood")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    adapter = HoudiniLoggerAdapter(logger)
+    limited_adapter = HoudiniLoggerAdapter(
+        logger, options=HoudiniLoggerAdapterOptions(rate_limit=CallSiteRateLimitFilter(rate=10, burst=20))
+    )
+
+    logger_filter = CallSiteRateLimitFilter(rate=10, burst=20)
+    filtered_logger = logging.getLogger("bench.flood.filtered")
+    filtered_logger.addFilter(logger_filter)
+
+    _harness.run(
+        {
+            "flood warning() (adapter)": lambda: adapter.warning("point %d has no normal", 42),
+            "flood warning() (adapter, rate limited)": lambda: limited_adapter.warning("point %d has no normal", 42),
+            "flood warning() (logger filter)": lambda: filtered_logger.warning("point %d has no normal", 42),
+        },
+        number=100000,
+    )
+
+
+if __name__ == "__main__":
+    bench_filter()
+    bench_flood()
@@ -0,0 +1,150 @@
+"""Benchmarks for houdini_logging_tools.forwarding and its handler.
+
+Run with hython, or as part of the suite with benchmarks/run.py:
+
+    hython benchmarks/bench_forwarding.py
+"""
+
+# Standard Library
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+
+# Third Party
+import _harness
+
+# Houdini Logging Tools
+from houdini_logging_tools.forwarding import LogCollector, encode_record
+from houdini_logging_tools.handlers.forwarding import ForwardingHandler, ForwardingOptions
+
+# Globals
+
+# Log records from a fresh interpreter, like a worker process.  Arguments are the
+# collector address and the number of records.
+_PRODUCER_SCRIPT = """
+import logging
+import sys
+
+sys.modules["hou"] = None
+
+from houdini_logging_tools.handlers.forwarding import ForwardingHandler, ForwardingOptions
+
+handler = ForwardingHandler(sys.argv[1], options=ForwardingOptions(drop_policy="block"))
+
+logger = logging.getLogger("producer")
+logger.addHandler(handler)
+logger.propagate = False
+logger.setLevel(logging.INFO)
+
+for index in range(int(sys.argv[2])):
+    logger.info("Cooking point %d of %s", index, "geo1")
+
+handler.close()
+"""
+
+# Classes
+
+
+class _CountingHandler(logging.Handler):
+    """Handler which counts records and notes when the expected number have arrived.
+
+    Args:
+        expected:
+            The number of records to wait for.
+    """
+
+    def __init__(self, expected: int = 0) -> None:
+        super().__init__()
+
+        self.count = 0
+        self.done = threading.Event()
+        self.expected = expected
+        self.first: float | None = None
+        self.last: float | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Count a record.
+
+        Args:
+            record:
+                The log record.
+        """
+        now = time.perf_counter()
+
+        if self.first is None:
+            self.first = now
+
+        self.count += 1
+        self.last = now
+
+        if self.count == self.expected:
+            self.done.set()
+
+
+# Functions
+
+
+def bench_emit() -> None:
+    """Time encoding records and queueing them to be forwarded."""
+    record = logging.LogRecord("bench", logging.INFO, __file__, 10, "Cooking point %d of %s", (42, "geo1"), None)
+
+    with LogCollector(_CountingHandler()) as collector:
+        handler = ForwardingHandler(collector.address, options=ForwardingOptions(drop_policy="block"))
+
+        try:
+            _harness.run(
+                {
+                    "encode_record()": lambda: encode_record(record),
+                    "ForwardingHandler.emit()": lambda: handler.emit(record),
+                },
+                number=20000,
+                allocations=False,
+            )
+
+        finally:
+            handler.close()
+
+
+def bench_throughput(producers: int = 16, records: int = 5000) -> None:
+    """Time a collector receiving records from many worker processes at once.
+
+    Args:
+        producers:
+            The number of worker processes.
+        records:
+            The number of records each worker logs.
+    """
+    counter = _CountingHandler(producers * records)
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    with LogCollector(counter) as collector:
+        processes = [
+            subprocess.Popen(
+                [sys.executable, "-c", _PRODUCER_SCRIPT, collector.address_string, str(records)],
+                env=env,
+            )
+            for _ in range(producers)
+        ]
+
+        for process in processes:
+            process.wait()
+
+        if not counter.done.wait(60):
+            msg = f"Only received {counter.count} of {counter.expected} records"
+            raise RuntimeError(msg)
+
+    per_record = (counter.last - counter.first) / counter.count  # type: ignore
+
+    _harness.record(
+        f"forwarding throughput ({producers} producers)",
+        ns_per_call=per_record * 1e9,
+        relative_time=per_record / _harness.reference_time(),
+    )
+
+
+if __name__ == "__main__":
+    bench_emit()
+    bench_throughput()
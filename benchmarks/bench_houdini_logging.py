@@ -0,0 +1,163 @@
+"""Benchmarks for houdini_logging_tools.handlers.houdini_logging.
+
+Run with hython, or as part of the suite with benchmarks/run.py:
+
+    hython benchmarks/bench_houdini_logging.py
+"""
+
+# Standard Library
+import itertools
+import logging
+import sys
+
+# Third Party
+import _harness
+
+# Houdini Logging Tools
+from houdini_logging_tools.formatting import TracebackCache
+from houdini_logging_tools.handlers.houdini_logging import (
+    HoudiniLoggingHandler,
+    HoudiniLoggingOptions,
+    top_level_package,
+)
+
+# Functions
+
+
+def bench_emit() -> None:
+    """Time emitting records to hou.logging directly, queued and coalesced.
+
+    A new record is created for each call, as formatted output is stored on records.
+    """
+
+    def _record() -> logging.LogRecord:
+        return logging.LogRecord("bench.emit", logging.WARNING, "/path/bench.py", 10, "cooking point %d", (42,), None)
+
+    direct_handler = HoudiniLoggingHandler()
+    queued_handler = HoudiniLoggingHandler(options=HoudiniLoggingOptions(queued=True))
+    coalesced_handler = HoudiniLoggingHandler(options=HoudiniLoggingOptions(coalesce_window=60))
+
+    try:
+        _harness.run(
+            {
+                "LogRecord creation": _record,
+                "houdini emit (direct)": lambda: direct_handler.emit(_record()),
+                "houdini emit (coalesced)": lambda: coalesced_handler.emit(_record()),
+            },
+            number=50000,
+        )
+
+        # How many records are waiting in the queue depends on the background thread.
+        _harness.run(
+            {"houdini emit (queued)": lambda: queued_handler.emit(_record())},
+            number=50000,
+            allocations=False,
+        )
+
+    finally:
+        for handler in (direct_handler, queued_handler, coalesced_handler):
+            handler.close()
+
+
+def bench_source_context() -> None:
+    """Compare building the source context per record against the cached lookup."""
+    record = logging.LogRecord(
+        "my_package.tools.validate", logging.WARNING, "/path/to/my_package/tools/validate.py", 123, "msg", (), None
+    )
+    record.funcName = "validate_node"
+
+    template = "{name} | {filename}:{lineno} ({funcName})"
+
+    default_handler = HoudiniLoggingHandler()
+    template_handler = HoudiniLoggingHandler(options=HoudiniLoggingOptions(context_format=template))
+
+    def _fstring() -> str:
+        return f"{record.name} | {record.module}.{record.funcName}:{record.lineno}"
+
+    def _template() -> str:
+        return template.format(
+            name=record.name,
+            module=record.module,
+            funcName=record.funcName,
+            lineno=record.lineno,
+            pathname=record.pathname,
+            filename=record.filename,
+        )
+
+    _harness.run(
+        {
+            "source context: f-string per record": _fstring,
+            "source context: cached (default format)": lambda: default_handler._get_source_context(record),
+            "source context: template per record": _template,
+            "source context: cached (custom format)": lambda: template_handler._get_source_context(record),
+        },
+        number=200000,
+    )
+
+
+def bench_source_routing(logger_count: int = 100) -> None:
+    """Time emitting records from several tools' loggers to a single source and to routed sources.
+
+    Args:
+        logger_count:
+            The number of loggers records are emitted from.
+    """
+    names = itertools.cycle([f"tool_{index}.module" for index in range(logger_count)])
+
+    def _record() -> logging.LogRecord:
+        return logging.LogRecord(next(names), logging.WARNING, "/path/bench.py", 10, "cooking point %d", (42,), None)
+
+    single_handler = HoudiniLoggingHandler()
+    routed_handler = HoudiniLoggingHandler(options=HoudiniLoggingOptions(source_routing=top_level_package))
+
+    try:
+        _harness.run(
+            {
+                f"houdini emit (single source, {logger_count} loggers)": lambda: single_handler.emit(_record()),
+                f"houdini emit (routed sources, {logger_count} loggers)": lambda: routed_handler.emit(_record()),
+            },
+            number=50000,
+        )
+
+    finally:
+        single_handler.close()
+        routed_handler.close()
+
+
+def bench_tracebacks() -> None:
+    """Time emitting records for a repeated exception with full and deduplicated tracebacks."""
+
+    def _fail() -> None:
+        raise ValueError("invalid point count")  # noqa: TRY003
+
+    try:
+        _fail()
+
+    except ValueError:
+        exc_info = sys.exc_info()
+
+    def _record() -> logging.LogRecord:
+        return logging.LogRecord("bench.tracebacks", logging.ERROR, "/path/bench.py", 10, "failed", (), exc_info)
+
+    full_handler = HoudiniLoggingHandler()
+    deduplicated_handler = HoudiniLoggingHandler(options=HoudiniLoggingOptions(traceback_cache=TracebackCache()))
+
+    try:
+        _harness.run(
+            {
+                "houdini emit exception (full traceback)": lambda: full_handler.emit(_record()),
+                "houdini emit exception (deduplicated)": lambda: deduplicated_handler.emit(_record()),
+            },
+            number=20000,
+        )
+
+    finally:
+        full_handler.close()
+        deduplicated_handler.close()
+
+
+if __name__ == "__main__":
+    bench_emit()
+    bench_source_context()
+    bench_source_routing()
+    bench_tracebacks()
@@ -0,0 +1,62 @@
+"""Benchmarks for importing houdini_logging_tools.
+
+Run with hython, or as part of the suite with benchmarks/run.py:
+
+    hython benchmarks/bench_import.py
+"""
+
+# Standard Library
+import os
+import subprocess
+import sys
+
+# Third Party
+import _harness
+
+# Globals
+
+# Import the modules used to configure logging in a fresh interpreter with hou blocked,
+# so the import fails if anything imports hou, and print how long it took.
+_IMPORT_SCRIPT = """
+import sys
+import time
+
+sys.modules["hou"] = None
+
+start = time.perf_counter()
+
+import houdini_logging_tools.adapters.loggeradapter
+import houdini_logging_tools.handlers.houdini_logging
+import houdini_logging_tools.handlers.shellio
+
+print(time.perf_counter() - start)
+"""
+
+# Functions
+
+
+def bench_import(repeat: int = 5) -> None:
+    """Time importing the package in a fresh interpreter without importing hou.
+
+    Args:
+        repeat:
+            The number of interpreters to time the import in.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    times = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", _IMPORT_SCRIPT], check=True, capture_output=True, env=env, text=True
+            ).stdout
+        )
+        for _ in range(repeat)
+    ]
+
+    best = min(times)
+
+    _harness.record("import (without hou)", ns_per_call=best * 1e9, relative_time=best / _harness.reference_time())
+
+
+if __name__ == "__main__":
+    bench_import()
@@ -0,0 +1,86 @@
+"""Benchmarks for houdini_logging_tools.handlers.jsonlines.
+
+Run with hython, or as part of the suite with benchmarks/run.py:
+
+    hython benchmarks/bench_jsonlines.py
+"""
+
+# Standard Library
+import logging
+import pathlib
+import tempfile
+import time
+
+# Third Party
+import _harness
+
+# Houdini Logging Tools
+from houdini_logging_tools.handlers.jsonlines import JsonLinesHandler, JsonLinesOptions
+
+# Functions
+
+
+def _record() -> logging.LogRecord:
+    """Create a record like those logged by a render.
+
+    Returns:
+        The log record.
+    """
+    record = logging.LogRecord("bench.render", logging.INFO, "/path/render.py", 10, "Rendered frame %d", (12,), None)
+    record.node_path = "/out/karma1"
+
+    return record
+
+
+def bench_emit() -> None:
+    """Time converting records to JSON and queueing them to be written."""
+    record = _record()
+
+    with tempfile.TemporaryDirectory() as directory:
+        handler = JsonLinesHandler(pathlib.Path(directory, "bench.jsonl"))
+
+        try:
+            _harness.run({"jsonlines encode": lambda: handler._encode_record(record)}, number=50000)
+
+            # How many records are waiting in the queue depends on the background thread.
+            _harness.run({"jsonlines emit": lambda: handler.emit(_record())}, number=50000, allocations=False)
+
+        finally:
+            handler.close()
+
+
+def bench_throughput(records: int = 200000) -> None:
+    """Time writing records to a rotating file, from the first emit until they are all written.
+
+    Args:
+        records:
+            The number of records to write.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        handler = JsonLinesHandler(
+            pathlib.Path(directory, "bench.jsonl"), options=JsonLinesOptions(max_bytes=8 * 1024 * 1024)
+        )
+
+        try:
+            start = time.perf_counter()
+
+            for _ in range(records):
+                handler.emit(_record())
+
+            handler.flush()
+
+            per_record = (time.perf_counter() - start) / records
+
+        finally:
+            handler.close()
+
+    _harness.record(
+        "jsonlines throughput (8MB rotation)",
+        ns_per_call=per_record * 1e9,
+        relative_time=per_record / _harness.reference_time(),
+    )
+
+
+if __name__ == "__main__":
+    bench_emit()
+    bench_throughput()
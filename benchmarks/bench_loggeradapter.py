@@ -0,0 +1,162 @@
+"""Benchmarks for houdini_logging_tools.adapters.loggeradapter.
+
+Run with hython, or as part of the suite with benchmarks/run.py:
+
+    hython benchmarks/bench_loggeradapter.py
+"""
+
+# Standard Library
+import gc
+import logging
+import tracemalloc
+
+# Third Party
+import _harness
+
+# Houdini Logging Tools
+from houdini_logging_tools.adapters.loggeradapter import HoudiniLoggerAdapter
+from houdini_logging_tools.nodes import NODE_PATH_CACHE
+
+# Houdini
+import hou
+
+# Functions
+
+
+def bench_construction() -> None:
+    """Time the construction of adapters."""
+    logger = logging.getLogger("bench")
+
+    _harness.run(
+        {
+            "adapter construction": lambda: HoudiniLoggerAdapter(logger),
+            "adapter construction (with extra)": lambda: HoudiniLoggerAdapter(logger, extra={"tool": "bench"}),
+        },
+        number=100000,
+    )
+
+
+def bench_disabled() -> None:
+    """Time log calls for a disabled level against a plain logging.Logger."""
+    logger = logging.getLogger("bench.disabled")
+    logger.setLevel(logging.INFO)
+
+    adapter = HoudiniLoggerAdapter(logger)
+    node_adapter = HoudiniLoggerAdapter(logger, hou.node("/obj"), status_bar=True)
+
+    _harness.run(
+        {
+            "disabled debug() (logging.Logger)": lambda: logger.debug("message %s", "arg"),
+            "disabled debug() (adapter)": lambda: adapter.debug("message %s", "arg"),
+            "disabled debug() (adapter, node kwarg)": lambda: adapter.debug("message", node=node_adapter.node),
+            "disabled debug() (adapter with node)": lambda: node_adapter.debug("message %s", "arg"),
+        },
+        number=200000,
+    )
+
+
+def bench_enabled() -> None:
+    """Time enabled log calls through the adapter against a plain logging.Logger."""
+    logger = logging.getLogger("bench.enabled")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    adapter = HoudiniLoggerAdapter(logger)
+    extra_adapter = HoudiniLoggerAdapter(logger, extra={"tool": "bench"})
+    node = hou.node("/obj")
+
+    _harness.run(
+        {
+            "enabled info() (logging.Logger)": lambda: logger.info("message %s", "arg"),
+            "enabled info() (adapter)": lambda: adapter.info("message %s", "arg"),
+            "enabled info() (adapter with extra)": lambda: extra_adapter.info("message %s", "arg"),
+            "enabled info() (adapter, call extra)": lambda: adapter.info("message", extra={"key": "value"}),
+            "enabled info() (adapter, node kwarg)": lambda: adapter.info("message %s", "arg", node=node),
+            "enabled log() (adapter, custom level)": lambda: adapter.log(25, "message %s", "arg"),
+        },
+        number=100000,
+    )
+
+
+def bench_process() -> None:
+    """Time HoudiniLoggerAdapter.process() for plain and node tagged messages."""
+    logger = logging.getLogger("bench.process")
+
+    adapter = HoudiniLoggerAdapter(logger)
+    node = hou.node("/obj")
+    severity = hou.severityType.ImportantMessage
+
+    _harness.run(
+        {
+            "process (plain)": lambda: adapter.process("message", {"extra": {"severity": severity}}),
+            "process (node)": lambda: adapter.process("message", {"extra": {"severity": severity, "node": node}}),
+        },
+        number=100000,
+    )
+
+
+def bench_node_paths(depth: int = 10) -> None:
+    """Time node tagged log calls for a node deep inside a network.
+
+    Args:
+        depth:
+            The number of subnets to nest the node in.
+    """
+    logger = logging.getLogger("bench.node")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    node = hou.node("/obj").createNode("subnet", "bench_node_paths")
+
+    for _ in range(depth):
+        node = node.createNode("subnet")
+
+    adapter = HoudiniLoggerAdapter(logger, node)
+
+    try:
+        _harness.run(
+            {
+                f"node.path() (depth {depth})": node.path,
+                f"NODE_PATH_CACHE.path() (depth {depth})": lambda: NODE_PATH_CACHE.path(node),
+                f"info() (adapter with node, depth {depth})": lambda: adapter.info("message %s", "arg"),
+            },
+            number=100000,
+        )
+
+    finally:
+        NODE_PATH_CACHE.clear()
+        hou.node("/obj/bench_node_paths").destroy()
+
+
+def bench_memory(count: int = 10000) -> None:
+    """Measure the memory retained by each adapter.
+
+    Args:
+        count:
+            The number of adapters to create.
+    """
+    logger = logging.getLogger("bench")
+
+    gc.collect()
+    tracemalloc.start()
+
+    before = tracemalloc.take_snapshot()
+    adapters = [HoudiniLoggerAdapter(logger) for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+
+    tracemalloc.stop()
+
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    _harness.record("adapter memory", bytes_per_adapter=retained / len(adapters))
+
+
+if __name__ == "__main__":
+    bench_construction()
+    bench_disabled()
+    bench_enabled()
+    bench_process()
+    bench_node_paths()
+    bench_memory()
@@ -0,0 +1,65 @@
+"""Benchmarks for houdini_logging_tools.metrics.
+
+Run with hython, or as part of the suite with benchmarks/run.py:
+
+    hython benchmarks/bench_metrics.py
+"""
+
+# Standard Library
+import logging
+
+# Third Party
+import _harness
+
+# Houdini Logging Tools
+from houdini_logging_tools.adapters.loggeradapter import HoudiniLoggerAdapter
+from houdini_logging_tools.handlers.houdini_logging import HoudiniLoggingHandler
+from houdini_logging_tools.metrics import METRICS
+
+# Functions
+
+
+def bench_overhead() -> None:
+    """Time logging through an adapter to a handler with metrics disabled and enabled."""
+    logger = logging.getLogger("bench.metrics")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    handler = HoudiniLoggingHandler()
+    logger.addHandler(handler)
+
+    adapter = HoudiniLoggerAdapter(logger)
+
+    try:
+        _harness.run({"info() to hou.logging (metrics disabled)": lambda: adapter.info("message %s", "arg")})
+
+        METRICS.enable()
+
+        _harness.run({"info() to hou.logging (metrics enabled)": lambda: adapter.info("message %s", "arg")})
+
+    finally:
+        METRICS.disable()
+        METRICS.reset()
+
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def bench_snapshot() -> None:
+    """Time taking a snapshot of the metrics of a few components."""
+    for name in ("HoudiniLoggerAdapter", "HoudiniLoggingHandler", "PythonShellHandler"):
+        metrics = METRICS.component(name)
+        metrics.count_record(logging.INFO)
+        metrics.count("dropped")
+        metrics.add_time("emit", 0.001)
+
+    try:
+        _harness.run({"metrics snapshot (3 components)": METRICS.snapshot}, number=20000)
+
+    finally:
+        METRICS.reset()
+
+
+if __name__ == "__main__":
+    bench_overhead()
+    bench_snapshot()
@@ -0,0 +1,76 @@
+"""Benchmarks for houdini_logging_tools.handlers.nodeindex.
+
+Run with hython, or as part of the suite with benchmarks/run.py:
+
+    hython benchmarks/bench_nodeindex.py
+"""
+
+# Standard Library
+import logging
+
+# Third Party
+import _harness
+
+# Houdini Logging Tools
+from houdini_logging_tools.handlers.nodeindex import NodeLogIndexHandler
+
+# Functions
+
+
+def _record(index: int, node_count: int) -> logging.LogRecord:
+    """Create a record for one of a number of nodes, most of which are messages.
+
+    Args:
+        index:
+            The index of the record.
+        node_count:
+            The number of nodes to spread the records across.
+
+    Returns:
+        The log record.
+    """
+    level = logging.WARNING if index % 50 == 0 else logging.INFO
+    node = index % node_count
+
+    record = logging.LogRecord("bench.cook", level, "/path/cook.py", 10, "Cooked %d", (index,), None)
+    record.created = float(index)
+    record.node_path = f"/obj/geo{node // 10}/node{node}"
+    record.node_session_id = node
+
+    return record
+
+
+def bench_emit() -> None:
+    """Time storing records, once the index is full and old records are being discarded."""
+    handler = NodeLogIndexHandler(max_records=10000, max_records_per_node=100)
+    records = [_record(index, 1000) for index in range(20000)]
+    position = [0]
+
+    def _emit() -> None:
+        handler.emit(records[position[0] % len(records)])
+        position[0] += 1
+
+    _harness.run({"node index emit": _emit}, number=50000)
+
+
+def bench_query() -> None:
+    """Time querying a node's warnings, which should not depend on the number of other records stored."""
+    for record_count in (10000, 100000):
+        handler = NodeLogIndexHandler(max_records=record_count)
+
+        for index in range(record_count):
+            handler.emit(_record(index, 1000))
+
+        _harness.run(
+            {
+                f"node index query subtree warnings ({record_count} records)": lambda handler=handler: handler.query(
+                    "/obj/geo5", level=logging.WARNING
+                ),
+            },
+            number=2000,
+        )
+
+
+if __name__ == "__main__":
+    bench_emit()
+    bench_query()
@@ -0,0 +1,105 @@
+"""Benchmarks for houdini_logging_tools.handlers.shellio.
+
+Run with hython, or as part of the suite with benchmarks/run.py:
+
+    hython benchmarks/bench_shellio.py
+"""
+
+# Standard Library
+import logging
+import sys
+import time
+import types
+from unittest import mock
+
+# Third Party
+import _harness
+
+# Houdini Logging Tools
+from houdini_logging_tools.handlers.shellio import PythonShellHandler, PythonShellOptions
+
+# Houdini
+import hou
+
+# Classes
+
+
+class _StandInShellIO:
+    """Stand-in for hou.ShellIO which simulates the cost of the panel redrawing.
+
+    Args:
+        redraw_cost:
+            The number of seconds each write and flush takes.
+    """
+
+    def __init__(self, redraw_cost: float) -> None:
+        self._redraw_cost = redraw_cost
+
+    def _redraw(self) -> None:
+        """Busy wait to simulate the panel redrawing."""
+        end = time.perf_counter() + self._redraw_cost
+
+        while time.perf_counter() < end:
+            pass
+
+    def flush(self) -> None:
+        """Simulate flushing the panel."""
+        self._redraw()
+
+    def write(self, text: str) -> None:
+        """Simulate writing to the panel.
+
+        Args:
+            text:
+                The text to write.
+        """
+        self._redraw()
+
+
+# Functions
+
+
+def bench_emit(redraw_cost: float = 20e-6) -> None:
+    """Time emitting records into a stand-in ShellIO with and without buffering.
+
+    Args:
+        redraw_cost:
+            The number of seconds each write and flush to the stand-in takes.
+    """
+
+    def _record() -> logging.LogRecord:
+        return logging.makeLogRecord({"msg": "cooking point %d", "args": (42,), "levelno": logging.INFO})
+
+    # A minimal hou.ui, a MagicMock would record every call.
+    stand_in_ui = types.SimpleNamespace(
+        addEventLoopCallback=lambda callback: None,
+        removeEventLoopCallback=lambda callback: None,
+    )
+
+    stream = _StandInShellIO(redraw_cost)
+
+    unbuffered_handler = PythonShellHandler()
+    buffered_handler = PythonShellHandler(options=PythonShellOptions(buffered=True, capacity=1000))
+    backlog_handler = PythonShellHandler(options=PythonShellOptions(backlog_size=1000, backlog_level=logging.INFO))
+
+    with (
+        mock.patch.object(hou, "ShellIO", _StandInShellIO),
+        mock.patch.object(hou, "ui", stand_in_ui, create=True),
+        mock.patch.object(sys, "stdout", stream),
+    ):
+        _harness.run(
+            {
+                "shell emit (unbuffered)": lambda: unbuffered_handler.emit(_record()),
+                "shell emit (buffered)": lambda: buffered_handler.emit(_record()),
+            },
+            number=10000,
+        )
+
+        buffered_handler.flush()
+
+    # Without a Python Shell only the backlog does any work.
+    _harness.run({"shell emit (no shell, backlog)": lambda: backlog_handler.emit(_record())}, number=50000)
+
+
+if __name__ == "__main__":
+    bench_emit()
@@ -0,0 +1,70 @@
+"""Benchmarks for houdini_logging_tools.spans.
+
+Run with hython, or as part of the suite with benchmarks/run.py:
+
+    hython benchmarks/bench_spans.py
+"""
+
+# Standard Library
+import logging
+
+# Third Party
+import _harness
+
+# Houdini Logging Tools
+from houdini_logging_tools.adapters.loggeradapter import HoudiniLoggerAdapter
+from houdini_logging_tools.nodes import NODE_PATH_CACHE
+from houdini_logging_tools.spans import SpanStatistics
+
+# Houdini
+import hou
+
+# Functions
+
+
+def bench_record() -> None:
+    """Time adding a duration to the span statistics."""
+    statistics = SpanStatistics()
+
+    _harness.run({"span statistics record": lambda: statistics.record("span", 0.001)}, number=100000)
+
+
+def bench_timed() -> None:
+    """Time the overhead of timing an empty span, with its duration logged or not."""
+    logger = logging.getLogger("bench.spans")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    adapter = HoudiniLoggerAdapter(logger)
+    node_adapter = HoudiniLoggerAdapter(logger, hou.node("/obj"))
+    statistics = SpanStatistics()
+
+    def _timed(span_adapter: HoudiniLoggerAdapter, level: int) -> None:
+        with span_adapter.timed("span", level=level, statistics=statistics):
+            pass
+
+    @adapter.timed(statistics=statistics)
+    def _decorated() -> None:
+        pass
+
+    try:
+        _harness.run(
+            {
+                "timed() (duration not logged)": lambda: _timed(adapter, logging.DEBUG),
+                "timed() (duration logged)": lambda: _timed(adapter, logging.INFO),
+                "timed() (node cook event, duration logged)": lambda: _timed(node_adapter, logging.INFO),
+                "timed() decorator (duration not logged)": _decorated,
+            },
+            number=20000,
+            # The Performance Monitor keeps a history of events.
+            allocations=False,
+        )
+
+    finally:
+        NODE_PATH_CACHE.clear()
+
+
+if __name__ == "__main__":
+    bench_record()
+    bench_timed()
@@ -0,0 +1,101 @@
+"""Benchmarks for houdini_logging_tools.ui.
+
+Run with hython, or as part of the suite with benchmarks/run.py:
+
+    hython benchmarks/bench_ui.py
+"""
+
+# Standard Library
+import threading
+import types
+from unittest import mock
+
+# Third Party
+import _harness
+
+# Houdini Logging Tools
+from houdini_logging_tools.formatting import LazyMessage
+from houdini_logging_tools.ui.dialogs import DialogAggregator
+from houdini_logging_tools.ui.dispatch import MainThreadDispatcher
+from houdini_logging_tools.ui.statusbar import StatusBarSink
+
+# Houdini
+import hou
+
+# Globals
+
+# A minimal hou.ui so nothing is displayed, a MagicMock would record every call.
+_STAND_IN_UI = types.SimpleNamespace(
+    addEventLoopCallback=lambda callback: None,
+    displayMessage=lambda text, **kwargs: 0,
+    removeEventLoopCallback=lambda callback: None,
+    setStatusMessage=lambda text, severity=None: None,
+)
+
+# Functions
+
+
+def bench_dialogs() -> None:
+    """Time adding messages to a dialog aggregator."""
+    aggregator = DialogAggregator(window=3600)
+    severity = hou.severityType.Warning
+
+    with mock.patch.object(hou, "ui", _STAND_IN_UI, create=True):
+        _harness.run(
+            {"dialog add (held)": lambda: aggregator.add("message", severity, node_path="/obj/geo1")},
+            number=20000,
+            repeat=3,
+        )
+
+        aggregator.flush()
+
+
+def bench_dispatch() -> None:
+    """Time posting calls to the main thread dispatcher, run directly and queued.
+
+    Calls posted from the main thread are only queued when earlier calls are waiting,
+    so a call is posted from a worker thread first to time queuing.
+    """
+    direct = MainThreadDispatcher()
+    queued = MainThreadDispatcher()
+    severity = hou.severityType.Message
+
+    with mock.patch.object(hou, "ui", _STAND_IN_UI, create=True):
+        worker = threading.Thread(target=queued.post, args=(_STAND_IN_UI.setStatusMessage, "message", severity))
+        worker.start()
+        worker.join()
+
+        _harness.run(
+            {
+                "dispatch post (main thread, direct)": lambda: direct.post(
+                    _STAND_IN_UI.setStatusMessage, "message", severity
+                ),
+                "dispatch post (queued)": lambda: queued.post(_STAND_IN_UI.setStatusMessage, "message", severity),
+            },
+            number=100000,
+        )
+
+        queued.flush()
+
+
+def bench_status_bar() -> None:
+    """Time updating a rate limited status bar sink faster than its rate."""
+    sink = StatusBarSink(max_rate=10)
+    severity = hou.severityType.Message
+
+    with mock.patch.object(hou, "ui", _STAND_IN_UI, create=True):
+        _harness.run(
+            {
+                "status bar update (held)": lambda: sink.update("message", severity),
+                "status bar update (held, lazy)": lambda: sink.update(LazyMessage("point %d", (42,)), severity),
+            },
+            number=100000,
+        )
+
+        sink.flush()
+
+
+if __name__ == "__main__":
+    bench_dialogs()
+    bench_dispatch()
+    bench_status_bar()
@@ -0,0 +1,216 @@
+"""Run the benchmark suite and check the results against a baseline.
+
+Every bench_* function in each of the bench_*.py modules is run.  Outside of Houdini,
+or when --fake-hou is passed, the modules are run against the fake hou module from
+houdini_logging_tools.testing.
+
+    python benchmarks/run.py --fake-hou
+    hython benchmarks/run.py
+
+The checked in baseline was recorded with the fake hou module.  Times are checked
+relative to a reference workload, but still vary between machines and Python builds,
+so record a new baseline with --update-baseline before comparing changes on other
+hardware.  Allocation metrics are largely machine independent.
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import importlib
+import json
+import pathlib
+import platform
+import sys
+
+# Globals
+
+BENCHMARK_DIR = pathlib.Path(__file__).parent
+
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+
+# Metrics which are reported but not checked.  Absolute times depend on how loaded the
+# machine is so the times relative to a reference workload are checked instead, and
+# peak memory depends on thread timing for the queued benchmarks.
+_UNCHECKED_METRICS = frozenset(("ns_per_call", "peak_bytes"))
+
+# Metric values must be above the baseline by more than this to be a regression, which
+# stops tiny values such as a few bytes of allocations failing the run.
+_MINIMUM_DIFFERENCE = {
+    "relative_time": 0.1,
+}
+_DEFAULT_MINIMUM_DIFFERENCE = 64.0
+
+# Functions
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser.
+
+    Returns:
+        The argument parser.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+
+    parser.add_argument("--fake-hou", action="store_true", help="Use the fake hou module even if hou is available.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds each call into the fake hou takes.")
+    parser.add_argument("--baseline", type=pathlib.Path, default=DEFAULT_BASELINE, help="The baseline file.")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline.")
+    parser.add_argument(
+        "--time-tolerance", type=float, default=0.25, help="Allowed fractional increase in relative time per call."
+    )
+    parser.add_argument(
+        "--memory-tolerance", type=float, default=0.10, help="Allowed fractional increase in memory metrics."
+    )
+    parser.add_argument("-k", dest="match", default="", help="Only run modules whose name contains this text.")
+
+    return parser
+
+
+def _find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    *,
+    time_tolerance: float,
+    memory_tolerance: float,
+) -> list[str]:
+    """Compare the results against the baseline.
+
+    Args:
+        results:
+            The metrics of each benchmark which was run.
+        baseline:
+            The baseline metrics of each benchmark.
+        time_tolerance:
+            Allowed fractional increase in relative time per call.
+        memory_tolerance:
+            Allowed fractional increase in memory metrics.
+
+    Returns:
+        A description of each regression.
+    """
+    regressions = []
+
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            expected = baseline.get(name, {}).get(metric)
+
+            if expected is None or metric in _UNCHECKED_METRICS:
+                continue
+
+            tolerance = time_tolerance if metric == "relative_time" else memory_tolerance
+            minimum = _MINIMUM_DIFFERENCE.get(metric, _DEFAULT_MINIMUM_DIFFERENCE)
+            limit = max(expected * (1 + tolerance), expected + minimum)
+
+            if value > limit:
+                regressions.append(f"{name}: {metric} {value:.2f} > {limit:.2f} (baseline {expected:.2f})")
+
+    return regressions
+
+
+def _run_benchmarks(match: str) -> None:
+    """Run the benchmark functions of each benchmark module.
+
+    Args:
+        match:
+            Only run modules whose name contains this text.
+    """
+    for path in sorted(BENCHMARK_DIR.glob("bench_*.py")):
+        if match not in path.stem:
+            continue
+
+        module = importlib.import_module(path.stem)
+
+        print(f"\n{path.name}")
+
+        for name, func in list(vars(module).items()):
+            if name.startswith("bench_") and callable(func) and getattr(func, "__module__", None) == module.__name__:
+                func()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite.
+
+    Args:
+        argv:
+            Optional command line arguments.
+
+    Returns:
+        The exit code, which is non-zero if any benchmark regressed.
+    """
+    args = _build_parser().parse_args(argv)
+
+    fake_hou = args.fake_hou
+
+    if not fake_hou:
+        try:
+            import hou  # noqa: F401, PLC0415
+
+        except ImportError:
+            fake_hou = True
+
+    if fake_hou:
+        # The fake must be installed before anything imports hou.
+        from houdini_logging_tools.testing import fake_hou as fake_hou_module  # noqa: PLC0415
+
+        fake_hou_module.install(latency=args.latency)
+
+    sys.path.insert(0, str(BENCHMARK_DIR))
+
+    import _harness  # noqa: PLC0415
+
+    _run_benchmarks(args.match)
+
+    environment = {
+        "hou": "fake" if fake_hou else sys.modules["hou"].applicationVersionString(),
+        "latency": args.latency if fake_hou else None,
+        "python": platform.python_version(),
+    }
+
+    if args.update_baseline:
+        results = {
+            name: {metric: round(value, 3) for metric, value in metrics.items()}
+            for name, metrics in _harness.RESULTS.items()
+        }
+
+        args.baseline.write_text(
+            json.dumps({"environment": environment, "benchmarks": results}, indent=4, sort_keys=True) + "\n"
+        )
+
+        print(f"\nWrote baseline to {args.baseline}")
+
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline found at {args.baseline}, run with --update-baseline to record one.")
+
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+
+    if baseline["environment"] != environment:
+        print(f"\nWarning: the baseline was recorded in a different environment: {baseline['environment']}")
+
+    regressions = _find_regressions(
+        _harness.RESULTS,
+        baseline["benchmarks"],
+        time_tolerance=args.time_tolerance,
+        memory_tolerance=args.memory_tolerance,
+    )
+
+    if regressions:
+        print("\nRegressions against the baseline:")
+
+        for regression in regressions:
+            print(f"    {regression}")
+
+        return 1
+
+    print("\nNo regressions against the baseline.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
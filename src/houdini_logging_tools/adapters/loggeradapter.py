@@ -4,15 +4,26 @@
 from __future__ import annotations
 
 # Standard Library
+import dataclasses
 import logging
-from functools import wraps
-from typing import Any, Callable, Self
+import sys
+from functools import cache, wraps
+from typing import TYPE_CHECKING, Any, Callable, Self
 
 # Houdini Logging Tools
-from houdini_logging_tools.mappings import LOGGING_TO_SEVERITY_MAP
-
-# Houdini
-import hou
+from houdini_logging_tools.context import LOG_CONTEXT
+from houdini_logging_tools.formatting import LazyMessage
+from houdini_logging_tools.lazy import hou, is_hou_available
+from houdini_logging_tools.mappings import get_severity
+from houdini_logging_tools.metrics import METRICS, instrument
+from houdini_logging_tools.nodes import NODE_PATH_CACHE
+from houdini_logging_tools.spans import SPAN_STATISTICS, SpanStatistics, TimedSpan
+from houdini_logging_tools.ui.dispatch import UI_DISPATCHER
+
+if TYPE_CHECKING:
+    from houdini_logging_tools.filters import CallSiteRateLimitFilter
+    from houdini_logging_tools.ui.dialogs import DialogAggregator
+    from houdini_logging_tools.ui.statusbar import StatusBarSink
 
 # Globals
 
@@ -24,6 +35,31 @@ _KWARGS_TO_EXTRA_KEYS = (
     "title",
 )
 
+# The logging level of each of the wrapped logging methods.
+_METHOD_LEVELS = {
+    "critical": logging.CRITICAL,
+    "debug": logging.DEBUG,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+}
+
+# The unwrapped log() method which all of the wrapped methods log through.
+_BASE_LOG = logging.LoggerAdapter.log
+
+# Keys which, when present in the extra data, require more than plain logging.
+_CONTROL_KEYS = frozenset(_KWARGS_TO_EXTRA_KEYS)
+
+# Bound once so each call only looks up the current LogContext, which is None outside
+# of any scope.
+_GET_SCOPE = LOG_CONTEXT.get
+
+# The stacklevel passed to log calls so that the module/file/line reporting will
+# represent the calling point and not the function call inside the adapter.  Frames
+# inside the logging module are not counted so this only needs to skip the wrapper.
+_STACKLEVEL = 2
+
 
 # Classes
 
@@ -45,8 +81,12 @@ class HoudiniLoggerAdapter(logging.LoggerAdapter):
             Whether to always use the status bar option.
         extra:
             Extra args to use to generate log messages.
+        options:
+            Optional dialog, status bar and rate limit options.
     """
 
+    __slots__ = ("_dialog", "_dialog_aggregator", "_node", "_rate_limit", "_status_bar", "_status_bar_sink")
+
     def __init__(
         self,
         base_logger: logging.Logger,
@@ -55,34 +95,21 @@ class HoudiniLoggerAdapter(logging.LoggerAdapter):
         dialog: bool = False,
         status_bar: bool = False,
         extra: dict | None = None,
+        options: HoudiniLoggerAdapterOptions | None = None,
     ) -> None:
         extra = extra or {}
 
         super().__init__(base_logger, extra)
 
+        if options is None:
+            options = _DEFAULT_OPTIONS
+
         self._dialog = dialog
+        self._dialog_aggregator = options.dialog_aggregator
         self._node = node
+        self._rate_limit = options.rate_limit
         self._status_bar = status_bar
-
-    def __new__(
-        cls: type[Self],
-        *args: Any,
-        **kwargs: Any,
-    ) -> Self:  # pragma: no cover
-        """Overridden __new__ that will wrap logging methods with custom function."""
-        inst = super().__new__(cls)
-
-        # We want to wrap various log calls to process args and set severities.
-        for key, severity in LOGGING_TO_SEVERITY_MAP.items():
-            if hasattr(inst, key):
-                attr = getattr(inst, key)
-
-                if callable(attr):
-                    wrapped = _wrap_logger(attr, severity)
-
-                    setattr(inst, key, wrapped)
-
-        return inst
+        self._status_bar_sink = options.status_bar_sink
 
     # Class Methods
 
@@ -95,6 +122,7 @@ class HoudiniLoggerAdapter(logging.LoggerAdapter):
         dialog: bool = False,
         status_bar: bool = False,
         extra: dict | None = None,
+        options: HoudiniLoggerAdapterOptions | None = None,
     ) -> HoudiniLoggerAdapter:
         """Create a new HoudiniLoggerAdapter from a name.
 
@@ -114,6 +142,8 @@ class HoudiniLoggerAdapter(logging.LoggerAdapter):
                 Whether to always use the status bar option.
             extra:
                 Extra args to use to generate log messages.
+            options:
+                Optional dialog, status bar and rate limit options.
 
         Returns:
             An adapter wrapping a logger of the passed name.
@@ -121,7 +151,14 @@ class HoudiniLoggerAdapter(logging.LoggerAdapter):
         # Create a base logger
         base_logger = logging.getLogger(name)
 
-        return cls(base_logger, node=node, dialog=dialog, status_bar=status_bar, extra=extra)
+        return cls(
+            base_logger,
+            node=node,
+            dialog=dialog,
+            status_bar=status_bar,
+            extra=extra,
+            options=options,
+        )
 
     # Properties
 
@@ -136,6 +173,17 @@ class HoudiniLoggerAdapter(logging.LoggerAdapter):
 
     # --------------------------------------------------------------------------
 
+    @property
+    def dialog_aggregator(self) -> DialogAggregator | None:
+        """Optional aggregator used to combine dialog messages."""
+        return self._dialog_aggregator
+
+    @dialog_aggregator.setter
+    def dialog_aggregator(self, dialog_aggregator: DialogAggregator | None) -> None:
+        self._dialog_aggregator = dialog_aggregator
+
+    # --------------------------------------------------------------------------
+
     @property
     def node(self) -> hou.Node | None:
         """A node the logger is associated with."""
@@ -147,6 +195,17 @@ class HoudiniLoggerAdapter(logging.LoggerAdapter):
 
     # --------------------------------------------------------------------------
 
+    @property
+    def rate_limit(self) -> CallSiteRateLimitFilter | None:
+        """Optional filter used to limit the rate of messages from each call site."""
+        return self._rate_limit
+
+    @rate_limit.setter
+    def rate_limit(self, rate_limit: CallSiteRateLimitFilter | None) -> None:
+        self._rate_limit = rate_limit
+
+    # --------------------------------------------------------------------------
+
     @property
     def status_bar(self) -> bool:
         """Whether the message will be logged to the status bar."""
@@ -156,13 +215,66 @@ class HoudiniLoggerAdapter(logging.LoggerAdapter):
     def status_bar(self, status_bar: bool) -> None:
         self._status_bar = status_bar
 
+    # --------------------------------------------------------------------------
+
+    @property
+    def status_bar_sink(self) -> StatusBarSink | None:
+        """Optional sink used to limit the rate of status bar updates."""
+        return self._status_bar_sink
+
+    @status_bar_sink.setter
+    def status_bar_sink(self, status_bar_sink: StatusBarSink | None) -> None:
+        self._status_bar_sink = status_bar_sink
+
+    # Non-Public Methods
+
+    @instrument("ui")
+    def _display(
+        self,
+        message: LazyMessage,
+        severity: hou.severityType,
+        *,
+        dialog: bool,
+        status_bar: bool,
+        title: str | None,
+    ) -> None:
+        """Display a message in a dialog and/or the status bar.
+
+        Args:
+            message:
+                The message to display.
+            severity:
+                The message severity.
+            dialog:
+                Whether to display the message in a dialog.
+            status_bar:
+                Whether to display the message in the status bar.
+            title:
+                Optional title of the dialog.
+        """
+        if dialog:
+            hou.ui.displayMessage(message.message, severity=severity, title=title)
+
+        if status_bar:
+            if self._status_bar_sink is not None:
+                self._status_bar_sink.update(message, severity)
+
+            else:
+                hou.ui.setStatusMessage(message.message, severity=severity)
+
     # Methods
 
+    @instrument("process")
     def process(self, msg: str, kwargs: Any) -> tuple[str, Any]:
         """Override function to handle custom logic.
 
         This will possibly insert a node path or to display a dialog with the log
-        message before being passed to regular logging output.
+        message before being passed to regular logging output.  The values of the
+        current LogContext are applied over the adapter's, with any values passed to
+        the call applied over both.
+
+        Dialog and status bar output is posted to the main thread, so calls from other
+        threads return without waiting for the UI.
 
         Args:
             msg:
@@ -173,83 +285,295 @@ class HoudiniLoggerAdapter(logging.LoggerAdapter):
         Returns:
             The message and updated kwargs.
         """
-        extra: dict = self.extra  # type: ignore
+        call_extra = kwargs.get("extra")
+        scope = _GET_SCOPE()
 
-        if "extra" in kwargs:
-            extra.update(kwargs["extra"])
+        if scope is None:
+            if call_extra is None:
+                kwargs["extra"] = self.extra
 
-            node = extra.pop("node", self.node)
+                return msg, kwargs
 
-            # Prepend the message with the node path.
-            if node is not None:
-                msg = f"{node.path()} - {msg}"
+            # Layer the call's extra data over the adapter's without modifying either.
+            extra = {**self.extra, **call_extra} if self.extra else dict(call_extra)  # type: ignore
 
-            dialog = extra.pop("dialog", self.dialog)
-            status_bar = extra.pop("status_bar", self.status_bar)
+        else:
+            # The values of the current LogContext sit between the adapter's and the call's.
+            extra = {**self.extra, **scope.values, **(call_extra or {})}  # type: ignore
 
-            if hou.isUIAvailable():
-                # Copy of the message for our display.
-                houdini_message = msg
+        kwargs["extra"] = extra
 
-                # If we have message args we need to format the message with them.
-                if "message_args" in extra:
-                    houdini_message %= extra["message_args"]
+        # Plain logging, nothing else to do.
+        if self._node is None and not self._dialog and not self._status_bar and _CONTROL_KEYS.isdisjoint(extra):
+            return msg, kwargs
 
-                severity = extra.pop("severity", hou.severityType.Message)
+        node = extra.pop("node", self._node)
+        dialog = extra.pop("dialog", self._dialog)
+        status_bar = extra.pop("status_bar", self._status_bar)
+        title = extra.pop("title", None)
 
-                # Display the message as a popup.
-                if dialog:
-                    title = extra.pop("title", None)
+        # Copy of the message for our display.
+        ui_message = msg
+        node_path = None
 
-                    hou.ui.displayMessage(houdini_message, severity=severity, title=title)
+        # Prepend the message with the node path.  Getting the path from Houdini is
+        # relatively expensive so use the cached path if there is one.  The node's
+        # path and session id are also added to the extra data for handlers which
+        # store them separately.
+        if node is not None:
+            session_id, node_path = NODE_PATH_CACHE.lookup(node)
+            msg = f"{node_path} - {msg}"
+            extra["node_path"] = node_path
+            extra["node_session_id"] = session_id
 
-                if status_bar:
-                    hou.ui.setStatusMessage(houdini_message, severity=severity)
+        if (dialog or status_bar) and _is_ui_available():
+            # The message args are only interpolated once an output needs the message,
+            # which may never happen for a status bar message superseded by another.
+            houdini_message = LazyMessage(ui_message, extra.get("message_args"), node_path)
 
-        kwargs["extra"] = extra
+            severity = extra.get("severity", hou.severityType.Message)
+
+            # Messages are added to the aggregator from the calling thread so they are
+            # held by any defer() scope it is in.  The aggregator posts its own dialogs.
+            if dialog and self._dialog_aggregator is not None:
+                self._dialog_aggregator.add(houdini_message.text, severity, title=title, node_path=node_path)
+
+                dialog = False
+
+            if dialog or status_bar:
+                UI_DISPATCHER.post(
+                    self._display, houdini_message, severity, dialog=dialog, status_bar=status_bar, title=title
+                )
 
         return msg, kwargs
 
+    def timed(
+        self,
+        name: str | None = None,
+        *,
+        level: int = logging.DEBUG,
+        node: hou.Node | None = None,
+        statistics: SpanStatistics | None = None,
+    ) -> TimedSpan:
+        """Time a span of code as a Performance Monitor event and log its duration.
+
+        The returned span can be used as a context manager, or as a decorator which
+        times each call to the function.  The event is a cook event for the node if
+        there is one, so the time shows under the node in the Performance Monitor.  The
+        duration is also added to the span statistics, which can be dumped at any time.
+
+        >>> with logger.timed("build_points"):
+        ...     build_points(geo)
+
+        >>> @logger.timed(level=logging.INFO)
+        ... def export(node):
+        ...     ...
+
+        >>> SPAN_STATISTICS.dump(logger)
+
+        Args:
+            name:
+                The span name.  Optional when decorating a function, which uses the
+                function's qualified name by default.
+            level:
+                The level to log the duration at.
+            node:
+                Optional node to record the event and log the duration for.  Defaults to
+                the node of the current LogContext, or else the adapter's node.
+            statistics:
+                Optional statistics to add the duration to, instead of SPAN_STATISTICS.
+
+        Returns:
+            The span.
+        """
+        return TimedSpan(
+            self,
+            name,
+            level=level,
+            node=node,
+            statistics=statistics if statistics is not None else SPAN_STATISTICS,
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class HoudiniLoggerAdapterOptions:
+    """Dialog, status bar and rate limit options for a HoudiniLoggerAdapter.
+
+    >>> options = HoudiniLoggerAdapterOptions(dialog_aggregator=DialogAggregator(window=0.5))
+    >>> adapter = HoudiniLoggerAdapter.from_name("demo", dialog=True, options=options)
+    """
+
+    status_bar_sink: StatusBarSink | None = None
+    """Optional sink to limit the rate of status bar updates."""
+
+    dialog_aggregator: DialogAggregator | None = None
+    """Optional aggregator to combine dialog messages."""
+
+    rate_limit: CallSiteRateLimitFilter | None = None
+    """Optional filter to limit the rate of messages from each call site."""
+
+
+# The options of adapters created without any.  The options are frozen, so they are
+# shared rather than creating an instance for every adapter.
+_DEFAULT_OPTIONS = HoudiniLoggerAdapterOptions()
+
 
 # Non-Public Functions
 
 
-def _wrap_logger(func: Callable, severity: hou.severityType) -> Callable:
-    """Function which wraps a logger method with custom code.
+def _is_rate_limited(adapter: HoudiniLoggerAdapter, level: int, kwargs: dict[str, Any]) -> bool:
+    """Check whether a log call is suppressed by the adapter's rate limit.
+
+    The call site is the frame the record will report, which is the frame calling
+    the wrapped logging method unless the call passes a larger stacklevel, so
+    suppressed calls return before any record is created or any UI is updated.
+
+    Args:
+        adapter:
+            The adapter being logged through.
+        level:
+            The logging level of the call.
+        kwargs:
+            The keyword args of the call.
+
+    Returns:
+        Whether the call is suppressed.
+    """
+    rate_limit = adapter._rate_limit
+
+    if rate_limit is None:
+        return False
+
+    try:
+        # Skip this function, and then the same frames as the record, starting with
+        # the wrapper.
+        frame = sys._getframe(kwargs.get("stacklevel", _STACKLEVEL))
+
+    except ValueError:
+        # Like logging, use the outermost frame if the stacklevel is too large.
+        frame = sys._getframe()
+
+        while frame.f_back is not None:
+            frame = frame.f_back
+
+    if rate_limit.allow(adapter.logger.name, frame.f_code.co_filename, frame.f_lineno, level):
+        return False
+
+    if METRICS.enabled:
+        METRICS.component(adapter.__class__.__name__).count("suppressed")
+
+    return True
+
+
+@cache
+def _is_ui_available() -> bool:
+    """Check whether the Houdini UI is available.
+
+    The result cannot change during a session so it is only checked once.
+
+    Returns:
+        Whether hou is available and has a UI.
+    """
+    return is_hou_available() and hou.isUIAvailable()
+
+
+def _prepare_kwargs(level: int, args: tuple, kwargs: dict[str, Any]) -> None:
+    """Move the custom kwargs of a log call into its extra data.
+
+    Args:
+        level:
+            The logging level of the call.
+        args:
+            The message args of the call.
+        kwargs:
+            The kwargs of the call, which are modified in place.
+    """
+    # Copy any passed extra dictionary so the caller's is never modified.
+    extra = dict(kwargs["extra"]) if "extra" in kwargs else {}
+    kwargs["extra"] = extra
+
+    # Set the severity for the level, which also handles custom levels.
+    extra["severity"] = get_severity(level)
+
+    for key in _KWARGS_TO_EXTRA_KEYS:
+        if key in kwargs:
+            extra[key] = kwargs.pop(key)
+
+    # If there are any message args, we want to pass them as extra data so that
+    # we can use them to format the message for extra outputs.
+    if args:
+        extra["message_args"] = args
+
+    if "stacklevel" not in kwargs:
+        kwargs["stacklevel"] = _STACKLEVEL
+
+
+def _wrap_log(func: Callable) -> Callable:
+    """Function which wraps the logger log() method with custom code.
 
     Args:
         func:
             The callable to wrap.
 
-        severity:
-            The corresponding hou.severityType value.
-
     Returns:
         The wrapped function.
     """
 
     @wraps(func)
-    def func_wrapper(*args: Any, **kwargs: Any) -> Any:
-        # Get the extra dictionary, or an empty one if it doesn't exist.
-        extra = kwargs.setdefault("extra", {})
+    def log_wrapper(self: HoudiniLoggerAdapter, level: int, msg: Any, *args: Any, **kwargs: Any) -> Any:
+        if not self.logger.isEnabledFor(level) or _is_rate_limited(self, level, kwargs):
+            return None
+
+        if METRICS.enabled:
+            METRICS.component(self.__class__.__name__).count_record(level)
+
+        _prepare_kwargs(level, args, kwargs)
+
+        return func(self, level, msg, *args, **kwargs)
+
+    return log_wrapper
+
 
-        # Set the severity to our passed in value.
-        extra["severity"] = severity
+def _wrap_logger(func: Callable, level: int) -> Callable:
+    """Function which wraps a logger method with custom code.
 
-        for key in _KWARGS_TO_EXTRA_KEYS:
-            if key in kwargs:
-                extra[key] = kwargs.pop(key)
+    The wrapped method logs through logging.LoggerAdapter.log() directly so the
+    wrapped log() method does not process the call a second time.
 
-        # If there is more than one arg, we want to pass them as extra data so that
-        # we can use it to format the message for extra outputs.
-        if len(args) > 1:
-            extra["message_args"] = args[1:]
+    Args:
+        func:
+            The callable to wrap.
+        level:
+            The logging level the callable logs at.
 
-        if "stacklevel" not in kwargs:
-            # Set stacklevel=4 so that the module/file/line reporting will represent
-            # the calling point and not the function call inside the adapter.
-            kwargs["stacklevel"] = 4
+    Returns:
+        The wrapped function.
+    """
+    exc_info = func is logging.LoggerAdapter.exception
 
-        return func(*args, **kwargs)
+    @wraps(func)
+    def func_wrapper(self: HoudiniLoggerAdapter, msg: Any, *args: Any, **kwargs: Any) -> Any:
+        # Return before doing any work if the level is disabled.  The logger caches
+        # this result and clears the cache whenever any logger's level is changed.
+        if not self.logger.isEnabledFor(level) or _is_rate_limited(self, level, kwargs):
+            return None
+
+        if METRICS.enabled:
+            METRICS.component(self.__class__.__name__).count_record(level)
+
+        _prepare_kwargs(level, args, kwargs)
+
+        if exc_info:
+            kwargs.setdefault("exc_info", True)
+
+        return _BASE_LOG(self, level, msg, *args, **kwargs)
 
     return func_wrapper
+
+
+# Wrap the standard logging methods once at the class level so they process args
+# and set severities.
+HoudiniLoggerAdapter.log = _wrap_log(_BASE_LOG)  # type: ignore
+
+for _name, _level in _METHOD_LEVELS.items():
+    setattr(HoudiniLoggerAdapter, _name, _wrap_logger(getattr(logging.LoggerAdapter, _name), _level))
@@ -0,0 +1,185 @@
+"""Scopes which set the node, outputs and extra data of log calls made inside them."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import contextvars
+import inspect
+from functools import wraps
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from houdini_logging_tools.lazy import hou
+
+# Globals
+
+# The values of the innermost LogContext, merged with those of the scopes around it.
+# HoudiniLoggerAdapter reads this on each call so it should only be set through
+# LogContext.
+LOG_CONTEXT: contextvars.ContextVar[_Scope | None] = contextvars.ContextVar(
+    "houdini_logging_tools.log_context", default=None
+)
+
+# Classes
+
+
+class LogContext:
+    """Context manager and decorator which sets values for the log calls inside it.
+
+    Log calls made through any HoudiniLoggerAdapter inside the scope use the scope's
+    node, dialog, status bar and title options, and have the scope's extra data added
+    to their records.  This avoids creating an adapter for each node, or passing the
+    node to every call, when walking a network:
+
+    >>> logger = HoudiniLoggerAdapter.from_name(__name__)
+    >>> for node in hou.node("/obj").allSubChildren():
+    ...     with LogContext(node, tool="validate"):
+    ...         validate(node)
+
+    Values passed to a log call take precedence over the scope's values, which take
+    precedence over the adapter's.  Scopes can be nested, with the inner scope's values
+    taking precedence over the outer's.
+
+    When used as a decorator the scope is entered each time the function is called,
+    including for the whole of each call to a coroutine function.
+
+    Scopes are stored in a context variable so each thread, and each asyncio task, has
+    its own.  Tasks start with the scope they were created in, while threads start
+    without a scope unless run in a copy of the creating thread's context.
+
+    Args:
+        node:
+            Optional node for prefixing messages with the path.
+        dialog:
+            Optional override of whether to display messages in a dialog.
+        status_bar:
+            Optional override of whether to display messages in the status bar.
+        title:
+            Optional title of displayed dialogs.
+        **extra:
+            Extra data to add to the records.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(
+        self,
+        node: hou.Node | None = None,
+        *,
+        dialog: bool | None = None,
+        status_bar: bool | None = None,
+        title: str | None = None,
+        **extra: Any,
+    ) -> None:
+        self._values = extra
+
+        for key, value in (("node", node), ("dialog", dialog), ("status_bar", status_bar), ("title", title)):
+            if value is not None:
+                self._values[key] = value
+
+    def __call__(self, func: Callable) -> Callable:
+        """Decorate a function so it is called inside the scope.
+
+        Args:
+            func:
+                The function to decorate.
+
+        Returns:
+            The decorated function.
+        """
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                self._push()
+
+                try:
+                    return await func(*args, **kwargs)
+
+                finally:
+                    _pop()
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            self._push()
+
+            try:
+                return func(*args, **kwargs)
+
+            finally:
+                _pop()
+
+        return wrapper
+
+    def __enter__(self) -> Self:
+        """Enter the scope, applying its values to log calls made inside it."""
+        self._push()
+
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit the scope, restoring the scope around it."""
+        _pop()
+
+    # Properties
+
+    @property
+    def values(self) -> Mapping[str, Any]:
+        """The values set by the scope, not including those of the scopes around it."""
+        return MappingProxyType(self._values)
+
+    # Non-Public Methods
+
+    def _push(self) -> None:
+        """Enter the scope, merging its values with those of the current scope."""
+        parent = LOG_CONTEXT.get()
+
+        values = {**parent.values, **self._values} if parent is not None else dict(self._values)
+
+        LOG_CONTEXT.set(_Scope(values, parent))
+
+
+# Non-Public Classes
+
+
+class _Scope(NamedTuple):
+    """The merged values of a scope, which restores the scope around it on exit.
+
+    Restoring the parent, rather than resetting a token, means a LogContext can be
+    entered by several threads or tasks at once.
+    """
+
+    values: dict[str, Any]
+    """The values of the scope, merged with those of the scopes around it."""
+
+    parent: _Scope | None
+    """The scope around this one, if any."""
+
+
+# Non-Public Functions
+
+
+def _pop() -> None:
+    """Exit the current scope, restoring the scope around it."""
+    LOG_CONTEXT.set(LOG_CONTEXT.get().parent)  # type: ignore
+
+
+# Functions
+
+
+def get_log_context() -> Mapping[str, Any]:
+    """Get the values of the current scope, merged with those of the scopes around it.
+
+    Returns:
+        The values which will be applied to log calls, which are empty outside of any
+        scope.
+    """
+    scope = LOG_CONTEXT.get()
+
+    return MappingProxyType(scope.values if scope is not None else {})
@@ -0,0 +1,279 @@
+"""Logging filters which limit the output of noisy call sites."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import collections
+import logging
+import threading
+import time
+
+# Globals
+
+# The record attribute marking the reports of suppressed records, which are always allowed.
+_REPORT_ATTRIBUTE = "rate_limit_report"
+
+# Classes
+
+
+class CallSiteRateLimitFilter(logging.Filter):
+    """Filter which limits the rate of records logged from each call site.
+
+    Each call site, identified by its logger name, file path and line number, has a
+    token bucket which holds up to burst tokens and is refilled at rate tokens per
+    second.  Each record takes a token and records logged when the bucket is empty
+    are suppressed, so a logging call inside a loop over every point of a geometry
+    logs the first burst records and then at most rate records per second.
+
+    The number of records suppressed at a call site is reported by logging a record
+    from the same call site when the next record from the call site is allowed and at
+    least report_interval seconds have passed since the last report.  Any counts which
+    have not been reported can be reported at any time with report(), such as once a
+    cook has finished.
+
+    The filter can be added to a logger, or passed to a HoudiniLoggerAdapter which
+    checks it before doing any other work, and the reports are logged through the
+    logger of the call site.  When the filter is added to a handler, that handler must
+    be passed as well so the reports are only emitted by the handler which suppressed
+    the records, rather than by every handler of the logger.
+
+    Args:
+        rate:
+            The number of records allowed per second from each call site, once the
+            burst has been used.
+        burst:
+            The number of records which can be logged from a call site at once.
+        report_interval:
+            The minimum number of seconds between reports for a call site.
+        max_call_sites:
+            The maximum number of call sites to track.  The least recently used call
+            sites are forgotten once there are more, after reporting any records they
+            suppressed.
+        handler:
+            The handler the filter is added to, if any, which emits the reports.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 20,
+        *,
+        report_interval: float = 10.0,
+        max_call_sites: int = 4096,
+        handler: logging.Handler | None = None,
+    ) -> None:
+        super().__init__()
+
+        if rate < 0 or burst < 1:
+            msg = "rate must not be negative and burst must be at least 1"
+            raise ValueError(msg)
+
+        self._buckets: collections.OrderedDict[tuple[str, str, int], _TokenBucket] = collections.OrderedDict()
+        self._burst = burst
+        self._handler = handler
+        self._lock = threading.Lock()
+        self._max_call_sites = max_call_sites
+        self._rate = rate
+        self._report_interval = report_interval
+        self._suppressed = 0
+
+    # Properties
+
+    @property
+    def burst(self) -> int:
+        """The number of records which can be logged from a call site at once."""
+        return self._burst
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def handler(self) -> logging.Handler | None:
+        """The handler the filter is added to, if any, which emits the reports."""
+        return self._handler
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def rate(self) -> float:
+        """The number of records allowed per second from each call site."""
+        return self._rate
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def suppressed(self) -> int:
+        """The total number of records which have been suppressed."""
+        return self._suppressed
+
+    # Non-Public Methods
+
+    def _report(self, call_site: tuple[str, str, int], levelno: int, count: int, elapsed: float) -> None:
+        """Log the number of records suppressed at a call site.
+
+        The report is emitted by the filter's handler, or otherwise handled by the
+        logger of the call site.
+
+        Args:
+            call_site:
+                The logger name, file path and line number of the call site.
+            levelno:
+                The level of the last suppressed record.
+            count:
+                The number of records suppressed.
+            elapsed:
+                The number of seconds since the last report.
+        """
+        name, pathname, lineno = call_site
+
+        logger = logging.getLogger(name)
+
+        record = logger.makeRecord(
+            name,
+            levelno,
+            pathname,
+            lineno,
+            "Suppressed %d records logged here in the last %.1f seconds",
+            (count, elapsed),
+            None,
+            extra={_REPORT_ATTRIBUTE: True},
+        )
+
+        if self._handler is not None:
+            self._handler.handle(record)
+
+        else:
+            logger.handle(record)
+
+    # Methods
+
+    def allow(self, name: str, pathname: str, lineno: int, levelno: int = logging.WARNING) -> bool:
+        """Check whether a record from a call site is allowed, taking a token if it is.
+
+        If the record is allowed and a report of the suppressed records is due, the
+        report is logged before returning.
+
+        Args:
+            name:
+                The logger name.
+            pathname:
+                The path of the file containing the call.
+            lineno:
+                The line number of the call.
+            levelno:
+                The level of the record.
+
+        Returns:
+            Whether the record is allowed.
+        """
+        call_site = (name, pathname, lineno)
+        now = time.monotonic()
+
+        with self._lock:
+            bucket = self._buckets.get(call_site)
+
+            if bucket is None:
+                # The first record from a call site is always allowed.
+                self._buckets[call_site] = _TokenBucket(self._burst - 1, now)
+
+                if len(self._buckets) <= self._max_call_sites:
+                    return True
+
+                # Forget the least recently used call site, reporting any records it
+                # suppressed which have not been reported yet.
+                call_site, bucket = self._buckets.popitem(last=False)
+
+                if not bucket.suppressed:
+                    return True
+
+            else:
+                self._buckets.move_to_end(call_site)
+
+                bucket.tokens = min(bucket.tokens + (now - bucket.updated) * self._rate, self._burst)
+                bucket.updated = now
+
+                if bucket.tokens < 1:
+                    bucket.levelno = levelno
+                    bucket.suppressed += 1
+                    self._suppressed += 1
+
+                    return False
+
+                bucket.tokens -= 1
+
+                if not bucket.suppressed or now - bucket.reported < self._report_interval:
+                    return True
+
+            report = bucket.take_report(now)
+
+        self._report(call_site, *report)
+
+        return True
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Check whether a record is allowed.
+
+        Args:
+            record:
+                The log record to check.
+
+        Returns:
+            Whether the record should be logged.
+        """
+        if _REPORT_ATTRIBUTE in record.__dict__:
+            return True
+
+        return self.allow(record.name, record.pathname, record.lineno, record.levelno)
+
+    def report(self) -> None:
+        """Log the number of records suppressed at each call site since its last report."""
+        now = time.monotonic()
+
+        with self._lock:
+            pending = [
+                (call_site, bucket.take_report(now)) for call_site, bucket in self._buckets.items() if bucket.suppressed
+            ]
+
+        for call_site, report in pending:
+            self._report(call_site, *report)
+
+
+# Non-Public Classes
+
+
+class _TokenBucket:
+    """The token bucket of a call site.
+
+    Args:
+        tokens:
+            The number of tokens to start with.
+        now:
+            The current monotonic time.
+    """
+
+    __slots__ = ("levelno", "reported", "suppressed", "tokens", "updated")
+
+    def __init__(self, tokens: float, now: float) -> None:
+        self.levelno = logging.NOTSET
+        self.reported = now
+        self.suppressed = 0
+        self.tokens = tokens
+        self.updated = now
+
+    def take_report(self, now: float) -> tuple[int, int, float]:
+        """Get the details of the suppressed records to report and reset the count.
+
+        Args:
+            now:
+                The current monotonic time.
+
+        Returns:
+            The level of the last suppressed record, the number of suppressed records
+            and the number of seconds since the last report.
+        """
+        report = (self.levelno, self.suppressed, now - self.reported)
+
+        self.reported = now
+        self.suppressed = 0
+
+        return report
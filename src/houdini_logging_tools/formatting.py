@@ -0,0 +1,339 @@
+"""Formatting of log records and messages shared by the adapters and handlers."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import collections
+import logging
+import threading
+import traceback
+import weakref
+from typing import Any
+
+# Globals
+
+# The formatted output of each formatter for each live record.  Keeping the output
+# here rather than on the record leaves records picklable for handlers such as
+# QueueHandler and SocketHandler, and the output is discarded with the record.
+_FORMATTED: weakref.WeakKeyDictionary[logging.LogRecord, dict[Any, tuple[Any, Any, str]]] = weakref.WeakKeyDictionary()
+
+# The formatter used by handlers which do not have one set, equivalent to the one
+# used by logging.Handler.format().
+_DEFAULT_FORMATTER = logging.Formatter()
+
+# Classes
+
+
+class LazyMessage:
+    """A log message which is only interpolated with its args when first needed.
+
+    Args:
+        msg:
+            The log message.
+        args:
+            Optional args to interpolate into the message.
+        prefix:
+            Optional prefix for the full message.
+    """
+
+    __slots__ = ("_args", "_msg", "_prefix", "_text")
+
+    def __init__(self, msg: Any, args: Any = None, prefix: str | None = None) -> None:
+        self._args = args
+        self._msg = msg
+        self._prefix = prefix
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        """The full message, including any prefix."""
+        return str(self.message)
+
+    # Properties
+
+    @property
+    def message(self) -> str:
+        """The full message, including any prefix."""
+        if self._prefix is None:
+            return self.text
+
+        return f"{self._prefix} - {self.text}"
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def text(self) -> str:
+        """The message interpolated with its args, without any prefix."""
+        if self._text is None:
+            text = self._msg
+
+            if self._args:
+                text %= self._args
+
+            self._text = text
+
+        return self._text
+
+
+class TracebackCache:
+    """Deduplicate the tracebacks of logged exceptions.
+
+    Exceptions are fingerprinted by their type and the code and line of each frame of
+    their traceback, including those of any chained exceptions.  The first record of
+    each fingerprint gets the fully formatted traceback followed by a reference number.
+    Repeats instead get only the final line of the exception along with the reference
+    and the number of times it has been seen:
+
+        ValueError: Invalid point count (traceback #3, seen 12 times)
+
+    Only the most recently seen tracebacks are kept, so a traceback which has been
+    discarded is formatted in full again the next time it is seen.
+
+    Args:
+        max_size:
+            The maximum number of tracebacks to keep.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        if max_size < 1:
+            msg = "max_size must be at least 1"
+            raise ValueError(msg)
+
+        self._entries: collections.OrderedDict[tuple, _TracebackEntry] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._next_reference = 1
+        self._texts: weakref.WeakKeyDictionary[logging.LogRecord, str] = weakref.WeakKeyDictionary()
+
+    # Properties
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of tracebacks to keep."""
+        return self._max_size
+
+    # Non-Public Methods
+
+    def _deduplicate(self, exc: BaseException, exc_info: tuple, formatter: logging.Formatter) -> str:
+        """Get the full traceback of a new exception, or a reference to a repeated one.
+
+        Args:
+            exc:
+                The exception.
+            exc_info:
+                The exception info of the record.
+            formatter:
+                The formatter used to format new tracebacks.
+
+        Returns:
+            The exception text.
+        """
+        fingerprint = _fingerprint(exc)
+
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+
+            if entry is not None:
+                entry.count += 1
+                self._entries.move_to_end(fingerprint)
+
+                count, reference = entry.count, entry.reference
+
+        if entry is not None:
+            summary = traceback.format_exception_only(type(exc), exc)[-1].rstrip()
+
+            return f"{summary} (traceback #{reference}, seen {count} times)"
+
+        # Format outside of the lock as reading the source lines can be slow.
+        text = formatter.formatException(exc_info)
+
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+
+            # Another thread may have added the traceback while it was being formatted.
+            if entry is None:
+                entry = self._entries[fingerprint] = _TracebackEntry(self._next_reference, text)
+                self._next_reference += 1
+
+                if len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+
+            else:
+                entry.count += 1
+
+            reference = entry.reference
+
+        return f"{text}\n(traceback #{reference})"
+
+    # Methods
+
+    def clear(self) -> None:
+        """Discard all the tracebacks."""
+        with self._lock:
+            self._entries.clear()
+
+    def exception_text(self, record: logging.LogRecord, formatter: logging.Formatter) -> str:
+        """Get the exception text of a record, formatting the traceback only if it is new.
+
+        The text is stored for the lifetime of the record so that a record formatted by
+        several handlers sharing this cache is only counted once.
+
+        Args:
+            record:
+                The log record with exception info.
+            formatter:
+                The formatter used to format new tracebacks.
+
+        Returns:
+            The full traceback or a reference to it.
+        """
+        text = self._texts.get(record)
+
+        if text is not None:
+            return text
+
+        exc_info: Any = record.exc_info
+        exc = exc_info[1]
+
+        # Exception info without an exception, such as from exception() being called
+        # outside of an except block, has no traceback to deduplicate.
+        text = formatter.formatException(exc_info) if exc is None else self._deduplicate(exc, exc_info, formatter)
+
+        self._texts[record] = text
+
+        return text
+
+    def lookup(self, reference: int) -> str | None:
+        """Get the full traceback for a reference.
+
+        Args:
+            reference:
+                The reference number.
+
+        Returns:
+            The formatted traceback, or None if it is not kept.
+        """
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.reference == reference:
+                    return entry.text
+
+        return None
+
+
+TRACEBACK_CACHE = TracebackCache()
+"""The traceback cache which can be shared by handlers to deduplicate tracebacks."""
+
+# Non-Public Classes
+
+
+class _TracebackEntry:
+    """A traceback which has been seen.
+
+    Args:
+        reference:
+            The reference number of the traceback.
+        text:
+            The formatted traceback.
+    """
+
+    __slots__ = ("count", "reference", "text")
+
+    def __init__(self, reference: int, text: str) -> None:
+        self.count = 1
+        self.reference = reference
+        self.text = text
+
+
+# Non-Public Functions
+
+
+def _fingerprint(exc: BaseException) -> tuple:
+    """Get a fingerprint of an exception from its type and traceback frames.
+
+    Args:
+        exc:
+            The exception.
+
+    Returns:
+        The types and the code and line of each frame of the exception and any
+        exceptions it was chained from.
+    """
+    parts: list[Any] = []
+    seen: set[int] = set()
+
+    current: BaseException | None = exc
+
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+
+        parts.append(type(current))
+        parts.extend((frame.f_code, lineno) for frame, lineno in traceback.walk_tb(current.__traceback__))
+
+        current = current.__cause__ or (None if current.__suppress_context__ else current.__context__)
+
+    return tuple(parts)
+
+
+# Functions
+
+
+def format_record(
+    handler: logging.Handler,
+    record: logging.LogRecord,
+    tracebacks: TracebackCache | None = None,
+) -> str:
+    """Format a record using a handler's formatter, at most once per formatter.
+
+    The output of each formatter is stored for the lifetime of the record so that
+    other handlers using the same formatter reuse it rather than formatting the record
+    again.  The stored output is only used while the record's message and args are
+    unchanged.
+
+    Args:
+        handler:
+            The handler whose formatter should be used.
+        record:
+            The log record to format.
+        tracebacks:
+            Optional cache to deduplicate the record's exception traceback with.
+
+    Returns:
+        The formatted record.
+    """
+    formatter = handler.formatter or _DEFAULT_FORMATTER
+    key: Any = formatter if tracebacks is None or not record.exc_info else (formatter, tracebacks)
+    msg = record.msg
+    args = record.args
+
+    formatted = _FORMATTED.get(record)
+
+    if formatted is None:
+        formatted = _FORMATTED[record] = {}
+
+    else:
+        cached = formatted.get(key)
+
+        # Filters and other handlers may change the message or args so check the
+        # output is still for the same ones.
+        if cached is not None and cached[0] is msg and cached[1] is args:
+            return cached[2]
+
+    if key is formatter:
+        text = formatter.format(record)
+
+    else:
+        # Only use the deduplicated exception text for this formatting, so handlers
+        # outside of the package still output the full traceback.
+        exc_text = record.exc_text
+        record.exc_text = tracebacks.exception_text(record, formatter)  # type: ignore
+
+        try:
+            text = formatter.format(record)
+
+        finally:
+            record.exc_text = exc_text
+
+    formatted[key] = (msg, args, text)
+
+    return text
@@ -0,0 +1,579 @@
+"""Forwarding of log records from worker processes to a collector in another session.
+
+Records are sent over a local TCP connection in frames.  Each frame is the length of
+its payload followed by the payload, which starts with the worker and work item
+names shared by all of the frame's records and is followed by the records:
+
+    frame:   payload length (uint32), payload
+    payload: worker (string), work item (string), record...
+    record:  created (float64), levelno (int32), lineno (int32), process (uint32),
+             name, pathname, funcName, threadName, message, exc_text, stack_info
+    string:  length (uint32), UTF-8 bytes
+
+All numbers are in network byte order.  The record message is sent already merged
+with its args, and exception and stack information is sent already formatted, so
+no objects from the worker need to be recreated by the collector.
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import logging
+import pathlib
+import selectors
+import socket
+import struct
+import threading
+from functools import lru_cache
+from typing import Self
+
+# Globals
+
+COLLECTOR_ADDRESS_ENV = "HOUDINI_LOGGING_TOOLS_COLLECTOR"
+"""Environment variable containing the host:port address of the collector to send to."""
+
+DEFAULT_MAX_FRAME_SIZE = 16 * 1024 * 1024
+"""The default maximum size of a frame accepted by a collector, in bytes."""
+
+FRAME_HEADER = struct.Struct("!I")
+"""The header of each frame, containing the length of its payload."""
+
+# The fixed size fields at the start of each record.
+_RECORD_HEADER = struct.Struct("!diiI")
+
+# The length prefix of each string.
+_STRING_LENGTH = struct.Struct("!I")
+
+# The string record attributes sent after the fixed size fields, in order.
+_STRING_FIELDS = ("name", "pathname", "funcName", "threadName", "message", "exc_text", "stack_info")
+
+# The formatter used to format exceptions for records sent by handlers without one.
+_DEFAULT_FORMATTER = logging.Formatter()
+
+# The number of bytes read from a connection at once.
+_RECEIVE_SIZE = 256 * 1024
+
+# Classes
+
+
+class LogCollector:
+    """Receives records forwarded from other processes and passes them to a handler.
+
+    The collector listens on a local TCP port and reads from every connection on a
+    single background thread.  If the handler cannot keep up the collector stops
+    reading, which fills the connections' buffers and so blocks or queues the
+    senders, depending on their drop policy.
+
+    Each received record has worker and work_item attributes with the names sent by
+    its process.  When prefix_messages is set the record messages are prefixed with
+    the names, as "worker [work item] - message".
+
+    >>> collector = LogCollector(HoudiniLoggingHandler(options=HoudiniLoggingOptions(queued=True)))
+    >>> collector.start()
+    >>> os.environ[COLLECTOR_ADDRESS_ENV] = collector.address_string
+
+    Args:
+        handler:
+            The handler to pass the received records to.
+        host:
+            The host to listen on.
+        port:
+            The port to listen on, or 0 to use any free port.
+        prefix_messages:
+            Whether to prefix messages with the worker and work item names.
+        max_frame_size:
+            The largest frame accepted, in bytes.  Connections sending larger
+            frames are closed.
+    """
+
+    def __init__(
+        self,
+        handler: logging.Handler,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        prefix_messages: bool = True,
+        max_frame_size: int = DEFAULT_MAX_FRAME_SIZE,
+    ) -> None:
+        self._address = (host, port)
+        # The data received from each connection which is not yet a complete frame.
+        self._connections: dict[socket.socket, bytearray] = {}
+        self._handler = handler
+        self._lock = threading.Lock()
+        self._max_frame_size = max_frame_size
+        self._prefix_messages = prefix_messages
+        self._records_received = 0
+        self._selector: selectors.BaseSelector | None = None
+        self._server: socket.socket | None = None
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        self._wake_receiver: socket.socket | None = None
+        self._wake_sender: socket.socket | None = None
+
+    def __enter__(self) -> Self:
+        """Start the collector when entering the context."""
+        self.start()
+
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop the collector when leaving the context."""
+        self.stop()
+
+    # Properties
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """The host and port the collector listens on, once started."""
+        return self._address
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def address_string(self) -> str:
+        """The host:port address the collector listens on, once started."""
+        return f"{self._address[0]}:{self._address[1]}"
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def connection_count(self) -> int:
+        """The number of connected senders."""
+        return len(self._connections)
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def handler(self) -> logging.Handler:
+        """The handler the received records are passed to."""
+        return self._handler
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the collector thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def records_received(self) -> int:
+        """The number of records received."""
+        return self._records_received
+
+    # Non-Public Methods
+
+    def _accept(self) -> None:
+        """Accept a new connection."""
+        try:
+            connection, _ = self._server.accept()  # type: ignore
+
+        except BlockingIOError:
+            return
+
+        connection.settimeout(0)
+
+        self._connections[connection] = bytearray()
+        self._selector.register(connection, selectors.EVENT_READ)  # type: ignore
+
+    def _close_connection(self, connection: socket.socket) -> None:
+        """Stop reading from and close a connection.
+
+        Args:
+            connection:
+                The connection to close.
+        """
+        self._selector.unregister(connection)  # type: ignore
+        del self._connections[connection]
+
+        connection.close()
+
+    def _handle_records(self, records: list[logging.LogRecord]) -> None:
+        """Pass received records to the handler.
+
+        Args:
+            records:
+                The received records.
+        """
+        self._records_received += len(records)
+
+        handler = self._handler
+
+        for record in records:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _read(self, connection: socket.socket) -> None:
+        """Read from a connection and handle any complete frames.
+
+        Args:
+            connection:
+                The connection to read from.
+        """
+        try:
+            data = connection.recv(_RECEIVE_SIZE)
+
+        except BlockingIOError:
+            return
+
+        except OSError:
+            data = b""
+
+        # The sender closed the connection, any incomplete frame is discarded.
+        if not data:
+            self._close_connection(connection)
+
+            return
+
+        buffer = self._connections[connection]
+        buffer += data
+
+        header_size = FRAME_HEADER.size
+
+        while len(buffer) >= header_size:
+            (length,) = FRAME_HEADER.unpack_from(buffer)
+
+            if length > self._max_frame_size:
+                self._close_connection(connection)
+
+                return
+
+            end = header_size + length
+
+            if len(buffer) < end:
+                break
+
+            payload = bytes(buffer[header_size:end])
+            del buffer[:end]
+
+            try:
+                records = decode_payload(payload, prefix_messages=self._prefix_messages)
+
+            except (struct.error, UnicodeDecodeError):
+                self._close_connection(connection)
+
+                return
+
+            self._handle_records(records)
+
+    def _run(self) -> None:
+        """Collector thread loop which accepts connections and reads from them."""
+        selector = self._selector
+
+        while not self._stopping:
+            for key, _ in selector.select():  # type: ignore
+                sock = key.fileobj
+
+                if sock is self._server:
+                    self._accept()
+
+                elif sock is self._wake_receiver:
+                    sock.recv(1024)  # type: ignore
+
+                else:
+                    self._read(sock)  # type: ignore
+
+    # Methods
+
+    def start(self) -> None:
+        """Start listening and receiving records if the collector is not already running."""
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            server = socket.create_server(self._address)
+            server.settimeout(0)
+
+            self._address = server.getsockname()[:2]
+            self._server = server
+
+            self._wake_receiver, self._wake_sender = socket.socketpair()
+            self._wake_receiver.settimeout(0)
+
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(server, selectors.EVENT_READ)
+            self._selector.register(self._wake_receiver, selectors.EVENT_READ)
+
+            self._stopping = False
+
+            self._thread = threading.Thread(target=self._run, name=f"{self.__class__.__name__}-receive", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop receiving records and close all connections.
+
+        Args:
+            timeout:
+                Optional number of seconds to wait for the collector thread to finish.
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+
+            if thread is None:
+                return
+
+            self._stopping = True
+            self._wake_sender.send(b"\0")  # type: ignore
+
+            thread.join(timeout)
+
+            for connection in list(self._connections):
+                self._close_connection(connection)
+
+            self._selector.close()  # type: ignore
+            self._server.close()  # type: ignore
+            self._wake_receiver.close()  # type: ignore
+            self._wake_sender.close()  # type: ignore
+
+            self._selector = self._server = self._wake_receiver = self._wake_sender = None
+
+        self._handler.flush()
+
+
+# Functions
+
+
+def decode_payload(payload: bytes, *, prefix_messages: bool = False) -> list[logging.LogRecord]:
+    """Decode the records in a frame payload.
+
+    Args:
+        payload:
+            The frame payload.
+        prefix_messages:
+            Whether to prefix messages with the worker and work item names.
+
+    Returns:
+        The decoded records.
+
+    Raises:
+        struct.error:
+            If the payload is truncated.
+        UnicodeDecodeError:
+            If a string is not valid UTF-8.
+    """
+    worker, offset = _read_string(payload, 0)
+    work_item, offset = _read_string(payload, offset)
+
+    prefix = None
+
+    if prefix_messages:
+        prefix = f"{worker} [{work_item}]" if work_item else worker
+
+    records = []
+
+    while offset < len(payload):
+        record, offset = _decode_record(payload, offset, worker, work_item, prefix)
+
+        records.append(record)
+
+    return records
+
+
+def encode_frame(header: bytes, records: list[bytes]) -> bytes:
+    """Encode a frame containing a batch of records.
+
+    Args:
+        header:
+            The encoded worker and work item names, from encode_header().
+        records:
+            The encoded records, from encode_record().
+
+    Returns:
+        The encoded frame.
+    """
+    payload = header + b"".join(records)
+
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def encode_header(worker: str, work_item: str) -> bytes:
+    """Encode the worker and work item names which start each frame payload.
+
+    Args:
+        worker:
+            The name of the worker process.
+        work_item:
+            The name of the work item the worker is processing.
+
+    Returns:
+        The encoded names.
+    """
+    return _encode_string(worker) + _encode_string(work_item)
+
+
+def encode_record(record: logging.LogRecord, formatter: logging.Formatter | None = None) -> bytes:
+    """Encode a record to send to a collector.
+
+    Args:
+        record:
+            The record to encode.
+        formatter:
+            Optional formatter used to format exception and stack information.
+
+    Returns:
+        The encoded record.
+    """
+    formatter = formatter or _DEFAULT_FORMATTER
+
+    exc_text = record.exc_text
+
+    if record.exc_info and not exc_text:
+        exc_text = formatter.formatException(record.exc_info)
+
+    stack_info = formatter.formatStack(record.stack_info) if record.stack_info else ""
+
+    parts = [
+        _RECORD_HEADER.pack(record.created, record.levelno, record.lineno or 0, record.process or 0),
+        _encode_string(record.name),
+        _encode_string(record.pathname),
+        _encode_string(record.funcName or ""),
+        _encode_string(record.threadName or ""),
+        _encode_string(record.getMessage()),
+        _encode_string(exc_text or ""),
+        _encode_string(stack_info),
+    ]
+
+    return b"".join(parts)
+
+
+def parse_address(address: str | tuple[str, int]) -> tuple[str, int]:
+    """Parse a collector address.
+
+    Args:
+        address:
+            A host:port string or a (host, port) tuple.
+
+    Returns:
+        The host and port.
+
+    Raises:
+        ValueError:
+            If the address is not a valid host:port string.
+    """
+    if isinstance(address, tuple):
+        return address
+
+    host, separator, port = address.rpartition(":")
+
+    if not separator or not host or not port.isdigit():
+        msg = f"Invalid collector address: {address!r}"
+        raise ValueError(msg)
+
+    return host, int(port)
+
+
+# Non-Public Functions
+
+
+def _decode_record(
+    payload: bytes, offset: int, worker: str, work_item: str, prefix: str | None
+) -> tuple[logging.LogRecord, int]:
+    """Decode the record starting at an offset in a frame payload.
+
+    Args:
+        payload:
+            The frame payload.
+        offset:
+            The offset of the start of the record.
+        worker:
+            The name of the worker which sent the frame.
+        work_item:
+            The name of the work item the worker was processing.
+        prefix:
+            The optional prefix for the message.
+
+    Returns:
+        The decoded record and the offset of the next one.
+    """
+    created, levelno, lineno, process = _RECORD_HEADER.unpack_from(payload, offset)
+    offset += _RECORD_HEADER.size
+
+    strings = {}
+
+    for field in _STRING_FIELDS:
+        strings[field], offset = _read_string(payload, offset)
+
+    filename, module = _split_pathname(strings["pathname"])
+
+    record = logging.makeLogRecord({
+        "name": strings["name"],
+        "levelno": levelno,
+        "levelname": logging.getLevelName(levelno),
+        "pathname": strings["pathname"],
+        "filename": filename,
+        "module": module,
+        "lineno": lineno,
+        "funcName": strings["funcName"],
+        "created": created,
+        "msecs": (created % 1) * 1000,
+        "threadName": strings["threadName"],
+        "process": process,
+        "msg": f"{prefix} - {strings['message']}" if prefix else strings["message"],
+        "exc_text": strings["exc_text"] or None,
+        "stack_info": strings["stack_info"] or None,
+        "worker": worker,
+        "work_item": work_item,
+    })
+
+    return record, offset
+
+
+def _encode_string(value: str) -> bytes:
+    """Encode a length prefixed string.
+
+    Args:
+        value:
+            The string to encode.
+
+    Returns:
+        The encoded string.
+    """
+    data = value.encode(errors="replace")
+
+    return _STRING_LENGTH.pack(len(data)) + data
+
+
+def _read_string(payload: bytes, offset: int) -> tuple[str, int]:
+    """Decode the length prefixed string starting at an offset in a frame payload.
+
+    Args:
+        payload:
+            The frame payload.
+        offset:
+            The offset of the length prefix.
+
+    Returns:
+        The decoded string and the offset of the end of it.
+
+    Raises:
+        struct.error:
+            If the string extends past the end of the payload.
+    """
+    (length,) = _STRING_LENGTH.unpack_from(payload, offset)
+    start = offset + _STRING_LENGTH.size
+    end = start + length
+
+    if end > len(payload):
+        msg = "string extends past the end of the payload"
+        raise struct.error(msg)
+
+    return payload[start:end].decode(), end
+
+
+@lru_cache(maxsize=1024)
+def _split_pathname(pathname: str) -> tuple[str, str]:
+    """Get the file and module names of a record's path.
+
+    Args:
+        pathname:
+            The path of the source file.
+
+    Returns:
+        The file name and module name.
+    """
+    path = pathlib.PurePath(pathname)
+
+    return path.name, path.stem
@@ -0,0 +1,374 @@
+"""Custom logging handler which forwards records to a collector in another process."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import collections
+import dataclasses
+import logging
+import os
+import socket
+import threading
+import time
+
+# Houdini Logging Tools
+from houdini_logging_tools.forwarding import (
+    COLLECTOR_ADDRESS_ENV,
+    encode_frame,
+    encode_header,
+    encode_record,
+    parse_address,
+)
+from houdini_logging_tools.queueing import BatchDispatcher, DropPolicy
+
+# Globals
+
+WORK_ITEM_ENV = "PDG_ITEM_NAME"
+"""Environment variable containing the name of the PDG work item being processed."""
+
+# Classes
+
+
+class ForwardingHandler(logging.Handler):
+    """Custom handler which forwards records to a LogCollector over a local connection.
+
+    This allows records logged by worker processes, such as hython processes cooking
+    PDG work items, to be displayed by the Houdini session running the collector.
+
+    Records are encoded when they are emitted and placed on a bounded queue.  A
+    background thread sends them to the collector in batches.  If the collector is
+    slower than the records are logged the queue fills and the drop policy decides
+    whether to block the logging threads or discard records.
+
+    If the collector cannot be reached, or the connection is lost, the handler keeps
+    up to queue_size records which have not been sent and tries to connect again
+    after a delay.  The delay doubles after each failed attempt, up to a maximum.  A
+    send which times out keeps the connection and carries on from where it stopped
+    after the same delay.  The retries are made from a timer, so records are sent
+    without waiting for more to be logged.
+
+    Args:
+        address:
+            The host:port string or (host, port) tuple of the collector.  Defaults to
+            the address in the HOUDINI_LOGGING_TOOLS_COLLECTOR environment variable.
+        worker:
+            The name of the worker, which defaults to the host name and process id.
+        work_item:
+            The name of the work item being processed.  Defaults to the name in the
+            PDG_ITEM_NAME environment variable, if any.
+        options:
+            Optional options for the handler.  Defaults to ForwardingOptions().
+
+    Raises:
+        ValueError:
+            If no address is passed or set in the environment.
+    """
+
+    def __init__(
+        self,
+        address: str | tuple[str, int] | None = None,
+        *,
+        worker: str | None = None,
+        work_item: str | None = None,
+        options: ForwardingOptions | None = None,
+    ) -> None:
+        super().__init__()
+
+        if address is None:
+            address = os.environ.get(COLLECTOR_ADDRESS_ENV)
+
+            if not address:
+                msg = f"No collector address passed or set in ${COLLECTOR_ADDRESS_ENV}"
+                raise ValueError(msg)
+
+        if options is None:
+            options = ForwardingOptions()
+
+        if worker is None:
+            worker = f"{socket.gethostname()}:{os.getpid()}"
+
+        if work_item is None:
+            work_item = os.environ.get(WORK_ITEM_ENV, "")
+
+        self._address = parse_address(address)
+        self._header = encode_header(worker, work_item)
+        self._max_retry_delay = options.max_retry_delay
+        self._next_retry_delay = options.retry_delay
+        self._retry_delay = options.retry_delay
+        self._retry_time = 0.0
+        self._retry_timer: threading.Timer | None = None
+        self._send_lock = threading.Lock()
+        self._socket: socket.socket | None = None
+        self._timeout = options.timeout
+        self._unsent: collections.deque[tuple[bytes, int]] = collections.deque()
+        self._unsent_count = 0
+        self._unsent_dropped = 0
+        self._unsent_limit = options.queue_size
+        self._unsent_offset = 0
+        self._work_item = work_item
+        self._worker = worker
+
+        self._dispatcher = BatchDispatcher(
+            self._send_records,
+            name=f"{self.__class__.__name__}-send",
+            max_size=options.queue_size,
+            drop_policy=options.drop_policy,
+            batch_size=options.batch_size,
+        )
+
+    # Properties
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """The host and port of the collector."""
+        return self._address
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def connected(self) -> bool:
+        """Whether the handler is connected to the collector."""
+        return self._socket is not None
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def dropped(self) -> int:
+        """The number of records discarded due to the queue being full or the collector being unreachable."""
+        return self._dispatcher.dropped + self._unsent_dropped
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def work_item(self) -> str:
+        """The name of the work item being processed."""
+        return self._work_item
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def worker(self) -> str:
+        """The name of the worker."""
+        return self._worker
+
+    # Non-Public Methods
+
+    def _back_off(self) -> None:
+        """Wait before trying again, for longer after each failed attempt."""
+        self._retry_time = time.monotonic() + self._next_retry_delay
+        self._next_retry_delay = min(self._next_retry_delay * 2, self._max_retry_delay)
+
+    def _connect(self) -> socket.socket | None:
+        """Get the connection to the collector, connecting if it is time to try again.
+
+        Returns:
+            The connection, or None if the collector cannot be reached.
+        """
+        if self._socket is not None:
+            return self._socket
+
+        now = time.monotonic()
+
+        if now < self._retry_time:
+            return None
+
+        try:
+            self._socket = socket.create_connection(self._address, timeout=self._timeout)
+
+        except OSError:
+            self._back_off()
+
+            return None
+
+        self._next_retry_delay = self._retry_delay
+        self._retry_time = 0.0
+
+        return self._socket
+
+    def _disconnect(self) -> None:
+        """Close the connection to the collector."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+        # The collector discards any partially sent frame, so it is sent again in full.
+        self._unsent_offset = 0
+
+    def _retry(self) -> None:
+        """Timer callback which tries to send the unsent frames again."""
+        with self._send_lock:
+            # The handler was closed while the timer was waiting for the lock.
+            if self._retry_timer is None:
+                return
+
+            self._retry_timer = None
+
+            self._send_unsent()
+
+    def _schedule_retry(self) -> None:
+        """Start a timer to try sending again once the retry delay has passed.
+
+        This must be called while holding the send lock.
+        """
+        timer = threading.Timer(max(self._retry_time - time.monotonic(), 0.0), self._retry)
+        timer.daemon = True
+        timer.start()
+
+        self._retry_timer = timer
+
+    def _send_frame(self, connection: socket.socket, frame: bytes) -> None:
+        """Send the rest of a frame, keeping track of how much has been sent.
+
+        Unlike sendall(), the amount sent is known when a send times out, so the
+        frame can be carried on with later over the same connection.
+
+        Args:
+            connection:
+                The connection to the collector.
+            frame:
+                The frame to send.
+        """
+        view = memoryview(frame)
+
+        while self._unsent_offset < len(frame):
+            self._unsent_offset += connection.send(view[self._unsent_offset :])
+
+        self._unsent_offset = 0
+
+    def _send_records(self, records: list[bytes]) -> None:
+        """Send a batch of encoded records, along with any which could not be sent earlier.
+
+        This is called from the dispatcher thread.
+
+        Args:
+            records:
+                The encoded records.
+        """
+        with self._send_lock:
+            self._unsent.append((encode_frame(self._header, records), len(records)))
+            self._unsent_count += len(records)
+
+            # Keep the newest records if the collector has been unreachable for a while.
+            while self._unsent_count > self._unsent_limit:
+                # A partially sent frame can only be discarded along with the connection.
+                if self._unsent_offset:
+                    self._disconnect()
+
+                _, count = self._unsent.popleft()
+
+                self._unsent_count -= count
+                self._unsent_dropped += count
+
+            # While waiting to retry the timer sends the new frame after the others.
+            if self._retry_timer is None:
+                self._send_unsent()
+
+    def _send_unsent(self, *, retry: bool = True) -> None:
+        """Send the frames which have not been sent, retrying later if they cannot be.
+
+        This must be called while holding the send lock.
+
+        Args:
+            retry:
+                Whether to schedule another attempt if the frames cannot all be sent.
+        """
+        while self._unsent:
+            connection = self._connect()
+
+            if connection is None:
+                if retry:
+                    self._schedule_retry()
+
+                return
+
+            frame, count = self._unsent[0]
+
+            try:
+                self._send_frame(connection, frame)
+
+            except TimeoutError:
+                # The collector is reading slowly rather than gone, so keep the
+                # connection and carry on with the frame after a delay.
+                self._back_off()
+
+                if retry:
+                    self._schedule_retry()
+
+                return
+
+            except OSError:
+                # Try the same frame again once the collector can be reached.
+                self._disconnect()
+                self._back_off()
+
+                continue
+
+            self._unsent.popleft()
+            self._unsent_count -= count
+            self._next_retry_delay = self._retry_delay
+
+    # Methods
+
+    def close(self) -> None:
+        """Send any queued records and close the connection to the collector."""
+        try:
+            self._dispatcher.stop()
+
+            with self._send_lock:
+                if self._retry_timer is not None:
+                    self._retry_timer.cancel()
+                    self._retry_timer = None
+
+                # Make a final attempt to send anything left over, even if still
+                # waiting to try again.
+                self._retry_time = 0.0
+                self._send_unsent(retry=False)
+
+                self._disconnect()
+
+        finally:
+            super().close()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a log message.
+
+        Args:
+            record:
+                The log record to emit.
+        """
+        try:
+            self._dispatcher.put(encode_record(record, self.formatter))
+
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Wait for any queued records to be sent, or kept if the collector cannot be reached."""
+        self._dispatcher.flush()
+
+
+@dataclasses.dataclass(frozen=True)
+class ForwardingOptions:
+    """Options for a ForwardingHandler.
+
+    >>> handler = ForwardingHandler(options=ForwardingOptions(queue_size=50000, max_retry_delay=10.0))
+    """
+
+    queue_size: int = 10000
+    """The maximum number of records which can be waiting to be sent."""
+
+    drop_policy: DropPolicy | str = DropPolicy.DROP_OLDEST
+    """How to handle records when the queue is full."""
+
+    batch_size: int = 100
+    """The maximum number of records sent at once."""
+
+    timeout: float = 5.0
+    """The number of seconds to wait when connecting or sending before trying again later."""
+
+    retry_delay: float = 0.5
+    """The number of seconds to wait before trying again after the first failure."""
+
+    max_retry_delay: float = 30.0
+    """The maximum number of seconds to wait before trying again."""
@@ -1,28 +1,460 @@
 """Custom logging stream handler which writes to the Houdini logging API."""
 
+# Future
+from __future__ import annotations
+
 # Standard Library
+import collections
+import copy
+import dataclasses
+import datetime
 import logging
+import threading
+import time
+from typing import TYPE_CHECKING
 
 # Houdini Logging Tools
-from houdini_logging_tools.mappings import LOGGING_TO_SEVERITY_MAP
+from houdini_logging_tools.formatting import TracebackCache, format_record
+from houdini_logging_tools.lazy import hou, is_hou_available
+from houdini_logging_tools.mappings import get_severity
+from houdini_logging_tools.metrics import count, instrument
+from houdini_logging_tools.queueing import BatchDispatcher, DropPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
 
-# Houdini
-import hou
+# Globals
+
+DEFAULT_CONTEXT_FORMAT = "{name} | {module}.{funcName}:{lineno}"
+"""The default format of the source context for log entries."""
 
 # Classes
 
 
 class HoudiniLoggingHandler(logging.StreamHandler):
-    """Custom stream handler which outputs to the Houdini logging API."""
+    """Custom stream handler which outputs to the Houdini logging API.
+
+    When queued, emit() only places the record on a bounded queue and a background
+    thread formats the records and sends them to hou.logging in batches.  Any queued
+    records are sent when the handler is flushed or closed, which the logging module
+    does for all handlers when the session exits.
+
+    When a coalesce window is set, records with the same logger, call site, level and
+    message are held for the length of the window after the first one is seen.  When
+    the window closes a single entry is sent which includes the number of times the
+    message was repeated and when it was first and last seen.
+
+    The source context of each entry is generated from the context format using the
+    record's call site fields: name, module, funcName, lineno, pathname and filename.
+    Since a call site always generates the same context the results are cached.
+
+    By default all records are sent to a single source named after the handler class.
+    When source routing is set, each record is instead sent to a source chosen by its
+    logger name, either using a mapping of logger names to sources, where the closest
+    ancestor logger in the mapping is used, or a callable such as top_level_package().
+    The source of each logger name is cached.
 
-    def __init__(self, stream=None) -> None:  # type: ignore
+    With a traceback cache, only the first record of each distinct exception traceback
+    includes the full traceback and repeats include a short reference to it.
+
+    Each log source is created when the first record is sent to it rather than when
+    the handler is created, so the handler can be configured before hou is imported.
+    If hou is not available the formatted records are written to the stream instead,
+    like a logging.StreamHandler.
+
+    Args:
+        stream:
+            Optional stream for the handler.
+        options:
+            Optional options for the handler.  Defaults to HoudiniLoggingOptions().
+    """
+
+    def __init__(self, stream=None, *, options: HoudiniLoggingOptions | None = None) -> None:  # type: ignore
         super().__init__(stream=stream)
 
-        # Create a new source for the handler to emit to.
-        hou.logging.createSource(self.__class__.__name__)
+        if options is None:
+            options = HoudiniLoggingOptions()
+
+        self._coalesce_window = options.coalesce_window
+        self._coalesce_lock = threading.Lock()
+        self._coalesce_timer: threading.Timer | None = None
+        self._coalesced: dict[tuple, _CoalescedRecord] = {}
+        self._context_cache: collections.OrderedDict[tuple, str] = collections.OrderedDict()
+        self._context_cache_size = options.context_cache_size
+        self._context_format = options.context_format
+        self._context_lock = threading.Lock()
+        self._created_sources: set[str] = set()
+        self._dispatcher: BatchDispatcher | None = None
+        self._source_routing = options.source_routing
+        self._sources: dict[str, str] = {}
+        self._traceback_cache = options.traceback_cache
+
+        if options.queued:
+            self._dispatcher = BatchDispatcher(
+                self._log_records,
+                name=f"{self.__class__.__name__}-dispatch",
+                max_size=options.queue_size,
+                drop_policy=options.drop_policy,
+                batch_size=options.batch_size,
+                on_drop=self._count_dropped,
+            )
+
+    # Properties
+
+    @property
+    def coalesce_window(self) -> float | None:
+        """The number of seconds repeated records are combined for."""
+        return self._coalesce_window
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def context_format(self) -> str:
+        """The format of the source context for log entries."""
+        return self._context_format
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def queued(self) -> bool:
+        """Whether records are sent to hou.logging from a background thread."""
+        return self._dispatcher is not None
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def source_routing(self) -> Mapping[str, str] | Callable[[str], str | None] | None:
+        """The mapping or callable which chooses the source of each logger."""
+        return self._source_routing
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def traceback_cache(self) -> TracebackCache | None:
+        """Optional cache used to deduplicate exception tracebacks."""
+        return self._traceback_cache
+
+    # Non-Public Methods
+
+    def _coalesce(self, record: logging.LogRecord, message: str | None = None) -> None:
+        """Send a record unless it repeats one sent within the coalesce window.
+
+        The first record of each window is sent immediately while its repeats are
+        only counted, to be summarized when the window closes.
+
+        Args:
+            record:
+                The log record to add.
+            message:
+                Optional already formatted message for the record.
+        """
+        key = (record.name, record.pathname, record.lineno, record.levelno, record.getMessage())
+        window = self._coalesce_window or 0.0
+        now = time.monotonic()
+
+        expired = None
+
+        with self._coalesce_lock:
+            pending = self._coalesced.get(key)
+
+            # The window closed but the timer has not fired yet so summarize the
+            # existing repeats before starting a new window.
+            if pending is not None and pending.deadline <= now:
+                expired = self._coalesced.pop(key)
+                pending = None
+
+            if pending is None:
+                self._coalesced[key] = _CoalescedRecord(record, message, now + window)
+
+                if self._coalesce_timer is None:
+                    self._schedule_coalesce_timer(window)
+
+            else:
+                pending.add_repeat(record)
+
+        if expired is not None:
+            self._log_coalesced(expired)
+
+        if pending is None:
+            self._log_record(record, message)
+
+    def _count_dropped(self) -> None:
+        """Count a record discarded due to the queue being full."""
+        count(self.__class__.__name__, "dropped")
+
+    def _create_source(self, source: str) -> bool:
+        """Create a source for the handler to emit to.
+
+        Args:
+            source:
+                The name of the source.
+
+        Returns:
+            Whether the source was created, which is only False if hou is not available.
+        """
+        if not is_hou_available():
+            return False
+
+        hou.logging.createSource(source)
+        self._created_sources.add(source)
+
+        return True
+
+    def _flush_coalesced(self, *, force: bool = False) -> None:
+        """Send any pending repeated records whose window has closed.
+
+        Args:
+            force:
+                Whether to send all pending records regardless of their window.
+        """
+        now = time.monotonic()
+
+        with self._coalesce_lock:
+            if self._coalesce_timer is not None:
+                self._coalesce_timer.cancel()
+                self._coalesce_timer = None
+
+            expired = [key for key, pending in self._coalesced.items() if force or pending.deadline <= now]
+            flushed = [self._coalesced.pop(key) for key in expired]
+
+            if self._coalesced:
+                next_deadline = min(pending.deadline for pending in self._coalesced.values())
+                self._schedule_coalesce_timer(max(next_deadline - now, 0))
+
+        for pending in flushed:
+            self._log_coalesced(pending)
+
+    def _get_source(self, name: str) -> str:
+        """Get the source for a logger.
+
+        Args:
+            name:
+                The logger name.
+
+        Returns:
+            The source name.
+        """
+        source = self._sources.get(name)
+
+        if source is None:
+            source = self._sources[name] = self._route_source(name) or self.__class__.__name__
+
+        return source
+
+    def _get_source_context(self, record: logging.LogRecord) -> str:
+        """Get the source context for a record.
+
+        Args:
+            record:
+                The log record to get the context for.
+
+        Returns:
+            The source context.
+        """
+        key = (record.name, record.pathname, record.lineno)
+        cache = self._context_cache
+
+        # Records are sent from the dispatcher and coalesce timer threads as well as
+        # the logging threads, so the cache order must only be changed under the lock.
+        with self._context_lock:
+            context = cache.get(key)
+
+            if context is not None:
+                cache.move_to_end(key)
+
+                return context
+
+        context = self._context_format.format(
+            name=record.name,
+            module=record.module,
+            funcName=record.funcName,
+            lineno=record.lineno,
+            pathname=record.pathname,
+            filename=record.filename,
+        )
+
+        with self._context_lock:
+            cache[key] = context
+
+            if len(cache) > self._context_cache_size:
+                cache.popitem(last=False)
+
+        return context
+
+    def _handle_record(self, record: logging.LogRecord, message: str | None = None) -> None:
+        """Send a record to hou.logging, combining it with repeated records if enabled.
+
+        Args:
+            record:
+                The log record to handle.
+            message:
+                Optional already formatted message for the record.
+        """
+        if self._coalesce_window:
+            self._coalesce(record, message)
+
+        else:
+            self._log_record(record, message)
+
+    def _log_coalesced(self, pending: _CoalescedRecord) -> None:
+        """Send a summary of a record's repeats to hou.logging, if it was repeated.
+
+        Args:
+            pending:
+                The record whose repeats should be summarized.
+        """
+        if not pending.count:
+            return
+
+        record = pending.record
+
+        try:
+            message = self.format(record) if pending.message is None else pending.message
+
+            self._log_record(record, f"{message} {_describe_repeats(pending)}")
+
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    def _log_record(self, record: logging.LogRecord, message: str | None = None) -> None:
+        """Send a record to hou.logging, or the stream if hou is not available.
+
+        Args:
+            record:
+                The log record to send.
+            message:
+                Optional message to send instead of the formatted record.
+        """
+        if message is None:
+            message = self.format(record)
+
+        source = self._get_source(record.name)
+
+        if source not in self._created_sources and not self._create_source(source):
+            self._write_stream(message)
+
+            return
+
+        entry = hou.logging.LogEntry(
+            message=message,
+            source_context=self._get_source_context(record),
+            severity=get_severity(record.levelno),
+            time=record.created,
+        )
+
+        hou.logging.log(entry, source)
+
+    @instrument("dispatch")
+    def _log_records(self, items: list[tuple[logging.LogRecord, str]]) -> None:
+        """Send a batch of queued records to hou.logging.
+
+        Args:
+            items:
+                The prepared log records to send, with their formatted messages.
+        """
+        for record, message in items:
+            try:
+                self._handle_record(record, message)
+
+            except Exception:  # noqa: BLE001
+                self.handleError(record)
+
+    def _prepare(self, record: logging.LogRecord) -> tuple[logging.LogRecord, str]:
+        """Prepare a record to be queued, in the same way as QueueHandler.prepare().
+
+        The record is formatted in the logging thread, as its args may be changed once
+        the log call returns, and a copy is queued with its message merged into it so
+        the background thread never formats it again.
+
+        Args:
+            record:
+                The log record to prepare.
+
+        Returns:
+            The copied record and its formatted message.
+        """
+        msg = record.getMessage()
+        message = self.format(record)
+
+        record = copy.copy(record)
+        record.msg = msg
+        record.args = None
+        record.exc_info = None
+
+        return record, message
+
+    def _route_source(self, name: str) -> str | None:
+        """Choose the source for a logger using the source routing.
+
+        Args:
+            name:
+                The logger name.
+
+        Returns:
+            The source name, or None to use the default source.
+        """
+        routing = self._source_routing
+
+        if routing is None:
+            return None
+
+        if callable(routing):
+            return routing(name)
+
+        # Walk up the logger hierarchy to find the closest mapped logger.
+        while name:
+            source = routing.get(name)
+
+            if source is not None:
+                return source
+
+            name = name.rpartition(".")[0]
+
+        return None
+
+    def _schedule_coalesce_timer(self, delay: float) -> None:
+        """Start a timer to send pending repeated records.
+
+        This must be called while holding the coalesce lock.
+
+        Args:
+            delay:
+                The number of seconds to wait before sending.
+        """
+        timer = threading.Timer(delay, self._flush_coalesced)
+        timer.daemon = True
+        timer.start()
+
+        self._coalesce_timer = timer
+
+    def _write_stream(self, message: str) -> None:
+        """Write a message to the stream when hou is not available.
+
+        Args:
+            message:
+                The formatted message.
+        """
+        stream = self.stream
+
+        stream.write(message + self.terminator)
+
+        # Flush the stream itself as flush() waits for queued records, which would
+        # deadlock when called from the dispatcher thread.
+        if hasattr(stream, "flush"):
+            stream.flush()
 
     # Methods
 
+    def close(self) -> None:
+        """Send any queued records and close the handler."""
+        if self._dispatcher is not None:
+            self._dispatcher.stop()
+
+        self._flush_coalesced(force=True)
+
+        super().close()
+
+    @instrument("emit", records=True)
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log message.
 
@@ -30,13 +462,170 @@ class HoudiniLoggingHandler(logging.StreamHandler):
             record:
                 The log record to emit.
         """
-        context = f"{record.name} | {record.module}.{record.funcName}:{record.lineno}"
+        if self._dispatcher is not None:
+            self._dispatcher.put(self._prepare(record))
 
-        entry = hou.logging.LogEntry(
-            message=self.format(record),
-            source_context=context,
-            severity=LOGGING_TO_SEVERITY_MAP[record.levelname.lower()],
-            time=record.created,
-        )
+            return
+
+        self._handle_record(record)
+
+    def flush(self) -> None:
+        """Wait for any queued or repeated records to be sent and flush the stream."""
+        if self._dispatcher is not None:
+            self._dispatcher.flush()
+
+        self._flush_coalesced(force=True)
+
+        super().flush()
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record, reusing the output of any handler with the same formatter.
+
+        Args:
+            record:
+                The log record to format.
+
+        Returns:
+            The formatted record.
+        """
+        return format_record(self, record, self._traceback_cache)
+
+    def handleError(self, record: logging.LogRecord) -> None:
+        """Count the error and handle it as normal.
+
+        Args:
+            record:
+                The log record which could not be handled.
+        """
+        count(self.__class__.__name__, "errors")
+
+        super().handleError(record)
+
+
+@dataclasses.dataclass(frozen=True)
+class HoudiniLoggingOptions:
+    """Options for a HoudiniLoggingHandler.
+
+    >>> handler = HoudiniLoggingHandler(options=HoudiniLoggingOptions(queued=True, coalesce_window=2.0))
+    """
+
+    queued: bool = False
+    """Whether to send records to hou.logging from a background thread."""
+
+    queue_size: int = 10000
+    """The maximum number of records which can be waiting to be sent."""
+
+    drop_policy: DropPolicy | str = DropPolicy.DROP_OLDEST
+    """How to handle records when the queue is full."""
+
+    batch_size: int = 100
+    """The maximum number of records sent by the background thread at once."""
+
+    coalesce_window: float | None = None
+    """Optional number of seconds to combine repeated records for."""
+
+    context_format: str = DEFAULT_CONTEXT_FORMAT
+    """The format of the source context for log entries."""
+
+    context_cache_size: int = 1024
+    """The maximum number of call site source contexts to cache."""
+
+    source_routing: Mapping[str, str] | Callable[[str], str | None] | None = None
+    """Optional mapping of logger names to source names, or callable returning them.
+
+    Loggers without a source are sent to the default source.
+    """
+
+    traceback_cache: TracebackCache | None = None
+    """Optional cache to deduplicate exception tracebacks with."""
+
+
+# Non-Public Classes
+
+
+class _CoalescedRecord:
+    """A sent record whose repeats are being counted.
+
+    Args:
+        record:
+            The record which was sent.
+        message:
+            Optional already formatted message for the record.
+        deadline:
+            The monotonic time when the coalesce window closes.
+    """
+
+    __slots__ = ("count", "deadline", "first", "last", "message", "record")
+
+    def __init__(self, record: logging.LogRecord, message: str | None, deadline: float) -> None:
+        self.count = 0
+        self.deadline = deadline
+        self.first = 0.0
+        self.last = 0.0
+        self.message = message
+        self.record = record
+
+    def add_repeat(self, record: logging.LogRecord) -> None:
+        """Count a repeat of the record.
+
+        Args:
+            record:
+                The repeated record.
+        """
+        if not self.count:
+            self.first = record.created
+
+        self.count += 1
+        self.last = record.created
+
+
+# Non-Public Functions
+
+
+def _describe_repeats(pending: _CoalescedRecord) -> str:
+    """Describe how many times a record was repeated and when.
+
+    Args:
+        pending:
+            The repeated record.
+
+    Returns:
+        The description of the repeats.
+    """
+    if pending.count == 1:
+        return f"(repeated once more at {_format_time(pending.first)})"
+
+    return (
+        f"(repeated {pending.count} more times between {_format_time(pending.first)} and {_format_time(pending.last)})"
+    )
+
+
+def _format_time(created: float) -> str:
+    """Format a record creation time for display.
+
+    Args:
+        created:
+            The record creation time.
+
+    Returns:
+        The formatted time.
+    """
+    return datetime.datetime.fromtimestamp(created).strftime("%H:%M:%S.%f")[:-3]
+
+
+# Functions
+
+
+def top_level_package(name: str) -> str:
+    """Get the top-level package of a logger name, for use as source routing.
+
+    >>> handler = HoudiniLoggingHandler(options=HoudiniLoggingOptions(source_routing=top_level_package))
+
+    Args:
+        name:
+            The logger name.
 
-        hou.logging.log(entry, self.__class__.__name__)
+    Returns:
+        The first part of the logger name.
+    """
+    return name.partition(".")[0]
@@ -0,0 +1,445 @@
+"""Custom logging handler which writes records to rotating JSON lines files."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import copy
+import dataclasses
+import datetime
+import gzip
+import json
+import logging
+import pathlib
+import re
+import shutil
+import time
+from typing import TYPE_CHECKING, BinaryIO
+
+# Houdini Logging Tools
+from houdini_logging_tools.mappings import get_severity
+from houdini_logging_tools.queueing import BatchDispatcher, DropPolicy
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+
+# Globals
+
+# The formatter used to format exceptions for handlers which do not have one set.
+_DEFAULT_FORMATTER = logging.Formatter()
+
+# Encoder for the entries.  Values which are not JSON types, such as objects passed
+# in the extra fields, are written as their string representation.
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+
+# The format of the timestamp in the names of rotated files.
+_ROTATED_TIME_FORMAT = "%Y%m%d-%H%M%S"
+
+# Classes
+
+
+class JsonLinesHandler(logging.Handler):
+    """Custom handler which writes records to a file as one JSON object per line.
+
+    Each line contains the record's time, level, Houdini severity, logger name,
+    message, the node path added by HoudiniLoggerAdapter and the call site of the
+    logging call, along with any formatted exception and stack information and any
+    of the extra fields which are set on the record:
+
+        {"time": "2026-10-18T11:52:26.123+00:00", "level": "INFO", "severity": "ImportantMessage",
+         "logger": "render", "message": "Rendered frame 12", "node_path": "/out/karma1",
+         "module": "render", "function": "render_frame", "line": 42, "path": "/tools/render.py",
+         "process": 1234, "thread": "MainThread"}
+
+    emit() only renders the record's message and exception and places a copy of it on
+    a bounded queue.  A background thread converts the queued records to JSON and
+    writes them in batches, with one write per batch.  The file is opened by the
+    background thread when the first batch is written.
+
+    The file is rotated when writing a batch would make it larger than max_bytes, or
+    when it has been open for longer than rotate_interval.  The current file is
+    renamed with the time of the rotation, for example "render.jsonl" is renamed to
+    "render.20261018-115226.jsonl", and a new file is started.  Rotated files are
+    compressed with gzip on a second background thread so that writing is never held
+    up, and only the newest backup_count rotated files are kept.
+
+    A file should only be written to by a single handler.
+
+    Args:
+        filename:
+            The path of the file to write to.
+        options:
+            Optional options for the handler.  Defaults to JsonLinesOptions().
+    """
+
+    def __init__(self, filename: str | os.PathLike, *, options: JsonLinesOptions | None = None) -> None:
+        super().__init__()
+
+        if options is None:
+            options = JsonLinesOptions()
+
+        path = pathlib.Path(filename).absolute()
+
+        self._backup_count = options.backup_count
+        self._buffer_size = options.buffer_size
+        self._compress = options.compress
+        self._extra_fields = tuple(options.extra_fields)
+        self._max_bytes = options.max_bytes
+        self._path = path
+        self._rotate_interval = options.rotate_interval
+        self._rotate_time = 0.0
+        self._rotated_pattern = re.compile(
+            rf"{re.escape(path.stem)}\.(\d{{8}}-\d{{6}})(?:-(\d+))?{re.escape(path.suffix)}(?:\.gz)?"
+        )
+        self._size = 0
+        self._stream: BinaryIO | None = None
+        self._time_prefix = ""
+        self._time_second = -1
+
+        self._dispatcher = BatchDispatcher(
+            self._write_records,
+            name=f"{self.__class__.__name__}-write",
+            max_size=options.queue_size,
+            drop_policy=options.drop_policy,
+            batch_size=options.batch_size,
+        )
+
+        # Rotated files are compressed one at a time in the order they were rotated.
+        self._compressor = BatchDispatcher(
+            self._compress_files,
+            name=f"{self.__class__.__name__}-compress",
+            drop_policy=DropPolicy.BLOCK,
+            batch_size=1,
+        )
+
+    # Properties
+
+    @property
+    def dropped(self) -> int:
+        """The number of records discarded due to the queue being full."""
+        return self._dispatcher.dropped
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def path(self) -> pathlib.Path:
+        """The path of the file being written to."""
+        return self._path
+
+    # Non-Public Methods
+
+    def _close_stream(self) -> None:
+        """Close the file, if it is open."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _compress_files(self, paths: list[pathlib.Path]) -> None:
+        """Compress rotated files and remove any old ones.
+
+        This is called from the compressor thread.
+
+        Args:
+            paths:
+                The rotated files to compress.
+        """
+        for path in paths:
+            try:
+                compressed_path = path.with_name(f"{path.name}.gz")
+
+                with path.open("rb") as source, gzip.open(compressed_path, "wb") as target:
+                    shutil.copyfileobj(source, target, self._buffer_size)
+
+                path.unlink()
+
+            except Exception:  # noqa: BLE001
+                self.handleError(logging.makeLogRecord({"msg": "Could not compress %s", "args": (path,)}))
+
+        self._remove_old_files()
+
+    def _encode_record(self, record: logging.LogRecord) -> str:
+        """Convert a prepared record to a line of JSON.
+
+        Args:
+            record:
+                The prepared log record to convert.
+
+        Returns:
+            The JSON object, without a line ending.
+        """
+        severity = get_severity(record.levelno)
+
+        entry = {
+            "time": self._format_time(record),
+            "level": record.levelname,
+            "severity": severity.name() if severity is not None else None,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "node_path": getattr(record, "node_path", None),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "path": record.pathname,
+            "process": record.process,
+            "thread": record.threadName,
+        }
+
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+
+        attributes = record.__dict__
+
+        for name in self._extra_fields:
+            if name in attributes:
+                entry[name] = attributes[name]
+
+        return _ENCODER.encode(entry)
+
+    def _format_time(self, record: logging.LogRecord) -> str:
+        """Format a record's creation time as an ISO 8601 UTC time.
+
+        Records are usually logged many times a second so the date and time up to
+        the second are only formatted when they change.
+
+        Args:
+            record:
+                The log record.
+
+        Returns:
+            The formatted time, with the same milliseconds as logging.Formatter.
+        """
+        second = int(record.created)
+
+        if second != self._time_second:
+            self._time_prefix = datetime.datetime.fromtimestamp(second, datetime.UTC).strftime("%Y-%m-%dT%H:%M:%S")
+            self._time_second = second
+
+        return f"{self._time_prefix}.{int(record.msecs):03d}+00:00"
+
+    def _open_stream(self) -> BinaryIO:
+        """Get the file, opening it if it is not open.
+
+        Returns:
+            The open file.
+        """
+        if self._stream is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+
+            stream = self._path.open("ab", buffering=self._buffer_size)
+
+            self._size = stream.tell()
+
+            if self._rotate_interval:
+                self._rotate_time = time.time() + self._rotate_interval
+
+            self._stream = stream
+
+        return self._stream
+
+    def _prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare a record to be queued, in the same way as QueueHandler.prepare().
+
+        The message and exception are rendered in the logging thread, as the record's
+        args may be changed once the log call returns and the other handlers may set
+        or clear its exc_text, and a copy is queued with them merged into it.  The
+        formatted exception is not cached on the record as it is shared with the other
+        handlers.
+
+        Args:
+            record:
+                The log record to prepare.
+
+        Returns:
+            The copied record.
+        """
+        msg = record.getMessage()
+        exc_text = record.exc_text
+
+        if record.exc_info and not exc_text:
+            exc_text = (self.formatter or _DEFAULT_FORMATTER).formatException(record.exc_info)
+
+        record = copy.copy(record)
+        record.msg = msg
+        record.args = None
+        record.exc_info = None
+        record.exc_text = exc_text
+
+        return record
+
+    def _remove_old_files(self) -> None:
+        """Remove the oldest rotated files so that at most backup_count are kept."""
+        if self._backup_count is None:
+            return
+
+        rotated = []
+
+        for path in self._path.parent.iterdir():
+            match = self._rotated_pattern.fullmatch(path.name)
+
+            if match is not None:
+                rotated.append((match.group(1), int(match.group(2) or 0), path.name.endswith(".gz"), path))
+
+        rotated.sort()
+
+        for *_, path in rotated[: max(len(rotated) - self._backup_count, 0)]:
+            path.unlink(missing_ok=True)
+
+    def _rotate(self) -> None:
+        """Rename the current file and pass it to be compressed."""
+        self._close_stream()
+
+        timestamp = time.strftime(_ROTATED_TIME_FORMAT)
+        stem = f"{self._path.stem}.{timestamp}"
+        rotated_path = self._path.with_name(f"{stem}{self._path.suffix}")
+        index = 0
+
+        # Files rotated within the same second are numbered.
+        while rotated_path.exists() or rotated_path.with_name(f"{rotated_path.name}.gz").exists():
+            index += 1
+            rotated_path = self._path.with_name(f"{stem}-{index}{self._path.suffix}")
+
+        self._path.replace(rotated_path)
+
+        if self._compress:
+            self._compressor.put(rotated_path)
+
+        else:
+            self._remove_old_files()
+
+    def _should_rotate(self, size: int) -> bool:
+        """Check whether the file should be rotated before writing.
+
+        Args:
+            size:
+                The number of bytes about to be written.
+
+        Returns:
+            Whether the file should be rotated.
+        """
+        if not self._size:
+            return False
+
+        if self._max_bytes and self._size + size > self._max_bytes:
+            return True
+
+        return bool(self._rotate_interval) and time.time() >= self._rotate_time
+
+    def _write_data(self, data: bytes) -> None:
+        """Write encoded lines to the file, rotating it first if needed.
+
+        Args:
+            data:
+                The encoded lines.
+        """
+        stream = self._open_stream()
+
+        if self._should_rotate(len(data)):
+            self._rotate()
+
+            stream = self._open_stream()
+
+        stream.write(data)
+        stream.flush()
+
+        self._size += len(data)
+
+    def _write_records(self, records: list[logging.LogRecord]) -> None:
+        """Write a batch of queued records to the file.
+
+        This is called from the dispatcher thread.
+
+        Args:
+            records:
+                The log records to write.
+        """
+        lines = []
+
+        for record in records:
+            try:
+                lines.append(self._encode_record(record))
+
+            except Exception:  # noqa: BLE001
+                self.handleError(record)
+
+        if not lines:
+            return
+
+        lines.append("")
+
+        try:
+            self._write_data("\n".join(lines).encode())
+
+        except Exception:  # noqa: BLE001
+            self.handleError(records[-1])
+
+    # Methods
+
+    def close(self) -> None:
+        """Write any queued records, close the file and finish compressing rotated files."""
+        try:
+            self._dispatcher.stop()
+            self._close_stream()
+            self._compressor.stop()
+
+        finally:
+            super().close()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a log message.
+
+        Args:
+            record:
+                The log record to emit.
+        """
+        try:
+            prepared = self._prepare(record)
+
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+            return
+
+        self._dispatcher.put(prepared)
+
+    def flush(self) -> None:
+        """Wait for any queued records to be written."""
+        self._dispatcher.flush()
+
+
+@dataclasses.dataclass(frozen=True)
+class JsonLinesOptions:
+    """Options for a JsonLinesHandler.
+
+    >>> handler = JsonLinesHandler("render.jsonl", options=JsonLinesOptions(max_bytes=64 * 1024 * 1024))
+    """
+
+    max_bytes: int = 0
+    """Optional size in bytes to rotate the file at."""
+
+    rotate_interval: float | None = None
+    """Optional number of seconds to rotate the file after."""
+
+    backup_count: int | None = 5
+    """The number of rotated files to keep, or None to keep all of them."""
+
+    compress: bool = True
+    """Whether to compress rotated files with gzip."""
+
+    extra_fields: Iterable[str] = ()
+    """Names of extra record attributes to include when they are set."""
+
+    queue_size: int = 10000
+    """The maximum number of records which can be waiting to be written."""
+
+    drop_policy: DropPolicy | str = DropPolicy.BLOCK
+    """How to handle records when the queue is full."""
+
+    batch_size: int = 1000
+    """The maximum number of records written at once."""
+
+    buffer_size: int = 1024 * 1024
+    """The size of the file's write buffer, in bytes."""
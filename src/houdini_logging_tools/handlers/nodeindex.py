@@ -0,0 +1,415 @@
+"""Custom logging handler which keeps an in-memory index of records by node."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import bisect
+import collections
+import logging
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+# Houdini Logging Tools
+from houdini_logging_tools.nodes import NODE_PATH_CACHE
+
+if TYPE_CHECKING:
+    from houdini_logging_tools.lazy import hou
+
+# Globals
+
+# Key used to sort query results by time.
+_CREATED_KEY = attrgetter("created")
+
+# Classes
+
+
+class IndexedRecord:
+    """The information kept about a record in a NodeLogIndexHandler.
+
+    Args:
+        created:
+            The record creation time.
+        levelno:
+            The record logging level.
+        name:
+            The name of the logger.
+        message:
+            The record message, merged with its args, without the node path prefix
+            added by HoudiniLoggerAdapter.
+        node_path:
+            The path of the node the record was logged for, if any.
+    """
+
+    __slots__ = ("_key", "created", "levelno", "message", "name", "node_path")
+
+    def __init__(self, created: float, levelno: int, name: str, message: str, node_path: str | None) -> None:
+        self.created = created
+        self.levelno = levelno
+        self.message = message
+        self.name = name
+        self.node_path = node_path
+
+        # The key of the node the record is stored under.
+        self._key: int | str | None = None
+
+    def __repr__(self) -> str:
+        """The level, node path and message of the record."""
+        return f"<IndexedRecord {logging.getLevelName(self.levelno)} {self.node_path} {self.message!r}>"
+
+
+class NodeLogIndexHandler(logging.Handler):
+    """Custom handler which keeps recent records indexed by node so they can be queried.
+
+    Records logged for a node through HoudiniLoggerAdapter are stored by the node's
+    session id, so renaming a node keeps its records together, and the node paths are
+    kept sorted so all the nodes under a path can be found without checking every
+    node.  The records of each node are stored separately for each level, so queries
+    for a subtree, levels and time range only look at the records which can match.
+
+    Records logged without a node are only returned by queries for all nodes.
+
+    The number of records kept is limited both per node and in total.  When a node
+    has too many records its oldest record of its lowest level is discarded, so
+    warnings and errors are kept for longer than messages.  When there are too many
+    records in total the oldest record is discarded.
+
+    >>> index = NodeLogIndexHandler()
+    >>> logger.addHandler(index)
+    >>> index.query(hou.node("/obj/geo1"), level=logging.WARNING)
+
+    Args:
+        max_records:
+            The maximum number of records to keep.
+        max_records_per_node:
+            The maximum number of records to keep for each node.
+    """
+
+    def __init__(self, max_records: int = 100000, max_records_per_node: int = 1000) -> None:
+        super().__init__()
+
+        if max_records < 1 or max_records_per_node < 1:
+            msg = "max_records and max_records_per_node must be at least 1"
+            raise ValueError(msg)
+
+        self._max_records = max_records
+        self._max_records_per_node = max_records_per_node
+        self._nodes: dict[int | str | None, _NodeRecords] = {}
+        self._order: collections.deque[IndexedRecord] = collections.deque()
+        self._path_keys: dict[str, set[int | str]] = {}
+        self._paths: list[str] = []
+        self._record_count = 0
+
+    # Properties
+
+    @property
+    def node_count(self) -> int:
+        """The number of nodes with stored records."""
+        return len(self._nodes) - (None in self._nodes)
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def record_count(self) -> int:
+        """The number of stored records."""
+        return self._record_count
+
+    # Non-Public Methods
+
+    def _add(self, entry: IndexedRecord, key: int | str | None) -> None:
+        """Store a record and discard old records if there are too many.
+
+        This must be called while holding the lock.
+
+        Args:
+            entry:
+                The record to store.
+            key:
+                The key of the node to store the record under.
+        """
+        entry._key = key
+
+        node = self._nodes.get(key)
+
+        if node is None:
+            node = self._nodes[key] = _NodeRecords(entry.node_path)
+
+            if entry.node_path is not None:
+                self._add_path(entry.node_path, key)  # type: ignore
+
+        # The node has been renamed since its last record.
+        elif node.path != entry.node_path:
+            self._remove_path(node.path, key)  # type: ignore
+            self._add_path(entry.node_path, key)  # type: ignore
+
+            node.path = entry.node_path
+
+        records = node.levels.get(entry.levelno)
+
+        if records is None:
+            records = node.levels[entry.levelno] = collections.deque()
+
+        records.append(entry)
+        node.count += 1
+
+        self._order.append(entry)
+        self._record_count += 1
+
+        if node.count > self._max_records_per_node:
+            self._discard_oldest(key, node, min(node.levels))
+
+        # Records already discarded for their node are still counted here, which keeps
+        # the order bounded even when a single node logs most of the records.
+        while len(self._order) > self._max_records:
+            self._discard(self._order.popleft())
+
+    def _add_path(self, path: str, key: int | str) -> None:
+        """Add the path of a node to the sorted paths.
+
+        Args:
+            path:
+                The node path.
+            key:
+                The key of the node.
+        """
+        keys = self._path_keys.get(path)
+
+        if keys is None:
+            keys = self._path_keys[path] = set()
+            bisect.insort(self._paths, path)
+
+        keys.add(key)
+
+    def _discard(self, entry: IndexedRecord) -> None:
+        """Discard a record, if it has not already been discarded for its node.
+
+        Args:
+            entry:
+                The record to discard.
+        """
+        # A node is removed once all of its records have been discarded, which can be
+        # before the older records it discarded itself have left the order.
+        node = self._nodes.get(entry._key)
+
+        if node is None:
+            return
+
+        records = node.levels.get(entry.levelno)
+
+        # Records are discarded in the order they were stored, so a record which is
+        # still stored must be the oldest of its level.
+        if records and records[0] is entry:
+            self._discard_oldest(entry._key, node, entry.levelno)
+
+    def _discard_oldest(self, key: int | str | None, node: _NodeRecords, levelno: int) -> None:
+        """Discard the oldest record of a level for a node.
+
+        Args:
+            key:
+                The key of the node.
+            node:
+                The records of the node.
+            levelno:
+                The level to discard the record from.
+        """
+        records = node.levels[levelno]
+        records.popleft()
+
+        if not records:
+            del node.levels[levelno]
+
+        node.count -= 1
+        self._record_count -= 1
+
+        if not node.count:
+            del self._nodes[key]
+
+            if node.path is not None:
+                self._remove_path(node.path, key)  # type: ignore
+
+    def _find_nodes(self, node: hou.Node | str | None, *, children: bool) -> list[_NodeRecords]:
+        """Find the records of a node and optionally its children.
+
+        Args:
+            node:
+                The node, or node path, to find.  If None the records of every node are
+                returned, along with the records without a node.
+            children:
+                Whether to include the records of the node's children.
+
+        Returns:
+            The records of the matching nodes.
+        """
+        if node is None:
+            return list(self._nodes.values())
+
+        keys: set[int | str | None] = set()
+
+        if isinstance(node, str):
+            path = node
+
+        else:
+            session_id, path = NODE_PATH_CACHE.lookup(node)
+
+            # Include records logged before the node was renamed.
+            if session_id in self._nodes:
+                keys.add(session_id)
+
+        path = path.rstrip("/")
+
+        keys.update(self._path_keys.get(path, ()))
+
+        if children:
+            # Paths with the node's path followed by a "/" sort between the path
+            # followed by "/" and the path followed by the next character, "0".
+            paths = self._paths
+            start = bisect.bisect_left(paths, f"{path}/")
+            end = bisect.bisect_left(paths, f"{path}0", start)
+
+            for child_path in paths[start:end]:
+                keys.update(self._path_keys[child_path])
+
+        return [self._nodes[key] for key in keys]
+
+    def _remove_path(self, path: str, key: int | str) -> None:
+        """Remove the path of a node from the sorted paths.
+
+        Args:
+            path:
+                The node path.
+            key:
+                The key of the node.
+        """
+        keys = self._path_keys[path]
+        keys.discard(key)
+
+        if not keys:
+            del self._path_keys[path]
+            del self._paths[bisect.bisect_left(self._paths, path)]
+
+    # Methods
+
+    def clear(self) -> None:
+        """Discard all stored records."""
+        with self.lock:  # type: ignore
+            self._nodes.clear()
+            self._order.clear()
+            self._path_keys.clear()
+            self._paths.clear()
+            self._record_count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store a record.
+
+        Args:
+            record:
+                The log record to store.
+        """
+        try:
+            self._add(*_create_entry(record))
+
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    def query(
+        self,
+        node: hou.Node | str | None = None,
+        *,
+        level: int = logging.NOTSET,
+        start: float | None = None,
+        end: float | None = None,
+        children: bool = True,
+        limit: int | None = None,
+    ) -> list[IndexedRecord]:
+        """Find the stored records for a node and its children.
+
+        Only the records of the matching nodes and levels are checked, and the
+        records of each are checked from the newest, stopping at the start time.
+
+        >>> index.query("/obj/geo1", level=logging.WARNING, start=time.time() - 60)
+
+        Args:
+            node:
+                The node, or node path, to find records for.  If None the records for
+                every node are found, along with the records without a node.
+            level:
+                The minimum level of the records to find.
+            start:
+                Optional earliest creation time of the records to find.
+            end:
+                Optional latest creation time of the records to find.
+            children:
+                Whether to include the records for the node's children.
+            limit:
+                Optional maximum number of records to return, keeping the newest.
+
+        Returns:
+            The matching records, from oldest to newest.
+        """
+        matches = []
+
+        with self.lock:  # type: ignore
+            for node_records in self._find_nodes(node, children=children):
+                for levelno, records in node_records.levels.items():
+                    if levelno < level:
+                        continue
+
+                    for entry in reversed(records):
+                        if start is not None and entry.created < start:
+                            break
+
+                        if end is None or entry.created <= end:
+                            matches.append(entry)
+
+        matches.sort(key=_CREATED_KEY)
+
+        if limit is not None:
+            return matches[-limit:] if limit else []
+
+        return matches
+
+
+# Non-Public Classes
+
+
+class _NodeRecords:
+    """The stored records of a node.
+
+    Args:
+        path:
+            The path of the node, or None for records without a node.
+    """
+
+    __slots__ = ("count", "levels", "path")
+
+    def __init__(self, path: str | None) -> None:
+        self.count = 0
+        self.levels: dict[int, collections.deque[IndexedRecord]] = {}
+        self.path = path
+
+
+# Non-Public Functions
+
+
+def _create_entry(record: logging.LogRecord) -> tuple[IndexedRecord, int | str | None]:
+    """Create the stored information about a record.
+
+    Args:
+        record:
+            The log record.
+
+    Returns:
+        The record information and the key of the node to store it under.
+    """
+    message = record.getMessage()
+    node_path = getattr(record, "node_path", None)
+
+    # The node path is stored separately, so the prefix is not needed.
+    if node_path is not None:
+        message = message.removeprefix(f"{node_path} - ")
+
+    session_id = getattr(record, "node_session_id", None)
+
+    entry = IndexedRecord(record.created, record.levelno, record.name, message, node_path)
+
+    return entry, session_id if session_id is not None else node_path
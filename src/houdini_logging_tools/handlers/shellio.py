@@ -1,11 +1,21 @@
 """Custom logging stream handler which writes to Houdini Python Shell panels."""
 
+# Future
+from __future__ import annotations
+
 # Standard Library
+import collections
+import dataclasses
 import logging
 import sys
+import threading
+import time
 
-# Houdini
-import hou
+# Houdini Logging Tools
+from houdini_logging_tools.formatting import TracebackCache, format_record
+from houdini_logging_tools.lazy import hou, is_hou_available
+from houdini_logging_tools.metrics import count, instrument
+from houdini_logging_tools.ui.dispatch import UI_DISPATCHER, EventLoopCallback
 
 # Classes
 
@@ -17,10 +27,220 @@ class PythonShellHandler(logging.StreamHandler):
     is a Python Shell panel active and displayed.  This handler works by checking
     that sys.stdout is a hou.ShellIO and writes output to it accordingly.  Otherwise,
     no output will be written.
+
+    Every write to a Python Shell causes the panel to redraw.  When buffered, formatted
+    messages are collected and written in a single chunk once the flush interval has
+    passed, the buffer is full, or a message at or above the flush level is emitted.
+
+    With a backlog, messages at or above the backlog level which are emitted while no
+    Python Shell is open are kept in a fixed size buffer of the most recent messages.
+    They are written in a single chunk the next time a Python Shell is found.
+
+    With a traceback cache, only the first record of each distinct exception traceback
+    includes the full traceback and repeats include a short reference to it.
+
+    Args:
+        stream:
+            Optional stream for the handler.
+        options:
+            Optional options for the handler.  Defaults to PythonShellOptions().
     """
 
+    def __init__(self, stream=None, *, options: PythonShellOptions | None = None) -> None:  # type: ignore
+        super().__init__(stream=stream)
+
+        if options is None:
+            options = PythonShellOptions()
+
+        self._backlog: collections.deque[str] | None = None
+        self._backlog_level = options.backlog_level
+
+        if options.backlog_size > 0:
+            self._backlog = collections.deque(maxlen=options.backlog_size)
+
+        self._buffer: list[str] = []
+        self._buffer_lock = threading.Lock()
+        self._buffered = options.buffered
+        self._capacity = options.capacity
+        self._deadline: float | None = None
+        self._flush_interval = options.flush_interval
+        self._flush_level = options.flush_level
+        self._traceback_cache = options.traceback_cache
+
+        # Records can be emitted from any thread, so the callback is added and removed
+        # on the main thread.
+        self._event_loop_callback = EventLoopCallback(self._on_event_loop, UI_DISPATCHER)
+
+    # Properties
+
+    @property
+    def backlog(self) -> tuple[str, ...]:
+        """The messages waiting to be written when a Python Shell is found."""
+        return tuple(self._backlog or ())
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def buffered(self) -> bool:
+        """Whether messages are buffered and written in chunks."""
+        return self._buffered
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def traceback_cache(self) -> TracebackCache | None:
+        """Optional cache used to deduplicate exception tracebacks."""
+        return self._traceback_cache
+
+    # Non-Public Methods
+
+    def _add_to_backlog(self, record: logging.LogRecord) -> None:
+        """Keep a record's message to write once a Python Shell is found, if it is kept.
+
+        Args:
+            record:
+                The log record to keep.
+        """
+        backlog = self._backlog
+
+        if backlog is None or record.levelno < self._backlog_level:
+            return
+
+        # The oldest message is discarded when the backlog is full.
+        if len(backlog) == backlog.maxlen:
+            count(self.__class__.__name__, "dropped")
+
+        backlog.append(self.format(record))
+
+    def _buffer_message(self, msg: str, *, immediate: bool) -> None:
+        """Add a formatted message to the buffer.
+
+        Args:
+            msg:
+                The formatted message.
+            immediate:
+                Whether to write the buffer immediately.
+        """
+        with self._buffer_lock:
+            if self._backlog:
+                self._buffer.extend(self._take_backlog())
+
+            self._buffer.append(msg)
+
+            if not immediate and len(self._buffer) < self._capacity:
+                # Start the interval and wait for it to pass.
+                if self._deadline is None:
+                    self._deadline = time.monotonic() + self._flush_interval
+
+                    self._event_loop_callback.register()
+
+                return
+
+        self._flush_buffer()
+
+    @instrument("flush")
+    def _flush_buffer(self) -> None:
+        """Write all buffered messages to the Python Shell in a single chunk."""
+        # Write while holding the lock so that chunks are written in order.
+        with self._buffer_lock:
+            lines = self._buffer
+
+            self._buffer = []
+            self._deadline = None
+
+            self._event_loop_callback.unregister()
+
+            if not lines:
+                return
+
+            stream = sys.stdout
+
+            # The panel may have been closed since the messages were buffered.
+            if _is_shell_io(stream):
+                lines.append("")
+
+                stream.write("\n".join(lines))
+                stream.flush()
+
+    def _handle_record(self, record: logging.LogRecord) -> None:
+        """Write a record to the Python Shell if one is open, otherwise keep it in the backlog.
+
+        Args:
+            record:
+                The log record to handle.
+        """
+        # Get the current stdout stream. Houdini will muck around with
+        # this depending on whether a PythonShell panel is open.
+        stream = sys.stdout
+
+        # If the stream is really an output to a Python Shell, then we know
+        # that we want to write the message to it. Otherwise, a panel isn't
+        # open, so we don't have anything to write to.
+        if _is_shell_io(stream):
+            # Format the message
+            msg = self.format(record)
+
+            if self._buffered:
+                self._buffer_message(msg, immediate=record.levelno >= self._flush_level)
+
+            else:
+                self._write_message(stream, msg)
+
+        else:
+            self._add_to_backlog(record)
+
+    def _on_event_loop(self) -> None:
+        """Event loop callback which writes the buffer once the flush interval has passed."""
+        deadline = self._deadline
+
+        if deadline is not None and time.monotonic() >= deadline:
+            self._flush_buffer()
+
+    def _take_backlog(self) -> list[str]:
+        """Remove and return all the messages in the backlog.
+
+        Returns:
+            The backlog messages.
+        """
+        backlog = self._backlog
+        lines = []
+
+        # Pop individually rather than copying and clearing so a message added by
+        # another thread can't be lost in between.
+        while backlog:
+            lines.append(backlog.popleft())
+
+        return lines
+
+    def _write_message(self, stream: hou.ShellIO, msg: str) -> None:
+        """Write a formatted message directly to a Python Shell.
+
+        Args:
+            stream:
+                The Python Shell stream.
+            msg:
+                The formatted message.
+        """
+        # Write any messages from while there wasn't a shell open.
+        if self._backlog:
+            stream.write("\n".join(self._take_backlog()))
+            stream.write("\n")
+
+        stream.write(msg)
+        stream.write("\n")
+        stream.flush()
+
     # Methods
 
+    def close(self) -> None:
+        """Write any buffered messages and close the handler."""
+        try:
+            self._flush_buffer()
+
+        finally:
+            super().close()
+
+    @instrument("emit", records=True)
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log message.
 
@@ -29,20 +249,7 @@ class PythonShellHandler(logging.StreamHandler):
                 The log record to emit.
         """
         try:
-            # Get the current stdout stream. Houdini will muck around with
-            # this depending on whether a PythonShell panel is open.
-            stream = sys.stdout
-
-            # If the stream is really an output to a Python Shell, then we know
-            # that we want to write the message to it. Otherwise, a panel isn't
-            # open, so we don't have anything to write to.
-            if isinstance(stream, hou.ShellIO):
-                # Format the message
-                msg = self.format(record)
-
-                stream.write(msg)
-                stream.write("\n")
-                stream.flush()
+            self._handle_record(record)
 
         # Re-raise these as we don't want to actually handle them.
         except KeyboardInterrupt:
@@ -54,3 +261,78 @@ class PythonShellHandler(logging.StreamHandler):
         # Otherwise, handle the error.
         except Exception:  # noqa: BLE001
             self.handleError(record)
+
+    def flush(self) -> None:
+        """Write any buffered messages."""
+        self._flush_buffer()
+
+        super().flush()
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record, reusing the output of any handler with the same formatter.
+
+        Args:
+            record:
+                The log record to format.
+
+        Returns:
+            The formatted record.
+        """
+        return format_record(self, record, self._traceback_cache)
+
+    def handleError(self, record: logging.LogRecord) -> None:
+        """Count the error and handle it as normal.
+
+        Args:
+            record:
+                The log record which could not be handled.
+        """
+        count(self.__class__.__name__, "errors")
+
+        super().handleError(record)
+
+
+@dataclasses.dataclass(frozen=True)
+class PythonShellOptions:
+    """Options for a PythonShellHandler.
+
+    >>> handler = PythonShellHandler(options=PythonShellOptions(buffered=True, backlog_size=200))
+    """
+
+    buffered: bool = False
+    """Whether to buffer messages and write them in chunks."""
+
+    flush_interval: float = 0.1
+    """The number of seconds messages can be buffered for."""
+
+    flush_level: int = logging.ERROR
+    """The logging level at and above which the buffer is written immediately."""
+
+    capacity: int = 1000
+    """The maximum number of messages which can be buffered."""
+
+    backlog_size: int = 0
+    """The maximum number of messages to keep while no Python Shell is open."""
+
+    backlog_level: int = logging.WARNING
+    """The minimum logging level of messages to keep while no Python Shell is open."""
+
+    traceback_cache: TracebackCache | None = None
+    """Optional cache to deduplicate exception tracebacks with."""
+
+
+# Non-Public Functions
+
+
+def _is_shell_io(stream: object) -> bool:
+    """Check whether a stream writes to a Python Shell panel.
+
+    Args:
+        stream:
+            The stream to check.
+
+    Returns:
+        Whether the stream is a hou.ShellIO, which is never the case if hou is not
+        available.
+    """
+    return is_hou_available() and isinstance(stream, hou.ShellIO)
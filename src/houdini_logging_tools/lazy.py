@@ -0,0 +1,126 @@
+"""Lazily imported modules."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import importlib
+import threading
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+# Classes
+
+
+class LazyModule:
+    """A module which is only imported once one of its attributes is used.
+
+    Attribute lookups are passed to the module every time, so attributes which are
+    replaced on the module, such as by mocking, are always seen.  If the module cannot
+    be imported the ImportError is raised from every attribute lookup, other than for
+    special attributes which raise AttributeError until the module is imported.
+
+    Args:
+        name:
+            The name of the module.
+    """
+
+    __slots__ = ("_error", "_lock", "_module", "_name")
+
+    def __init__(self, name: str) -> None:
+        self._error: ImportError | None = None
+        self._lock = threading.Lock()
+        self._module: ModuleType | None = None
+        self._name = name
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an attribute from the module, importing it first if necessary.
+
+        Args:
+            name:
+                The attribute name.
+
+        Returns:
+            The module attribute.
+
+        Raises:
+            AttributeError:
+                If a special attribute is requested before the module is imported.
+        """
+        module = self._module
+
+        if module is None:
+            # Don't import the module when tools such as mock or inspect probe for
+            # special attributes.
+            if name.startswith("__") and name.endswith("__"):
+                raise AttributeError(name)
+
+            module = self._import()
+
+        return getattr(module, name)
+
+    def __repr__(self) -> str:
+        """The representation of the lazy module."""
+        state = "imported" if self._module is not None else "not imported"
+
+        return f"<{self.__class__.__name__} {self._name!r} ({state})>"
+
+    # Non-Public Methods
+
+    def _import(self) -> ModuleType:
+        """Import the module.
+
+        Returns:
+            The imported module.
+
+        Raises:
+            ImportError:
+                If the module cannot be imported.
+        """
+        with self._lock:
+            if self._module is None:
+                # Failed imports are not cached by the import system, so remember the
+                # failure rather than searching for the module on every lookup.
+                if self._error is None:
+                    try:
+                        self._module = importlib.import_module(self._name)
+
+                    except ImportError as error:
+                        self._error = error
+
+                if self._error is not None:
+                    msg = f"{self._name} could not be imported"
+                    raise ImportError(msg) from self._error
+
+            return self._module  # type: ignore
+
+
+if TYPE_CHECKING:
+    import hou
+
+else:
+    hou = LazyModule("hou")
+    """The hou module, which is imported on first use."""
+
+# Functions
+
+
+@cache
+def is_hou_available() -> bool:
+    """Check whether the hou module can be imported.
+
+    The result cannot change during a session so it is only checked once.
+
+    Returns:
+        Whether the hou module is available.
+    """
+    try:
+        hou._import()
+
+    except ImportError:
+        return False
+
+    return True
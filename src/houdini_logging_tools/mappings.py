@@ -1,14 +1,277 @@
-"""Mappings between logging levels and Houdini severities."""
-
-# Houdini
-import hou
-
-LOGGING_TO_SEVERITY_MAP = {
-    "critical": hou.severityType.Error,
-    "debug": hou.severityType.Message,
-    "error": hou.severityType.Error,
-    "exception": hou.severityType.Error,
-    "info": hou.severityType.ImportantMessage,
-    "warning": hou.severityType.Warning,
+"""Mappings between logging levels and Houdini severities.
+
+The mappings of hou.severityType values are built on first use so that importing the
+module does not import hou.
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import bisect
+import logging
+import threading
+from functools import cache
+from typing import Any
+
+# Houdini Logging Tools
+from houdini_logging_tools.lazy import hou, is_hou_available
+
+# Globals
+
+DEFAULT_LEVEL_SEVERITIES = {
+    logging.DEBUG: "Message",
+    logging.INFO: "ImportantMessage",
+    logging.WARNING: "Warning",
+    logging.ERROR: "Error",
+    logging.CRITICAL: "Error",
+}
+"""The name of the hou.severityType value of each standard logging level."""
+
+# The names of the logging methods and the level each logs at.
+_METHOD_NAME_LEVELS = {
+    "critical": logging.CRITICAL,
+    "debug": logging.DEBUG,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+}
+
+# The names of the hou.severityType values from least to most severe.
+_SEVERITY_NAMES = ("Message", "ImportantMessage", "Warning", "Error", "Fatal")
+
+# Classes
+
+
+class SeverityRegistry:
+    """Houdini severities indexed by numeric logging level.
+
+    Levels which have not been registered, such as custom levels between the standard
+    ones, use the severity of the closest registered level below them, or the lowest
+    registered level if there is none.  The result for each level is stored so every
+    level is only looked up once.
+
+    Args:
+        levels:
+            Optional Houdini severity enum value of each logging level.  Defaults to the
+            values named in DEFAULT_LEVEL_SEVERITIES, which are looked up from hou when
+            a severity is first needed.
+    """
+
+    def __init__(self, levels: dict[int, hou.severityType] | None = None) -> None:
+        if levels is not None and not levels:
+            msg = "At least one level must be registered"
+            raise ValueError(msg)
+
+        self._lock = threading.RLock()
+        self._levels = dict(levels) if levels is not None else None
+
+        self._sorted_levels: list[int] = []
+        self._table: dict[int, hou.severityType] = {}
+
+        if self._levels is not None:
+            self._rebuild()
+
+    # Properties
+
+    @property
+    def levels(self) -> dict[int, hou.severityType]:
+        """The Houdini severity enum value of each registered logging level."""
+        return dict(self._get_levels())
+
+    # Non-Public Methods
+
+    def _get_levels(self) -> dict[int, hou.severityType]:
+        """Get the registered levels, looking up the default severities on first use.
+
+        Returns:
+            The Houdini severity enum value of each registered logging level.
+        """
+        with self._lock:
+            if self._levels is None:
+                self._levels = {
+                    level: getattr(hou.severityType, name) for level, name in DEFAULT_LEVEL_SEVERITIES.items()
+                }
+
+                self._rebuild()
+
+            return self._levels
+
+    def _lookup(self, level: int) -> hou.severityType | None:
+        """Find and store the severity of a level which has not been looked up before.
+
+        Args:
+            level:
+                The logging level.
+
+        Returns:
+            The Houdini severity enum value, or None if the default severities are
+            needed and hou is not available.
+        """
+        if self._levels is None and not is_hou_available():
+            return None
+
+        with self._lock:
+            levels = self._get_levels()
+            sorted_levels = self._sorted_levels
+
+            index = max(bisect.bisect_right(sorted_levels, level) - 1, 0)
+            severity = levels[sorted_levels[index]]
+
+            # Replace the table, as _rebuild() does, so a severity found from levels
+            # which have since been changed is never stored in the rebuilt table.
+            self._table = {**self._table, level: severity}
+
+        return severity
+
+    def _rebuild(self) -> None:
+        """Rebuild the sorted levels and the lookup table."""
+        self._sorted_levels = sorted(self._levels)  # type: ignore
+
+        # Replace rather than clear the table so lookups from other threads are never
+        # made against a partially built table.
+        self._table = dict(self._levels)  # type: ignore
+
+    # Methods
+
+    def register(self, level: int, severity: hou.severityType) -> None:
+        """Register the Houdini severity of a logging level.
+
+        Args:
+            level:
+                The logging level.
+            severity:
+                The Houdini severity enum value.
+        """
+        with self._lock:
+            self._get_levels()[level] = severity
+
+            self._rebuild()
+
+    def severity(self, level: int) -> hou.severityType | None:
+        """Get the Houdini severity of a logging level.
+
+        Args:
+            level:
+                The logging level.
+
+        Returns:
+            The Houdini severity enum value, or None if the default severities are
+            needed and hou is not available.
+        """
+        try:
+            return self._table[level]
+
+        except KeyError:
+            return self._lookup(level)
+
+
+SEVERITY_REGISTRY = SeverityRegistry()
+"""The registry of Houdini severities used by the adapters and handlers."""
+
+# Non-Public Functions
+
+
+@cache
+def _build_logging_to_severity_map() -> dict[str, hou.severityType]:
+    """Build the mapping between logging method names and Houdini severity enum values.
+
+    Returns:
+        The Houdini severity enum value of each logging method.
+    """
+    return {
+        name: getattr(hou.severityType, DEFAULT_LEVEL_SEVERITIES[level]) for name, level in _METHOD_NAME_LEVELS.items()
+    }
+
+
+@cache
+def _build_severity_ranks() -> dict[hou.severityType, int]:
+    """Build the ranking of Houdini severity enum values.
+
+    Returns:
+        The rank of each Houdini severity enum value, from least to most severe.
+    """
+    return {getattr(hou.severityType, name): rank for rank, name in enumerate(_SEVERITY_NAMES)}
+
+
+# Mappings of hou.severityType values which are built when first accessed.
+_LAZY_ATTRIBUTES = {
+    "LOGGING_TO_SEVERITY_MAP": _build_logging_to_severity_map,
+    "SEVERITY_RANKS": _build_severity_ranks,
 }
-"""Mapping between logging levels and Houdini severity enum values."""
+
+# Functions
+
+
+def __getattr__(name: str) -> Any:
+    """Get the mappings of Houdini severity enum values, building them on first access.
+
+    LOGGING_TO_SEVERITY_MAP maps logging method names to Houdini severity enum values
+    and SEVERITY_RANKS ranks the Houdini severity enum values from least to most
+    severe.
+
+    Args:
+        name:
+            The attribute name.
+
+    Returns:
+        The mapping.
+
+    Raises:
+        AttributeError:
+            If the attribute does not exist.
+    """
+    try:
+        builder = _LAZY_ATTRIBUTES[name]
+
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    return builder()
+
+
+def get_severity(level: int) -> hou.severityType | None:
+    """Get the Houdini severity of a logging level from the shared registry.
+
+    Args:
+        level:
+            The logging level.
+
+    Returns:
+        The Houdini severity enum value, or None if hou is not available.
+    """
+    return SEVERITY_REGISTRY.severity(level)
+
+
+def register_level(level: int, severity: hou.severityType, name: str | None = None) -> None:
+    """Register the Houdini severity of a logging level in the shared registry.
+
+    >>> register_level(5, hou.severityType.Message, "TRACE")
+
+    Args:
+        level:
+            The logging level.
+        severity:
+            The Houdini severity enum value.
+        name:
+            Optional name to register for the level with the logging module.
+    """
+    if name is not None:
+        logging.addLevelName(level, name)
+
+    SEVERITY_REGISTRY.register(level, severity)
+
+
+def severity_rank(severity: hou.severityType) -> int:
+    """Get the rank of a Houdini severity, from least to most severe.
+
+    Args:
+        severity:
+            The Houdini severity enum value.
+
+    Returns:
+        The rank of the severity, or 0 if it is unknown.
+    """
+    return _build_severity_ranks().get(severity, 0)
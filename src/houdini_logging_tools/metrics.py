@@ -0,0 +1,426 @@
+"""Counters and timers which measure the cost of logging itself."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import logging
+import threading
+import time
+import weakref
+from functools import wraps
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Classes
+
+
+class ComponentMetrics:
+    """The counters and timers of a logging component, such as a handler class.
+
+    Args:
+        name:
+            The component name.
+    """
+
+    __slots__ = ("_counters", "_lock", "_records", "_timers", "name")
+
+    def __init__(self, name: str) -> None:
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._records: dict[int, int] = {}
+        self._timers: dict[str, list[float]] = {}
+
+        self.name = name
+
+    # Methods
+
+    def add_time(self, timer: str, seconds: float) -> None:
+        """Add a call's duration to a timer.
+
+        Args:
+            timer:
+                The timer name.
+            seconds:
+                The duration of the call.
+        """
+        with self._lock:
+            values = self._timers.get(timer)
+
+            if values is None:
+                self._timers[timer] = [1, seconds, seconds]
+
+            else:
+                values[0] += 1
+                values[1] += seconds
+                values[2] = max(values[2], seconds)
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        """Increment a counter.
+
+        Args:
+            counter:
+                The counter name.
+            amount:
+                The amount to add.
+        """
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    def count_record(self, levelno: int) -> None:
+        """Count a record.
+
+        Args:
+            levelno:
+                The record level.
+        """
+        with self._lock:
+            self._records[levelno] = self._records.get(levelno, 0) + 1
+
+    def reset(self) -> None:
+        """Discard all counts and times."""
+        with self._lock:
+            self._counters.clear()
+            self._records.clear()
+            self._timers.clear()
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Get the current counts and times.
+
+        Returns:
+            A copy of the counts and times.
+        """
+        with self._lock:
+            records = {logging.getLevelName(levelno): count for levelno, count in sorted(self._records.items())}
+            counters = dict(self._counters)
+            timers = {
+                timer: TimerSnapshot(int(count), total, peak) for timer, (count, total, peak) in self._timers.items()
+            }
+
+        return MetricsSnapshot(self.name, records, counters, timers)
+
+
+class MetricsRegistry:
+    """The metrics of each logging component.
+
+    Metrics are only recorded while enabled is True, and the components check it before
+    doing any other work, so disabled metrics cost a single attribute lookup per call.
+    Methods decorated with instrument() are only replaced by their timed versions
+    while enabled, so they cost nothing extra at all while disabled.  Use enable() and
+    disable() rather than setting enabled directly so the methods are swapped.
+
+    >>> METRICS.enable()
+    >>> METRICS.start_reporting(logger, interval=60)
+    >>> METRICS.snapshot()["HoudiniLoggingHandler"].timers["emit"]
+    """
+
+    def __init__(self) -> None:
+        self._components: dict[str, ComponentMetrics] = {}
+        self._instrumented: weakref.WeakKeyDictionary[type, dict[str, tuple[Callable, Callable]]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._reporter: _Reporter | None = None
+
+        self.enabled = False
+        """Whether metrics are recorded."""
+
+    # Non-Public Methods
+
+    def _add_instrumented(self, owner: type, name: str, func: Callable, wrapper: Callable) -> None:
+        """Add an instrumented method, setting the version to use on its class.
+
+        Args:
+            owner:
+                The class the method is defined on.
+            name:
+                The name of the method.
+            func:
+                The plain method.
+            wrapper:
+                The timed version of the method.
+        """
+        with self._lock:
+            self._instrumented.setdefault(owner, {})[name] = (func, wrapper)
+
+            setattr(owner, name, wrapper if self.enabled else func)
+
+    def _bind_instrumented(self) -> None:
+        """Set the plain or timed version of each instrumented method on its class."""
+        with self._lock:
+            for owner, methods in self._instrumented.items():
+                for name, (func, wrapper) in methods.items():
+                    setattr(owner, name, wrapper if self.enabled else func)
+
+    # Methods
+
+    def component(self, name: str) -> ComponentMetrics:
+        """Get the metrics of a component, creating them if necessary.
+
+        Args:
+            name:
+                The component name.
+
+        Returns:
+            The component's metrics.
+        """
+        metrics = self._components.get(name)
+
+        if metrics is None:
+            with self._lock:
+                metrics = self._components.setdefault(name, ComponentMetrics(name))
+
+        return metrics
+
+    def disable(self) -> None:
+        """Stop recording metrics, keeping the current counts and times."""
+        self.enabled = False
+        self._bind_instrumented()
+
+    def enable(self) -> None:
+        """Start recording metrics."""
+        self.enabled = True
+        self._bind_instrumented()
+
+    def report(self, logger: logging.Logger | logging.LoggerAdapter, level: int = logging.INFO) -> None:
+        """Log the metrics of each component.
+
+        Args:
+            logger:
+                The logger to log the metrics to.
+            level:
+                The level to log the metrics at.
+        """
+        for snapshot in self.snapshot().values():
+            logger.log(level, "%s", snapshot)
+
+    def reset(self) -> None:
+        """Discard the counts and times of every component."""
+        with self._lock:
+            self._components.clear()
+
+    def snapshot(self) -> dict[str, MetricsSnapshot]:
+        """Get the current counts and times of every component.
+
+        Returns:
+            The metrics of each component, by name.
+        """
+        with self._lock:
+            components = sorted(self._components.items())
+
+        return {name: metrics.snapshot() for name, metrics in components}
+
+    def start_reporting(
+        self,
+        logger: logging.Logger | logging.LoggerAdapter,
+        interval: float = 60.0,
+        level: int = logging.INFO,
+    ) -> None:
+        """Log the metrics of each component periodically from a background thread.
+
+        Any existing reporting is stopped first.  Metrics must also be enabled to be
+        recorded.
+
+        Args:
+            logger:
+                The logger to log the metrics to.
+            interval:
+                The number of seconds between reports.
+            level:
+                The level to log the metrics at.
+        """
+        self.stop_reporting()
+
+        self._reporter = _Reporter(self, logger, interval, level)
+        self._reporter.start()
+
+    def stop_reporting(self) -> None:
+        """Stop logging the metrics periodically."""
+        reporter, self._reporter = self._reporter, None
+
+        if reporter is not None:
+            reporter.stop()
+
+
+class MetricsSnapshot(NamedTuple):
+    """A copy of the counts and times of a component."""
+
+    name: str
+    """The component name."""
+
+    records: dict[str, int]
+    """The number of records of each level."""
+
+    counters: dict[str, int]
+    """The value of each counter, such as the number of dropped records or errors."""
+
+    timers: dict[str, TimerSnapshot]
+    """The calls to and time spent in each timed part of the component."""
+
+    def __str__(self) -> str:
+        """The metrics on a single line."""
+        parts = [f"{self.name}:"]
+
+        parts.extend(f"{level}={count}" for level, count in self.records.items())
+        parts.extend(f"{counter}={count}" for counter, count in sorted(self.counters.items()))
+
+        parts.extend(
+            f"{timer}={timing.count} calls {timing.total * 1000:.3f}ms total {timing.max * 1000:.3f}ms max"
+            for timer, timing in sorted(self.timers.items())
+        )
+
+        return " ".join(parts)
+
+
+class TimerSnapshot(NamedTuple):
+    """A copy of the calls to and time spent in a timed part of a component."""
+
+    count: int  # type: ignore
+    """The number of timed calls."""
+
+    total: float
+    """The total time spent in the calls, in seconds."""
+
+    max: float
+    """The duration of the longest call, in seconds."""
+
+
+METRICS = MetricsRegistry()
+"""The metrics registry shared by the handlers and adapters."""
+
+# Non-Public Classes
+
+
+class _InstrumentedMethod:
+    """Placeholder left on a class by instrument(), which registers the method with METRICS.
+
+    When the class is created the placeholder is replaced by the plain method, or by
+    its timed version if metrics are enabled.
+
+    Args:
+        func:
+            The plain method.
+        wrapper:
+            The timed version of the method.
+    """
+
+    def __init__(self, func: Callable, wrapper: Callable) -> None:
+        self._func = func
+        self._wrapper = wrapper
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Register the method once the class it is defined on has been created.
+
+        Args:
+            owner:
+                The class the method is defined on.
+            name:
+                The name of the method.
+        """
+        METRICS._add_instrumented(owner, name, self._func, self._wrapper)
+
+
+class _Reporter:
+    """Background thread which reports metrics periodically.
+
+    Args:
+        registry:
+            The metrics to report.
+        logger:
+            The logger to log the metrics to.
+        interval:
+            The number of seconds between reports.
+        level:
+            The level to log the metrics at.
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        logger: logging.Logger | logging.LoggerAdapter,
+        interval: float,
+        level: int,
+    ) -> None:
+        self._interval = interval
+        self._level = level
+        self._logger = logger
+        self._registry = registry
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="MetricsReporter", daemon=True)
+
+    # Non-Public Methods
+
+    def _run(self) -> None:
+        """Report the metrics each interval until stopped."""
+        while not self._stopped.wait(self._interval):
+            self._registry.report(self._logger, self._level)
+
+    # Methods
+
+    def start(self) -> None:
+        """Start reporting."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop reporting and wait for the thread to exit."""
+        self._stopped.set()
+        self._thread.join()
+
+
+# Functions
+
+
+def count(component: str, counter: str, amount: int = 1) -> None:
+    """Increment a component's counter, if metrics are enabled.
+
+    Args:
+        component:
+            The component name.
+        counter:
+            The counter name.
+        amount:
+            The amount to add.
+    """
+    if METRICS.enabled:
+        METRICS.component(component).count(counter, amount)
+
+
+def instrument(timer: str, *, records: bool = False) -> Callable[[Callable], Callable]:
+    """Decorate a method to time its calls while metrics are enabled.
+
+    The metrics are recorded under the name of the instance's class.  The method
+    must be defined in a class body.  While metrics are disabled the class has the
+    plain method, so calls are not slowed down by the timing wrapper.
+
+    Args:
+        timer:
+            The timer name.
+        records:
+            Whether the method is passed a record as its first argument, which is
+            counted by level.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            metrics = METRICS.component(self.__class__.__name__)
+
+            if records:
+                metrics.count_record(args[0].levelno)
+
+            start = time.perf_counter()
+
+            try:
+                return func(self, *args, **kwargs)
+
+            finally:
+                metrics.add_time(timer, time.perf_counter() - start)
+
+        return _InstrumentedMethod(func, wrapper)  # type: ignore
+
+    return decorator
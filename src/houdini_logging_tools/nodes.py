@@ -0,0 +1,204 @@
+"""Caching of node related information used when logging."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import collections
+import contextlib
+import threading
+from functools import cache
+from typing import Any
+
+# Houdini Logging Tools
+from houdini_logging_tools.lazy import hou
+
+# Classes
+
+
+class NodePathCache:
+    """Cache of node paths keyed by node session id.
+
+    Getting a node's path is a round trip to Houdini which builds the full path each
+    time.  Cached paths are invalidated by node event callbacks on the node and each
+    of its ancestors so renaming or deleting any of them will cause the path to be
+    looked up again.  The least recently used paths are discarded once the cache is
+    full, along with any event callbacks no other cached path needs.
+
+    Args:
+        max_size:
+            The maximum number of node paths to cache.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        if max_size < 1:
+            msg = "max_size must be at least 1"
+            raise ValueError(msg)
+
+        self._entries: collections.OrderedDict[int, tuple[str, tuple[int, ...]]] = collections.OrderedDict()
+        self._lock = threading.RLock()
+        self._max_size = max_size
+        self._watched: dict[int, list] = {}
+
+        # Node event callbacks are removed by identity, so every watched node is given
+        # this same bound method.
+        self._event_callback = self._on_node_event
+
+    def __len__(self) -> int:
+        """The number of cached paths."""
+        return len(self._entries)
+
+    # Properties
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of node paths to cache."""
+        return self._max_size
+
+    # Non-Public Methods
+
+    def _on_node_event(self, **kwargs: Any) -> None:
+        """Node event callback which invalidates paths affected by the node.
+
+        Args:
+            **kwargs:
+                The event keyword arguments.
+        """
+        self.invalidate(kwargs["node"])
+
+    def _remove_entry(self, session_id: int) -> None:
+        """Remove a cached path and stop watching nodes only it needed.
+
+        This must be called while holding the lock.
+
+        Args:
+            session_id:
+                The session id of the node to remove.
+        """
+        _, chain = self._entries.pop(session_id)
+
+        for watched_id in chain:
+            watched = self._watched[watched_id]
+            watched[1] -= 1
+
+            if watched[1]:
+                continue
+
+            del self._watched[watched_id]
+
+            with contextlib.suppress(hou.ObjectWasDeleted):
+                watched[0].removeEventCallback(_invalidating_event_types(), self._event_callback)
+
+    def _watch(self, node: hou.Node) -> tuple[int, ...]:
+        """Add event callbacks to a node and its ancestors.
+
+        This must be called while holding the lock.
+
+        Args:
+            node:
+                The node to watch.
+
+        Returns:
+            The session ids of the watched nodes.
+        """
+        chain = []
+        parent = node.parent()
+
+        # The root node cannot be renamed or deleted so it does not need watching.
+        while parent is not None:
+            session_id = node.sessionId()
+            chain.append(session_id)
+
+            watched = self._watched.get(session_id)
+
+            if watched is None:
+                node.addEventCallback(_invalidating_event_types(), self._event_callback)
+                self._watched[session_id] = [node, 1]
+
+            else:
+                watched[1] += 1
+
+            node = parent
+            parent = node.parent()
+
+        return tuple(chain)
+
+    # Methods
+
+    def clear(self) -> None:
+        """Remove all cached paths and event callbacks."""
+        with self._lock:
+            for session_id in list(self._entries):
+                self._remove_entry(session_id)
+
+    def invalidate(self, node: hou.Node) -> None:
+        """Remove the cached paths of a node and all its descendants.
+
+        Args:
+            node:
+                The node whose path is no longer valid.
+        """
+        session_id = node.sessionId()
+
+        with self._lock:
+            stale = [key for key, (_, chain) in self._entries.items() if session_id in chain]
+
+            for key in stale:
+                self._remove_entry(key)
+
+    def lookup(self, node: hou.Node) -> tuple[int, str]:
+        """Get the session id and path of a node.
+
+        Args:
+            node:
+                The node to get the session id and path for.
+
+        Returns:
+            The node session id and path.
+        """
+        session_id = node.sessionId()
+
+        with self._lock:
+            entry = self._entries.get(session_id)
+
+            if entry is not None:
+                self._entries.move_to_end(session_id)
+
+                return session_id, entry[0]
+
+            path = node.path()
+
+            self._entries[session_id] = (path, self._watch(node))
+
+            if len(self._entries) > self._max_size:
+                self._remove_entry(next(iter(self._entries)))
+
+        return session_id, path
+
+    def path(self, node: hou.Node) -> str:
+        """Get the path of a node.
+
+        Args:
+            node:
+                The node to get the path for.
+
+        Returns:
+            The node path.
+        """
+        return self.lookup(node)[1]
+
+
+NODE_PATH_CACHE = NodePathCache()
+"""The node path cache shared by the adapters."""
+
+# Non-Public Functions
+
+
+@cache
+def _invalidating_event_types() -> tuple[hou.nodeEventType, ...]:
+    """Get the node events which change the path of a node or any of its descendants.
+
+    Returns:
+        The node event types.
+    """
+    return (hou.nodeEventType.NameChanged, hou.nodeEventType.BeingDeleted)
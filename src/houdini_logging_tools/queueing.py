@@ -0,0 +1,223 @@
+"""Bounded queues which dispatch items in batches from a background thread."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import enum
+import queue
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Globals
+
+# Sentinel placed on the queue to tell the worker thread to exit.
+_STOP = object()
+
+
+# Classes
+
+
+class DropPolicy(enum.Enum):
+    """Policies for handling new items when a bounded queue is full."""
+
+    BLOCK = "block"
+    """Block the calling thread until there is room in the queue."""
+
+    DROP_NEWEST = "drop-newest"
+    """Discard the incoming item."""
+
+    DROP_OLDEST = "drop-oldest"
+    """Discard the oldest queued item to make room for the incoming one."""
+
+
+class BatchDispatcher:
+    """Bounded queue drained in batches by a background worker thread.
+
+    The worker thread is started on the first call to put().  The callback is invoked
+    from the worker thread and is responsible for handling any errors raised while
+    processing its items.  Once stop() has been called the worker is never restarted
+    and any further items are discarded.
+
+    Args:
+        callback:
+            Callable which is passed each list of items removed from the queue.
+        name:
+            The name of the worker thread.
+        max_size:
+            The maximum number of items which can be queued.
+        drop_policy:
+            How to handle new items when the queue is full.
+        batch_size:
+            The maximum number of items passed to a single callback call.
+        on_drop:
+            Optional callable which is called each time an item is discarded.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[list[Any]], None],
+        *,
+        name: str,
+        max_size: int = 10000,
+        drop_policy: DropPolicy | str = DropPolicy.DROP_OLDEST,
+        batch_size: int = 100,
+        on_drop: Callable[[], None] | None = None,
+    ) -> None:
+        if batch_size < 1:
+            msg = "batch_size must be at least 1"
+            raise ValueError(msg)
+
+        self._batch_size = batch_size
+        self._callback = callback
+        self._drop_policy = DropPolicy(drop_policy)
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._name = name
+        self._on_drop = on_drop
+        self._queue: queue.Queue = queue.Queue(max_size)
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    # Properties
+
+    @property
+    def drop_policy(self) -> DropPolicy:
+        """How new items are handled when the queue is full."""
+        return self._drop_policy
+
+    @property
+    def dropped(self) -> int:
+        """The number of items which have been discarded due to the queue being full."""
+        return self._dropped
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    # Non-Public Methods
+
+    def _count_dropped(self) -> None:
+        """Increment the dropped item count and call the drop callback."""
+        with self._lock:
+            self._dropped += 1
+
+        if self._on_drop is not None:
+            self._on_drop()
+
+    def _run(self) -> None:
+        """Worker thread loop which passes batches of queued items to the callback."""
+        item_queue = self._queue
+
+        while True:
+            batch = [item_queue.get()]
+
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(item_queue.get_nowait())
+
+                except queue.Empty:
+                    break
+
+            items = [item for item in batch if item is not _STOP]
+
+            try:
+                if items:
+                    self._callback(items)
+
+            finally:
+                for _ in batch:
+                    item_queue.task_done()
+
+            if len(items) != len(batch):
+                return
+
+    # Methods
+
+    def flush(self) -> None:
+        """Block until all currently queued items have been dispatched."""
+        if self.is_running:
+            self._queue.join()
+
+    def put(self, item: Any) -> bool:
+        """Add an item to the queue.
+
+        Args:
+            item:
+                The item to queue.
+
+        Returns:
+            Whether the item was queued.
+        """
+        if self._stopped:
+            return False
+
+        self.start()
+
+        if self._drop_policy == DropPolicy.BLOCK:
+            self._queue.put(item)
+
+            return True
+
+        while True:
+            try:
+                self._queue.put_nowait(item)
+
+            except queue.Full:
+                if self._drop_policy == DropPolicy.DROP_NEWEST:
+                    self._count_dropped()
+
+                    return False
+
+                # Make room by removing the oldest item.  If the worker emptied the
+                # queue in the meantime there is nothing to discard so just try again.
+                try:
+                    self._queue.get_nowait()
+
+                except queue.Empty:
+                    continue
+
+                self._queue.task_done()
+                self._count_dropped()
+
+            else:
+                return True
+
+    def start(self) -> None:
+        """Start the worker thread if it is not already running or has been stopped."""
+        if self._thread is not None or self._stopped:
+            return
+
+        with self._lock:
+            if self._thread is None and not self._stopped:
+                thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                thread.start()
+
+                self._thread = thread
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Dispatch any queued items and stop the worker thread.
+
+        Items put after this is called are discarded.
+
+        Args:
+            timeout:
+                Optional number of seconds to wait for the worker thread to finish.
+        """
+        with self._lock:
+            self._stopped = True
+
+            thread = self._thread
+            self._thread = None
+
+        if thread is None:
+            return
+
+        # Always block here so the stop request can't be discarded by the drop policy.
+        self._queue.put(_STOP)
+
+        thread.join(timeout)
@@ -0,0 +1,353 @@
+"""Timed spans of code, recorded as Performance Monitor events, log records and statistics."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import collections
+import contextvars
+import logging
+import math
+import threading
+import time
+from functools import wraps
+from typing import TYPE_CHECKING, Any, NamedTuple, Self
+
+# Houdini Logging Tools
+from houdini_logging_tools.context import LOG_CONTEXT
+from houdini_logging_tools.lazy import hou, is_hou_available
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from houdini_logging_tools.adapters.loggeradapter import HoudiniLoggerAdapter
+
+# Globals
+
+# The innermost span entered as a context manager, linked to the spans it is inside.
+# A context variable keeps the spans of each thread and asyncio task separate, so the
+# same TimedSpan can be entered by several of them at once.
+_ACTIVE_SPAN: contextvars.ContextVar[_ActiveSpan | None] = contextvars.ContextVar(
+    "houdini_logging_tools.active_span", default=None
+)
+
+# The stacklevel passed when logging a span's duration, which skips the log wrapper,
+# _stop() and the __exit__() or decorator wrapper so the record represents the code
+# which used the span.
+_STACKLEVEL = 4
+
+# Classes
+
+
+class SpanStatistics:
+    """Thread safe statistics of the durations of named spans.
+
+    The count and total duration of each span are exact, while the percentiles are
+    calculated from only the most recent durations so that recording a duration takes
+    constant time and memory.
+
+    Args:
+        max_samples:
+            The maximum number of recent durations to keep for each span.
+    """
+
+    def __init__(self, max_samples: int = 1024) -> None:
+        if max_samples < 1:
+            msg = "max_samples must be at least 1"
+            raise ValueError(msg)
+
+        self._lock = threading.Lock()
+        self._max_samples = max_samples
+        self._spans: dict[str, _SpanDurations] = {}
+
+    # Methods
+
+    def clear(self) -> None:
+        """Discard the statistics of all spans."""
+        with self._lock:
+            self._spans.clear()
+
+    def dump(self, logger: logging.Logger | logging.LoggerAdapter, level: int = logging.INFO) -> None:
+        """Log the statistics of each span, slowest in total first.
+
+        Args:
+            logger:
+                The logger to log the statistics to.
+            level:
+                The level to log the statistics at.
+        """
+        summaries = sorted(self.summary().values(), key=lambda summary: summary.total, reverse=True)
+
+        for summary in summaries:
+            logger.log(
+                level,
+                "%s: count=%d total=%.3fs p50=%.3fms p95=%.3fms",
+                summary.name,
+                summary.count,
+                summary.total,
+                summary.p50 * 1000,
+                summary.p95 * 1000,
+            )
+
+    def record(self, name: str, duration: float) -> None:
+        """Record the duration of a span.
+
+        Args:
+            name:
+                The span name.
+            duration:
+                The duration in seconds.
+        """
+        with self._lock:
+            durations = self._spans.get(name)
+
+            if durations is None:
+                durations = self._spans[name] = _SpanDurations(self._max_samples)
+
+            durations.count += 1
+            durations.total += duration
+            durations.samples.append(duration)
+
+    def summary(self) -> dict[str, SpanSummary]:
+        """Get the statistics of each span.
+
+        Returns:
+            The statistics of each span, by name.
+        """
+        with self._lock:
+            spans = [
+                (name, durations.count, durations.total, list(durations.samples))
+                for name, durations in self._spans.items()
+            ]
+
+        result = {}
+
+        for name, count, total, samples in spans:
+            samples.sort()
+
+            result[name] = SpanSummary(name, count, total, _percentile(samples, 0.5), _percentile(samples, 0.95))
+
+        return result
+
+
+class SpanSummary(NamedTuple):
+    """The statistics of a span."""
+
+    name: str
+    """The span name."""
+
+    count: int  # type: ignore
+    """The number of times the span was recorded."""
+
+    total: float
+    """The total duration of the span, in seconds."""
+
+    p50: float
+    """The median of the recent durations, in seconds."""
+
+    p95: float
+    """The 95th percentile of the recent durations, in seconds."""
+
+
+class TimedSpan:
+    """Context manager and decorator which times a span of code.
+
+    The span is recorded as a Performance Monitor event, for the node if there is one,
+    its duration is logged and it is added to the span statistics.  These are created
+    with HoudiniLoggerAdapter.timed().
+
+    Args:
+        adapter:
+            The adapter to log the duration through.
+        name:
+            The span name.  If None the qualified name of the decorated function is used.
+        level:
+            The level to log the duration at.
+        node:
+            Optional node to record the event for.  Defaults to the node of the current
+            LogContext, or else the adapter's node.
+        statistics:
+            The statistics to add the duration to.
+    """
+
+    __slots__ = ("_adapter", "_level", "_name", "_node", "_statistics")
+
+    def __init__(
+        self,
+        adapter: HoudiniLoggerAdapter,
+        name: str | None,
+        *,
+        level: int,
+        node: hou.Node | None,
+        statistics: SpanStatistics,
+    ) -> None:
+        self._adapter = adapter
+        self._level = level
+        self._name = name
+        self._node = node
+        self._statistics = statistics
+
+    def __call__(self, func: Callable) -> Callable:
+        """Decorate a function so each call to it is timed.
+
+        Args:
+            func:
+                The function to decorate.
+
+        Returns:
+            The decorated function.
+        """
+        name = self._name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            event, start = self._start(name)
+
+            try:
+                return func(*args, **kwargs)
+
+            finally:
+                self._stop(name, event, start)
+
+        return wrapper
+
+    def __enter__(self) -> Self:
+        """Start timing the span.
+
+        Raises:
+            ValueError:
+                If the span has no name.
+        """
+        if self._name is None:
+            msg = "A span needs a name when used as a context manager"
+            raise ValueError(msg)
+
+        _ACTIVE_SPAN.set(_ActiveSpan(*self._start(self._name), _ACTIVE_SPAN.get()))
+
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop timing the span."""
+        active: _ActiveSpan = _ACTIVE_SPAN.get()  # type: ignore
+
+        _ACTIVE_SPAN.set(active.parent)
+
+        self._stop(self._name, active.event, active.start)  # type: ignore
+
+    # Properties
+
+    @property
+    def name(self) -> str | None:
+        """The span name."""
+        return self._name
+
+    # Non-Public Methods
+
+    def _start(self, name: str) -> tuple[Any, float]:
+        """Start a Performance Monitor event and the timer.
+
+        Args:
+            name:
+                The span name.
+
+        Returns:
+            The started event, if hou is available, and the start time.
+        """
+        event = None
+
+        if is_hou_available():
+            node = self._node
+
+            if node is None:
+                scope = LOG_CONTEXT.get()
+                node = scope.values.get("node") if scope is not None else None
+
+                if node is None:
+                    node = self._adapter.node
+
+            event = hou.perfMon.startEvent(name) if node is None else hou.perfMon.startCookEvent(name, node)
+
+        return event, time.perf_counter()
+
+    def _stop(self, name: str, event: Any, start: float) -> None:
+        """Stop the timer and the Performance Monitor event, and record the duration.
+
+        Args:
+            name:
+                The span name.
+            event:
+                The started event, if any.
+            start:
+                The start time.
+        """
+        duration = time.perf_counter() - start
+
+        if event is not None:
+            event.stop()
+
+        self._statistics.record(name, duration)
+
+        if not self._adapter.isEnabledFor(self._level):
+            return
+
+        kwargs: dict[str, Any] = {"extra": {"span": name, "span_duration": duration}, "stacklevel": _STACKLEVEL}
+
+        # Only pass an explicit node, so the current LogContext's or the adapter's is
+        # used otherwise.
+        if self._node is not None:
+            kwargs["node"] = self._node
+
+        self._adapter.log(self._level, "%s took %.3fms", name, duration * 1000, **kwargs)
+
+
+SPAN_STATISTICS = SpanStatistics()
+"""The span statistics shared by the adapters."""
+
+# Non-Public Classes
+
+
+class _ActiveSpan(NamedTuple):
+    """A span entered as a context manager, which restores the span around it on exit."""
+
+    event: Any
+    """The started Performance Monitor event, if any."""
+
+    start: float
+    """The start time."""
+
+    parent: _ActiveSpan | None
+    """The span this one was entered inside, if any."""
+
+
+class _SpanDurations:
+    """The recorded durations of a span.
+
+    Args:
+        max_samples:
+            The maximum number of recent durations to keep.
+    """
+
+    __slots__ = ("count", "samples", "total")
+
+    def __init__(self, max_samples: int) -> None:
+        self.count = 0
+        self.samples: collections.deque[float] = collections.deque(maxlen=max_samples)
+        self.total = 0.0
+
+
+# Non-Public Functions
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    """Get a percentile of sorted samples using the nearest rank.
+
+    Args:
+        samples:
+            The sorted samples.
+        fraction:
+            The percentile, as a fraction.
+
+    Returns:
+        The percentile.
+    """
+    return samples[math.ceil(fraction * len(samples)) - 1]
@@ -0,0 +1,764 @@
+"""A stand-in for the hou module for running outside of Houdini.
+
+The module only covers the parts of hou used by this package: logging, perfMon, ui,
+ShellIO, severityType, nodeEventType and a simple node hierarchy.  Every call into it can be
+given an artificial latency to approximate the cost of calling into Houdini.
+
+Calls which would display something are recorded on the module instead, for example
+the messages passed to hou.ui.displayMessage() are available from hou.ui.messages.
+
+>>> from houdini_logging_tools.testing import fake_hou
+>>> hou = fake_hou.install(latency=1e-6)
+>>> import houdini_logging_tools.handlers.houdini_logging
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import collections
+import sys
+import time
+import types
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+# Globals
+
+DEFAULT_NODE_PATHS = ("/obj", "/out", "/mat", "/stage", "/tasks")
+"""The paths of the nodes which exist in a new fake session."""
+
+# Classes
+
+
+class Error(Exception):
+    """Base class for fake hou exceptions."""
+
+
+class ObjectWasDeleted(Error):
+    """Raised when using a node which has been destroyed."""
+
+
+class EnumValue:
+    """A value of one of the fake hou enumerations.
+
+    Args:
+        enum_name:
+            The name of the enumeration.
+        name:
+            The name of the value.
+    """
+
+    __slots__ = ("_enum_name", "_name")
+
+    def __init__(self, enum_name: str, name: str) -> None:
+        self._enum_name = enum_name
+        self._name = name
+
+    def __repr__(self) -> str:
+        """The representation of the value."""
+        return f"{self._enum_name}.{self._name}"
+
+    # Methods
+
+    def name(self) -> str:
+        """The name of the value.
+
+        Returns:
+            The value name.
+        """
+        return self._name
+
+
+class nodeEventType:
+    """Fake hou.nodeEventType enumeration."""
+
+    BeingDeleted = EnumValue("nodeEventType", "BeingDeleted")
+    NameChanged = EnumValue("nodeEventType", "NameChanged")
+
+
+class severityType:
+    """Fake hou.severityType enumeration."""
+
+    Message = EnumValue("severityType", "Message")
+    ImportantMessage = EnumValue("severityType", "ImportantMessage")
+    Warning = EnumValue("severityType", "Warning")
+    Error = EnumValue("severityType", "Error")
+    Fatal = EnumValue("severityType", "Fatal")
+
+
+class Session:
+    """The state shared by the objects of a fake hou module.
+
+    Args:
+        latency:
+            The number of seconds every call into the module takes.
+        ui_available:
+            Whether the UI is reported as being available.
+        history_size:
+            The maximum number of displayed or logged items to record.
+    """
+
+    def __init__(self, latency: float = 0.0, *, ui_available: bool = True, history_size: int = 1000) -> None:
+        self.history_size = history_size
+        self.latency = latency
+        self.nodes: dict[str, Node] = {}
+        self.ui_available = ui_available
+
+        self._last_session_id = 0
+
+    # Methods
+
+    def next_session_id(self) -> int:
+        """Get a new unique node session id.
+
+        Returns:
+            The session id.
+        """
+        self._last_session_id += 1
+
+        return self._last_session_id
+
+    def wait(self) -> None:
+        """Wait for the artificial latency to pass.
+
+        This busy waits since sleeping is not accurate for very short times.
+        """
+        if self.latency <= 0:
+            return
+
+        end = time.perf_counter() + self.latency
+
+        while time.perf_counter() < end:
+            pass
+
+
+class LogEntry:
+    """Fake hou.logging.LogEntry.
+
+    Args:
+        message:
+            The entry message.
+        source_context:
+            The entry source context.
+        severity:
+            The entry severity.
+        time:
+            The entry time.
+        **kwargs:
+            Any other entry data.
+    """
+
+    def __init__(
+        self,
+        message: str = "",
+        source_context: str = "",
+        severity: EnumValue = severityType.Message,
+        time: float = 0.0,
+        **kwargs: Any,
+    ) -> None:
+        self.message = message
+        self.severity = severity
+        self.source_context = source_context
+        self.time = time
+        self.kwargs = kwargs
+
+
+class Logging:
+    """Fake hou.logging module.
+
+    Args:
+        session:
+            The fake session.
+    """
+
+    LogEntry: TypeAlias = LogEntry
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+        self.entries: collections.deque[tuple[LogEntry, str | None]] = collections.deque(maxlen=session.history_size)
+        """The most recently logged entries and their source names."""
+
+        self._sources: list[str] = []
+
+    # Methods
+
+    def createSource(self, source_name: str) -> None:
+        """Create a log source.
+
+        Args:
+            source_name:
+                The name of the source.
+        """
+        self._session.wait()
+
+        if source_name not in self._sources:
+            self._sources.append(source_name)
+
+    def log(self, entry: LogEntry, source_name: str | None = None) -> None:
+        """Log an entry.
+
+        Args:
+            entry:
+                The entry to log.
+            source_name:
+                The name of the source to log to.
+        """
+        self._session.wait()
+
+        self.entries.append((entry, source_name))
+
+    def sources(self) -> tuple[str, ...]:
+        """Get the names of the log sources.
+
+        Returns:
+            The source names.
+        """
+        self._session.wait()
+
+        return tuple(self._sources)
+
+
+class Node:
+    """Fake hou.Node.
+
+    Args:
+        session:
+            The fake session.
+        name:
+            The node name.
+        parent:
+            Optional parent node.
+    """
+
+    def __init__(self, session: Session, name: str, parent: Node | None = None) -> None:
+        self._callbacks: list[tuple[tuple[EnumValue, ...], Callable]] = []
+        self._children: dict[str, Node] = {}
+        self._deleted = False
+        self._name = name
+        self._parent = parent
+        self._session = session
+        self._session_id = session.next_session_id()
+
+        if parent is not None:
+            parent._children[name] = self
+
+        session.nodes[self._build_path()] = self
+
+    def __repr__(self) -> str:
+        """The representation of the node."""
+        return f"<fake hou.Node {self._build_path()}>"
+
+    # Non-Public Methods
+
+    def _build_path(self) -> str:
+        """Build the path of the node.
+
+        Returns:
+            The node path.
+        """
+        if self._parent is None:
+            return "/"
+
+        parent_path = self._parent._build_path()
+
+        return f"{parent_path.rstrip('/')}/{self._name}"
+
+    def _check(self) -> None:
+        """Simulate a call into Houdini.
+
+        Raises:
+            ObjectWasDeleted: The node has been destroyed.
+        """
+        self._session.wait()
+
+        if self._deleted:
+            raise ObjectWasDeleted
+
+    def _fire(self, event_type: EnumValue) -> None:
+        """Run the event callbacks for an event.
+
+        Args:
+            event_type:
+                The event which occurred.
+        """
+        for event_types, callback in list(self._callbacks):
+            if event_type in event_types:
+                callback(event_type=event_type, node=self)
+
+    def _register(self) -> None:
+        """Add the node and its descendants to the session's node paths."""
+        self._session.nodes[self._build_path()] = self
+
+        for child in self._children.values():
+            child._register()
+
+    def _unregister(self) -> None:
+        """Remove the node and its descendants from the session's node paths."""
+        for child in self._children.values():
+            child._unregister()
+
+        del self._session.nodes[self._build_path()]
+
+    # Methods
+
+    def addEventCallback(self, event_types: Iterable[EnumValue], callback: Callable) -> None:
+        """Add a callback to run when an event occurs.
+
+        Args:
+            event_types:
+                The events to run the callback for.
+            callback:
+                The callback to run.
+        """
+        self._check()
+
+        self._callbacks.append((tuple(event_types), callback))
+
+    def children(self) -> tuple[Node, ...]:
+        """Get the child nodes.
+
+        Returns:
+            The child nodes.
+        """
+        self._check()
+
+        return tuple(self._children.values())
+
+    def createNode(self, node_type_name: str, node_name: str | None = None) -> Node:
+        """Create a child node.
+
+        Args:
+            node_type_name:
+                The type of node to create.
+            node_name:
+                Optional name of the node.
+
+        Returns:
+            The new node.
+        """
+        self._check()
+
+        if node_name is None:
+            index = 1
+
+            while f"{node_type_name}{index}" in self._children:
+                index += 1
+
+            node_name = f"{node_type_name}{index}"
+
+        return Node(self._session, node_name, self)
+
+    def destroy(self) -> None:
+        """Destroy the node and all its descendants."""
+        self._check()
+
+        for child in list(self._children.values()):
+            child.destroy()
+
+        self._fire(nodeEventType.BeingDeleted)
+
+        self._unregister()
+
+        if self._parent is not None:
+            del self._parent._children[self._name]
+
+        self._deleted = True
+
+    def eventCallbacks(self) -> tuple[tuple[tuple[EnumValue, ...], Callable], ...]:
+        """Get the event callbacks.
+
+        Returns:
+            The event types and callback of each callback.
+        """
+        self._check()
+
+        return tuple(self._callbacks)
+
+    def name(self) -> str:
+        """Get the node name.
+
+        Returns:
+            The node name.
+        """
+        self._check()
+
+        return self._name
+
+    def parent(self) -> Node | None:
+        """Get the parent node.
+
+        Returns:
+            The parent node, if any.
+        """
+        self._check()
+
+        return self._parent
+
+    def path(self) -> str:
+        """Get the node path.
+
+        Returns:
+            The node path.
+        """
+        self._check()
+
+        return self._build_path()
+
+    def removeEventCallback(self, event_types: Iterable[EnumValue], callback: Callable) -> None:
+        """Remove an event callback.
+
+        Args:
+            event_types:
+                The events the callback was added for.
+            callback:
+                The callback to remove.
+        """
+        self._check()
+
+        self._callbacks.remove((tuple(event_types), callback))
+
+    def sessionId(self) -> int:
+        """Get the node's unique id.
+
+        Returns:
+            The session id.
+        """
+        self._check()
+
+        return self._session_id
+
+    def setName(self, name: str) -> None:
+        """Rename the node.
+
+        Args:
+            name:
+                The new name.
+        """
+        self._check()
+
+        self._unregister()
+
+        if self._parent is not None:
+            del self._parent._children[self._name]
+            self._parent._children[name] = self
+
+        self._name = name
+
+        self._register()
+
+        self._fire(nodeEventType.NameChanged)
+
+
+class PerfMon:
+    """Fake hou.perfMon module.
+
+    Args:
+        session:
+            The fake session.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+        self.events: collections.deque[PerfMonEvent] = collections.deque(maxlen=session.history_size)
+        """The most recently started events."""
+
+    # Methods
+
+    def startCookEvent(
+        self,
+        description: str,
+        node: Node,
+        auto_nest_events: bool = True,  # noqa: FBT001, FBT002
+    ) -> PerfMonEvent:
+        """Start a cook event for a node.
+
+        Args:
+            description:
+                The event description.
+            node:
+                The node the event is for.
+            auto_nest_events:
+                Whether events started before this one is stopped are nested in it.
+
+        Returns:
+            The started event.
+        """
+        self._session.wait()
+
+        event = PerfMonEvent(self._session, description, node)
+        self.events.append(event)
+
+        return event
+
+    def startEvent(
+        self,
+        description: str,
+        auto_nest_events: bool = True,  # noqa: FBT001, FBT002
+    ) -> PerfMonEvent:
+        """Start an event.
+
+        Args:
+            description:
+                The event description.
+            auto_nest_events:
+                Whether events started before this one is stopped are nested in it.
+
+        Returns:
+            The started event.
+        """
+        self._session.wait()
+
+        event = PerfMonEvent(self._session, description)
+        self.events.append(event)
+
+        return event
+
+
+class PerfMonEvent:
+    """Fake hou.PerfMonEvent.
+
+    Args:
+        session:
+            The fake session.
+        description:
+            The event description.
+        node:
+            Optional node the event is for.
+    """
+
+    def __init__(self, session: Session, description: str, node: Node | None = None) -> None:
+        self._session = session
+
+        self.description = description
+        self.node = node
+        self.start_time = time.perf_counter()
+        self.stop_time: float | None = None
+
+    # Methods
+
+    def isRunning(self) -> bool:
+        """Check whether the event is still running.
+
+        Returns:
+            Whether the event has not been stopped.
+        """
+        self._session.wait()
+
+        return self.stop_time is None
+
+    def stop(self) -> None:
+        """Stop the event."""
+        self._session.wait()
+
+        self.stop_time = time.perf_counter()
+
+
+class ShellIO:
+    """Fake hou.ShellIO.
+
+    Args:
+        session:
+            Optional fake session, used for the write latency.  Defaults to the session
+            of the module the class was taken from.
+    """
+
+    default_session: Session | None = None
+
+    def __init__(self, session: Session | None = None) -> None:
+        self._session = session or self.default_session or Session()
+
+        self.flushes = 0
+        """The number of times the shell was flushed."""
+
+        self.writes: collections.deque[str] = collections.deque(maxlen=self._session.history_size)
+        """The most recently written text."""
+
+    # Methods
+
+    def flush(self) -> None:
+        """Flush the shell."""
+        self._session.wait()
+
+        self.flushes += 1
+
+    def write(self, text: str) -> None:
+        """Write text to the shell.
+
+        Args:
+            text:
+                The text to write.
+        """
+        self._session.wait()
+
+        self.writes.append(text)
+
+
+class UI:
+    """Fake hou.ui module.
+
+    Args:
+        session:
+            The fake session.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._callbacks: list[Callable[[], None]] = []
+        self._session = session
+
+        self.messages: collections.deque[tuple[str, dict[str, Any]]] = collections.deque(maxlen=session.history_size)
+        """The most recently displayed dialog messages and their keyword arguments."""
+
+        self.status_messages: collections.deque[tuple[str, EnumValue]] = collections.deque(maxlen=session.history_size)
+        """The most recently set status bar messages and their severities."""
+
+    # Methods
+
+    def addEventLoopCallback(self, callback: Callable[[], None]) -> None:
+        """Add an event loop callback.
+
+        Args:
+            callback:
+                The callback to add.
+        """
+        self._session.wait()
+
+        self._callbacks.append(callback)
+
+    def displayMessage(self, text: str, **kwargs: Any) -> int:
+        """Record a dialog message.
+
+        Args:
+            text:
+                The message.
+            **kwargs:
+                The dialog options.
+
+        Returns:
+            The index of the chosen button, which is always 0.
+        """
+        self._session.wait()
+
+        self.messages.append((text, kwargs))
+
+        return 0
+
+    def eventLoopCallbacks(self) -> tuple[Callable[[], None], ...]:
+        """Get the event loop callbacks.
+
+        Returns:
+            The event loop callbacks.
+        """
+        self._session.wait()
+
+        return tuple(self._callbacks)
+
+    def process_events(self) -> None:
+        """Run each event loop callback once, as the Houdini event loop would."""
+        for callback in list(self._callbacks):
+            callback()
+
+    def removeEventLoopCallback(self, callback: Callable[[], None]) -> None:
+        """Remove an event loop callback.
+
+        Args:
+            callback:
+                The callback to remove.
+        """
+        self._session.wait()
+
+        self._callbacks.remove(callback)
+
+    def setStatusMessage(self, text: str, severity: EnumValue = severityType.Message) -> None:
+        """Record a status bar message.
+
+        Args:
+            text:
+                The message.
+            severity:
+                The message severity.
+        """
+        self._session.wait()
+
+        self.status_messages.append((text, severity))
+
+
+# Functions
+
+
+def create_module(latency: float = 0.0, *, ui_available: bool = True, history_size: int = 1000) -> types.ModuleType:
+    """Create a new fake hou module.
+
+    Args:
+        latency:
+            The number of seconds every call into the module takes.
+        ui_available:
+            Whether the UI is reported as being available.
+        history_size:
+            The maximum number of displayed or logged items to record.
+
+    Returns:
+        The fake module.
+    """
+    session = Session(latency, ui_available=ui_available, history_size=history_size)
+
+    root = Node(session, "/")
+
+    for path in DEFAULT_NODE_PATHS:
+        Node(session, path.lstrip("/"), root)
+
+    def is_ui_available() -> bool:
+        session.wait()
+
+        return session.ui_available
+
+    def node(path: str) -> Node | None:
+        session.wait()
+
+        return session.nodes.get(path)
+
+    module = types.ModuleType("hou", "Fake hou module created by houdini_logging_tools.testing.fake_hou.")
+
+    module.__dict__.update(
+        Error=Error,
+        Node=Node,
+        ObjectWasDeleted=ObjectWasDeleted,
+        ShellIO=type("ShellIO", (ShellIO,), {"default_session": session}),
+        isUIAvailable=is_ui_available,
+        logging=Logging(session),
+        node=node,
+        nodeEventType=nodeEventType,
+        perfMon=PerfMon(session),
+        session=session,
+        severityType=severityType,
+        ui=UI(session),
+    )
+
+    return module
+
+
+def install(latency: float = 0.0, *, ui_available: bool = True, history_size: int = 1000) -> types.ModuleType:
+    """Create a new fake hou module and make it the one imported as hou.
+
+    This must be called before importing any modules which import hou.
+
+    Args:
+        latency:
+            The number of seconds every call into the module takes.
+        ui_available:
+            Whether the UI is reported as being available.
+        history_size:
+            The maximum number of displayed or logged items to record.
+
+    Returns:
+        The fake module.
+    """
+    module = create_module(latency, ui_available=ui_available, history_size=history_size)
+
+    sys.modules["hou"] = module
+
+    return module
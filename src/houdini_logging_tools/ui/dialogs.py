@@ -0,0 +1,266 @@
+"""Aggregation of log messages into summary Houdini dialogs."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import contextlib
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+# Houdini Logging Tools
+from houdini_logging_tools.lazy import hou
+from houdini_logging_tools.mappings import severity_rank
+from houdini_logging_tools.ui.dispatch import UI_DISPATCHER, EventLoopCallback
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+# Classes
+
+
+class DialogMessage(NamedTuple):
+    """A message waiting to be displayed in a dialog."""
+
+    message: str
+    """The message text."""
+
+    severity: hou.severityType
+    """The message severity."""
+
+    title: str | None
+    """Optional dialog title for the message."""
+
+    node_path: str | None
+    """Optional path of the node the message is associated with."""
+
+
+class DialogAggregator:
+    """Collect dialog messages and display them together in a single dialog.
+
+    Messages are collected for a window of time after the first one is received, or
+    until the outermost defer() scope exits.  A single collected message is displayed
+    as normal.  Multiple messages are displayed as one dialog containing a summary of
+    the counts by severity and a details section listing all the messages grouped by
+    severity and node.
+
+    Without a window, and outside a defer() scope, messages are displayed immediately.
+
+    Args:
+        window:
+            Optional number of seconds to collect messages for before displaying them.
+        title:
+            Optional title for summary dialogs.
+    """
+
+    def __init__(self, window: float | None = None, *, title: str | None = None) -> None:
+        self._deadline: float | None = None
+        self._depth = 0
+        self._lock = threading.Lock()
+        self._messages: list[DialogMessage] = []
+        self._title = title
+        self._window = window
+
+        self._event_loop_callback = EventLoopCallback(self._on_event_loop, UI_DISPATCHER)
+
+    # Properties
+
+    @property
+    def deferred(self) -> bool:
+        """Whether messages are being held until a defer() scope exits."""
+        return self._depth > 0
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def pending(self) -> tuple[DialogMessage, ...]:
+        """The messages waiting to be displayed."""
+        return tuple(self._messages)
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def title(self) -> str | None:
+        """Optional title for summary dialogs."""
+        return self._title
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def window(self) -> float | None:
+        """The number of seconds messages are collected for before being displayed."""
+        return self._window
+
+    # Non-Public Methods
+
+    def _display(self, messages: list[DialogMessage]) -> None:
+        """Display a list of messages.
+
+        The dialog is posted to the main thread, so messages can be displayed when a
+        defer() scope exits on any thread.
+
+        Args:
+            messages:
+                The messages to display.
+        """
+        if not messages:
+            return
+
+        if len(messages) == 1:
+            message = messages[0]
+            text = message.message
+
+            if message.node_path is not None:
+                text = f"{message.node_path} - {text}"
+
+            UI_DISPATCHER.post(hou.ui.displayMessage, text, severity=message.severity, title=message.title)
+
+            return
+
+        summary, details, severity = _build_summary(messages)
+
+        title = self._title or next((message.title for message in messages if message.title), None)
+
+        UI_DISPATCHER.post(
+            hou.ui.displayMessage, summary, severity=severity, title=title, details=details, details_expanded=False
+        )
+
+    def _on_event_loop(self) -> None:
+        """Event loop callback which displays the messages once the window closes."""
+        with self._lock:
+            if self._depth or self._deadline is None or time.monotonic() < self._deadline:
+                return
+
+            messages = self._take_messages()
+
+        self._display(messages)
+
+    def _take_messages(self) -> list[DialogMessage]:
+        """Remove and return all the pending messages.
+
+        This must be called while holding the lock.
+
+        Returns:
+            The pending messages.
+        """
+        messages = self._messages
+
+        self._messages = []
+        self._deadline = None
+
+        self._event_loop_callback.unregister()
+
+        return messages
+
+    # Methods
+
+    def add(
+        self,
+        message: str,
+        severity: hou.severityType | None = None,
+        *,
+        title: str | None = None,
+        node_path: str | None = None,
+    ) -> None:
+        """Add a message to be displayed.
+
+        Args:
+            message:
+                The message text.
+            severity:
+                The severity of the message. Defaults to hou.severityType.Message.
+            title:
+                Optional dialog title for the message.
+            node_path:
+                Optional path of the node the message is associated with.
+        """
+        if severity is None:
+            severity = hou.severityType.Message
+
+        entry = DialogMessage(message, severity, title, node_path)
+
+        with self._lock:
+            if not self._depth and not self._window:
+                display = [entry]
+
+            else:
+                display = []
+
+                self._messages.append(entry)
+
+                # Start the window and wait for it to close.
+                if self._window and self._deadline is None:
+                    self._deadline = time.monotonic() + self._window
+
+                    self._event_loop_callback.register()
+
+        self._display(display)
+
+    @contextlib.contextmanager
+    def defer(self) -> Generator[None, None, None]:
+        """Context manager which holds all messages until the outermost scope exits."""
+        with self._lock:
+            self._depth += 1
+
+        try:
+            yield
+
+        finally:
+            with self._lock:
+                self._depth -= 1
+
+                messages = [] if self._depth else self._take_messages()
+
+            self._display(messages)
+
+    def flush(self) -> None:
+        """Immediately display any pending messages."""
+        with self._lock:
+            messages = self._take_messages()
+
+        self._display(messages)
+
+
+# Non-Public Functions
+
+
+def _build_summary(messages: list[DialogMessage]) -> tuple[str, str, hou.severityType]:
+    """Build the text for a summary dialog of multiple messages.
+
+    Args:
+        messages:
+            The messages to summarize.
+
+    Returns:
+        The summary text, the details text and the highest severity of the messages.
+    """
+    grouped: dict[hou.severityType, dict[str | None, list[str]]] = {}
+
+    for message in messages:
+        grouped.setdefault(message.severity, {}).setdefault(message.node_path, []).append(message.message)
+
+    severities = sorted(grouped, key=severity_rank, reverse=True)
+
+    counts = ", ".join(
+        f"{sum(len(node_messages) for node_messages in grouped[severity].values())} {severity.name()}"
+        for severity in severities
+    )
+
+    summary = f"{len(messages)} messages were logged ({counts})."
+
+    lines = []
+
+    for severity in severities:
+        lines.append(f"{severity.name()}:")
+
+        for node_path, node_messages in grouped[severity].items():
+            indent = "    "
+
+            if node_path is not None:
+                lines.append(f"    {node_path}")
+                indent = "        "
+
+            lines.extend(f"{indent}{text}" for text in node_messages)
+
+    return summary, "\n".join(lines), severities[0]
@@ -0,0 +1,212 @@
+"""Marshaling of UI calls from any thread onto Houdini's main thread."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import collections
+import threading
+from typing import TYPE_CHECKING, Any
+
+# Houdini Logging Tools
+from houdini_logging_tools.lazy import hou
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Classes
+
+
+class EventLoopCallback:
+    """Houdini event loop callback which is only registered while it has work to do.
+
+    Houdini removes event loop callbacks by identity, so the same callable is always
+    used to add and remove it, and registering or unregistering it again does nothing.
+
+    With a dispatcher the callback is only added and removed on the main thread.
+    Requests from other threads are posted through the dispatcher and the callback is
+    left registered or not according to the latest request once they run.  Without
+    one it is added and removed on the calling thread.
+
+    Args:
+        callback:
+            The callable run by each iteration of the event loop.
+        dispatcher:
+            Optional dispatcher to add and remove the callback through.
+    """
+
+    def __init__(self, callback: Callable[[], None], dispatcher: MainThreadDispatcher | None = None) -> None:
+        self._callback = callback
+        self._dispatcher = dispatcher
+        self._registered = False
+        self._wanted = False
+
+    # Properties
+
+    @property
+    def callback(self) -> Callable[[], None]:
+        """The callable run by each iteration of the event loop."""
+        return self._callback
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def registered(self) -> bool:
+        """Whether the callback is registered with the event loop."""
+        return self._registered
+
+    # Non-Public Methods
+
+    def _request(self, *, wanted: bool) -> None:
+        """Request that the callback is registered or not.
+
+        Args:
+            wanted:
+                Whether the callback should be registered.
+        """
+        if wanted == self._wanted:
+            return
+
+        self._wanted = wanted
+
+        if self._dispatcher is None:
+            self._sync()
+
+        else:
+            self._dispatcher.post(self._sync)
+
+    def _sync(self) -> None:
+        """Add or remove the callback to match the latest request."""
+        wanted = self._wanted
+
+        if wanted == self._registered:
+            return
+
+        if wanted:
+            hou.ui.addEventLoopCallback(self._callback)
+
+        else:
+            hou.ui.removeEventLoopCallback(self._callback)
+
+        self._registered = wanted
+
+    # Methods
+
+    def register(self) -> None:
+        """Register the callback if it is not already."""
+        self._request(wanted=True)
+
+    def unregister(self) -> None:
+        """Remove the callback if it is registered."""
+        self._request(wanted=False)
+
+
+class MainThreadDispatcher:
+    """Run calls on the main thread in the order they were posted.
+
+    Houdini's UI must only be used from the main thread.  Calls posted from any other
+    thread are queued and the posting thread returns immediately, without waiting for
+    the UI.  The queued calls are run in batches from a Houdini event loop callback.
+
+    Calls posted from the main thread are run immediately, unless earlier calls are
+    still queued in which case they are queued behind them.
+
+    Args:
+        batch_size:
+            The maximum number of queued calls run by each event loop callback.
+    """
+
+    def __init__(self, batch_size: int = 100) -> None:
+        if batch_size < 1:
+            msg = "batch_size must be at least 1"
+            raise ValueError(msg)
+
+        self._batch_size = batch_size
+        self._calls: collections.deque[tuple[Callable[..., Any], tuple, dict[str, Any]]] = collections.deque()
+        self._lock = threading.Lock()
+        self._main_thread_id = threading.main_thread().ident
+
+        # The dispatcher's own callback is registered from the posting thread, as it is
+        # what runs the posted calls on the main thread.
+        self._event_loop_callback = EventLoopCallback(self._on_event_loop)
+
+    # Properties
+
+    @property
+    def batch_size(self) -> int:
+        """The maximum number of queued calls run by each event loop callback."""
+        return self._batch_size
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def pending(self) -> int:
+        """The number of calls waiting to be run."""
+        return len(self._calls)
+
+    # Non-Public Methods
+
+    def _on_event_loop(self) -> None:
+        """Event loop callback which runs the next batch of queued calls."""
+        for _ in range(self._batch_size):
+            if not self._run_next():
+                return
+
+    def _run_next(self) -> bool:
+        """Remove the oldest queued call and run it.
+
+        Calls are removed one at a time, rather than as a whole batch, so any calls
+        run from a nested event loop, such as that of a modal dialog, still run in
+        order.
+
+        Returns:
+            Whether there was a call to run.
+        """
+        with self._lock:
+            call = self._calls.popleft() if self._calls else None
+
+            if not self._calls:
+                self._event_loop_callback.unregister()
+
+        if call is None:
+            return False
+
+        func, args, kwargs = call
+        func(*args, **kwargs)
+
+        return True
+
+    # Methods
+
+    def flush(self) -> None:
+        """Immediately run all the queued calls.
+
+        This must be called from the main thread.
+        """
+        while self._run_next():
+            pass
+
+    def post(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Run a call on the main thread.
+
+        Args:
+            func:
+                The callable to run.
+            *args:
+                The positional args to call it with.
+            **kwargs:
+                The keyword args to call it with.
+        """
+        if threading.get_ident() == self._main_thread_id and not self._calls:
+            func(*args, **kwargs)
+
+            return
+
+        with self._lock:
+            self._calls.append((func, args, kwargs))
+
+            self._event_loop_callback.register()
+
+
+UI_DISPATCHER = MainThreadDispatcher()
+"""The dispatcher which adapters post their dialog and status bar output through."""
@@ -0,0 +1,145 @@
+"""Throttled output of messages to the Houdini status bar."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import threading
+import time
+from typing import TYPE_CHECKING
+
+# Houdini Logging Tools
+from houdini_logging_tools.lazy import hou
+from houdini_logging_tools.mappings import severity_rank
+from houdini_logging_tools.ui.dispatch import UI_DISPATCHER, EventLoopCallback
+
+if TYPE_CHECKING:
+    from houdini_logging_tools.formatting import LazyMessage
+
+# Classes
+
+
+class StatusBarSink:
+    """Write messages to the Houdini status bar at a limited rate.
+
+    Messages received faster than the maximum rate are held and only the latest one
+    is shown once the rate allows it.  When prioritizing severity, a held message is
+    only replaced by one of the same or higher severity, so the most severe message
+    received during the interval is the one shown.
+
+    Held messages are shown from a Houdini event loop callback.  Messages can be
+    passed as a LazyMessage so that any which are never shown are never interpolated.
+
+    Args:
+        max_rate:
+            The maximum number of status bar updates per second.
+        prioritize_severity:
+            Whether a held message can only be replaced by one of the same or higher severity.
+    """
+
+    def __init__(self, max_rate: float = 10.0, *, prioritize_severity: bool = True) -> None:
+        if max_rate <= 0:
+            msg = "max_rate must be greater than 0"
+            raise ValueError(msg)
+
+        self._interval = 1.0 / max_rate
+        self._last_update = float("-inf")
+        self._lock = threading.Lock()
+        self._pending: tuple[str | LazyMessage, hou.severityType] | None = None
+        self._prioritize_severity = prioritize_severity
+
+        self._event_loop_callback = EventLoopCallback(self._on_event_loop, UI_DISPATCHER)
+
+    # Properties
+
+    @property
+    def max_rate(self) -> float:
+        """The maximum number of status bar updates per second."""
+        return 1.0 / self._interval
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def pending(self) -> tuple[str | LazyMessage, hou.severityType] | None:
+        """The message and severity waiting to be shown, if any."""
+        return self._pending
+
+    # --------------------------------------------------------------------------
+
+    @property
+    def prioritize_severity(self) -> bool:
+        """Whether a held message can only be replaced by one of the same or higher severity."""
+        return self._prioritize_severity
+
+    # Non-Public Methods
+
+    def _on_event_loop(self) -> None:
+        """Event loop callback which shows the held message once the rate allows it."""
+        now = time.monotonic()
+
+        with self._lock:
+            pending = self._pending
+
+            if pending is None:
+                self._event_loop_callback.unregister()
+
+                return
+
+            if now - self._last_update < self._interval:
+                return
+
+            self._pending = None
+            self._last_update = now
+
+            self._event_loop_callback.unregister()
+
+        hou.ui.setStatusMessage(str(pending[0]), severity=pending[1])
+
+    # Methods
+
+    def flush(self) -> None:
+        """Immediately show any held message."""
+        with self._lock:
+            pending = self._pending
+
+            self._pending = None
+            self._last_update = time.monotonic()
+
+            self._event_loop_callback.unregister()
+
+        if pending is not None:
+            hou.ui.setStatusMessage(str(pending[0]), severity=pending[1])
+
+    def update(self, message: str | LazyMessage, severity: hou.severityType | None = None) -> None:
+        """Show a message in the status bar, or hold it until the rate allows.
+
+        Args:
+            message:
+                The message to show.
+            severity:
+                The severity of the message. Defaults to hou.severityType.Message.
+        """
+        if severity is None:
+            severity = hou.severityType.Message
+
+        now = time.monotonic()
+
+        with self._lock:
+            if self._pending is None and now - self._last_update >= self._interval:
+                self._last_update = now
+
+            else:
+                pending = self._pending
+
+                if (
+                    pending is None
+                    or not self._prioritize_severity
+                    or severity_rank(severity) >= severity_rank(pending[1])
+                ):
+                    self._pending = (message, severity)
+
+                self._event_loop_callback.register()
+
+                return
+
+        hou.ui.setStatusMessage(str(message), severity=severity)
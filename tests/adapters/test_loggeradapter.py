@@ -2,12 +2,21 @@
 
 # Standard Library
 import logging
+import threading
 
 # Third Party
 import pytest
 
 # Houdini Logging Tools
 import houdini_logging_tools.adapters.loggeradapter
+import houdini_logging_tools.context
+import houdini_logging_tools.filters
+import houdini_logging_tools.formatting
+import houdini_logging_tools.nodes
+import houdini_logging_tools.spans
+import houdini_logging_tools.ui.dialogs
+import houdini_logging_tools.ui.dispatch
+import houdini_logging_tools.ui.statusbar
 
 # Houdini
 import hou
@@ -15,6 +24,24 @@ import hou
 # Fixtures
 
 
+@pytest.fixture(autouse=True)
+def clear_ui_available_cache():
+    """Fixture to clear the cached UI availability so tests can change it."""
+    houdini_logging_tools.adapters.loggeradapter._is_ui_available.cache_clear()
+
+    yield
+
+    houdini_logging_tools.adapters.loggeradapter._is_ui_available.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_node_path_cache():
+    """Fixture to remove any node paths and callbacks cached by the adapter."""
+    yield
+
+    houdini_logging_tools.nodes.NODE_PATH_CACHE.clear()
+
+
 @pytest.fixture
 def test_adapter():
     """Fixture to provide a HoudiniLoggerAdapter."""
@@ -49,10 +76,26 @@ class TestHoudiniLoggerAdapter:
         assert log._node == mock_node
         assert log._status_bar == mock_status_bar
 
+    def test_logging_methods(self, test_adapter):
+        """Test that the logging methods are wrapped at the class level."""
+        for name in ("critical", "debug", "error", "exception", "info", "warning"):
+            method = getattr(houdini_logging_tools.adapters.loggeradapter.HoudiniLoggerAdapter, name)
+
+            assert method.__wrapped__ is getattr(logging.LoggerAdapter, name)
+            assert name not in vars(test_adapter)
+
+        log = houdini_logging_tools.adapters.loggeradapter.HoudiniLoggerAdapter.log
+
+        assert log.__wrapped__ is logging.LoggerAdapter.log
+
     # Class Methods
 
-    def test_from_name(self):
+    def test_from_name(self, mocker):
         """Test HoudiniLoggerAdapter.from_name()."""
+        mock_sink = mocker.MagicMock(spec=houdini_logging_tools.ui.statusbar.StatusBarSink)
+        mock_aggregator = mocker.MagicMock(spec=houdini_logging_tools.ui.dialogs.DialogAggregator)
+        mock_rate_limit = mocker.MagicMock(spec=houdini_logging_tools.filters.CallSiteRateLimitFilter)
+
         result = houdini_logging_tools.adapters.loggeradapter.HoudiniLoggerAdapter.from_name("test_name")
 
         assert result.logger.name == "test_name"
@@ -63,6 +106,9 @@ class TestHoudiniLoggerAdapter:
             dialog=True,
             status_bar=True,
             extra={"foo": "bar"},
+            options=houdini_logging_tools.adapters.loggeradapter.HoudiniLoggerAdapterOptions(
+                status_bar_sink=mock_sink, dialog_aggregator=mock_aggregator, rate_limit=mock_rate_limit
+            ),
         )
 
         assert result.logger.name == "test_name"
@@ -70,6 +116,9 @@ class TestHoudiniLoggerAdapter:
         assert result.dialog
         assert result.status_bar
         assert result.extra == {"foo": "bar"}
+        assert result.status_bar_sink == mock_sink
+        assert result.dialog_aggregator == mock_aggregator
+        assert result.rate_limit == mock_rate_limit
 
     # Properties
 
@@ -80,6 +129,14 @@ class TestHoudiniLoggerAdapter:
         test_adapter.dialog = True
         assert test_adapter._dialog
 
+    def test_dialog_aggregator(self, test_adapter, mocker):
+        """Test HoudiniLoggerAdapter.dialog_aggregator."""
+        assert test_adapter.dialog_aggregator is None
+
+        mock_aggregator = mocker.MagicMock(spec=houdini_logging_tools.ui.dialogs.DialogAggregator)
+        test_adapter.dialog_aggregator = mock_aggregator
+        assert test_adapter._dialog_aggregator == mock_aggregator
+
     def test_node(self, test_adapter):
         """Test HoudiniLoggerAdapter.node."""
         assert test_adapter.node is None
@@ -88,6 +145,14 @@ class TestHoudiniLoggerAdapter:
         test_adapter.node = test_node
         assert test_adapter._node == test_node
 
+    def test_rate_limit(self, test_adapter, mocker):
+        """Test HoudiniLoggerAdapter.rate_limit."""
+        assert test_adapter.rate_limit is None
+
+        mock_rate_limit = mocker.MagicMock(spec=houdini_logging_tools.filters.CallSiteRateLimitFilter)
+        test_adapter.rate_limit = mock_rate_limit
+        assert test_adapter._rate_limit == mock_rate_limit
+
     def test_status_bar(self, test_adapter):
         """Test HoudiniLoggerAdapter.status_bar."""
         assert not test_adapter.status_bar
@@ -95,6 +160,60 @@ class TestHoudiniLoggerAdapter:
         test_adapter.status_bar = True
         assert test_adapter._status_bar
 
+    def test_status_bar_sink(self, test_adapter, mocker):
+        """Test HoudiniLoggerAdapter.status_bar_sink."""
+        assert test_adapter.status_bar_sink is None
+
+        mock_sink = mocker.MagicMock(spec=houdini_logging_tools.ui.statusbar.StatusBarSink)
+        test_adapter.status_bar_sink = mock_sink
+        assert test_adapter._status_bar_sink == mock_sink
+
+    # Methods
+
+    def test_log(self, test_adapter, mocker):
+        """Test HoudiniLoggerAdapter.log() with a custom level."""
+        mock_handle = mocker.patch.object(test_adapter.logger, "handle")
+
+        test_adapter.log(35, "message %s", "arg", node=hou.node("/obj"))
+
+        record = mock_handle.call_args.args[0]
+
+        assert record.severity == hou.severityType.Warning
+        assert record.message_args == ("arg",)
+        assert record.funcName == "test_log"
+
+    def test_log__disabled(self, test_adapter, mocker):
+        """Test that HoudiniLoggerAdapter.log() returns without processing for disabled levels."""
+        mock_process = mocker.patch.object(test_adapter, "process")
+
+        test_adapter.logger.setLevel(logging.ERROR)
+
+        try:
+            assert test_adapter.log(logging.WARNING, "message", node=hou.node("/obj")) is None
+
+        finally:
+            test_adapter.logger.setLevel(logging.NOTSET)
+
+        mock_process.assert_not_called()
+
+    def test_timed(self, test_adapter):
+        """Test HoudiniLoggerAdapter.timed()."""
+        span = test_adapter.timed("span", node=hou.node("/obj"))
+
+        assert span.name == "span"
+        assert span._adapter is test_adapter
+        assert span._level == logging.DEBUG
+        assert span._node == hou.node("/obj")
+        assert span._statistics is houdini_logging_tools.spans.SPAN_STATISTICS
+
+        statistics = houdini_logging_tools.spans.SpanStatistics()
+
+        assert test_adapter.timed(statistics=statistics)._statistics is statistics
+
+
+class TestHoudiniLoggerAdapterProcess:
+    """Test houdini_logging_tools.adapters.loggeradapter.HoudiniLoggerAdapter.process()."""
+
     # Methods
 
     def test_process__node_arg(self, test_adapter):
@@ -106,6 +225,7 @@ class TestHoudiniLoggerAdapter:
         result = test_adapter.process("test logger message", kwargs)
 
         assert result == ("/out - test logger message", kwargs)
+        assert kwargs["extra"]["node_path"] == "/out"
 
     def test_process__node_property(self, test_adapter):
         """Test HoudiniLoggerAdapter.process() when using the node property."""
@@ -116,6 +236,8 @@ class TestHoudiniLoggerAdapter:
         result = test_adapter.process("test logger message", kwargs)
 
         assert result == ("/obj - test logger message", kwargs)
+        assert kwargs["extra"]["node_path"] == "/obj"
+        assert kwargs["extra"]["node_session_id"] == hou.node("/obj").sessionId()
 
     @pytest.mark.usefixtures("set_ui_available")
     def test_process__ui_passed_no_severity_no_title(
@@ -186,6 +308,193 @@ class TestHoudiniLoggerAdapter:
 
         mock_hou_ui.displayMessage.assert_not_called()
 
+    @pytest.mark.usefixtures("set_ui_available")
+    def test_process__dialog_only(self, test_adapter, mock_hou_ui):
+        """Test HoudiniLoggerAdapter.process() when only displaying a dialog."""
+        kwargs = {"extra": {"dialog": True}}
+
+        test_adapter.process("test logger message", kwargs)
+
+        mock_hou_ui.displayMessage.assert_called()
+        mock_hou_ui.setStatusMessage.assert_not_called()
+
+    @pytest.mark.usefixtures("set_ui_available")
+    def test_process__status_bar_only(self, test_adapter, mock_hou_ui):
+        """Test HoudiniLoggerAdapter.process() when only displaying a status bar message."""
+        kwargs = {"extra": {"status_bar": True}}
+
+        test_adapter.process("test logger message", kwargs)
+
+        mock_hou_ui.displayMessage.assert_not_called()
+        mock_hou_ui.setStatusMessage.assert_called()
+
+    @pytest.mark.usefixtures("set_ui_available")
+    def test_process__dialog_aggregator(self, test_adapter, mock_hou_ui, mocker):
+        """Test HoudiniLoggerAdapter.process() sending dialog messages to an aggregator."""
+        mock_aggregator = mocker.MagicMock(spec=houdini_logging_tools.ui.dialogs.DialogAggregator)
+        test_adapter.dialog_aggregator = mock_aggregator
+
+        kwargs = {
+            "extra": {
+                "dialog": True,
+                "node": hou.node("/obj"),
+                "message_args": ("extra",),
+                "severity": hou.severityType.Error,
+                "title": "title",
+            }
+        }
+
+        result = test_adapter.process("test logger message %s", kwargs)
+
+        assert result[0] == "/obj - test logger message %s"
+
+        mock_aggregator.add.assert_called_with(
+            "test logger message extra", hou.severityType.Error, title="title", node_path="/obj"
+        )
+        mock_hou_ui.displayMessage.assert_not_called()
+
+    @pytest.mark.usefixtures("set_ui_available")
+    def test_process__dialog_aggregator_status_bar(self, test_adapter, mock_hou_ui, mocker):
+        """Test HoudiniLoggerAdapter.process() still displaying the status bar message when using an aggregator."""
+        mock_aggregator = mocker.MagicMock(spec=houdini_logging_tools.ui.dialogs.DialogAggregator)
+        test_adapter.dialog_aggregator = mock_aggregator
+
+        test_adapter.process("test logger message", {"extra": {"dialog": True, "status_bar": True}})
+
+        mock_aggregator.add.assert_called_once_with(
+            "test logger message", hou.severityType.Message, title=None, node_path=None
+        )
+        mock_hou_ui.displayMessage.assert_not_called()
+        mock_hou_ui.setStatusMessage.assert_called_once_with("test logger message", severity=hou.severityType.Message)
+
+    @pytest.mark.usefixtures("set_ui_available")
+    def test_process__dialog_aggregator_worker_thread(self, test_adapter, mock_hou_ui, mocker):
+        """Test HoudiniLoggerAdapter.process() adding messages from a worker thread to a deferred aggregator."""
+        dispatcher = houdini_logging_tools.ui.dispatch.MainThreadDispatcher()
+        mocker.patch.object(houdini_logging_tools.adapters.loggeradapter, "UI_DISPATCHER", dispatcher)
+        mocker.patch.object(houdini_logging_tools.ui.dialogs, "UI_DISPATCHER", dispatcher)
+
+        test_adapter.dialog_aggregator = houdini_logging_tools.ui.dialogs.DialogAggregator()
+
+        message_count = 5
+
+        def _validate():
+            with test_adapter.dialog_aggregator.defer():
+                for index in range(message_count):
+                    test_adapter.process("invalid %d", {"extra": {"dialog": True, "message_args": (index,)}})
+
+        thread = threading.Thread(target=_validate)
+        thread.start()
+        thread.join()
+
+        # The messages were collected by the worker's defer() scope and only the
+        # summary dialog was posted to the main thread.
+        assert dispatcher.pending == 1
+
+        dispatcher.flush()
+
+        mock_hou_ui.displayMessage.assert_called_once()
+        assert (
+            mock_hou_ui.displayMessage.call_args.args[0]
+            == f"{message_count} messages were logged ({message_count} Message)."
+        )
+
+    @pytest.mark.usefixtures("set_ui_available")
+    def test_process__node_dialog(self, test_adapter, mock_hou_ui):
+        """Test HoudiniLoggerAdapter.process() displaying a dialog for a node message."""
+        kwargs = {"extra": {"dialog": True, "node": hou.node("/obj"), "message_args": ("extra",)}}
+
+        test_adapter.process("test logger message %s", kwargs)
+
+        mock_hou_ui.displayMessage.assert_called_with(
+            "/obj - test logger message extra", severity=hou.severityType.Message, title=None
+        )
+
+    @pytest.mark.usefixtures("set_ui_available")
+    def test_process__status_bar_sink(self, test_adapter, mock_hou_ui, mocker):
+        """Test HoudiniLoggerAdapter.process() sending status bar messages to a sink."""
+        mock_sink = mocker.MagicMock(spec=houdini_logging_tools.ui.statusbar.StatusBarSink)
+        test_adapter.status_bar_sink = mock_sink
+
+        kwargs = {"extra": {"status_bar": True, "severity": hou.severityType.Warning, "message_args": ("arg",)}}
+
+        test_adapter.process("test logger message %s", kwargs)
+
+        message, severity = mock_sink.update.call_args.args
+
+        # The message is passed to the sink to be interpolated if it is shown.
+        assert isinstance(message, houdini_logging_tools.formatting.LazyMessage)
+        assert str(message) == "test logger message arg"
+        assert severity == hou.severityType.Warning
+        mock_hou_ui.setStatusMessage.assert_not_called()
+
+    @pytest.mark.usefixtures("set_ui_available")
+    def test_process__worker_thread(self, test_adapter, mock_hou_ui, mocker):
+        """Test HoudiniLoggerAdapter.process() posting UI output from a worker thread to the main thread."""
+        dispatcher = houdini_logging_tools.ui.dispatch.MainThreadDispatcher()
+        mocker.patch.object(houdini_logging_tools.adapters.loggeradapter, "UI_DISPATCHER", dispatcher)
+
+        def _log(message, severity):
+            test_adapter.process(message, {"extra": {"dialog": True, "status_bar": True, "severity": severity}})
+
+        for message, severity in (("first", hou.severityType.Error), ("second", hou.severityType.Warning)):
+            thread = threading.Thread(target=_log, args=(message, severity))
+            thread.start()
+            thread.join()
+
+        # The worker threads returned without touching the UI.
+        mock_hou_ui.displayMessage.assert_not_called()
+        mock_hou_ui.addEventLoopCallback.assert_called_once_with(dispatcher._event_loop_callback.callback)
+
+        dispatcher._on_event_loop()
+
+        assert mock_hou_ui.displayMessage.call_args_list == [
+            mocker.call("first", severity=hou.severityType.Error, title=None),
+            mocker.call("second", severity=hou.severityType.Warning, title=None),
+        ]
+        assert mock_hou_ui.setStatusMessage.call_args_list == [
+            mocker.call("first", severity=hou.severityType.Error),
+            mocker.call("second", severity=hou.severityType.Warning),
+        ]
+
+    def test_process__layered_extra(self, test_adapter):
+        """Test HoudiniLoggerAdapter.process() does not modify the adapter or call extra data."""
+        test_adapter.extra = {"adapter_key": 1, "shared_key": "adapter"}
+
+        call_extra = {"shared_key": "call", "node": hou.node("/obj"), "dialog": False}
+        kwargs = {"extra": call_extra}
+
+        result = test_adapter.process("test logger message", kwargs)
+
+        assert result == (
+            "/obj - test logger message",
+            {
+                "extra": {
+                    "adapter_key": 1,
+                    "shared_key": "call",
+                    "node_path": "/obj",
+                    "node_session_id": hou.node("/obj").sessionId(),
+                }
+            },
+        )
+
+        assert test_adapter.extra == {"adapter_key": 1, "shared_key": "adapter"}
+        assert call_extra == {"shared_key": "call", "node": hou.node("/obj"), "dialog": False}
+
+    def test_process__plain(self, test_adapter, mocker):
+        """Test HoudiniLoggerAdapter.process() when no node, dialog or status bar output is needed."""
+        mock_ui_available = mocker.patch("houdini_logging_tools.adapters.loggeradapter._is_ui_available")
+
+        call_extra = {"severity": hou.severityType.Warning}
+        kwargs = {"extra": call_extra}
+
+        result = test_adapter.process("test logger message", kwargs)
+
+        assert result == ("test logger message", {"extra": {"severity": hou.severityType.Warning}})
+        assert kwargs["extra"] is not call_extra
+
+        mock_ui_available.assert_not_called()
+
     def test_process__no_extra(self, mocker, test_adapter):
         """Test HoudiniLoggerAdapter.process() when passing an empty kwargs dict."""
         mock_message = mocker.MagicMock(spec=str)
@@ -196,6 +505,54 @@ class TestHoudiniLoggerAdapter:
 
         assert result == (mock_message, kwargs)
 
+    def test_process__log_context(self, test_adapter):
+        """Test HoudiniLoggerAdapter.process() inside a LogContext."""
+        test_adapter.extra = {"adapter_key": 1, "shared_key": "adapter"}
+        test_adapter.node = hou.node("/out")
+
+        call_extra = {"shared_key": "call"}
+        kwargs = {"extra": call_extra}
+
+        with houdini_logging_tools.context.LogContext(hou.node("/obj"), shared_key="context", context_key=2):
+            result = test_adapter.process("test logger message", kwargs)
+
+        assert result == (
+            "/obj - test logger message",
+            {
+                "extra": {
+                    "adapter_key": 1,
+                    "context_key": 2,
+                    "shared_key": "call",
+                    "node_path": "/obj",
+                    "node_session_id": hou.node("/obj").sessionId(),
+                }
+            },
+        )
+
+        assert call_extra == {"shared_key": "call"}
+
+    @pytest.mark.usefixtures("set_ui_available")
+    def test_process__log_context_overridden(self, test_adapter, mock_hou_ui):
+        """Test HoudiniLoggerAdapter.process() with call values overriding a LogContext's."""
+        kwargs = {"extra": {"node": None, "status_bar": False}}
+
+        with houdini_logging_tools.context.LogContext(hou.node("/obj"), status_bar=True):
+            result = test_adapter.process("test logger message", kwargs)
+
+            assert result == ("test logger message", {"extra": {}})
+
+            # Without call values, the context's are used.
+            result = test_adapter.process("test logger message", {})
+
+        assert result[0] == "/obj - test logger message"
+        mock_hou_ui.setStatusMessage.assert_called_once()
+
+
+class TestHoudiniLoggerAdapterCalls:
+    """Test calling the logging methods of houdini_logging_tools.adapters.loggeradapter.HoudiniLoggerAdapter."""
+
+    # Methods
+
     @pytest.mark.parametrize(
         ("level", "severity", "num_message_args", "passed_kwargs"),
         [
@@ -236,7 +593,7 @@ class TestHoudiniLoggerAdapter:
             "extra": {
                 "severity": severity,
             },
-            "stacklevel": passed_kwargs.get("stacklevel", 4),
+            "stacklevel": passed_kwargs.get("stacklevel", 2),
         }
 
         # If there were any extra message args, we expect them to have been added
@@ -255,3 +612,167 @@ class TestHoudiniLoggerAdapter:
         getattr(test_adapter, level)(mock_msg, *message_args, **kwargs)
 
         mock_process.assert_called_with(mock_msg, expected_kwargs)
+
+    @pytest.mark.parametrize(
+        ("method", "level"),
+        [
+            ("critical", logging.CRITICAL),
+            ("debug", logging.DEBUG),
+            ("error", logging.ERROR),
+            ("exception", logging.ERROR),
+            ("info", logging.INFO),
+            ("warning", logging.WARNING),
+        ],
+    )
+    def test_calls__disabled(self, mocker, test_adapter, method, level):
+        """Test that log calls for disabled levels return without processing."""
+        mock_logger = mocker.MagicMock(spec=logging.Logger)
+        mock_logger.isEnabledFor.return_value = False
+        mocker.patch.object(test_adapter, "logger", mock_logger)
+
+        mock_process = mocker.patch(
+            "houdini_logging_tools.adapters.loggeradapter.HoudiniLoggerAdapter.process",
+        )
+
+        assert getattr(test_adapter, method)("message %s", "arg", node=hou.node("/obj")) is None
+
+        mock_logger.isEnabledFor.assert_called_with(level)
+        mock_process.assert_not_called()
+        mock_logger.log.assert_not_called()
+
+    def test_calls__level_changed(self, test_adapter, mocker):
+        """Test that log calls respect changes to the logger's level."""
+        mock_handle = mocker.patch.object(test_adapter.logger, "handle")
+
+        test_adapter.logger.setLevel(logging.ERROR)
+
+        try:
+            test_adapter.warning("message")
+            mock_handle.assert_not_called()
+
+            test_adapter.logger.setLevel(logging.WARNING)
+
+            test_adapter.warning("message")
+            mock_handle.assert_called()
+
+        finally:
+            test_adapter.logger.setLevel(logging.NOTSET)
+
+    def test_calls__extra_not_modified(self, test_adapter, mocker):
+        """Test that log calls do not modify a passed extra dictionary."""
+        mocker.patch.object(test_adapter.logger, "handle")
+
+        extra = {"foo": "bar"}
+
+        test_adapter.warning("message %s", "arg", extra=extra, node=hou.node("/obj"))
+
+        assert extra == {"foo": "bar"}
+
+    def test_calls__caller(self, test_adapter, mocker):
+        """Test that records report the calling function as their source."""
+        mock_handle = mocker.patch.object(test_adapter.logger, "handle")
+
+        test_adapter.warning("message")
+
+        record = mock_handle.call_args.args[0]
+
+        assert record.funcName == "test_calls__caller"
+        assert record.pathname == __file__
+
+    @pytest.mark.usefixtures("set_ui_available")
+    def test_calls__rate_limit(self, test_adapter, mocker, mock_hou_ui):
+        """Test that rate limited calls return before creating a record or displaying anything."""
+        mock_handle = mocker.patch.object(test_adapter.logger, "handle")
+
+        burst = 2
+        call_count = 3
+
+        test_adapter.rate_limit = houdini_logging_tools.filters.CallSiteRateLimitFilter(rate=0, burst=burst)
+
+        for _ in range(call_count):
+            test_adapter.warning("message", dialog=True)
+
+        test_adapter.log(logging.WARNING, "other call site")
+
+        # The burst from the first call site and the call from the other.
+        assert mock_handle.call_count == burst + 1
+        assert mock_hou_ui.displayMessage.call_count == burst
+        assert test_adapter.rate_limit.suppressed == call_count - burst
+
+        first, *_, other = (call.args[0] for call in mock_handle.call_args_list)
+
+        # Both call sites are keyed by the calling line.
+        assert first.lineno != other.lineno
+        assert set(test_adapter.rate_limit._buckets) == {
+            ("test_logger", __file__, first.lineno),
+            ("test_logger", __file__, other.lineno),
+        }
+
+    def test_calls__rate_limit_stacklevel(self, test_adapter, mocker):
+        """Test that rate limited calls are keyed by the call site the stacklevel reports."""
+        mock_handle = mocker.patch.object(test_adapter.logger, "handle")
+
+        test_adapter.rate_limit = houdini_logging_tools.filters.CallSiteRateLimitFilter(rate=0, burst=1)
+
+        def log_helper():
+            test_adapter.warning("message", stacklevel=3)
+
+        # Keyed by this line, rather than the helper's.
+        for _ in range(2):
+            log_helper()
+
+        log_helper()
+
+        # Like logging, a stacklevel past the outermost frame uses that frame.
+        test_adapter.warning("message", stacklevel=10000)
+
+        (first, other_line, outermost) = (call.args[0] for call in mock_handle.call_args_list)
+
+        assert first.funcName == other_line.funcName == "test_calls__rate_limit_stacklevel"
+        assert first.lineno != other_line.lineno
+        assert outermost.pathname != __file__
+        assert test_adapter.rate_limit.suppressed == 1
+
+    @pytest.mark.usefixtures("set_ui_available")
+    def test_calls__metrics(self, test_adapter, mocker, mock_hou_ui, enabled_metrics):
+        """Test the metrics recorded for log calls."""
+        mocker.patch.object(test_adapter.logger, "handle")
+
+        test_adapter.logger.setLevel(logging.INFO)
+        test_adapter.rate_limit = houdini_logging_tools.filters.CallSiteRateLimitFilter(rate=0, burst=1)
+
+        try:
+            for _ in range(2):
+                test_adapter.warning("message", status_bar=True)
+
+            test_adapter.log(logging.ERROR, "message")
+            test_adapter.debug("disabled")
+
+        finally:
+            test_adapter.logger.setLevel(logging.NOTSET)
+
+        snapshot = enabled_metrics.snapshot()["HoudiniLoggerAdapter"]
+
+        assert snapshot.records == {"WARNING": 1, "ERROR": 1}
+        assert snapshot.counters == {"suppressed": 1}
+        assert snapshot.timers["process"].count == sum(snapshot.records.values())
+        assert snapshot.timers["ui"].count == 1
+        mock_hou_ui.setStatusMessage.assert_called_once()
+
+    def test_calls__exception_info_passed(self, test_adapter, mocker):
+        """Test that exception() does not override a passed exc_info."""
+        mock_handle = mocker.patch.object(test_adapter.logger, "handle")
+
+        test_adapter.exception("message", exc_info=False)
+
+        assert mock_handle.call_args.args[0].exc_info is False
+
+
+def test__is_ui_available(mocker):
+    """Test houdini_logging_tools.adapters.loggeradapter._is_ui_available()."""
+    mock_available = mocker.patch("hou.isUIAvailable", return_value=True)
+
+    assert houdini_logging_tools.adapters.loggeradapter._is_ui_available()
+    assert houdini_logging_tools.adapters.loggeradapter._is_ui_available()
+
+    mock_available.assert_called_once()
@@ -0,0 +1,106 @@
+"""Shared fixtures for the houdini_logging_tools tests."""
+
+# Standard Library
+import logging
+import sys
+import time
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.forwarding
+import houdini_logging_tools.metrics
+
+# Fixtures
+
+
+@pytest.fixture
+def add_collecting_handler():
+    """Fixture to add handlers which collect the records they handle to loggers."""
+    added = []
+
+    def _create(logger):
+        handler = _CollectingHandler()
+        logger.addHandler(handler)
+
+        added.append((logger, handler))
+
+        return handler
+
+    yield _create
+
+    for logger, handler in added:
+        logger.removeHandler(handler)
+
+
+@pytest.fixture
+def collector(mocker):
+    """Fixture to start a collector which passes records to a mock handler."""
+    handler = mocker.MagicMock(spec=logging.Handler)
+    handler.level = logging.NOTSET
+
+    with houdini_logging_tools.forwarding.LogCollector(handler) as inst:
+        yield inst
+
+
+@pytest.fixture
+def enabled_metrics():
+    """Fixture to record metrics for the duration of a test."""
+    houdini_logging_tools.metrics.METRICS.enable()
+
+    yield houdini_logging_tools.metrics.METRICS
+
+    houdini_logging_tools.metrics.METRICS.disable()
+    houdini_logging_tools.metrics.METRICS.reset()
+
+
+@pytest.fixture
+def exc_info():
+    """Fixture to provide the exception info of a raised exception."""
+
+    def _fail():
+        raise RuntimeError("error")
+
+    try:
+        _fail()
+
+    except RuntimeError:
+        return sys.exc_info()
+
+
+@pytest.fixture
+def mock_monotonic(mocker):
+    """Fixture to control the current monotonic time."""
+    return mocker.patch("time.monotonic", return_value=100.0)
+
+
+@pytest.fixture
+def wait_for():
+    """Fixture to wait for a condition to be true, such as a background thread finishing its work."""
+
+    def _wait(condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+
+        while not condition():
+            assert time.monotonic() < deadline, "Timed out waiting for condition"
+
+            time.sleep(0.01)
+
+    return _wait
+
+
+# Helpers
+
+
+class _CollectingHandler(logging.Handler):
+    """Handler which collects the records it handles."""
+
+    def __init__(self):
+        super().__init__()
+
+        self.records = []
+
+    def emit(self, record):
+        """Collect a record."""
+        self.records.append(record)
@@ -0,0 +1,424 @@
+"""Tests for houdini_logging_tools.handlers.forwarding module."""
+
+# Standard Library
+import logging
+import socket
+import threading
+import time
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.forwarding
+import houdini_logging_tools.handlers.forwarding
+import houdini_logging_tools.queueing
+
+# Fixtures
+
+
+@pytest.fixture
+def init_handler():
+    """Fixture to initialize handlers and close them afterwards."""
+    handlers = []
+
+    def _create(address=("127.0.0.1", 1), *, worker=None, work_item=None, **kwargs):
+        handler = houdini_logging_tools.handlers.forwarding.ForwardingHandler(
+            address,
+            worker=worker,
+            work_item=work_item,
+            options=houdini_logging_tools.handlers.forwarding.ForwardingOptions(**kwargs) if kwargs else None,
+        )
+        handlers.append(handler)
+
+        return handler
+
+    yield _create
+
+    for handler in handlers:
+        handler.close()
+
+
+# Tests
+
+
+class TestForwardingHandler:
+    """Test houdini_logging_tools.handlers.forwarding.ForwardingHandler object."""
+
+    def test___init__(self, init_handler, monkeypatch, mocker):
+        """Test object initialization."""
+        monkeypatch.setenv("PDG_ITEM_NAME", "ropfetch1_5")
+        mocker.patch("socket.gethostname", return_value="host")
+        mocker.patch("os.getpid", return_value=123)
+
+        inst = init_handler("localhost:1234", drop_policy="block")
+
+        assert inst.address == ("localhost", 1234)
+        assert inst.worker == "host:123"
+        assert inst.work_item == "ropfetch1_5"
+        assert not inst.connected
+        assert inst.dropped == 0
+        assert inst._dispatcher.drop_policy == houdini_logging_tools.queueing.DropPolicy.BLOCK
+
+    def test___init____environment(self, init_handler, monkeypatch):
+        """Test object initialization using the address from the environment."""
+        monkeypatch.setenv("HOUDINI_LOGGING_TOOLS_COLLECTOR", "localhost:1234")
+        monkeypatch.delenv("PDG_ITEM_NAME", raising=False)
+
+        inst = init_handler(None, worker="worker")
+
+        assert inst.address == ("localhost", 1234)
+        assert inst.worker == "worker"
+        assert not inst.work_item
+
+    def test___init____no_address(self, monkeypatch):
+        """Test object initialization without an address."""
+        monkeypatch.delenv("HOUDINI_LOGGING_TOOLS_COLLECTOR", raising=False)
+
+        with pytest.raises(ValueError, match="No collector address"):
+            houdini_logging_tools.handlers.forwarding.ForwardingHandler()
+
+    # Non-Public Methods
+
+    def test__connect__retry(self, init_handler, mocker):
+        """Test ForwardingHandler._connect() waiting longer after each failure."""
+        now = 100
+        mock_monotonic = mocker.patch("time.monotonic", return_value=now)
+        mock_create = mocker.patch("socket.create_connection", side_effect=ConnectionRefusedError)
+
+        inst = init_handler(retry_delay=1, max_retry_delay=3)
+
+        assert inst._connect() is None
+        assert inst._retry_time == now + 1
+
+        # Too soon to try again.
+        mock_monotonic.return_value = now + 0.5
+        assert inst._connect() is None
+        mock_create.assert_called_once()
+
+        # The delay doubles up to the maximum.
+        for delay in (2, 3):
+            now = inst._retry_time
+            mock_monotonic.return_value = now
+
+            assert inst._connect() is None
+            assert inst._retry_time == now + delay
+
+        mock_monotonic.return_value = inst._retry_time
+        mock_create.side_effect = None
+
+        assert inst._connect() is mock_create.return_value
+        assert inst._connect() is mock_create.return_value
+        assert inst.connected
+
+        # Three failed attempts and the successful one.
+        assert mock_create.call_args_list == [mocker.call(("127.0.0.1", 1), timeout=5.0)] * 4
+
+        # The delay is reset once connected.
+        assert inst._next_retry_delay == 1
+        assert inst._retry_time == 0
+
+    def test__retry(self, init_handler, mocker):
+        """Test ForwardingHandler._retry() sending the unsent frames when the timer fires."""
+        mock_send_unsent = mocker.patch.object(
+            houdini_logging_tools.handlers.forwarding.ForwardingHandler, "_send_unsent"
+        )
+
+        inst = init_handler()
+        inst._retry_timer = mocker.MagicMock(spec=threading.Timer)
+
+        inst._retry()
+
+        assert inst._retry_timer is None
+        mock_send_unsent.assert_called_once_with()
+
+    def test__retry__closed(self, init_handler, mocker):
+        """Test ForwardingHandler._retry() doing nothing once the timer has been cancelled."""
+        mock_send_unsent = mocker.patch.object(
+            houdini_logging_tools.handlers.forwarding.ForwardingHandler, "_send_unsent"
+        )
+
+        inst = init_handler()
+
+        inst._retry()
+
+        mock_send_unsent.assert_not_called()
+
+    def test__schedule_retry(self, init_handler, mocker):
+        """Test ForwardingHandler._schedule_retry() starting a timer for the remaining delay."""
+        mocker.patch("time.monotonic", return_value=100.0)
+        mock_timer = mocker.patch("threading.Timer")
+
+        inst = init_handler()
+        inst._retry_time = 102.0
+
+        inst._schedule_retry()
+
+        mock_timer.assert_called_once_with(2.0, inst._retry)
+        mock_timer.return_value.start.assert_called_once()
+        assert mock_timer.return_value.daemon
+        assert inst._retry_timer is mock_timer.return_value
+
+    def test__send_records__retry_pending(self, init_handler, mocker):
+        """Test ForwardingHandler._send_records() leaving the sending to a pending retry."""
+        mock_send_unsent = mocker.patch.object(
+            houdini_logging_tools.handlers.forwarding.ForwardingHandler, "_send_unsent"
+        )
+
+        inst = init_handler()
+        inst._retry_timer = mocker.MagicMock(spec=threading.Timer)
+
+        inst._send_records([b"a"])
+
+        mock_send_unsent.assert_not_called()
+        assert inst._unsent_count == 1
+
+        inst._retry_timer = None
+
+    def test__send_records__unreachable(self, init_handler, mocker):
+        """Test ForwardingHandler._send_records() keeping the newest records while the collector is unreachable."""
+        mocker.patch.object(houdini_logging_tools.handlers.forwarding.ForwardingHandler, "_connect", return_value=None)
+        mocker.patch.object(houdini_logging_tools.handlers.forwarding.ForwardingHandler, "_schedule_retry")
+
+        queue_size = 3
+        dropped = [b"a", b"b"]
+
+        inst = init_handler(queue_size=queue_size)
+
+        inst._send_records(dropped)
+        inst._send_records([b"c"])
+        inst._send_records([b"d", b"e"])
+
+        assert [count for _, count in inst._unsent] == [1, 2]
+        assert inst._unsent_count == queue_size
+        assert inst.dropped == len(dropped)
+
+    def test__send_records__unreachable_partial(self, init_handler, mocker):
+        """Test ForwardingHandler._send_records() disconnecting when dropping a partially sent frame."""
+        mocker.patch.object(houdini_logging_tools.handlers.forwarding.ForwardingHandler, "_send_unsent")
+        mock_connection = mocker.MagicMock(spec=socket.socket)
+
+        inst = init_handler(queue_size=1)
+        inst._socket = mock_connection
+        inst._unsent.append((b"frame", 1))
+        inst._unsent_count = 1
+        inst._unsent_offset = 2
+
+        inst._send_records([b"a"])
+
+        mock_connection.close.assert_called()
+        assert inst._unsent_offset == 0
+        assert inst.dropped == 1
+
+    def test__send_unsent__error(self, init_handler, mocker):
+        """Test ForwardingHandler._send_unsent() keeping the frame and retrying later when sending fails."""
+        now = 100.0
+        retry_delay = 0.5
+        mocker.patch("time.monotonic", return_value=now)
+        mock_schedule = mocker.patch.object(
+            houdini_logging_tools.handlers.forwarding.ForwardingHandler, "_schedule_retry"
+        )
+        mock_connection = mocker.MagicMock(spec=socket.socket)
+        mock_connection.send.side_effect = [2, BrokenPipeError]
+
+        inst = init_handler(retry_delay=retry_delay)
+        inst._socket = mock_connection
+        inst._unsent.append((b"frame", 1))
+        inst._unsent_count = 1
+
+        inst._send_unsent()
+
+        mock_connection.close.assert_called()
+        assert not inst.connected
+        assert inst._retry_time == pytest.approx(now + retry_delay)
+        assert inst._next_retry_delay == pytest.approx(retry_delay * 2)
+        assert inst._unsent_offset == 0
+        assert list(inst._unsent) == [(b"frame", 1)]
+        mock_schedule.assert_called_once()
+
+    def test__send_unsent__timeout(self, init_handler, mocker):
+        """Test ForwardingHandler._send_unsent() keeping the connection and carrying on after a timeout."""
+        now = 100.0
+        retry_delay = 0.5
+        sent = 2
+        mocker.patch("time.monotonic", return_value=now)
+        mock_schedule = mocker.patch.object(
+            houdini_logging_tools.handlers.forwarding.ForwardingHandler, "_schedule_retry"
+        )
+        mock_connection = mocker.MagicMock(spec=socket.socket)
+        mock_connection.send.side_effect = [sent, TimeoutError]
+
+        inst = init_handler(retry_delay=retry_delay)
+        inst._socket = mock_connection
+        inst._unsent.append((b"frame", 1))
+        inst._unsent_count = 1
+
+        inst._send_unsent()
+
+        mock_connection.close.assert_not_called()
+        assert inst.connected
+        assert inst._retry_time == pytest.approx(now + retry_delay)
+        assert inst._unsent_offset == sent
+        mock_schedule.assert_called_once()
+
+        # The retry sends the rest of the frame over the same connection.
+        mock_connection.send.side_effect = None
+        mock_connection.send.return_value = len(b"frame") - sent
+
+        inst._send_unsent()
+
+        assert bytes(mock_connection.send.call_args.args[0]) == b"ame"
+        assert not inst._unsent
+        assert inst._unsent_offset == 0
+        assert inst._next_retry_delay == pytest.approx(retry_delay)
+
+    def test__send_unsent__timeout_no_retry(self, init_handler, mocker):
+        """Test ForwardingHandler._send_unsent() not scheduling a retry when asked not to."""
+        mock_schedule = mocker.patch.object(
+            houdini_logging_tools.handlers.forwarding.ForwardingHandler, "_schedule_retry"
+        )
+        mock_connection = mocker.MagicMock(spec=socket.socket)
+        mock_connection.send.side_effect = TimeoutError
+
+        inst = init_handler()
+        inst._socket = mock_connection
+        inst._unsent.append((b"frame", 1))
+
+        inst._send_unsent(retry=False)
+
+        mock_schedule.assert_not_called()
+
+    def test__send_unsent__unreachable(self, init_handler, mocker):
+        """Test ForwardingHandler._send_unsent() scheduling a retry when the collector cannot be reached."""
+        mocker.patch.object(houdini_logging_tools.handlers.forwarding.ForwardingHandler, "_connect", return_value=None)
+        mock_schedule = mocker.patch.object(
+            houdini_logging_tools.handlers.forwarding.ForwardingHandler, "_schedule_retry"
+        )
+
+        inst = init_handler()
+        inst._unsent.append((b"frame", 1))
+
+        inst._send_unsent()
+
+        mock_schedule.assert_called_once()
+
+    # Methods
+
+    def test_close__unsent(self, init_handler, mocker):
+        """Test ForwardingHandler.close() trying to send unsent records immediately."""
+        mock_connection = mocker.MagicMock(spec=socket.socket)
+        mocker.patch("socket.create_connection", return_value=mock_connection)
+
+        mock_connection.send.return_value = 5
+
+        inst = init_handler()
+        inst._retry_time = time.monotonic() + 100
+        inst._unsent.append((b"frame", 1))
+
+        inst.close()
+
+        assert bytes(mock_connection.send.call_args.args[0]) == b"frame"
+        mock_connection.close.assert_called()
+        assert not inst._unsent
+
+    def test_close__retry_pending(self, init_handler, mocker):
+        """Test ForwardingHandler.close() cancelling a pending retry."""
+        mocker.patch("socket.create_connection", side_effect=ConnectionRefusedError)
+        mock_timer = mocker.MagicMock(spec=threading.Timer)
+
+        inst = init_handler()
+        inst._retry_timer = mock_timer
+        inst._unsent.append((b"frame", 1))
+
+        inst.close()
+
+        mock_timer.cancel.assert_called_once()
+        assert inst._retry_timer is None
+        assert inst._unsent
+
+    def test_emit(self, collector, init_handler, wait_for):
+        """Test forwarding records to a collector."""
+        inst = init_handler(collector.address_string, worker="worker", work_item="item", batch_size=2)
+
+        record_count = 5
+
+        for index in range(record_count):
+            inst.emit(logging.LogRecord("test", logging.INFO, "/path/to/module.py", 10, "message %d", (index,), None))
+
+        inst.flush()
+
+        assert inst.connected
+
+        wait_for(lambda: collector.records_received == record_count)
+
+        messages = [call.args[0].getMessage() for call in collector.handler.handle.call_args_list]
+
+        assert messages == [f"worker [item] - message {index}" for index in range(record_count)]
+
+    def test_emit__reconnect(self, collector, init_handler, wait_for):
+        """Test that records are sent again after reconnecting to a restarted collector."""
+        inst = init_handler(collector.address_string, retry_delay=0.01, max_retry_delay=0.05)
+
+        inst.emit(_create_record("first"))
+        inst.flush()
+
+        wait_for(lambda: collector.records_received == 1)
+
+        address = collector.address
+        collector.stop()
+
+        # Sending to the closed connection may not fail straight away, so keep
+        # sending until the loss of the connection is noticed.
+        def send_until_disconnected():
+            inst.emit(_create_record("lost"))
+            inst.flush()
+
+            return not inst.connected
+
+        wait_for(send_until_disconnected)
+
+        inst.emit(_create_record("unsent"))
+        inst.flush()
+
+        assert inst._unsent
+
+        restarted = houdini_logging_tools.forwarding.LogCollector(collector.handler, host=address[0], port=address[1])
+
+        with restarted:
+            # The retry timer sends the unsent records without waiting for another.
+            wait_for(lambda: restarted.records_received >= 1)
+
+            inst.emit(_create_record("last"))
+            inst.flush()
+
+            wait_for(lambda: collector.handler.handle.call_args.args[0].getMessage().endswith("last"))
+
+        messages = [call.args[0].getMessage() for call in collector.handler.handle.call_args_list]
+
+        assert messages[0].endswith("first")
+        assert messages[-2].endswith("unsent")
+        assert messages[-1].endswith("last")
+
+    def test_emit__error(self, init_handler, mocker):
+        """Test ForwardingHandler.emit() handling errors."""
+        mocker.patch.object(
+            houdini_logging_tools.handlers.forwarding, "encode_record", side_effect=RuntimeError("error")
+        )
+        mock_handle_error = mocker.patch.object(
+            houdini_logging_tools.handlers.forwarding.ForwardingHandler, "handleError"
+        )
+
+        inst = init_handler()
+        record = _create_record("message")
+
+        inst.emit(record)
+
+        mock_handle_error.assert_called_with(record)
+
+
+# Helpers
+
+
+def _create_record(msg):
+    """Create a log record for testing."""
+    return logging.LogRecord("test", logging.INFO, "/path/to/module.py", 10, msg, (), None)
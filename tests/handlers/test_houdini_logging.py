@@ -2,12 +2,18 @@
 
 # Standard Library
 import logging
+import sys
+import threading
 
 # Third Party
 import pytest
 
 # Houdini Logging Tools
+import houdini_logging_tools.formatting
 import houdini_logging_tools.handlers.houdini_logging
+import houdini_logging_tools.handlers.shellio
+import houdini_logging_tools.metrics
+import houdini_logging_tools.queueing
 
 # Houdini
 import hou
@@ -18,16 +24,22 @@ import hou
 @pytest.fixture
 def init_handler(mocker):
     """Fixture to initialize a handler."""
-    mocker.patch.object(
-        houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler,
-        "__init__",
-        return_value=None,
-    )
+    mocker.patch("hou.logging.createSource")
+
+    handlers = []
+
+    def _create(**kwargs):
+        handler = houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler(
+            None, options=houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingOptions(**kwargs)
+        )
+        handlers.append(handler)
+
+        return handler
 
-    def _create():
-        return houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler(None)
+    yield _create
 
-    return _create
+    for handler in handlers:
+        handler.close()
 
 
 # Tests
@@ -38,17 +50,150 @@ class TestHoudiniLoggingHandler:
 
     def test___init__(self, mocker):
         """Test object initialization."""
-        source_name = houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler.__name__
-
-        assert source_name not in hou.logging.sources()
-
+        mock_create = mocker.patch("hou.logging.createSource")
         mock_stream = mocker.MagicMock()
 
         inst = houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler(mock_stream)
         assert inst.stream == mock_stream
 
+        # The source is only created once a record is sent.
+        assert not inst._created_sources
+        mock_create.assert_not_called()
+
+        assert not inst.queued
+        assert inst.coalesce_window is None
+        assert inst.context_format == houdini_logging_tools.handlers.houdini_logging.DEFAULT_CONTEXT_FORMAT
+        assert inst.source_routing is None
+        assert inst.traceback_cache is None
+
+    # Non-Public Methods
+
+    def test__create_source(self):
+        """Test HoudiniLoggingHandler._create_source()."""
+        source_name = houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler.__name__
+
+        inst = houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler()
+
+        assert inst._create_source(source_name)
+        assert inst._created_sources == {source_name}
+
         assert source_name in hou.logging.sources()
 
+    def test__create_source__no_hou(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._create_source() when hou is not available."""
+        mocker.patch.object(houdini_logging_tools.handlers.houdini_logging, "is_hou_available", return_value=False)
+
+        inst = init_handler()
+
+        assert not inst._create_source("test")
+        assert not inst._created_sources
+
+        hou.logging.createSource.assert_not_called()
+
+    def test__get_source(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._get_source() caching the source of each logger."""
+        mock_routing = mocker.MagicMock(side_effect=["tools", None])
+
+        inst = init_handler(source_routing=mock_routing)
+
+        assert inst.source_routing is mock_routing
+
+        assert inst._get_source("tools.validate") == "tools"
+        assert inst._get_source("tools.validate") == "tools"
+
+        # Loggers without a source use the default one.
+        assert inst._get_source("other") == inst.__class__.__name__
+
+        assert mock_routing.call_args_list == [mocker.call("tools.validate"), mocker.call("other")]
+
+    def test__log_record__create_source(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._log_record() creating the source for the first record."""
+        mocker.patch("hou.logging.log")
+
+        inst = init_handler()
+
+        inst._log_record(_create_record("message"))
+        inst._log_record(_create_record("message"))
+
+        hou.logging.createSource.assert_called_once_with(inst.__class__.__name__)
+
+    def test__log_record__no_hou(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._log_record() writing to the stream when hou is not available."""
+        mocker.patch.object(houdini_logging_tools.handlers.houdini_logging, "is_hou_available", return_value=False)
+        mock_log = mocker.patch("hou.logging.log")
+
+        inst = init_handler()
+        inst.stream = mocker.MagicMock()
+
+        inst._log_record(_create_record("message %s", ("a",)))
+        inst._log_record(_create_record("message"), "combined")
+
+        assert inst.stream.method_calls == [
+            mocker.call.write("message a\n"),
+            mocker.call.flush(),
+            mocker.call.write("combined\n"),
+            mocker.call.flush(),
+        ]
+        mock_log.assert_not_called()
+
+    def test__log_records(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._log_records()."""
+        mock_log_record = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler,
+            "_log_record",
+            side_effect=(None, Exception, None),
+        )
+        mock_handle = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "handleError"
+        )
+
+        records = [mocker.MagicMock(spec=logging.LogRecord) for _ in range(3)]
+
+        inst = init_handler()
+
+        inst._log_records([(record, f"message {i}") for i, record in enumerate(records)])
+
+        mock_log_record.assert_has_calls([mocker.call(record, f"message {i}") for i, record in enumerate(records)])
+        mock_handle.assert_called_once_with(records[1])
+
+    def test__prepare(self, init_handler):
+        """Test HoudiniLoggingHandler._prepare()."""
+        inst = init_handler()
+
+        values = ["a"]
+
+        def _fail():
+            raise ValueError("bad")
+
+        try:
+            _fail()
+
+        except ValueError:
+            record = _create_record("message %s", (values,), exc_info=True)
+
+        result, message = inst._prepare(record)
+
+        # Changing the args after the log call does not change the queued message.
+        values.append("b")
+
+        assert result is not record
+        assert result.getMessage() == "message ['a']"
+        assert result.args is None
+        assert result.exc_info is None
+        assert message.startswith("message ['a']\nTraceback")
+        assert record.args == (values,)
+
+    def test__write_stream(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._write_stream() with a stream which cannot be flushed."""
+        inst = init_handler()
+        inst.stream = mocker.MagicMock(spec=["write"])
+
+        inst._write_stream("message")
+
+        inst.stream.write.assert_called_with("message\n")
+
+    # Methods
+
     def test_emit(self, init_handler, mocker):
         """Test HoudiniLoggingHandler.emit()."""
         mock_record = mocker.MagicMock(spec=logging.LogRecord)
@@ -56,7 +201,9 @@ class TestHoudiniLoggingHandler:
         mock_record.module = mocker.PropertyMock()
         mock_record.funcName = mocker.PropertyMock()
         mock_record.lineno = mocker.PropertyMock()
-        mock_record.levelname = "error"
+        mock_record.pathname = mocker.PropertyMock()
+        mock_record.filename = mocker.PropertyMock()
+        mock_record.levelno = logging.ERROR
         mock_record.created = mocker.PropertyMock()
 
         mock_format = mocker.patch.object(
@@ -76,3 +223,578 @@ class TestHoudiniLoggingHandler:
             time=mock_record.created,
         )
         mock_log.assert_called_with(mock_entry.return_value, inst.__class__.__name__)
+
+    def test_emit__custom_level(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler.emit() with a level between the standard levels."""
+        record = logging.LogRecord("test", 25, "path", 10, "message", None, None)
+
+        mocker.patch("hou.logging.log")
+        mock_entry = mocker.patch("hou.logging.LogEntry")
+
+        inst = init_handler()
+
+        inst.emit(record)
+
+        assert mock_entry.call_args.kwargs["severity"] == hou.severityType.ImportantMessage
+
+    def test_flush__not_queued(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler.flush() when not queued."""
+        mock_flush = mocker.patch("logging.StreamHandler.flush")
+
+        inst = init_handler()
+
+        inst.flush()
+
+        mock_flush.assert_called()
+
+    @pytest.mark.usefixtures("enabled_metrics")
+    def test_handleError(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler.handleError() counting errors."""
+        mock_handle_error = mocker.patch("logging.StreamHandler.handleError")
+
+        inst = init_handler()
+        record = _create_record("message")
+
+        inst.handleError(record)
+
+        mock_handle_error.assert_called_once_with(record)
+        assert houdini_logging_tools.metrics.METRICS.snapshot()["HoudiniLoggingHandler"].counters == {"errors": 1}
+
+    def test_format(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler.format() reusing the output of another handler's formatter."""
+        formatter = logging.Formatter("%(levelname)s: %(message)s")
+        mock_format = mocker.patch.object(formatter, "format", wraps=formatter.format)
+
+        inst = init_handler()
+        inst.setFormatter(formatter)
+
+        other = houdini_logging_tools.handlers.shellio.PythonShellHandler()
+        other.setFormatter(formatter)
+
+        record = _create_record("message %s", ("arg",))
+
+        assert other.format(record) == "ERROR: message arg"
+        assert inst.format(record) == "ERROR: message arg"
+
+        mock_format.assert_called_once_with(record)
+
+    def test_format__traceback_cache(self, init_handler):
+        """Test HoudiniLoggingHandler.format() deduplicating tracebacks with a shared cache."""
+        cache = houdini_logging_tools.formatting.TracebackCache()
+
+        inst = init_handler(traceback_cache=cache)
+        assert inst.traceback_cache is cache
+
+        other = houdini_logging_tools.handlers.shellio.PythonShellHandler(
+            options=houdini_logging_tools.handlers.shellio.PythonShellOptions(traceback_cache=cache)
+        )
+        other.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+
+        def _fail(value):
+            raise ValueError(value)
+
+        records = []
+
+        for value in range(2):
+            try:
+                _fail(value)
+
+            except ValueError:
+                records.append(_create_record("failed", exc_info=True))
+
+        first = inst.format(records[0])
+
+        assert first.startswith("failed\nTraceback (most recent call last):")
+        assert first.endswith("ValueError: 0\n(traceback #1)")
+
+        # The other handler sharing the cache gets the same traceback for the record.
+        assert other.format(records[0]).endswith("ValueError: 0\n(traceback #1)")
+
+        assert inst.format(records[1]) == "failed\nValueError: 1 (traceback #1, seen 2 times)"
+
+
+class TestHoudiniLoggingHandlerSources:
+    """Test the log sources of houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler."""
+
+    # Non-Public Methods
+
+    def test__get_source_context(self, init_handler):
+        """Test HoudiniLoggingHandler._get_source_context()."""
+        inst = init_handler(context_format="{filename}:{lineno} {funcName} ({name}, {module}, {pathname})")
+
+        record = _create_record("message")
+
+        expected = "module.py:10 None (test, module, /path/to/module.py)"
+
+        assert inst._get_source_context(record) == expected
+
+        # A second record from the same call site gets the cached value.
+        inst._context_cache["test", "/path/to/module.py", 10] = "cached"
+
+        assert inst._get_source_context(_create_record("other")) == "cached"
+
+    def test__get_source_context__eviction(self, init_handler):
+        """Test HoudiniLoggingHandler._get_source_context() evicting the least recently used value."""
+        inst = init_handler(context_cache_size=2)
+
+        first = _create_record("message", lineno=1)
+        second = _create_record("message", lineno=2)
+        third = _create_record("message", lineno=3)
+
+        inst._get_source_context(first)
+        inst._get_source_context(second)
+
+        # Use the first context again so the second is the least recently used.
+        inst._get_source_context(first)
+        inst._get_source_context(third)
+
+        assert list(inst._context_cache) == [
+            ("test", "/path/to/module.py", 1),
+            ("test", "/path/to/module.py", 3),
+        ]
+
+    def test__get_source_context__threads(self, init_handler):
+        """Test HoudiniLoggingHandler._get_source_context() being called from several threads at once."""
+        inst = init_handler(context_cache_size=4)
+
+        records = [_create_record("message", lineno=lineno) for lineno in range(16)]
+
+        def _get_contexts():
+            for _ in range(200):
+                for record in records:
+                    inst._get_source_context(record)
+
+        threads = [threading.Thread(target=_get_contexts) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert len(inst._context_cache) == inst._context_cache_size
+
+    def test__log_record__routed(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._log_record() creating each routed source once."""
+        mock_log = mocker.patch("hou.logging.log")
+        mocker.patch("hou.logging.LogEntry")
+
+        inst = init_handler(source_routing=houdini_logging_tools.handlers.houdini_logging.top_level_package)
+
+        inst._log_record(_create_record("message", name="tools.validate"))
+        inst._log_record(_create_record("message", name="tools.export"))
+        inst._log_record(_create_record("message", name="pipeline"))
+
+        assert hou.logging.createSource.call_args_list == [mocker.call("tools"), mocker.call("pipeline")]
+        assert [call.args[1] for call in mock_log.call_args_list] == ["tools", "tools", "pipeline"]
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("tools.validate.geo", "Validation"),
+            ("tools.validate", "Validation"),
+            ("tools.export", "Tools"),
+            ("tools", "Tools"),
+            ("toolsets", None),
+            ("other.tools", None),
+        ],
+    )
+    def test__route_source__mapping(self, init_handler, name, expected):
+        """Test HoudiniLoggingHandler._route_source() using the closest mapped logger."""
+        inst = init_handler(source_routing={"tools": "Tools", "tools.validate": "Validation"})
+
+        assert inst._route_source(name) == expected
+
+    def test__route_source__none(self, init_handler):
+        """Test HoudiniLoggingHandler._route_source() without source routing."""
+        inst = init_handler()
+
+        assert inst._route_source("tools") is None
+
+
+class TestHoudiniLoggingHandlerQueued:
+    """Test the queued mode of houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler."""
+
+    def test___init____queued(self, init_handler):
+        """Test object initialization when queued."""
+        queue_size = 5
+        batch_size = 2
+
+        inst = init_handler(queued=True, queue_size=queue_size, drop_policy="block", batch_size=batch_size)
+
+        assert inst.queued
+        assert inst._dispatcher.drop_policy == houdini_logging_tools.queueing.DropPolicy.BLOCK
+        assert inst._dispatcher._batch_size == batch_size
+        assert inst._dispatcher._queue.maxsize == queue_size
+
+    # Non-Public Methods
+
+    @pytest.mark.usefixtures("enabled_metrics")
+    def test__count_dropped(self, init_handler, mocker):
+        """Test counting the records dropped from a full queue."""
+        inst = init_handler(queued=True, queue_size=1, drop_policy="drop-newest")
+        mocker.patch.object(inst._dispatcher, "start")
+
+        inst.emit(_create_record("first"))
+        inst.emit(_create_record("second"))
+
+        snapshot = houdini_logging_tools.metrics.METRICS.snapshot()["HoudiniLoggingHandler"]
+
+        assert snapshot.records == {"ERROR": 2}
+        assert snapshot.counters == {"dropped": 1}
+        assert snapshot.timers["emit"].count == sum(snapshot.records.values())
+
+        inst._dispatcher._queue.get_nowait()
+        inst._dispatcher._queue.task_done()
+
+    # Methods
+
+    def test_close__queued(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler.close() when queued."""
+        inst = init_handler(queued=True)
+
+        mock_stop = mocker.patch.object(inst._dispatcher, "stop")
+
+        inst.close()
+
+        mock_stop.assert_called()
+
+    def test_emit__queued(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler.emit() when queued."""
+        mock_log_record = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_log_record"
+        )
+
+        mock_prepare = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_prepare"
+        )
+
+        mock_record = mocker.MagicMock(spec=logging.LogRecord)
+
+        inst = init_handler(queued=True)
+
+        mock_put = mocker.patch.object(inst._dispatcher, "put")
+
+        inst.emit(mock_record)
+
+        mock_put.assert_called_with(mock_prepare.return_value)
+        mock_prepare.assert_called_with(mock_record)
+        mock_log_record.assert_not_called()
+
+    def test_emit__queued_dispatch(self, init_handler, mocker):
+        """Test that records emitted when queued are sent to hou.logging once flushed."""
+        mock_log = mocker.patch("hou.logging.log")
+        mock_entry = mocker.patch("hou.logging.LogEntry")
+
+        inst = init_handler(queued=True, batch_size=4)
+
+        logger = logging.getLogger("test_emit__queued_dispatch")
+        logger.propagate = False
+        logger.addHandler(inst)
+
+        record_count = 10
+
+        try:
+            for i in range(record_count):
+                logger.warning("message %d", i)
+
+            inst.flush()
+
+        finally:
+            logger.removeHandler(inst)
+
+        assert mock_log.call_count == record_count
+
+        messages = [call.kwargs["message"] for call in mock_entry.call_args_list]
+        assert messages == [f"message {i}" for i in range(record_count)]
+
+    def test_flush__queued(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler.flush() when queued."""
+        inst = init_handler(queued=True)
+
+        mock_flush = mocker.patch.object(inst._dispatcher, "flush")
+
+        inst.flush()
+
+        mock_flush.assert_called()
+
+
+class TestHoudiniLoggingHandlerCoalescing:
+    """Test the record coalescing of houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler."""
+
+    # Non-Public Methods
+
+    def test__coalesce(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._coalesce()."""
+        now = 100
+        window = 5
+        first_repeat = 11
+        last_repeat = 12
+
+        mocker.patch("time.monotonic", return_value=now)
+        mock_schedule = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_schedule_coalesce_timer"
+        )
+        mock_log_record = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_log_record"
+        )
+
+        inst = init_handler(coalesce_window=window)
+
+        first = _create_record("message %s", ("a",), created=10)
+        inst._coalesce(first, "prepared")
+
+        # The first record is sent immediately.
+        mock_log_record.assert_called_once_with(first, "prepared")
+        mock_schedule.assert_called_once_with(window)
+
+        # Simulate the timer having been started.
+        inst._coalesce_timer = mocker.MagicMock()
+
+        inst._coalesce(_create_record("message %s", ("a",), created=first_repeat))
+        inst._coalesce(_create_record("message %s", ("a",), created=last_repeat))
+
+        other = _create_record("message %s", ("b",), created=13)
+        inst._coalesce(other)
+
+        mock_schedule.assert_called_once()
+
+        # Only the first record of each message is sent, the repeats are counted.
+        assert mock_log_record.call_args_list == [mocker.call(first, "prepared"), mocker.call(other, None)]
+        assert list(inst._coalesced) == [
+            ("test", "/path/to/module.py", 10, logging.ERROR, "message a"),
+            ("test", "/path/to/module.py", 10, logging.ERROR, "message b"),
+        ]
+
+        pending = inst._coalesced["test", "/path/to/module.py", 10, logging.ERROR, "message a"]
+        assert pending.record is first
+        assert pending.message == "prepared"
+        assert pending.count == last_repeat - first_repeat + 1
+        assert pending.first == first_repeat
+        assert pending.last == last_repeat
+        assert pending.deadline == now + window
+
+    def test__coalesce__expired(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._coalesce() when the pending record's window has closed."""
+        mock_monotonic = mocker.patch("time.monotonic", return_value=100)
+        mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_schedule_coalesce_timer"
+        )
+        mock_log_coalesced = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_log_coalesced"
+        )
+        mock_log_record = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_log_record"
+        )
+
+        inst = init_handler(coalesce_window=5)
+
+        first = _create_record("message")
+        second = _create_record("message")
+
+        inst._coalesce(first)
+        expired = inst._coalesced[next(iter(inst._coalesced))]
+
+        mock_monotonic.return_value = 110
+        inst._coalesce(second)
+
+        mock_log_coalesced.assert_called_once_with(expired)
+
+        # The record starts a new window so is sent immediately.
+        assert mock_log_record.call_args_list == [mocker.call(first, None), mocker.call(second, None)]
+        assert inst._coalesced[next(iter(inst._coalesced))].record is second
+
+    def test__flush_coalesced(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._flush_coalesced()."""
+        mocker.patch("time.monotonic", return_value=100)
+        mock_schedule = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_schedule_coalesce_timer"
+        )
+        mock_log_coalesced = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_log_coalesced"
+        )
+
+        inst = init_handler(coalesce_window=5)
+
+        expired = houdini_logging_tools.handlers.houdini_logging._CoalescedRecord(_create_record("a"), None, 99)
+        pending = houdini_logging_tools.handlers.houdini_logging._CoalescedRecord(_create_record("b"), None, 102)
+
+        inst._coalesced = {"a": expired, "b": pending}
+
+        mock_timer = mocker.MagicMock()
+        inst._coalesce_timer = mock_timer
+
+        inst._flush_coalesced()
+
+        mock_timer.cancel.assert_called()
+        mock_log_coalesced.assert_called_once_with(expired)
+        mock_schedule.assert_called_once_with(2)
+
+        assert inst._coalesced == {"b": pending}
+
+    def test__flush_coalesced__force(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._flush_coalesced() when forcing all records to be sent."""
+        mock_schedule = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_schedule_coalesce_timer"
+        )
+        mock_log_coalesced = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_log_coalesced"
+        )
+
+        inst = init_handler(coalesce_window=5)
+
+        pending = houdini_logging_tools.handlers.houdini_logging._CoalescedRecord(
+            _create_record("a"), None, float("inf")
+        )
+        inst._coalesced = {"a": pending}
+
+        inst._flush_coalesced(force=True)
+
+        mock_log_coalesced.assert_called_once_with(pending)
+        mock_schedule.assert_not_called()
+
+        assert not inst._coalesced
+
+    def test__log_coalesced(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._log_coalesced() for a record which was not repeated."""
+        mock_log_record = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_log_record"
+        )
+
+        inst = init_handler()
+
+        record = _create_record("message")
+
+        inst._log_coalesced(houdini_logging_tools.handlers.houdini_logging._CoalescedRecord(record, None, 0))
+
+        # The record was already sent so there is nothing to summarize.
+        mock_log_record.assert_not_called()
+
+    def test__log_coalesced__repeated(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._log_coalesced() for a repeated record."""
+        mock_log_record = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_log_record"
+        )
+        mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging,
+            "_format_time",
+            side_effect=lambda created: f"t{created}",
+        )
+
+        inst = init_handler()
+
+        record = _create_record("message", created=10)
+
+        pending = houdini_logging_tools.handlers.houdini_logging._CoalescedRecord(record, None, 0)
+        pending.add_repeat(_create_record("message", created=12))
+
+        inst._log_coalesced(pending)
+
+        mock_log_record.assert_called_with(record, "message (repeated once more at t12)")
+
+        for created in (15, 20):
+            pending.add_repeat(_create_record("message", created=created))
+
+        pending.message = "prepared"
+
+        inst._log_coalesced(pending)
+
+        mock_log_record.assert_called_with(record, "prepared (repeated 3 more times between t12 and t20)")
+
+    def test__log_coalesced__error(self, init_handler, mocker):
+        """Test HoudiniLoggingHandler._log_coalesced() when an error occurs."""
+        mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "_log_record", side_effect=Exception
+        )
+        mock_handle = mocker.patch.object(
+            houdini_logging_tools.handlers.houdini_logging.HoudiniLoggingHandler, "handleError"
+        )
+
+        inst = init_handler()
+
+        record = _create_record("message")
+
+        pending = houdini_logging_tools.handlers.houdini_logging._CoalescedRecord(record, None, 0)
+        pending.add_repeat(_create_record("message"))
+
+        inst._log_coalesced(pending)
+
+        mock_handle.assert_called_with(record)
+
+    # Methods
+
+    def test_emit__coalesce(self, init_handler, mocker):
+        """Test that repeated records are sent once followed by a summary of the repeats."""
+        mocker.patch("hou.logging.log")
+        mock_entry = mocker.patch("hou.logging.LogEntry")
+
+        inst = init_handler(coalesce_window=60)
+
+        logger = logging.getLogger("test_emit__coalesce")
+        logger.propagate = False
+        logger.addHandler(inst)
+
+        repeat_count = 5
+
+        try:
+            for _ in range(repeat_count):
+                logger.error("repeated message")
+
+            logger.error("other message")
+
+            # The first of each message is sent immediately, the repeats are held.
+            messages = [call.kwargs["message"] for call in mock_entry.call_args_list]
+            assert messages == ["repeated message", "other message"]
+
+            inst.flush()
+
+        finally:
+            logger.removeHandler(inst)
+
+        messages = [call.kwargs["message"] for call in mock_entry.call_args_list]
+
+        assert messages[:2] == ["repeated message", "other message"]
+        (summary,) = messages[2:]
+        assert summary.startswith(f"repeated message (repeated {repeat_count - 1} more times between ")
+
+    def test_emit__coalesce_timer(self, init_handler, mocker):
+        """Test that repeated records are sent by the timer when the window closes."""
+        mock_log = mocker.patch("hou.logging.log")
+        mocker.patch("hou.logging.LogEntry")
+
+        inst = init_handler(coalesce_window=0.01)
+
+        record_count = 2
+
+        for _ in range(record_count):
+            inst.emit(_create_record("message"))
+
+        timer = inst._coalesce_timer
+
+        timer.join(5)
+
+        # The first record is sent immediately and the repeat by the timer.
+        assert mock_log.call_count == record_count
+        assert inst._coalesce_timer is None
+
+
+def test_top_level_package():
+    """Test houdini_logging_tools.handlers.houdini_logging.top_level_package()."""
+    assert houdini_logging_tools.handlers.houdini_logging.top_level_package("tools.validate.geo") == "tools"
+    assert houdini_logging_tools.handlers.houdini_logging.top_level_package("tools") == "tools"
+
+
+# Helpers
+
+
+def _create_record(msg, args=(), *, created=None, lineno=10, name="test", exc_info=None):
+    """Create a log record for testing."""
+    if exc_info is True:
+        exc_info = sys.exc_info()
+
+    record = logging.LogRecord(name, logging.ERROR, "/path/to/module.py", lineno, msg, args, exc_info)
+
+    if created is not None:
+        record.created = created
+
+    return record
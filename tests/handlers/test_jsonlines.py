@@ -0,0 +1,317 @@
+"""Tests for houdini_logging_tools.handlers.jsonlines module."""
+
+# Standard Library
+import gzip
+import json
+import logging
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.handlers.jsonlines
+
+# Fixtures
+
+
+@pytest.fixture
+def init_handler(tmp_path):
+    """Fixture to initialize handlers writing to a temporary directory and close them afterwards."""
+    handlers = []
+
+    def _create(filename="render.jsonl", **kwargs):
+        handler = houdini_logging_tools.handlers.jsonlines.JsonLinesHandler(
+            tmp_path / filename,
+            options=houdini_logging_tools.handlers.jsonlines.JsonLinesOptions(**kwargs) if kwargs else None,
+        )
+        handlers.append(handler)
+
+        return handler
+
+    yield _create
+
+    for handler in handlers:
+        handler.close()
+
+
+# Tests
+
+
+class TestJsonLinesHandler:
+    """Test houdini_logging_tools.handlers.jsonlines.JsonLinesHandler object."""
+
+    def test___init__(self, init_handler, tmp_path):
+        """Test object initialization."""
+        inst = init_handler()
+
+        assert inst.path == tmp_path / "render.jsonl"
+        assert inst.dropped == 0
+
+        # The file is not created until there is something to write.
+        assert not inst.path.exists()
+
+    # Non-Public Methods
+
+    def test__compress_files__error(self, init_handler, tmp_path, mocker):
+        """Test JsonLinesHandler._compress_files() keeping files which cannot be compressed."""
+        mocker.patch("gzip.open", side_effect=OSError)
+        mock_handle_error = mocker.patch.object(
+            houdini_logging_tools.handlers.jsonlines.JsonLinesHandler, "handleError"
+        )
+
+        rotated_path = tmp_path / "render.20261018-115226.jsonl"
+        rotated_path.write_text("{}\n")
+
+        inst = init_handler()
+        inst._compress_files([rotated_path])
+
+        assert rotated_path.exists()
+        assert mock_handle_error.call_args.args[0].getMessage() == f"Could not compress {rotated_path}"
+
+    def test__encode_record(self, init_handler, exc_info):
+        """Test JsonLinesHandler._encode_record()."""
+        inst = init_handler(extra_fields=("work_item", "frame", "missing"))
+
+        record = _create_record(logging.ERROR, "Rendered frame %d", (12,), exc_info=exc_info)
+        record.created = 1792324346.123
+        record.msecs = 123.0
+        record.node_path = "/out/karma1"
+        record.stack_info = "Stack (most recent call last):"
+        record.work_item = "ropfetch1_5"
+        record.frame = object()
+
+        entry = json.loads(inst._encode_record(inst._prepare(record)))
+
+        assert entry.pop("exception").startswith("Traceback")
+        assert entry.pop("frame").startswith("<object object")
+        assert entry == {
+            "time": "2026-10-18T11:52:26.123+00:00",
+            "level": "ERROR",
+            "severity": "Error",
+            "logger": "test",
+            "message": "Rendered frame 12",
+            "node_path": "/out/karma1",
+            "module": "module",
+            "function": "func",
+            "line": record.lineno,
+            "path": "/path/to/module.py",
+            "process": record.process,
+            "thread": record.threadName,
+            "stack": "Stack (most recent call last):",
+            "work_item": "ropfetch1_5",
+        }
+
+    def test__encode_record__no_severity(self, init_handler, mocker):
+        """Test JsonLinesHandler._encode_record() when hou is not available to look up the severity."""
+        mocker.patch.object(houdini_logging_tools.handlers.jsonlines, "get_severity", return_value=None)
+
+        inst = init_handler()
+
+        entry = json.loads(inst._encode_record(_create_record(logging.INFO, "é")))
+
+        assert entry["severity"] is None
+        assert entry["node_path"] is None
+        assert entry["message"] == "é"
+        assert "exception" not in entry
+        assert "stack" not in entry
+
+    def test__prepare(self, init_handler, exc_info):
+        """Test JsonLinesHandler._prepare() rendering a copy of the record."""
+        inst = init_handler()
+
+        args = ["first"]
+        record = _create_record(logging.ERROR, "message %s", (args,), exc_info=exc_info)
+
+        result = inst._prepare(record)
+
+        # Changing the args after the log call does not change the queued record.
+        args.append("second")
+
+        assert result is not record
+        assert result.getMessage() == "message ['first']"
+        assert result.exc_info is None
+        assert result.exc_text.startswith("Traceback")
+
+        # The formatted exception is not cached on the shared record.
+        assert record.exc_info is not None
+        assert record.exc_text is None
+
+    def test__prepare__exc_text(self, init_handler, exc_info):
+        """Test JsonLinesHandler._prepare() using exception text formatted by another handler."""
+        inst = init_handler()
+
+        record = _create_record(logging.ERROR, "message", exc_info=exc_info)
+        record.exc_text = "formatted"
+
+        result = inst._prepare(record)
+
+        assert result.exc_text == "formatted"
+
+        # Clearing the shared record's exception text does not change the queued record.
+        record.exc_text = None
+
+        assert json.loads(inst._encode_record(result))["exception"] == "formatted"
+
+    def test__write_records__encode_error(self, init_handler, mocker):
+        """Test JsonLinesHandler._write_records() skipping records which cannot be encoded."""
+        mock_handle_error = mocker.patch.object(
+            houdini_logging_tools.handlers.jsonlines.JsonLinesHandler, "handleError"
+        )
+
+        inst = init_handler()
+
+        bad_record = _create_record(logging.INFO, "message %d", ("a",))
+        good_record = _create_record(logging.INFO, "message")
+
+        inst._write_records([bad_record])
+
+        assert not inst.path.exists()
+
+        inst._write_records([bad_record, good_record])
+
+        assert mock_handle_error.call_args_list == [mocker.call(bad_record), mocker.call(bad_record)]
+        assert _read_messages(inst.path) == ["message"]
+
+    def test__write_records__write_error(self, init_handler, mocker):
+        """Test JsonLinesHandler._write_records() handling errors opening the file."""
+        mocker.patch("pathlib.Path.open", side_effect=PermissionError)
+        mock_handle_error = mocker.patch.object(
+            houdini_logging_tools.handlers.jsonlines.JsonLinesHandler, "handleError"
+        )
+
+        inst = init_handler()
+        records = [_create_record(logging.INFO, "first"), _create_record(logging.INFO, "second")]
+
+        inst._write_records(records)
+
+        mock_handle_error.assert_called_once_with(records[1])
+
+    # Methods
+
+    def test_emit(self, init_handler, tmp_path):
+        """Test writing records to a file."""
+        path = tmp_path / "logs" / "render.jsonl"
+        path.parent.mkdir()
+        path.write_text('{"message":"existing"}\n')
+
+        record_count = 5
+
+        inst = init_handler(path, batch_size=2)
+
+        for index in range(record_count):
+            inst.emit(_create_record(logging.INFO, "message %d", (index,)))
+
+        inst.flush()
+
+        assert _read_messages(path) == ["existing"] + [f"message {index}" for index in range(record_count)]
+
+    def test_emit__mutated_args(self, init_handler):
+        """Test writing the message as it was when the record was emitted."""
+        inst = init_handler()
+
+        args = {"frame": 12}
+
+        inst.emit(_create_record(logging.INFO, "Rendered %(frame)d", (args,)))
+
+        args["frame"] = 13
+
+        inst.flush()
+
+        assert _read_messages(inst.path) == ["Rendered 12"]
+
+    def test_emit__prepare_error(self, init_handler, mocker):
+        """Test handling records whose message cannot be rendered."""
+        mock_handle_error = mocker.patch.object(
+            houdini_logging_tools.handlers.jsonlines.JsonLinesHandler, "handleError"
+        )
+
+        inst = init_handler()
+        record = _create_record(logging.INFO, "message %d", ("a",))
+
+        inst.emit(record)
+        inst.flush()
+
+        mock_handle_error.assert_called_once_with(record)
+        assert not inst.path.exists()
+
+    def test_emit__rotate_size(self, init_handler, tmp_path, mocker):
+        """Test rotating the file when it would exceed the maximum size."""
+        mocker.patch("time.strftime", return_value="20261018-115226")
+
+        inst = init_handler(max_bytes=700, backup_count=2, compress=False)
+
+        for index in range(7):
+            inst.emit(_create_record(logging.INFO, "message %d", (index,)))
+            inst.flush()
+
+        inst.close()
+
+        # Each file has room for two entries.  The oldest rotated file was removed.
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "render.20261018-115226-1.jsonl",
+            "render.20261018-115226-2.jsonl",
+            "render.jsonl",
+        ]
+        assert _read_messages(tmp_path / "render.20261018-115226-1.jsonl") == ["message 2", "message 3"]
+        assert _read_messages(tmp_path / "render.20261018-115226-2.jsonl") == ["message 4", "message 5"]
+        assert _read_messages(tmp_path / "render.jsonl") == ["message 6"]
+
+    def test_emit__rotate_interval(self, init_handler, tmp_path, mocker):
+        """Test rotating and compressing the file once it has been open for the rotate interval."""
+        mock_time = mocker.patch("time.time", return_value=1000.0)
+        mocker.patch("time.strftime", return_value="20261018-115226")
+
+        inst = init_handler(rotate_interval=60, backup_count=None)
+
+        inst.emit(_create_record(logging.INFO, "first"))
+        inst.flush()
+
+        mock_time.return_value = 1059.0
+        inst.emit(_create_record(logging.INFO, "second"))
+        inst.flush()
+
+        mock_time.return_value = 1060.0
+        inst.emit(_create_record(logging.INFO, "third"))
+        inst.close()
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["render.20261018-115226.jsonl.gz", "render.jsonl"]
+        assert _read_messages(tmp_path / "render.20261018-115226.jsonl.gz") == ["first", "second"]
+        assert _read_messages(tmp_path / "render.jsonl") == ["third"]
+
+    def test_emit__remove_compressed(self, init_handler, tmp_path):
+        """Test that only the newest compressed files are kept."""
+        for name in ("render.20261018-115224.jsonl.gz", "render.20261018-115225.jsonl.gz", "other.jsonl.gz"):
+            (tmp_path / name).touch()
+
+        inst = init_handler(max_bytes=1, backup_count=1)
+
+        inst.emit(_create_record(logging.INFO, "first"))
+        inst.flush()
+        inst.emit(_create_record(logging.INFO, "second"))
+        inst.close()
+
+        rotated = sorted(path.name for path in tmp_path.iterdir() if path.name.startswith("render."))
+
+        # Only the file rotated by the handler is left.
+        rotated_name, current_name = rotated
+
+        assert rotated_name.endswith(".jsonl.gz")
+        assert current_name == "render.jsonl"
+        assert _read_messages(tmp_path / rotated_name) == ["first"]
+        assert (tmp_path / "other.jsonl.gz").exists()
+
+
+# Helpers
+
+
+def _create_record(level, msg, args=(), exc_info=None):
+    """Create a log record for testing."""
+    return logging.LogRecord("test", level, "/path/to/module.py", 10, msg, args, exc_info, func="func")
+
+
+def _read_messages(path):
+    """Read the messages of the entries in a file."""
+    opener = gzip.open if path.suffix == ".gz" else open
+
+    with opener(path, "rt", encoding="utf-8") as handle:
+        return [json.loads(line)["message"] for line in handle]
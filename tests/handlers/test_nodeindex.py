@@ -0,0 +1,290 @@
+"""Tests for houdini_logging_tools.handlers.nodeindex module."""
+
+# Standard Library
+import logging
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.adapters.loggeradapter
+import houdini_logging_tools.handlers.nodeindex
+import houdini_logging_tools.nodes
+
+# Houdini
+import hou
+
+# Fixtures
+
+
+@pytest.fixture
+def populated_index():
+    """Fixture to provide an index with records for a small hierarchy of nodes."""
+    inst = houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler()
+
+    records = [
+        ("/obj/geo1", 1, logging.INFO, 100.0),
+        ("/obj/geo1", 1, logging.WARNING, 101.0),
+        ("/obj/geo1/box1", 2, logging.ERROR, 102.0),
+        ("/obj/geo1/box1", 2, logging.INFO, 103.0),
+        ("/obj/geo10", 3, logging.ERROR, 104.0),
+        ("/obj/geo1-copy", 4, logging.ERROR, 105.0),
+        ("/obj/geo1_copy/box1", 5, logging.ERROR, 106.0),
+        (None, None, logging.ERROR, 107.0),
+    ]
+
+    for node_path, session_id, level, created in records:
+        inst.handle(_create_record(level, f"{node_path} {created}", created, node_path, session_id))
+
+    return inst
+
+
+# Tests
+
+
+class TestIndexedRecord:
+    """Test houdini_logging_tools.handlers.nodeindex.IndexedRecord object."""
+
+    def test___repr__(self):
+        """Test IndexedRecord.__repr__()."""
+        inst = houdini_logging_tools.handlers.nodeindex.IndexedRecord(1.0, logging.WARNING, "test", "message", "/obj")
+
+        assert repr(inst) == "<IndexedRecord WARNING /obj 'message'>"
+
+
+class TestNodeLogIndexHandler:
+    """Test houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler object."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        inst = houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler()
+
+        assert inst.node_count == 0
+        assert inst.record_count == 0
+        assert inst.query() == []
+
+    @pytest.mark.parametrize("kwargs", [{"max_records": 0}, {"max_records_per_node": 0}])
+    def test___init____invalid(self, kwargs):
+        """Test object initialization with invalid limits."""
+        with pytest.raises(ValueError, match="must be at least 1"):
+            houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler(**kwargs)
+
+    # Properties
+
+    def test_counts(self, populated_index):
+        """Test NodeLogIndexHandler.node_count and NodeLogIndexHandler.record_count."""
+        records = populated_index.query()
+
+        # Records without a node are not counted as a node.
+        assert populated_index.node_count == len({entry.node_path for entry in records} - {None})
+        assert populated_index.record_count == len(records)
+
+    # Methods
+
+    def test_clear(self, populated_index):
+        """Test NodeLogIndexHandler.clear()."""
+        populated_index.clear()
+
+        assert populated_index.node_count == 0
+        assert populated_index.record_count == 0
+        assert populated_index.query() == []
+        assert populated_index._paths == []
+
+    def test_emit__error(self, mocker):
+        """Test NodeLogIndexHandler.emit() handling errors."""
+        mock_handle_error = mocker.patch.object(
+            houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler, "handleError"
+        )
+
+        inst = houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler()
+        record = _create_record(logging.INFO, "message %d", 1.0)
+        record.args = ("a",)
+
+        inst.emit(record)
+
+        mock_handle_error.assert_called_with(record)
+        assert inst.record_count == 0
+
+    def test_emit__max_records_per_node(self):
+        """Test that the oldest records of the lowest level are discarded when a node has too many."""
+        max_records_per_node = 3
+        inst = houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler(max_records_per_node=max_records_per_node)
+
+        levels = [logging.ERROR, logging.INFO, logging.WARNING, logging.INFO, logging.ERROR, logging.WARNING]
+
+        for created, level in enumerate(levels):
+            inst.handle(_create_record(level, str(created), float(created), "/obj/geo1", 1))
+
+        assert [entry.message for entry in inst.query()] == ["0", "4", "5"]
+        assert inst.record_count == max_records_per_node
+
+    def test_emit__max_records(self):
+        """Test that the oldest records are discarded when there are too many in total."""
+        max_records = 3
+        inst = houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler(
+            max_records=max_records, max_records_per_node=2
+        )
+
+        records = [
+            ("/obj/geo1", 1, logging.INFO),
+            ("/obj/geo1", 1, logging.WARNING),
+            # Discards the first record for the node, so only the second is kept.
+            ("/obj/geo1", 1, logging.ERROR),
+            # Discarding for the total skips the record already discarded for the node.
+            ("/obj/geo2", 2, logging.INFO),
+            ("/obj/geo2", 2, logging.INFO),
+        ]
+
+        for created, (node_path, session_id, level) in enumerate(records):
+            inst.handle(_create_record(level, str(created), float(created), node_path, session_id))
+
+        assert [entry.message for entry in inst.query()] == ["2", "3", "4"]
+        assert inst.record_count == max_records
+
+        inst.handle(_create_record(logging.INFO, "5", 5.0, "/obj/geo2", 2))
+        inst.handle(_create_record(logging.INFO, "6", 6.0, "/obj/geo2", 2))
+
+        # The node with no records left is removed.
+        assert [entry.message for entry in inst.query()] == ["5", "6"]
+        assert inst.node_count == 1
+        assert inst._paths == ["/obj/geo2"]
+
+    def test_emit__max_records_removed_node(self, mocker):
+        """Test discarding for the total skips records of a node which has already been removed."""
+        mock_handle_error = mocker.patch.object(
+            houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler, "handleError"
+        )
+
+        inst = houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler(max_records=3, max_records_per_node=1)
+
+        # Each record discards the previous INFO record for the node, so only the
+        # warning is kept, until it is discarded for the total and the node removed
+        # while its earlier records are still waiting to be discarded for the total.
+        for created, level in enumerate([logging.INFO, logging.WARNING, logging.INFO]):
+            inst.handle(_create_record(level, f"a{created}", float(created), "/obj/a", 1))
+
+        for created in range(3, 8):
+            inst.handle(_create_record(logging.INFO, f"b{created}", float(created), "/obj/b", 2))
+
+        mock_handle_error.assert_not_called()
+        assert [entry.message for entry in inst.query()] == ["b7"]
+        assert inst.record_count == 1
+        assert inst.node_count == 1
+        assert inst._paths == ["/obj/b"]
+
+    def test_emit__renamed(self):
+        """Test that records for a node keep being stored together after it is renamed."""
+        inst = houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler()
+
+        inst.handle(_create_record(logging.INFO, "first", 1.0, "/obj/geo1", 1))
+        inst.handle(_create_record(logging.INFO, "second", 2.0, "/obj/renamed", 1))
+
+        assert inst.node_count == 1
+        assert inst._paths == ["/obj/renamed"]
+        assert [entry.message for entry in inst.query("/obj/renamed")] == ["first", "second"]
+        assert inst.query("/obj/geo1") == []
+
+    def test_emit__same_path(self):
+        """Test storing records for different nodes which had the same path."""
+        inst = houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler(max_records=2)
+
+        inst.handle(_create_record(logging.INFO, "deleted", 1.0, "/obj/geo1", 1))
+        inst.handle(_create_record(logging.INFO, "recreated", 2.0, "/obj/geo1", 2))
+
+        assert inst.node_count == len(("deleted", "recreated"))
+        assert [entry.message for entry in inst.query("/obj/geo1")] == ["deleted", "recreated"]
+
+        # Removing the first node keeps the path for the second.
+        inst.handle(_create_record(logging.INFO, "no node", 3.0))
+
+        assert inst.node_count == 1
+        assert inst._paths == ["/obj/geo1"]
+
+        # Records without a node are discarded too.
+        inst.handle(_create_record(logging.INFO, "other", 4.0, "/obj/geo2", 3))
+        inst.handle(_create_record(logging.INFO, "other", 5.0, "/obj/geo2", 3))
+
+        assert [entry.created for entry in inst.query()] == [4.0, 5.0]
+
+    @pytest.mark.parametrize(
+        ("node", "kwargs", "expected"),
+        [
+            (None, {}, [100, 101, 102, 103, 104, 105, 106, 107]),
+            ("/", {}, [100, 101, 102, 103, 104, 105, 106]),
+            ("/obj/geo1", {}, [100, 101, 102, 103]),
+            ("/obj/geo1/", {}, [100, 101, 102, 103]),
+            ("/obj/geo1", {"children": False}, [100, 101]),
+            ("/obj/geo1", {"level": logging.WARNING}, [101, 102]),
+            ("/obj/geo1", {"start": 101, "end": 102}, [101, 102]),
+            ("/obj/geo1", {"limit": 3}, [101, 102, 103]),
+            ("/obj/geo1", {"limit": 0}, []),
+            ("/obj/geo1/box1", {}, [102, 103]),
+            ("/obj/geo2", {}, []),
+            (None, {"level": logging.ERROR, "start": 105}, [105, 106, 107]),
+        ],
+    )
+    def test_query(self, populated_index, node, kwargs, expected):
+        """Test NodeLogIndexHandler.query()."""
+        result = populated_index.query(node, **kwargs)
+
+        assert [entry.created for entry in result] == expected
+
+    def test_query__node(self, mocker):
+        """Test NodeLogIndexHandler.query() passing a node which was renamed after logging."""
+        mocker.patch.object(houdini_logging_tools.nodes.NODE_PATH_CACHE, "lookup", return_value=(1, "/obj/renamed"))
+
+        inst = houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler()
+
+        inst.handle(_create_record(logging.INFO, "first", 1.0, "/obj/geo1", 1))
+        inst.handle(_create_record(logging.INFO, "child", 2.0, "/obj/renamed/box1", 2))
+
+        result = inst.query(mocker.MagicMock())
+
+        assert [entry.message for entry in result] == ["first", "child"]
+        assert result[0].node_path == "/obj/geo1"
+
+        # A node without records of its own still finds its children's.
+        houdini_logging_tools.nodes.NODE_PATH_CACHE.lookup.return_value = (3, "/obj/renamed")
+
+        assert [entry.message for entry in inst.query(mocker.MagicMock())] == ["child"]
+
+
+def test_adapter_records():
+    """Test indexing records logged through HoudiniLoggerAdapter for a node."""
+    inst = houdini_logging_tools.handlers.nodeindex.NodeLogIndexHandler()
+
+    logger = logging.getLogger("test_nodeindex")
+    logger.addHandler(inst)
+
+    try:
+        adapter = houdini_logging_tools.adapters.loggeradapter.HoudiniLoggerAdapter(logger, hou.node("/obj"))
+        adapter.warning("message %s", "arg")
+
+    finally:
+        logger.removeHandler(inst)
+        houdini_logging_tools.nodes.NODE_PATH_CACHE.clear()
+
+    (entry,) = inst.query(hou.node("/obj"))
+
+    # The node path is only kept in its own attribute.
+    assert entry.message == "message arg"
+    assert entry.name == "test_nodeindex"
+    assert entry.levelno == logging.WARNING
+    assert entry.node_path == "/obj"
+
+
+# Helpers
+
+
+def _create_record(level, msg, created, node_path=None, session_id=None):
+    """Create a log record for testing."""
+    record = logging.LogRecord("test", level, "/path/to/module.py", 10, msg, (), None)
+    record.created = created
+
+    if node_path is not None:
+        record.node_path = node_path
+
+    if session_id is not None:
+        record.node_session_id = session_id
+
+    return record
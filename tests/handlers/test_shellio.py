@@ -2,12 +2,16 @@
 
 # Standard Library
 import logging
+import threading
 
 # Third Party
 import pytest
 
 # Houdini Logging Tools
+import houdini_logging_tools.formatting
 import houdini_logging_tools.handlers.shellio
+import houdini_logging_tools.metrics
+import houdini_logging_tools.ui.dispatch
 
 # Houdini
 import hou
@@ -16,16 +20,13 @@ import hou
 
 
 @pytest.fixture
-def init_handler(mocker):
+def init_handler():
     """Fixture to initialize a handler."""
-    mocker.patch.object(
-        houdini_logging_tools.handlers.shellio.PythonShellHandler,
-        "__init__",
-        return_value=None,
-    )
 
-    def _create():
-        return houdini_logging_tools.handlers.shellio.PythonShellHandler(None)
+    def _create(**kwargs):
+        return houdini_logging_tools.handlers.shellio.PythonShellHandler(
+            None, options=houdini_logging_tools.handlers.shellio.PythonShellOptions(**kwargs)
+        )
 
     return _create
 
@@ -36,6 +37,54 @@ def init_handler(mocker):
 class TestPythonShellHandler:
     """Test houdini_logging_tools.handlers.shellio.PythonShellHandler object."""
 
+    def test___init__(self, init_handler):
+        """Test object initialization."""
+        flush_interval = 2
+        capacity = 10
+
+        inst = init_handler(
+            buffered=True, flush_interval=flush_interval, flush_level=logging.WARNING, capacity=capacity
+        )
+
+        assert inst.buffered
+        assert inst._flush_interval == flush_interval
+        assert inst._flush_level == logging.WARNING
+        assert inst._capacity == capacity
+        assert inst._buffer == []
+        assert inst._backlog is None
+        assert inst.backlog == ()
+        assert inst.traceback_cache is None
+
+    # Methods
+
+    def test_close(self, init_handler, mocker):
+        """Test PythonShellHandler.close()."""
+        mock_flush_buffer = mocker.patch.object(
+            houdini_logging_tools.handlers.shellio.PythonShellHandler, "_flush_buffer"
+        )
+        mock_close = mocker.patch("logging.StreamHandler.close")
+
+        inst = init_handler(buffered=True)
+
+        inst.close()
+
+        mock_flush_buffer.assert_called_once()
+        mock_close.assert_called_once()
+
+    def test_emit__no_hou(self, init_handler, mocker):
+        """Test that nothing is written to the Python Shell when hou is not available."""
+        mocker.patch.object(houdini_logging_tools.handlers.shellio, "is_hou_available", return_value=False)
+
+        inst = init_handler(backlog_size=2)
+        inst.setFormatter(logging.Formatter("%(message)s"))
+
+        mock_stream = mocker.patch("sys.stdout", spec=hou.ShellIO)
+
+        inst.emit(logging.makeLogRecord({"msg": "message", "levelno": logging.WARNING}))
+
+        mock_stream.write.assert_not_called()
+        assert inst.backlog == ("message",)
+
     def test_emit__shellio(self, init_handler, mocker):
         """Test when sys.stdout is an instance of hou.ShellIO."""
         mock_format = mocker.patch.object(houdini_logging_tools.handlers.shellio.PythonShellHandler, "format")
@@ -118,3 +167,282 @@ class TestPythonShellHandler:
 
         mock_format.assert_called_with(mock_record)
         mock_handle.assert_called_with(mock_record)
+
+    def test_flush(self, init_handler, mocker):
+        """Test PythonShellHandler.flush()."""
+        mock_flush_buffer = mocker.patch.object(
+            houdini_logging_tools.handlers.shellio.PythonShellHandler, "_flush_buffer"
+        )
+
+        inst = init_handler(buffered=True)
+
+        inst.flush()
+
+        mock_flush_buffer.assert_called_once()
+
+    def test_format(self, init_handler, mocker):
+        """Test PythonShellHandler.format()."""
+        mock_format_record = mocker.patch("houdini_logging_tools.handlers.shellio.format_record")
+        mock_record = mocker.MagicMock(spec=logging.LogRecord)
+        mock_cache = mocker.MagicMock(spec=houdini_logging_tools.formatting.TracebackCache)
+
+        inst = init_handler(traceback_cache=mock_cache)
+
+        assert inst.traceback_cache is mock_cache
+        assert inst.format(mock_record) == mock_format_record.return_value
+
+        mock_format_record.assert_called_once_with(inst, mock_record, mock_cache)
+
+    @pytest.mark.usefixtures("enabled_metrics")
+    def test_handleError(self, init_handler, mocker):
+        """Test PythonShellHandler.handleError() counting errors."""
+        mock_handle_error = mocker.patch("logging.StreamHandler.handleError")
+        mock_record = mocker.MagicMock(spec=logging.LogRecord)
+
+        inst = init_handler()
+
+        inst.handleError(mock_record)
+
+        mock_handle_error.assert_called_once_with(mock_record)
+        assert houdini_logging_tools.metrics.METRICS.snapshot()["PythonShellHandler"].counters == {"errors": 1}
+
+
+class TestPythonShellHandlerBuffering:
+    """Test the buffered output of houdini_logging_tools.handlers.shellio.PythonShellHandler."""
+
+    # Non-Public Methods
+
+    def test__buffer_message(self, init_handler, mock_hou_ui, mock_monotonic, mocker):
+        """Test PythonShellHandler._buffer_message()."""
+        mock_flush_buffer = mocker.patch.object(
+            houdini_logging_tools.handlers.shellio.PythonShellHandler, "_flush_buffer"
+        )
+
+        flush_interval = 0.5
+
+        inst = init_handler(buffered=True, flush_interval=flush_interval, capacity=3)
+
+        inst._buffer_message("first", immediate=False)
+        inst._buffer_message("second", immediate=False)
+
+        assert inst._buffer == ["first", "second"]
+        assert inst._deadline == pytest.approx(mock_monotonic.return_value + flush_interval)
+
+        mock_hou_ui.addEventLoopCallback.assert_called_once_with(inst._event_loop_callback.callback)
+        mock_flush_buffer.assert_not_called()
+
+        # The buffer is now full.
+        inst._buffer_message("third", immediate=False)
+
+        mock_flush_buffer.assert_called_once()
+
+    def test__buffer_message__worker_thread(self, init_handler, mock_hou_ui, mocker):
+        """Test PythonShellHandler._buffer_message() from a worker thread adding the callback on the main thread."""
+        dispatcher = houdini_logging_tools.ui.dispatch.MainThreadDispatcher()
+        mocker.patch.object(houdini_logging_tools.handlers.shellio, "UI_DISPATCHER", dispatcher)
+
+        inst = init_handler(buffered=True)
+
+        thread = threading.Thread(target=inst._buffer_message, args=("message",), kwargs={"immediate": False})
+        thread.start()
+        thread.join()
+
+        # The worker thread only posted the registration.
+        mock_hou_ui.addEventLoopCallback.assert_called_once_with(dispatcher._event_loop_callback.callback)
+
+        dispatcher.flush()
+
+        mock_hou_ui.addEventLoopCallback.assert_called_with(inst._event_loop_callback.callback)
+        assert inst._event_loop_callback.registered
+
+    def test__buffer_message__immediate(self, init_handler, mock_hou_ui, mocker):
+        """Test PythonShellHandler._buffer_message() when the message should be written immediately."""
+        mock_flush_buffer = mocker.patch.object(
+            houdini_logging_tools.handlers.shellio.PythonShellHandler, "_flush_buffer"
+        )
+
+        inst = init_handler(buffered=True)
+
+        inst._buffer_message("message", immediate=True)
+
+        mock_flush_buffer.assert_called_once()
+        mock_hou_ui.addEventLoopCallback.assert_not_called()
+
+    def test__flush_buffer(self, init_handler, mock_hou_ui, mocker):
+        """Test PythonShellHandler._flush_buffer()."""
+        inst = init_handler(buffered=True)
+        inst._buffer = ["first", "second"]
+        inst._deadline = 100
+        inst._event_loop_callback.register()
+
+        mock_stream = mocker.patch("sys.stdout", spec=hou.ShellIO)
+
+        inst._flush_buffer()
+
+        mock_stream.write.assert_called_once_with("first\nsecond\n")
+        mock_stream.flush.assert_called_once()
+        mock_hou_ui.removeEventLoopCallback.assert_called_once_with(inst._event_loop_callback.callback)
+
+        assert inst._buffer == []
+        assert inst._deadline is None
+
+    def test__flush_buffer__empty(self, init_handler, mocker):
+        """Test PythonShellHandler._flush_buffer() when there is nothing buffered."""
+        inst = init_handler(buffered=True)
+
+        mock_stream = mocker.patch("sys.stdout", spec=hou.ShellIO)
+
+        inst._flush_buffer()
+
+        mock_stream.write.assert_not_called()
+
+    def test__flush_buffer__not_shellio(self, init_handler, mocker):
+        """Test PythonShellHandler._flush_buffer() when the Python Shell was closed."""
+        inst = init_handler(buffered=True)
+        inst._buffer = ["first"]
+
+        mock_stream = mocker.patch("sys.stdout")
+
+        inst._flush_buffer()
+
+        mock_stream.write.assert_not_called()
+
+        assert inst._buffer == []
+
+    def test__on_event_loop(self, init_handler, mock_monotonic, mocker):
+        """Test PythonShellHandler._on_event_loop()."""
+        mock_flush_buffer = mocker.patch.object(
+            houdini_logging_tools.handlers.shellio.PythonShellHandler, "_flush_buffer"
+        )
+
+        inst = init_handler(buffered=True)
+
+        # Nothing is buffered.
+        inst._on_event_loop()
+        mock_flush_buffer.assert_not_called()
+
+        # The interval has not passed.
+        inst._deadline = 101
+        inst._on_event_loop()
+        mock_flush_buffer.assert_not_called()
+
+        mock_monotonic.return_value = 101
+        inst._on_event_loop()
+        mock_flush_buffer.assert_called_once()
+
+    # Methods
+
+    def test_emit__buffered(self, init_handler, mock_hou_ui, mocker):
+        """Test buffering messages when sys.stdout is an instance of hou.ShellIO."""
+        inst = init_handler(buffered=True)
+        inst.setFormatter(logging.Formatter("%(message)s"))
+
+        mock_stream = mocker.patch("sys.stdout", spec=hou.ShellIO)
+
+        inst.emit(logging.makeLogRecord({"msg": "first", "levelno": logging.INFO}))
+        inst.emit(logging.makeLogRecord({"msg": "second", "levelno": logging.WARNING}))
+
+        mock_stream.write.assert_not_called()
+
+        inst.emit(logging.makeLogRecord({"msg": "third", "levelno": logging.ERROR}))
+
+        mock_stream.write.assert_called_once_with("first\nsecond\nthird\n")
+
+
+class TestPythonShellHandlerBacklog:
+    """Test the backlog of houdini_logging_tools.handlers.shellio.PythonShellHandler."""
+
+    def test___init____backlog(self, init_handler):
+        """Test object initialization with a backlog."""
+        backlog_size = 5
+
+        inst = init_handler(backlog_size=backlog_size, backlog_level=logging.INFO)
+
+        assert inst._backlog.maxlen == backlog_size
+        assert inst._backlog_level == logging.INFO
+
+    # Non-Public Methods
+
+    def test__buffer_message__backlog(self, init_handler, mock_hou_ui, mocker):
+        """Test PythonShellHandler._buffer_message() adding the backlog before the message."""
+        mocker.patch.object(houdini_logging_tools.handlers.shellio.PythonShellHandler, "_flush_buffer")
+
+        inst = init_handler(buffered=True, backlog_size=5)
+        inst._backlog.extend(["first", "second"])
+
+        inst._buffer_message("third", immediate=False)
+
+        assert inst._buffer == ["first", "second", "third"]
+        assert inst.backlog == ()
+
+    def test__take_backlog(self, init_handler):
+        """Test PythonShellHandler._take_backlog()."""
+        inst = init_handler(backlog_size=5)
+        inst._backlog.extend(["first", "second"])
+
+        assert inst._take_backlog() == ["first", "second"]
+        assert inst.backlog == ()
+
+    # Methods
+
+    def test_emit__backlog(self, init_handler, mocker):
+        """Test keeping messages while there is no Python Shell and writing them once there is."""
+        inst = init_handler(backlog_size=2)
+        inst.setFormatter(logging.Formatter("%(message)s"))
+
+        mock_stream = mocker.patch("sys.stdout")
+
+        inst.emit(logging.makeLogRecord({"msg": "first", "levelno": logging.WARNING}))
+        inst.emit(logging.makeLogRecord({"msg": "ignored", "levelno": logging.INFO}))
+        inst.emit(logging.makeLogRecord({"msg": "second", "levelno": logging.ERROR}))
+        inst.emit(logging.makeLogRecord({"msg": "third", "levelno": logging.WARNING}))
+
+        mock_stream.write.assert_not_called()
+
+        # The oldest message was discarded to stay within the size.
+        assert inst.backlog == ("second", "third")
+
+        mock_stream = mocker.patch("sys.stdout", spec=hou.ShellIO)
+
+        inst.emit(logging.makeLogRecord({"msg": "fourth", "levelno": logging.INFO}))
+        inst.emit(logging.makeLogRecord({"msg": "fifth", "levelno": logging.INFO}))
+
+        assert mock_stream.write.call_args_list == [
+            mocker.call("second\nthird"),
+            mocker.call("\n"),
+            mocker.call("fourth"),
+            mocker.call("\n"),
+            mocker.call("fifth"),
+            mocker.call("\n"),
+        ]
+        assert inst.backlog == ()
+
+    @pytest.mark.usefixtures("enabled_metrics")
+    def test_emit__backlog_metrics(self, init_handler, mocker):
+        """Test counting the messages discarded from a full backlog."""
+        inst = init_handler(backlog_size=1)
+
+        mocker.patch("sys.stdout")
+
+        inst.emit(logging.makeLogRecord({"msg": "first", "levelno": logging.WARNING}))
+        inst.emit(logging.makeLogRecord({"msg": "second", "levelno": logging.WARNING}))
+
+        snapshot = houdini_logging_tools.metrics.METRICS.snapshot()["PythonShellHandler"]
+
+        assert snapshot.records == {"WARNING": 2}
+        assert snapshot.counters == {"dropped": 1}
+
+    def test_emit__backlog_buffered(self, init_handler, mock_hou_ui, mocker):
+        """Test writing the backlog along with buffered messages."""
+        inst = init_handler(buffered=True, backlog_size=5)
+        inst.setFormatter(logging.Formatter("%(message)s"))
+
+        mocker.patch("sys.stdout")
+
+        inst.emit(logging.makeLogRecord({"msg": "first", "levelno": logging.WARNING}))
+
+        mock_stream = mocker.patch("sys.stdout", spec=hou.ShellIO)
+
+        inst.emit(logging.makeLogRecord({"msg": "second", "levelno": logging.ERROR}))
+
+        mock_stream.write.assert_called_once_with("first\nsecond\n")
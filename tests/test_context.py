@@ -0,0 +1,112 @@
+"""Tests for houdini_logging_tools.context module."""
+
+# Standard Library
+import asyncio
+import contextvars
+import threading
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.context
+
+# Tests
+
+
+class TestLogContext:
+    """Test houdini_logging_tools.context.LogContext object."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_node = mocker.MagicMock()
+
+        inst = houdini_logging_tools.context.LogContext(mock_node, status_bar=False, tool="validate")
+
+        assert inst.values == {"node": mock_node, "status_bar": False, "tool": "validate"}
+
+    def test___call__(self):
+        """Test LogContext.__call__() decorating a function."""
+
+        @houdini_logging_tools.context.LogContext(tool="validate")
+        def func(value):
+            return value, dict(houdini_logging_tools.context.get_log_context())
+
+        assert func(1) == (1, {"tool": "validate"})
+        assert houdini_logging_tools.context.get_log_context() == {}
+
+    def test___call____error(self):
+        """Test LogContext.__call__() exiting the scope when the function raises."""
+
+        @houdini_logging_tools.context.LogContext(tool="validate")
+        def func():
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            func()
+
+        assert houdini_logging_tools.context.get_log_context() == {}
+
+    def test___call____coroutine(self):
+        """Test LogContext.__call__() decorating a coroutine function run in concurrent tasks."""
+        scope = houdini_logging_tools.context.LogContext(tool="validate")
+
+        @scope
+        async def func(index):
+            with houdini_logging_tools.context.LogContext(index=index):
+                # Let the other task enter the same scope before checking this one's.
+                await asyncio.sleep(0)
+
+                return dict(houdini_logging_tools.context.get_log_context())
+
+        async def main():
+            return await asyncio.gather(func(1), func(2))
+
+        assert asyncio.run(main()) == [{"tool": "validate", "index": 1}, {"tool": "validate", "index": 2}]
+        assert houdini_logging_tools.context.get_log_context() == {}
+
+    def test___enter__(self):
+        """Test nesting scopes with LogContext.__enter__() and LogContext.__exit__()."""
+        with houdini_logging_tools.context.LogContext(dialog=True, tool="validate", step=1) as outer:
+            with houdini_logging_tools.context.LogContext(step=2, title="Title"):
+                assert houdini_logging_tools.context.get_log_context() == {
+                    "dialog": True,
+                    "step": 2,
+                    "title": "Title",
+                    "tool": "validate",
+                }
+
+            assert houdini_logging_tools.context.get_log_context() == outer.values
+
+        assert houdini_logging_tools.context.get_log_context() == {}
+        assert houdini_logging_tools.context.LOG_CONTEXT.get() is None
+
+    def test___enter____threads(self):
+        """Test that threads do not share the scopes of the thread which started them."""
+        results = {}
+
+        def get_values(name):
+            results[name] = dict(houdini_logging_tools.context.get_log_context())
+
+        with houdini_logging_tools.context.LogContext(tool="validate"):
+            thread = threading.Thread(target=get_values, args=("thread",))
+            thread.start()
+            thread.join()
+
+            context = contextvars.copy_context()
+            thread = threading.Thread(target=context.run, args=(get_values, "copied"))
+            thread.start()
+            thread.join()
+
+        assert results == {"thread": {}, "copied": {"tool": "validate"}}
+
+
+def test_get_log_context():
+    """Test houdini_logging_tools.context.get_log_context()."""
+    with houdini_logging_tools.context.LogContext(tool="validate"):
+        result = houdini_logging_tools.context.get_log_context()
+
+        with pytest.raises(TypeError):
+            result["tool"] = "other"  # type: ignore
+
+    assert result == {"tool": "validate"}
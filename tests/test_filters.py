@@ -0,0 +1,193 @@
+"""Tests for houdini_logging_tools.filters module."""
+
+# Standard Library
+import logging
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.filters
+
+# Fixtures
+
+
+@pytest.fixture
+def test_logger(add_collecting_handler):
+    """Fixture to provide a logger which collects the records it handles."""
+    logger = logging.getLogger("test_filters")
+    logger.propagate = False
+
+    add_collecting_handler(logger)
+
+    yield logger
+
+    logger.filters.clear()
+    logger.propagate = True
+
+
+# Tests
+
+
+class TestCallSiteRateLimitFilter:
+    """Test houdini_logging_tools.filters.CallSiteRateLimitFilter object."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        rate = 5
+        burst = 10
+        handler = logging.NullHandler()
+
+        inst = houdini_logging_tools.filters.CallSiteRateLimitFilter(rate=rate, burst=burst, handler=handler)
+
+        assert inst.rate == rate
+        assert inst.burst == burst
+        assert inst.handler is handler
+        assert inst.suppressed == 0
+
+    @pytest.mark.parametrize("kwargs", [{"rate": -1}, {"burst": 0}])
+    def test___init____invalid(self, kwargs):
+        """Test object initialization with invalid limits."""
+        with pytest.raises(ValueError, match="rate must not be negative"):
+            houdini_logging_tools.filters.CallSiteRateLimitFilter(**kwargs)
+
+    # Methods
+
+    def test_allow(self, mock_monotonic):
+        """Test CallSiteRateLimitFilter.allow() refilling each call site's bucket over time."""
+        inst = houdini_logging_tools.filters.CallSiteRateLimitFilter(rate=2, burst=3, report_interval=1000)
+
+        call_site = ("test", "/path/to/module.py", 10)
+
+        assert [inst.allow(*call_site) for _ in range(4)] == [True, True, True, False]
+
+        # Other call sites have their own buckets.
+        assert inst.allow("test", "/path/to/module.py", 11)
+        assert inst.allow("other", "/path/to/module.py", 10)
+
+        # Half a second refills a single token.
+        mock_monotonic.return_value = 100.5
+        assert [inst.allow(*call_site) for _ in range(2)] == [True, False]
+
+        # The bucket never holds more than the burst.
+        mock_monotonic.return_value = 200
+        assert [inst.allow(*call_site) for _ in range(4)] == [True, True, True, False]
+
+        # One record was suppressed each time the bucket was emptied.
+        suppressed_records = 3
+
+        assert inst.suppressed == suppressed_records
+
+    def test_allow__max_call_sites(self):
+        """Test CallSiteRateLimitFilter.allow() forgetting the least recently used call sites."""
+        inst = houdini_logging_tools.filters.CallSiteRateLimitFilter(rate=0, burst=1, max_call_sites=2)
+
+        for lineno in (1, 2):
+            assert inst.allow("test", "/path/to/module.py", lineno)
+
+        # Using the first call site again keeps it over the second.
+        assert not inst.allow("test", "/path/to/module.py", 1)
+        assert inst.allow("test", "/path/to/module.py", 3)
+
+        assert list(inst._buckets) == [("test", "/path/to/module.py", 1), ("test", "/path/to/module.py", 3)]
+
+        # The second call site starts with a full bucket again.
+        assert inst.allow("test", "/path/to/module.py", 2)
+
+    def test_allow__max_call_sites_report(self, mock_monotonic, test_logger):
+        """Test CallSiteRateLimitFilter.allow() reporting the suppressed records of a forgotten call site."""
+        inst = houdini_logging_tools.filters.CallSiteRateLimitFilter(rate=0, burst=1, max_call_sites=1)
+
+        call_site = ("test_filters", "/path/to/module.py", 10)
+
+        assert inst.allow(*call_site)
+        assert not inst.allow(*call_site, logging.ERROR)
+
+        mock_monotonic.return_value = 102
+        assert inst.allow("test_filters", "/path/to/module.py", 11)
+
+        (record,) = test_logger.handlers[0].records
+
+        assert record.getMessage() == "Suppressed 1 records logged here in the last 2.0 seconds"
+        assert record.levelno == logging.ERROR
+        assert (record.name, record.pathname, record.lineno) == call_site
+
+    def test_allow__report(self, mock_monotonic, test_logger):
+        """Test CallSiteRateLimitFilter.allow() reporting suppressed records once the interval has passed."""
+        inst = houdini_logging_tools.filters.CallSiteRateLimitFilter(rate=1, burst=1, report_interval=10)
+
+        call_site = ("test_filters", "/path/to/module.py", 10)
+
+        assert inst.allow(*call_site, logging.INFO)
+        assert not inst.allow(*call_site, logging.WARNING)
+
+        # Allowed, but too soon to report.
+        mock_monotonic.return_value = 105
+        assert inst.allow(*call_site)
+        assert not inst.allow(*call_site, logging.WARNING)
+
+        assert not test_logger.handlers[0].records
+
+        mock_monotonic.return_value = 112.5
+        assert inst.allow(*call_site)
+
+        (record,) = test_logger.handlers[0].records
+
+        assert record.getMessage() == "Suppressed 2 records logged here in the last 12.5 seconds"
+        assert record.levelno == logging.WARNING
+        assert (record.name, record.pathname, record.lineno) == call_site
+
+        # Nothing left to report.
+        mock_monotonic.return_value = 200
+        assert inst.allow(*call_site)
+        assert len(test_logger.handlers[0].records) == 1
+
+    def test_filter(self, test_logger):
+        """Test using the filter on a logger, including its own reports."""
+        burst = 2
+        record_count = 5
+
+        inst = houdini_logging_tools.filters.CallSiteRateLimitFilter(rate=0, burst=burst, report_interval=0)
+        test_logger.addFilter(inst)
+
+        for index in range(record_count):
+            test_logger.warning("message %d", index)
+
+        messages = [record.getMessage() for record in test_logger.handlers[0].records]
+
+        assert messages == ["message 0", "message 1"]
+        assert inst.suppressed == record_count - burst
+
+        inst.report()
+        inst.report()
+
+        messages = [record.getMessage() for record in test_logger.handlers[0].records]
+
+        assert messages[:2] == ["message 0", "message 1"]
+        (report,) = messages[2:]
+        assert report.startswith("Suppressed 3 records logged here")
+
+    def test_filter__handler(self, test_logger, add_collecting_handler):
+        """Test using the filter on a handler, which emits its own reports."""
+        other_handler = test_logger.handlers[0]
+
+        handler = add_collecting_handler(test_logger)
+
+        inst = houdini_logging_tools.filters.CallSiteRateLimitFilter(
+            rate=0, burst=1, report_interval=0, handler=handler
+        )
+        handler.addFilter(inst)
+
+        for index in range(3):
+            test_logger.warning("message %d", index)
+
+        inst.report()
+
+        messages = [record.getMessage() for record in handler.records]
+
+        assert messages[0] == "message 0"
+        (report,) = messages[1:]
+        assert report.startswith("Suppressed 2 records logged here")
+
+        # The logger's other handler is not rate limited and doesn't get the report.
+        assert [record.getMessage() for record in other_handler.records] == [f"message {index}" for index in range(3)]
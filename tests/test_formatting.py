@@ -0,0 +1,333 @@
+"""Tests for houdini_logging_tools.formatting module."""
+
+# Standard Library
+import gc
+import logging
+import pickle
+import sys
+import weakref
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.formatting
+
+# Fixtures
+
+
+@pytest.fixture
+def test_record():
+    """Fixture to provide a log record."""
+    return logging.LogRecord("test", logging.INFO, "/path/to/module.py", 10, "message %s", ("arg",), None)
+
+
+# Tests
+
+
+class TestLazyMessage:
+    """Test houdini_logging_tools.formatting.LazyMessage."""
+
+    def test___str__(self):
+        """Test LazyMessage.__str__()."""
+        inst = houdini_logging_tools.formatting.LazyMessage("message %s", ("arg",), "/obj")
+
+        assert str(inst) == "/obj - message arg"
+
+    # Properties
+
+    def test_message(self):
+        """Test LazyMessage.message."""
+        inst = houdini_logging_tools.formatting.LazyMessage("message %s", ("arg",), "/obj")
+
+        assert inst.message == "/obj - message arg"
+
+    def test_message__no_prefix(self):
+        """Test LazyMessage.message when there is no prefix."""
+        inst = houdini_logging_tools.formatting.LazyMessage("message %s", ("arg",))
+
+        assert inst.message == "message arg"
+
+    def test_text(self, mocker):
+        """Test LazyMessage.text only interpolating the message once."""
+        mock_arg = mocker.MagicMock()
+        mock_arg.__str__.return_value = "arg"
+
+        inst = houdini_logging_tools.formatting.LazyMessage("message %s", (mock_arg,), "/obj")
+
+        mock_arg.__str__.assert_not_called()
+
+        assert inst.text == "message arg"
+        assert inst.text == "message arg"
+
+        mock_arg.__str__.assert_called_once()
+
+    def test_text__no_args(self):
+        """Test LazyMessage.text when there are no args."""
+        inst = houdini_logging_tools.formatting.LazyMessage("message %s")
+
+        assert inst.text == "message %s"
+
+
+class TestTracebackCache:
+    """Test houdini_logging_tools.formatting.TracebackCache."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        max_size = 10
+
+        inst = houdini_logging_tools.formatting.TracebackCache(max_size)
+
+        assert inst.max_size == max_size
+
+    def test___init____invalid_size(self):
+        """Test object initialization with an invalid size."""
+        with pytest.raises(ValueError, match="must be at least 1"):
+            houdini_logging_tools.formatting.TracebackCache(0)
+
+    # Non-Public Methods
+
+    def test__deduplicate__added_while_formatting(self, mocker):
+        """Test TracebackCache._deduplicate() when another thread adds the traceback while it is formatted."""
+        inst = houdini_logging_tools.formatting.TracebackCache()
+        formatter = logging.Formatter()
+
+        record_count = 2
+
+        first, second = (_raise_value_error(value) for value in range(record_count))
+
+        def _format(exc_info):
+            # Simulate the other thread formatting the same traceback first.
+            inst._deduplicate(second[1], second, logging.Formatter())
+
+            return "formatted"
+
+        mocker.patch.object(formatter, "formatException", side_effect=_format)
+
+        assert inst._deduplicate(first[1], first, formatter) == "formatted\n(traceback #1)"
+        assert inst._entries[houdini_logging_tools.formatting._fingerprint(first[1])].count == record_count
+
+    # Methods
+
+    def test_exception_text(self, mocker):
+        """Test TracebackCache.exception_text() formatting each traceback once."""
+        formatter = logging.Formatter()
+        mock_format = mocker.patch.object(formatter, "formatException", return_value="formatted")
+
+        inst = houdini_logging_tools.formatting.TracebackCache()
+
+        records = [_create_exc_record(_raise_value_error(value)) for value in range(3)]
+
+        assert inst.exception_text(records[0], formatter) == "formatted\n(traceback #1)"
+        assert inst.exception_text(records[1], formatter) == "ValueError: 1 (traceback #1, seen 2 times)"
+
+        # The text is stored for the record so it is only counted once.
+        assert inst.exception_text(records[1], formatter) == "ValueError: 1 (traceback #1, seen 2 times)"
+        assert inst.exception_text(records[2], formatter) == "ValueError: 2 (traceback #1, seen 3 times)"
+
+        mock_format.assert_called_once_with(records[0].exc_info)
+
+        # Each cache stores its own text for the record.
+        other_cache = houdini_logging_tools.formatting.TracebackCache()
+
+        assert other_cache.exception_text(records[1], formatter) == "formatted\n(traceback #1)"
+
+        # A different traceback is formatted in full.
+        other = _create_exc_record(_raise_value_error(0, chained=True))
+
+        assert inst.exception_text(other, formatter) == "formatted\n(traceback #2)"
+
+        assert inst.lookup(1) == "formatted"
+        assert inst.lookup(3) is None
+
+        inst.clear()
+
+        assert inst.lookup(1) is None
+
+    def test_exception_text__eviction(self):
+        """Test TracebackCache.exception_text() discarding the least recently seen traceback."""
+        formatter = logging.Formatter()
+
+        inst = houdini_logging_tools.formatting.TracebackCache(1)
+
+        inst.exception_text(_create_exc_record(_raise_value_error(0)), formatter)
+        inst.exception_text(_create_exc_record(_raise_value_error(0, chained=True)), formatter)
+
+        # The first traceback was discarded so is formatted in full again.
+        result = inst.exception_text(_create_exc_record(_raise_value_error(0)), formatter)
+
+        assert result.startswith("Traceback (most recent call last):")
+        assert result.endswith("(traceback #3)")
+
+    def test_exception_text__pickle(self):
+        """Test that a record can be pickled after its exception text has been deduplicated."""
+        handler = logging.Handler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        inst = houdini_logging_tools.formatting.TracebackCache()
+
+        record = _create_exc_record(_raise_value_error(0))
+        text = houdini_logging_tools.formatting.format_record(handler, record, inst)
+
+        # Prepare the record as QueueHandler.prepare() does, as tracebacks can't be pickled.
+        record.exc_info = None
+        record.exc_text = text
+
+        result = pickle.loads(pickle.dumps(record))
+
+        assert result.exc_text == text
+        assert result.exc_text.endswith("(traceback #1)")
+
+    def test_exception_text__no_exception(self):
+        """Test TracebackCache.exception_text() for exception info without an exception."""
+        inst = houdini_logging_tools.formatting.TracebackCache()
+
+        record = _create_exc_record((None, None, None))
+
+        assert inst.exception_text(record, logging.Formatter()) == "NoneType: None"
+        assert inst.exception_text(record, logging.Formatter()) == "NoneType: None"
+
+
+def test__fingerprint():
+    """Test houdini_logging_tools.formatting._fingerprint()."""
+    first = _raise_value_error(0)[1]
+    second = _raise_value_error(1)[1]
+    chained = _raise_value_error(0, chained=True)[1]
+
+    assert houdini_logging_tools.formatting._fingerprint(first) == houdini_logging_tools.formatting._fingerprint(second)
+    assert houdini_logging_tools.formatting._fingerprint(first) != houdini_logging_tools.formatting._fingerprint(
+        chained
+    )
+
+    single = len(houdini_logging_tools.formatting._fingerprint(first))
+
+    # Suppressed and circular contexts are not followed.
+    chained.__suppress_context__ = True
+    second.__context__ = first
+    first.__context__ = second
+
+    assert houdini_logging_tools.formatting._fingerprint(chained)[0] is ValueError
+    assert len(houdini_logging_tools.formatting._fingerprint(first)) == single * 2
+
+
+def test_format_record(test_record, mocker):
+    """Test houdini_logging_tools.formatting.format_record() only formatting once per formatter."""
+    formatter = logging.Formatter("%(levelname)s: %(message)s")
+    mock_format = mocker.patch.object(formatter, "format", wraps=formatter.format)
+
+    first = logging.Handler()
+    first.setFormatter(formatter)
+
+    second = logging.Handler()
+    second.setFormatter(formatter)
+
+    assert houdini_logging_tools.formatting.format_record(first, test_record) == "INFO: message arg"
+    assert houdini_logging_tools.formatting.format_record(second, test_record) == "INFO: message arg"
+
+    mock_format.assert_called_once_with(test_record)
+
+    # A different formatter formats the record again.
+    third = logging.Handler()
+    third.setFormatter(logging.Formatter("%(name)s - %(message)s"))
+
+    assert houdini_logging_tools.formatting.format_record(third, test_record) == "test - message arg"
+
+
+def test_format_record__default_formatter(test_record):
+    """Test houdini_logging_tools.formatting.format_record() for a handler without a formatter."""
+    handler = logging.Handler()
+
+    assert houdini_logging_tools.formatting.format_record(handler, test_record) == handler.format(test_record)
+
+
+def test_format_record__modified(test_record):
+    """Test houdini_logging_tools.formatting.format_record() when the record was modified after formatting."""
+    handler = logging.Handler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    assert houdini_logging_tools.formatting.format_record(handler, test_record) == "message arg"
+
+    test_record.args = ("other",)
+
+    assert houdini_logging_tools.formatting.format_record(handler, test_record) == "message other"
+
+
+def test_format_record__side_cache():
+    """Test houdini_logging_tools.formatting.format_record() not storing its output on the record."""
+    handler = logging.Handler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    record = logging.LogRecord("test", logging.INFO, "/path/to/module.py", 10, "message %s", ("arg",), None)
+    attributes = set(vars(record))
+
+    houdini_logging_tools.formatting.format_record(handler, record)
+
+    # Formatting only adds the attribute logging.Formatter does and the record can be pickled.
+    assert set(vars(record)) - attributes == {"message"}
+    assert pickle.loads(pickle.dumps(record)).getMessage() == "message arg"
+
+    # The stored output is discarded along with the record.
+    assert record in houdini_logging_tools.formatting._FORMATTED
+    stored = len(houdini_logging_tools.formatting._FORMATTED)
+
+    record_ref = weakref.ref(record)
+
+    del record
+    gc.collect()
+
+    assert record_ref() is None
+    assert len(houdini_logging_tools.formatting._FORMATTED) < stored
+
+
+def test_format_record__tracebacks():
+    """Test houdini_logging_tools.formatting.format_record() deduplicating the record's traceback."""
+    cache = houdini_logging_tools.formatting.TracebackCache()
+
+    handler = logging.Handler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    first = _create_exc_record(_raise_value_error(0))
+    second = _create_exc_record(_raise_value_error(1))
+
+    houdini_logging_tools.formatting.format_record(handler, first, cache)
+
+    result = houdini_logging_tools.formatting.format_record(handler, second, cache)
+
+    assert result == "message\nValueError: 1 (traceback #1, seen 2 times)"
+    assert houdini_logging_tools.formatting.format_record(handler, second, cache) == result
+
+    # The record's own exception text is left for other handlers.
+    assert second.exc_text is None
+
+    result = houdini_logging_tools.formatting.format_record(handler, second)
+
+    assert result.startswith("message\nTraceback (most recent call last):")
+
+
+# Helpers
+
+
+def _create_exc_record(exc_info):
+    """Create a log record with exception info for testing."""
+    return logging.LogRecord("test", logging.ERROR, "/path/to/module.py", 10, "message", (), exc_info)
+
+
+def _fail(value, *, chained):
+    """Raise a ValueError, optionally chained from a KeyError."""
+    if not chained:
+        raise ValueError(value)
+
+    try:
+        {}[value]
+
+    except KeyError as exc:
+        raise ValueError(value) from exc
+
+
+def _raise_value_error(value, *, chained=False):
+    """Raise and catch a ValueError from the same frames each call, returning the exception info."""
+    try:
+        _fail(value, chained=chained)
+
+    except ValueError:
+        return sys.exc_info()
@@ -0,0 +1,274 @@
+"""Tests for houdini_logging_tools.forwarding module."""
+
+# Standard Library
+import logging
+import socket
+import struct
+import time
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.forwarding
+
+# Tests
+
+
+class TestLogCollector:
+    """Test houdini_logging_tools.forwarding.LogCollector."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        handler = mocker.MagicMock(spec=logging.Handler)
+
+        inst = houdini_logging_tools.forwarding.LogCollector(handler, host="localhost", port=1234)
+
+        assert inst.address == ("localhost", 1234)
+        assert inst.address_string == "localhost:1234"
+        assert inst.handler is handler
+        assert inst.connection_count == 0
+        assert inst.records_received == 0
+        assert not inst.is_running
+
+    def test___enter__(self, mocker):
+        """Test using the collector as a context manager."""
+        handler = mocker.MagicMock(spec=logging.Handler)
+
+        with houdini_logging_tools.forwarding.LogCollector(handler) as inst:
+            assert inst.is_running
+            assert inst.address[1] != 0
+
+        assert not inst.is_running
+        handler.flush.assert_called()
+
+    # Non-Public Methods
+
+    def test__accept__no_connection(self, collector, mocker):
+        """Test LogCollector._accept() when there is no connection waiting."""
+        mocker.patch.object(collector, "_server", **{"accept.side_effect": BlockingIOError})
+
+        collector._accept()
+
+        assert collector.connection_count == 0
+
+    def test__handle_records(self, collector):
+        """Test LogCollector._handle_records() skipping records below the handler's level."""
+        collector.handler.level = logging.WARNING
+
+        records = [_create_record(logging.INFO), _create_record(logging.ERROR)]
+
+        collector._handle_records(records)
+
+        collector.handler.handle.assert_called_once_with(records[1])
+        assert collector.records_received == len(records)
+
+    def test__read__not_ready(self, mocker, collector):
+        """Test LogCollector._read() when there is no data to read yet."""
+        connection = mocker.MagicMock(spec=socket.socket)
+        connection.recv.side_effect = BlockingIOError
+
+        collector._read(connection)
+
+        connection.close.assert_not_called()
+
+    def test__read__error(self, mocker, collector):
+        """Test LogCollector._read() closing a connection which fails."""
+        connection = mocker.MagicMock(spec=socket.socket)
+        connection.recv.side_effect = ConnectionResetError
+
+        collector._connections[connection] = bytearray()
+        mock_unregister = mocker.patch.object(collector._selector, "unregister")
+
+        collector._read(connection)
+
+        connection.close.assert_called()
+        mock_unregister.assert_called_with(connection)
+        assert connection not in collector._connections
+
+    # Methods
+
+    def test_receive(self, collector, wait_for):
+        """Test receiving frames split across multiple reads."""
+        header = houdini_logging_tools.forwarding.encode_header("worker", "item_1")
+        frame = houdini_logging_tools.forwarding.encode_frame(
+            header,
+            [houdini_logging_tools.forwarding.encode_record(_create_record(logging.INFO, "message %s", ("a",)))],
+        )
+
+        with socket.create_connection(collector.address) as connection:
+            # Send the first frame in pieces along with the start of the second.
+            connection.sendall(frame[:3])
+            time.sleep(0.05)
+            connection.sendall(frame[3:] + frame[:10])
+            time.sleep(0.05)
+            connection.sendall(frame[10:])
+
+            # The first frame and a second copy of it.
+            frame_count = 2
+
+            wait_for(lambda: collector.records_received == frame_count)
+
+            assert collector.connection_count == 1
+
+        wait_for(lambda: collector.connection_count == 0)
+
+        record = collector.handler.handle.call_args.args[0]
+
+        assert record.getMessage() == "worker [item_1] - message a"
+        assert record.worker == "worker"
+        assert record.work_item == "item_1"
+
+    def test_receive__oversized(self, mocker):
+        """Test that connections sending frames larger than the maximum are closed."""
+        handler = mocker.MagicMock(spec=logging.Handler)
+
+        max_frame_size = 10
+
+        with (
+            houdini_logging_tools.forwarding.LogCollector(handler, max_frame_size=max_frame_size) as inst,
+            socket.create_connection(inst.address) as connection,
+        ):
+            connection.sendall(struct.pack("!I", max_frame_size + 1) + b"\0" * (max_frame_size + 1))
+
+            # The collector closes the connection.
+            assert connection.recv(1) == b""
+
+        handler.handle.assert_not_called()
+
+    def test_receive__invalid(self, collector):
+        """Test that connections sending frames which cannot be decoded are closed."""
+        with socket.create_connection(collector.address) as connection:
+            connection.sendall(houdini_logging_tools.forwarding.encode_frame(b"\0\0\0\xff", []))
+
+            # The collector closes the connection.
+            assert connection.recv(1) == b""
+
+        collector.handler.handle.assert_not_called()
+
+    def test_start__running(self, collector, mocker):
+        """Test LogCollector.start() when already running."""
+        mock_create = mocker.patch("socket.create_server")
+
+        collector.start()
+
+        mock_create.assert_not_called()
+
+    def test_stop(self, collector, wait_for):
+        """Test LogCollector.stop() closing open connections."""
+        with socket.create_connection(collector.address) as connection:
+            wait_for(lambda: collector.connection_count == 1)
+
+            collector.stop()
+
+            assert collector.connection_count == 0
+            assert not collector.is_running
+            assert connection.recv(1) == b""
+
+        # Stopping again does nothing.
+        collector.stop()
+
+
+def test__split_pathname():
+    """Test houdini_logging_tools.forwarding._split_pathname() caching the names of each path."""
+    houdini_logging_tools.forwarding._split_pathname.cache_clear()
+
+    for _ in range(2):
+        assert houdini_logging_tools.forwarding._split_pathname("/path/to/module.py") == ("module.py", "module")
+
+    assert houdini_logging_tools.forwarding._split_pathname.cache_info().hits == 1
+
+    # Payloads are not cached, as each frame is different.
+    assert not hasattr(houdini_logging_tools.forwarding._read_string, "cache_info")
+
+
+@pytest.mark.parametrize("prefix_messages", [True, False])
+def test_decode_payload(prefix_messages, exc_info):
+    """Test houdini_logging_tools.forwarding.decode_payload()."""
+    records = [
+        _create_record(logging.WARNING, "message %s", ("é",)),
+        _create_record(logging.ERROR, "failed", exc_info=exc_info),
+    ]
+    records[1].stack_info = "Stack (most recent call last):"
+
+    payload = houdini_logging_tools.forwarding.encode_frame(
+        houdini_logging_tools.forwarding.encode_header("worker", ""),
+        [houdini_logging_tools.forwarding.encode_record(record) for record in records],
+    )[houdini_logging_tools.forwarding.FRAME_HEADER.size :]
+
+    result = houdini_logging_tools.forwarding.decode_payload(payload, prefix_messages=prefix_messages)
+
+    assert len(result) == len(records)
+
+    prefix = "worker - " if prefix_messages else ""
+
+    for original, decoded in zip(records, result, strict=True):
+        assert decoded.name == original.name
+        assert decoded.levelno == original.levelno
+        assert decoded.levelname == original.levelname
+        assert decoded.pathname == original.pathname
+        assert decoded.filename == "module.py"
+        assert decoded.module == "module"
+        assert decoded.lineno == original.lineno
+        assert decoded.funcName == original.funcName
+        assert decoded.created == original.created
+        assert decoded.msecs == pytest.approx(original.msecs, abs=1)
+        assert decoded.threadName == original.threadName
+        assert decoded.process == original.process
+        assert decoded.getMessage() == f"{prefix}{original.getMessage()}"
+        assert not decoded.args
+        assert decoded.worker == "worker"
+        assert not decoded.work_item
+
+    assert result[0].exc_text is None
+    assert result[0].stack_info is None
+    assert "RuntimeError: error" in result[1].exc_text
+    assert result[1].stack_info == "Stack (most recent call last):"
+
+
+def test_decode_payload__truncated():
+    """Test houdini_logging_tools.forwarding.decode_payload() with a truncated string."""
+    payload = struct.pack("!I", 10) + b"worker"
+
+    with pytest.raises(struct.error, match="past the end"):
+        houdini_logging_tools.forwarding.decode_payload(payload)
+
+
+def test_encode_record__formatted_exception():
+    """Test houdini_logging_tools.forwarding.encode_record() reusing already formatted exception text."""
+    record = _create_record(logging.ERROR, "failed")
+    record.exc_info = (RuntimeError, RuntimeError("error"), None)
+    record.exc_text = "formatted"
+
+    header = houdini_logging_tools.forwarding.encode_header("worker", "")
+    payload = header + houdini_logging_tools.forwarding.encode_record(record, logging.Formatter())
+
+    assert houdini_logging_tools.forwarding.decode_payload(payload)[0].exc_text == "formatted"
+
+
+@pytest.mark.parametrize(
+    ("address", "expected"),
+    [
+        ("localhost:1234", ("localhost", 1234)),
+        ("::1:1234", ("::1", 1234)),
+        (("localhost", 1234), ("localhost", 1234)),
+    ],
+)
+def test_parse_address(address, expected):
+    """Test houdini_logging_tools.forwarding.parse_address()."""
+    assert houdini_logging_tools.forwarding.parse_address(address) == expected
+
+
+@pytest.mark.parametrize("address", ["localhost", ":1234", "localhost:port"])
+def test_parse_address__invalid(address):
+    """Test houdini_logging_tools.forwarding.parse_address() with invalid addresses."""
+    with pytest.raises(ValueError, match="Invalid collector address"):
+        houdini_logging_tools.forwarding.parse_address(address)
+
+
+# Helpers
+
+
+def _create_record(level, msg="message", args=(), exc_info=None):
+    """Create a log record for testing."""
+    return logging.LogRecord("test", level, "/path/to/module.py", 10, msg, args, exc_info, func="func")
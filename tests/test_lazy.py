@@ -0,0 +1,98 @@
+"""Tests for houdini_logging_tools.lazy module."""
+
+# Standard Library
+import sys
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.lazy
+
+# Houdini
+import hou
+
+# Fixtures
+
+
+@pytest.fixture
+def clear_is_hou_available():
+    """Fixture to clear the cached result of is_hou_available()."""
+    houdini_logging_tools.lazy.is_hou_available.cache_clear()
+
+    yield
+
+    houdini_logging_tools.lazy.is_hou_available.cache_clear()
+
+
+# Tests
+
+
+class TestLazyModule:
+    """Test houdini_logging_tools.lazy.LazyModule."""
+
+    def test___getattr__(self):
+        """Test LazyModule.__getattr__() importing the module on first use."""
+        inst = houdini_logging_tools.lazy.LazyModule("hou")
+
+        assert inst._module is None
+
+        assert inst.severityType is hou.severityType
+        assert inst._module is hou
+
+    def test___getattr____patched(self, mocker):
+        """Test that attributes replaced on the module are seen."""
+        inst = houdini_logging_tools.lazy.LazyModule("hou")
+
+        mock_available = mocker.patch("hou.isUIAvailable")
+
+        assert inst.isUIAvailable is mock_available
+
+    def test___getattr____import_error(self, mocker):
+        """Test LazyModule.__getattr__() when the module cannot be imported."""
+        mocker.patch.dict(sys.modules, {"missing_module": None})
+        mock_import = mocker.patch("importlib.import_module", side_effect=ImportError)
+
+        inst = houdini_logging_tools.lazy.LazyModule("missing_module")
+
+        with pytest.raises(ImportError, match="missing_module could not be imported"):
+            _ = inst.attribute
+
+        # The failure is remembered rather than importing again.
+        with pytest.raises(ImportError, match="missing_module could not be imported"):
+            _ = inst.attribute
+
+        mock_import.assert_called_once()
+
+    def test___getattr____special(self):
+        """Test that special attributes do not import the module."""
+        inst = houdini_logging_tools.lazy.LazyModule("hou")
+
+        assert not hasattr(inst, "__wrapped__")
+        assert inst._module is None
+
+    def test___repr__(self):
+        """Test LazyModule.__repr__()."""
+        inst = houdini_logging_tools.lazy.LazyModule("hou")
+
+        assert repr(inst) == "<LazyModule 'hou' (not imported)>"
+
+        inst._import()
+
+        assert repr(inst) == "<LazyModule 'hou' (imported)>"
+
+
+@pytest.mark.usefixtures("clear_is_hou_available")
+def test_is_hou_available():
+    """Test houdini_logging_tools.lazy.is_hou_available()."""
+    assert houdini_logging_tools.lazy.is_hou_available()
+
+
+@pytest.mark.usefixtures("clear_is_hou_available")
+def test_is_hou_available__missing(monkeypatch):
+    """Test houdini_logging_tools.lazy.is_hou_available() when hou cannot be imported."""
+    # Use monkeypatch as mock probes the replacement's attributes, which would import it.
+    monkeypatch.setitem(sys.modules, "missing_module", None)
+    monkeypatch.setattr(houdini_logging_tools.lazy, "hou", houdini_logging_tools.lazy.LazyModule("missing_module"))
+
+    assert not houdini_logging_tools.lazy.is_hou_available()
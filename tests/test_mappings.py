@@ -0,0 +1,184 @@
+"""Tests for houdini_logging_tools.mappings module."""
+
+# Standard Library
+import logging
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.mappings
+
+# Houdini
+import hou
+
+# Fixtures
+
+
+@pytest.fixture
+def registry():
+    """Fixture to create a registry with the default levels."""
+    return houdini_logging_tools.mappings.SeverityRegistry()
+
+
+# Tests
+
+
+class TestSeverityRegistry:
+    """Test houdini_logging_tools.mappings.SeverityRegistry."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        levels = {logging.INFO: hou.severityType.Message}
+
+        inst = houdini_logging_tools.mappings.SeverityRegistry(levels)
+
+        assert inst.levels == levels
+        assert inst.levels is not levels
+
+    def test___init__default_levels(self):
+        """Test that the default levels are looked up on first use."""
+        inst = houdini_logging_tools.mappings.SeverityRegistry()
+
+        assert inst._levels is None
+
+        assert inst.levels == {
+            logging.DEBUG: hou.severityType.Message,
+            logging.INFO: hou.severityType.ImportantMessage,
+            logging.WARNING: hou.severityType.Warning,
+            logging.ERROR: hou.severityType.Error,
+            logging.CRITICAL: hou.severityType.Error,
+        }
+
+    def test___init__no_levels(self):
+        """Test that at least one level is required."""
+        with pytest.raises(ValueError, match="At least one level"):
+            houdini_logging_tools.mappings.SeverityRegistry({})
+
+    # Methods
+
+    def test_register(self, registry):
+        """Test SeverityRegistry.register()."""
+        assert registry.severity(35) == hou.severityType.Warning
+
+        registry.register(35, hou.severityType.Error)
+
+        assert registry.severity(35) == hou.severityType.Error
+        assert registry.severity(36) == hou.severityType.Error
+        assert registry.severity(logging.WARNING) == hou.severityType.Warning
+
+    def test_register__default_levels(self, registry):
+        """Test SeverityRegistry.register() before the default levels have been looked up."""
+        registry.register(5, hou.severityType.Fatal)
+
+        assert registry.severity(5) == hou.severityType.Fatal
+        assert registry.severity(logging.INFO) == hou.severityType.ImportantMessage
+
+    @pytest.mark.parametrize(
+        ("level", "expected"),
+        [
+            (logging.DEBUG, hou.severityType.Message),
+            (logging.INFO, hou.severityType.ImportantMessage),
+            (logging.WARNING, hou.severityType.Warning),
+            (logging.ERROR, hou.severityType.Error),
+            (logging.CRITICAL, hou.severityType.Error),
+            (5, hou.severityType.Message),
+            (25, hou.severityType.ImportantMessage),
+            (45, hou.severityType.Error),
+            (100, hou.severityType.Error),
+        ],
+    )
+    def test_severity(self, registry, level, expected):
+        """Test SeverityRegistry.severity()."""
+        assert registry.severity(level) == expected
+
+        # The second lookup comes from the stored result.
+        assert registry.severity(level) == expected
+
+    def test_severity__replaces_table(self, registry):
+        """Test SeverityRegistry.severity() storing a looked up level in a new table."""
+        level = logging.INFO + 5
+
+        registry.severity(logging.INFO)
+        table = registry._table
+
+        assert registry.severity(level) == hou.severityType.ImportantMessage
+
+        assert registry._table is not table
+        assert level not in table
+        assert registry._table[level] == hou.severityType.ImportantMessage
+
+    def test_severity__no_hou(self, registry, mocker):
+        """Test SeverityRegistry.severity() when hou is not available."""
+        mocker.patch.object(houdini_logging_tools.mappings, "is_hou_available", return_value=False)
+
+        assert registry.severity(logging.WARNING) is None
+        assert registry._levels is None
+
+    def test_severity__no_hou_levels(self, mocker):
+        """Test SeverityRegistry.severity() with passed levels when hou is not available."""
+        mocker.patch.object(houdini_logging_tools.mappings, "is_hou_available", return_value=False)
+
+        inst = houdini_logging_tools.mappings.SeverityRegistry({logging.INFO: "info"})
+
+        assert inst.severity(logging.WARNING) == "info"
+
+
+def test___getattr__():
+    """Test houdini_logging_tools.mappings.__getattr__()."""
+    result = houdini_logging_tools.mappings.LOGGING_TO_SEVERITY_MAP
+
+    assert result == {
+        "critical": hou.severityType.Error,
+        "debug": hou.severityType.Message,
+        "error": hou.severityType.Error,
+        "exception": hou.severityType.Error,
+        "info": hou.severityType.ImportantMessage,
+        "warning": hou.severityType.Warning,
+    }
+
+    ranks = houdini_logging_tools.mappings.SEVERITY_RANKS
+
+    assert ranks[hou.severityType.Fatal] == max(ranks.values())
+
+
+def test___getattr____missing():
+    """Test houdini_logging_tools.mappings.__getattr__() with an unknown attribute."""
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        _ = houdini_logging_tools.mappings.missing
+
+
+def test_get_severity():
+    """Test houdini_logging_tools.mappings.get_severity()."""
+    assert houdini_logging_tools.mappings.get_severity(logging.WARNING) == hou.severityType.Warning
+
+
+def test_register_level(mocker):
+    """Test houdini_logging_tools.mappings.register_level()."""
+    mock_registry = mocker.patch.object(houdini_logging_tools.mappings, "SEVERITY_REGISTRY")
+    mock_add = mocker.patch("logging.addLevelName")
+
+    houdini_logging_tools.mappings.register_level(5, hou.severityType.Message)
+
+    mock_registry.register.assert_called_with(5, hou.severityType.Message)
+    mock_add.assert_not_called()
+
+    houdini_logging_tools.mappings.register_level(5, hou.severityType.Message, "TRACE")
+
+    mock_add.assert_called_with(5, "TRACE")
+
+
+@pytest.mark.parametrize(
+    ("severity", "expected"),
+    [
+        (hou.severityType.Message, 0),
+        (hou.severityType.ImportantMessage, 1),
+        (hou.severityType.Warning, 2),
+        (hou.severityType.Error, 3),
+        (hou.severityType.Fatal, 4),
+        (None, 0),
+    ],
+)
+def test_severity_rank(severity, expected):
+    """Test houdini_logging_tools.mappings.severity_rank()."""
+    assert houdini_logging_tools.mappings.severity_rank(severity) == expected
@@ -0,0 +1,179 @@
+"""Tests for houdini_logging_tools.metrics module."""
+
+# Standard Library
+import logging
+import threading
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.metrics
+
+# Tests
+
+
+class TestComponentMetrics:
+    """Test houdini_logging_tools.metrics.ComponentMetrics object."""
+
+    def test_snapshot(self):
+        """Test recording metrics and ComponentMetrics.snapshot()."""
+        inst = houdini_logging_tools.metrics.ComponentMetrics("test")
+
+        inst.count_record(logging.WARNING)
+        inst.count_record(logging.INFO)
+        inst.count_record(logging.WARNING)
+        inst.count("dropped")
+        inst.count("dropped", 2)
+        inst.add_time("emit", 0.5)
+        inst.add_time("emit", 1.5)
+        inst.add_time("emit", 1.0)
+
+        result = inst.snapshot()
+
+        assert result == houdini_logging_tools.metrics.MetricsSnapshot(
+            "test",
+            {"INFO": 1, "WARNING": 2},
+            {"dropped": 3},
+            {"emit": houdini_logging_tools.metrics.TimerSnapshot(3, 3.0, 1.5)},
+        )
+
+        assert str(result) == "test: INFO=1 WARNING=2 dropped=3 emit=3 calls 3000.000ms total 1500.000ms max"
+
+        # The snapshot is a copy.
+        inst.reset()
+
+        assert result.records == {"INFO": 1, "WARNING": 2}
+        assert inst.snapshot() == houdini_logging_tools.metrics.MetricsSnapshot("test", {}, {}, {})
+
+
+class TestMetricsRegistry:
+    """Test houdini_logging_tools.metrics.MetricsRegistry object."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        inst = houdini_logging_tools.metrics.MetricsRegistry()
+
+        assert not inst.enabled
+        assert inst.snapshot() == {}
+
+    # Methods
+
+    def test_component(self):
+        """Test MetricsRegistry.component() creating each component once."""
+        inst = houdini_logging_tools.metrics.MetricsRegistry()
+
+        result = inst.component("test")
+
+        assert result.name == "test"
+        assert inst.component("test") is result
+
+    def test_enable(self):
+        """Test MetricsRegistry.enable() and MetricsRegistry.disable()."""
+        inst = houdini_logging_tools.metrics.MetricsRegistry()
+
+        inst.enable()
+        assert inst.enabled
+
+        inst.disable()
+        assert not inst.enabled
+
+    def test_report(self, mocker):
+        """Test MetricsRegistry.report() and MetricsRegistry.reset()."""
+        mock_logger = mocker.MagicMock(spec=logging.Logger)
+
+        inst = houdini_logging_tools.metrics.MetricsRegistry()
+        inst.component("second").count("errors")
+        inst.component("first").count_record(logging.INFO)
+
+        inst.report(mock_logger, logging.DEBUG)
+
+        snapshots = inst.snapshot()
+
+        assert mock_logger.log.call_args_list == [
+            mocker.call(logging.DEBUG, "%s", snapshots["first"]),
+            mocker.call(logging.DEBUG, "%s", snapshots["second"]),
+        ]
+
+        inst.reset()
+
+        assert inst.snapshot() == {}
+
+    def test_start_reporting(self, mocker):
+        """Test MetricsRegistry.start_reporting() and MetricsRegistry.stop_reporting()."""
+        reported = threading.Event()
+
+        inst = houdini_logging_tools.metrics.MetricsRegistry()
+        mock_report = mocker.patch.object(inst, "report", side_effect=lambda *args: reported.set())
+        mock_logger = mocker.MagicMock(spec=logging.Logger)
+
+        inst.start_reporting(mocker.MagicMock(), interval=60)
+        first = inst._reporter
+
+        # Starting again replaces the existing reporter.
+        inst.start_reporting(mock_logger, interval=0.001, level=logging.DEBUG)
+
+        assert not first._thread.is_alive()
+        assert reported.wait(5)
+
+        inst.stop_reporting()
+
+        mock_report.assert_called_with(mock_logger, logging.DEBUG)
+        assert inst._reporter is None
+
+        # Stopping when not reporting does nothing.
+        inst.stop_reporting()
+
+
+def test_count(enabled_metrics):
+    """Test houdini_logging_tools.metrics.count()."""
+    houdini_logging_tools.metrics.count("test", "errors")
+
+    enabled_metrics.disable()
+
+    houdini_logging_tools.metrics.count("test", "errors")
+
+    assert enabled_metrics.snapshot()["test"].counters == {"errors": 1}
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+def test_instrument(enabled_metrics, enabled):
+    """Test houdini_logging_tools.metrics.instrument()."""
+
+    class Component:
+        @houdini_logging_tools.metrics.instrument("emit", records=True)
+        def emit(self, record):
+            if record.msg == "error":
+                raise ValueError(record.msg)
+
+            return record.msg
+
+        @houdini_logging_tools.metrics.instrument("flush")
+        def flush(self):
+            pass
+
+    if not enabled:
+        enabled_metrics.disable()
+
+    # The timed version is only bound while metrics are enabled.
+    assert hasattr(Component.flush, "__wrapped__") is enabled
+
+    inst = Component()
+
+    assert inst.emit(logging.makeLogRecord({"msg": "message", "levelno": logging.INFO})) == "message"
+
+    with pytest.raises(ValueError, match="error"):
+        inst.emit(logging.makeLogRecord({"msg": "error", "levelno": logging.ERROR}))
+
+    inst.flush()
+
+    if not enabled:
+        assert enabled_metrics.snapshot() == {}
+
+        return
+
+    snapshot = enabled_metrics.snapshot()["Component"]
+
+    assert snapshot.records == {"INFO": 1, "ERROR": 1}
+    assert snapshot.timers["emit"].count == sum(snapshot.records.values())
+    assert snapshot.timers["flush"].count == 1
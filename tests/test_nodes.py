@@ -0,0 +1,188 @@
+"""Tests for houdini_logging_tools.nodes module."""
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.nodes
+
+# Houdini
+import hou
+
+# Fixtures
+
+
+@pytest.fixture
+def create_node(mocker):
+    """Fixture to create mock nodes with a parent hierarchy."""
+    session_ids = iter(range(1, 100))
+
+    def _create(path, parent=None):
+        node = mocker.MagicMock(spec=hou.Node)
+        node.path.return_value = path
+        node.parent.return_value = parent
+        node.sessionId.return_value = next(session_ids)
+
+        return node
+
+    return _create
+
+
+@pytest.fixture
+def node_hierarchy(create_node):
+    """Fixture to create a root, container, child and sibling node."""
+    root = create_node("/")
+    container = create_node("/obj/geo1", create_node("/obj", root))
+    child = create_node("/obj/geo1/box1", container)
+    sibling = create_node("/obj/geo1/sphere1", container)
+
+    return root, container, child, sibling
+
+
+# Tests
+
+
+class TestNodePathCache:
+    """Test houdini_logging_tools.nodes.NodePathCache."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        max_size = 5
+
+        inst = houdini_logging_tools.nodes.NodePathCache(max_size=max_size)
+
+        assert inst.max_size == max_size
+        assert len(inst) == 0
+
+    def test___init____invalid_max_size(self):
+        """Test object initialization with an invalid size."""
+        with pytest.raises(ValueError, match="max_size must be at least 1"):
+            houdini_logging_tools.nodes.NodePathCache(max_size=0)
+
+    # Non-Public Methods
+
+    def test__on_node_event(self, mocker):
+        """Test NodePathCache._on_node_event()."""
+        inst = houdini_logging_tools.nodes.NodePathCache()
+
+        mock_invalidate = mocker.patch.object(inst, "invalidate")
+        mock_node = mocker.MagicMock(spec=hou.Node)
+
+        inst._on_node_event(event_type=hou.nodeEventType.NameChanged, node=mock_node)
+
+        mock_invalidate.assert_called_once_with(mock_node)
+
+    def test__remove_entry__deleted(self, node_hierarchy):
+        """Test NodePathCache._remove_entry() when a watched node was already deleted."""
+        _, _, child, _ = node_hierarchy
+
+        child.removeEventCallback.side_effect = hou.ObjectWasDeleted
+
+        inst = houdini_logging_tools.nodes.NodePathCache()
+        inst.path(child)
+
+        inst._remove_entry(child.sessionId())
+
+        assert len(inst) == 0
+        assert inst._watched == {}
+
+    # Methods
+
+    def test_clear(self, node_hierarchy):
+        """Test NodePathCache.clear()."""
+        _, container, child, sibling = node_hierarchy
+
+        inst = houdini_logging_tools.nodes.NodePathCache()
+        inst.path(child)
+        inst.path(sibling)
+
+        inst.clear()
+
+        assert len(inst) == 0
+        assert inst._watched == {}
+
+        container.removeEventCallback.assert_called_once_with(
+            houdini_logging_tools.nodes._invalidating_event_types(), inst._event_callback
+        )
+
+    def test_invalidate(self, node_hierarchy):
+        """Test NodePathCache.invalidate() removing the paths of a node and its descendants."""
+        root, container, child, sibling = node_hierarchy
+
+        inst = houdini_logging_tools.nodes.NodePathCache()
+        inst.path(root)
+        inst.path(container)
+        inst.path(child)
+        inst.path(sibling)
+
+        # Invalidating a child only removes its own path.
+        inst.invalidate(child)
+
+        assert list(inst._entries) == [root.sessionId(), container.sessionId(), sibling.sessionId()]
+        child.removeEventCallback.assert_called_once()
+        container.removeEventCallback.assert_not_called()
+
+        inst.invalidate(container)
+
+        assert list(inst._entries) == [root.sessionId()]
+        container.removeEventCallback.assert_called_once()
+
+    def test_lookup(self, node_hierarchy):
+        """Test NodePathCache.lookup() returning the session id along with the cached path."""
+        _, _, child, _ = node_hierarchy
+
+        inst = houdini_logging_tools.nodes.NodePathCache()
+
+        assert inst.lookup(child) == (child.sessionId(), "/obj/geo1/box1")
+        assert inst.lookup(child) == (child.sessionId(), "/obj/geo1/box1")
+
+        child.path.assert_called_once()
+
+    def test_path(self, node_hierarchy):
+        """Test NodePathCache.path() caching the path and watching the node and its ancestors."""
+        root, container, child, sibling = node_hierarchy
+
+        inst = houdini_logging_tools.nodes.NodePathCache()
+
+        assert inst.path(child) == "/obj/geo1/box1"
+        assert inst.path(child) == "/obj/geo1/box1"
+        assert inst.path(sibling) == "/obj/geo1/sphere1"
+
+        child.path.assert_called_once()
+
+        for node in (child, container, container.parent()):
+            node.addEventCallback.assert_called_once_with(
+                houdini_logging_tools.nodes._invalidating_event_types(), inst._event_callback
+            )
+
+        root.addEventCallback.assert_not_called()
+
+        # Both cached paths share the ancestors.
+        assert inst._watched[container.sessionId()] == [container, len(inst)]
+
+    def test_path__evict(self, node_hierarchy):
+        """Test NodePathCache.path() discarding the least recently used path."""
+        _, container, child, sibling = node_hierarchy
+
+        inst = houdini_logging_tools.nodes.NodePathCache(max_size=2)
+        inst.path(child)
+        inst.path(sibling)
+
+        # Use the first path again so the sibling is the least recently used.
+        inst.path(child)
+        inst.path(container)
+
+        assert list(inst._entries) == [child.sessionId(), container.sessionId()]
+        sibling.removeEventCallback.assert_called_once()
+
+    def test_path__real_node(self):
+        """Test NodePathCache.path() with a real node."""
+        inst = houdini_logging_tools.nodes.NodePathCache()
+
+        node = hou.node("/obj")
+
+        assert inst.path(node) == "/obj"
+
+        inst._on_node_event(event_type=hou.nodeEventType.NameChanged, node=node)
+
+        assert len(inst) == 0
@@ -0,0 +1,263 @@
+"""Tests for houdini_logging_tools.queueing module."""
+
+# Standard Library
+import queue
+import threading
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.queueing
+
+# Fixtures
+
+
+@pytest.fixture
+def init_dispatcher():
+    """Fixture to initialize a dispatcher which is stopped after the test."""
+    dispatchers = []
+
+    def _create(callback, **kwargs):
+        dispatcher = houdini_logging_tools.queueing.BatchDispatcher(callback, name="test_dispatcher", **kwargs)
+        dispatchers.append(dispatcher)
+
+        return dispatcher
+
+    yield _create
+
+    for dispatcher in dispatchers:
+        dispatcher.stop(timeout=5)
+
+
+# Tests
+
+
+class TestBatchDispatcher:
+    """Test houdini_logging_tools.queueing.BatchDispatcher."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_callback = mocker.MagicMock()
+        max_size = 5
+        batch_size = 2
+
+        inst = houdini_logging_tools.queueing.BatchDispatcher(
+            mock_callback, name="test", max_size=max_size, drop_policy="drop-newest", batch_size=batch_size
+        )
+
+        assert inst._callback == mock_callback
+        assert inst._name == "test"
+        assert inst._queue.maxsize == max_size
+        assert inst.drop_policy == houdini_logging_tools.queueing.DropPolicy.DROP_NEWEST
+        assert inst._batch_size == batch_size
+        assert inst.dropped == 0
+        assert not inst.is_running
+
+    def test___init____invalid_batch_size(self, mocker):
+        """Test object initialization with an invalid batch size."""
+        with pytest.raises(ValueError, match="batch_size must be at least 1"):
+            houdini_logging_tools.queueing.BatchDispatcher(mocker.MagicMock(), name="test", batch_size=0)
+
+    # Methods
+
+    def test_flush__not_running(self, mocker):
+        """Test BatchDispatcher.flush() when the worker is not running."""
+        inst = houdini_logging_tools.queueing.BatchDispatcher(mocker.MagicMock(), name="test")
+
+        mock_join = mocker.patch.object(inst._queue, "join")
+
+        inst.flush()
+
+        mock_join.assert_not_called()
+
+    def test_put__batches(self, init_dispatcher):
+        """Test BatchDispatcher.put() dispatching items in batches."""
+        batches = []
+        batch_size = 3
+        item_count = 10
+
+        inst = init_dispatcher(batches.append, batch_size=batch_size)
+
+        for i in range(item_count):
+            assert inst.put(i)
+
+        assert inst.is_running
+
+        inst.flush()
+
+        assert [item for batch in batches for item in batch] == list(range(item_count))
+        assert all(len(batch) <= batch_size for batch in batches)
+
+    def test_put__block(self, init_dispatcher):
+        """Test BatchDispatcher.put() with the block policy."""
+        release = threading.Event()
+        received = []
+
+        def _callback(items):
+            release.wait(5)
+            received.extend(items)
+
+        inst = init_dispatcher(_callback, max_size=1, drop_policy="block", batch_size=1)
+
+        # The first item is held by the worker and the second fills the queue.
+        inst.put(1)
+        inst.put(2)
+
+        putter = threading.Thread(target=inst.put, args=(3,))
+        putter.start()
+        putter.join(0.1)
+
+        # The third put should be blocked waiting for room in the queue.
+        assert putter.is_alive()
+
+        release.set()
+        putter.join(5)
+        inst.flush()
+
+        assert received == [1, 2, 3]
+        assert inst.dropped == 0
+
+    def test_put__drop_newest(self, mocker):
+        """Test BatchDispatcher.put() with the drop-newest policy."""
+        inst = houdini_logging_tools.queueing.BatchDispatcher(
+            mocker.MagicMock(), name="test", max_size=2, drop_policy="drop-newest"
+        )
+        mocker.patch.object(inst, "start")
+
+        assert inst.put(1)
+        assert inst.put(2)
+        assert not inst.put(3)
+
+        assert inst.dropped == 1
+        assert list(inst._queue.queue) == [1, 2]
+
+    def test_put__drop_oldest(self, mocker):
+        """Test BatchDispatcher.put() with the drop-oldest policy."""
+        mock_on_drop = mocker.MagicMock()
+
+        inst = houdini_logging_tools.queueing.BatchDispatcher(
+            mocker.MagicMock(), name="test", max_size=2, drop_policy="drop-oldest", on_drop=mock_on_drop
+        )
+        mocker.patch.object(inst, "start")
+
+        assert inst.put(1)
+        assert inst.put(2)
+        assert inst.put(3)
+
+        assert inst.dropped == 1
+        assert list(inst._queue.queue) == [2, 3]
+        mock_on_drop.assert_called_once_with()
+
+    def test_put__drop_oldest_emptied(self, mocker):
+        """Test BatchDispatcher.put() with the drop-oldest policy when the queue is emptied while dropping."""
+        inst = houdini_logging_tools.queueing.BatchDispatcher(mocker.MagicMock(), name="test", max_size=1)
+        mocker.patch.object(inst, "start")
+
+        mocker.patch.object(inst._queue, "put_nowait", side_effect=(queue.Full, None))
+        mocker.patch.object(inst._queue, "get_nowait", side_effect=queue.Empty)
+
+        assert inst.put(1)
+
+        assert inst.dropped == 0
+
+    def test_start(self, init_dispatcher, mocker):
+        """Test BatchDispatcher.start() only starting a single thread."""
+        inst = init_dispatcher(mocker.MagicMock())
+
+        inst.start()
+        thread = inst._thread
+
+        inst.start()
+
+        assert inst._thread is thread
+        assert inst.is_running
+
+    def test_start__concurrent(self, mocker):
+        """Test BatchDispatcher.start() when another thread started the worker first."""
+        inst = houdini_logging_tools.queueing.BatchDispatcher(mocker.MagicMock(), name="test")
+
+        mock_thread = mocker.MagicMock(spec=threading.Thread)
+        mock_lock = mocker.MagicMock()
+
+        # Simulate the worker being started by another thread while waiting on the lock.
+        def _acquire():
+            inst._thread = mock_thread
+
+        mock_lock.__enter__.side_effect = _acquire
+        inst._lock = mock_lock
+
+        mock_thread_cls = mocker.patch("threading.Thread")
+
+        inst.start()
+
+        mock_thread_cls.assert_not_called()
+        assert inst._thread is mock_thread
+
+    def test_stop(self, mocker):
+        """Test BatchDispatcher.stop() dispatching remaining items."""
+        received = []
+
+        inst = houdini_logging_tools.queueing.BatchDispatcher(received.extend, name="test", batch_size=2)
+
+        for i in range(5):
+            inst.put(i)
+
+        inst.stop(timeout=5)
+
+        assert received == list(range(5))
+        assert not inst.is_running
+
+        # Stopping again does nothing.
+        inst.stop()
+
+    def test_stop__put(self, mocker):
+        """Test BatchDispatcher.put() discarding items without restarting the worker once stopped."""
+        mock_callback = mocker.MagicMock()
+
+        inst = houdini_logging_tools.queueing.BatchDispatcher(mock_callback, name="test")
+        inst.put(1)
+        inst.stop(timeout=5)
+
+        mock_callback.reset_mock()
+
+        assert not inst.put(2)
+        inst.start()
+
+        assert not inst.is_running
+        assert inst._queue.empty()
+        assert inst.dropped == 0
+
+        inst.stop()
+
+        mock_callback.assert_not_called()
+
+    def test_stop__concurrent_put(self, mocker):
+        """Test BatchDispatcher.start() not starting a worker when stopped while waiting on the lock."""
+        inst = houdini_logging_tools.queueing.BatchDispatcher(mocker.MagicMock(), name="test")
+
+        mock_lock = mocker.MagicMock()
+
+        # Simulate the dispatcher being stopped by another thread while waiting on the lock.
+        def _acquire():
+            inst._stopped = True
+
+        mock_lock.__enter__.side_effect = _acquire
+        inst._lock = mock_lock
+
+        mock_thread_cls = mocker.patch("threading.Thread")
+
+        inst.start()
+
+        mock_thread_cls.assert_not_called()
+        assert inst._thread is None
+
+    def test_stop__not_running(self, mocker):
+        """Test BatchDispatcher.stop() when the worker was never started."""
+        inst = houdini_logging_tools.queueing.BatchDispatcher(mocker.MagicMock(), name="test")
+
+        mock_put = mocker.patch.object(inst._queue, "put")
+
+        inst.stop()
+
+        mock_put.assert_not_called()
@@ -0,0 +1,273 @@
+"""Tests for houdini_logging_tools.spans module."""
+
+# Standard Library
+import logging
+import threading
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.adapters.loggeradapter
+import houdini_logging_tools.context
+import houdini_logging_tools.filters
+import houdini_logging_tools.nodes
+import houdini_logging_tools.spans
+
+# Houdini
+import hou
+
+# Fixtures
+
+
+@pytest.fixture
+def mock_perf_mon(mocker):
+    """Fixture to mock the Performance Monitor."""
+    return mocker.patch.object(hou, "perfMon", create=True)
+
+
+@pytest.fixture
+def test_adapter(add_collecting_handler):
+    """Fixture to provide an adapter whose records are collected."""
+    logger = logging.getLogger("test_spans")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+
+    add_collecting_handler(logger)
+
+    yield houdini_logging_tools.adapters.loggeradapter.HoudiniLoggerAdapter(logger)
+
+    logger.propagate = True
+    logger.setLevel(logging.NOTSET)
+
+    houdini_logging_tools.nodes.NODE_PATH_CACHE.clear()
+
+
+# Tests
+
+
+class TestSpanStatistics:
+    """Test houdini_logging_tools.spans.SpanStatistics object."""
+
+    def test___init____invalid(self):
+        """Test object initialization with an invalid number of samples."""
+        with pytest.raises(ValueError, match="must be at least 1"):
+            houdini_logging_tools.spans.SpanStatistics(max_samples=0)
+
+    # Methods
+
+    def test_clear(self):
+        """Test SpanStatistics.clear()."""
+        inst = houdini_logging_tools.spans.SpanStatistics()
+        inst.record("span", 1.0)
+
+        inst.clear()
+
+        assert inst.summary() == {}
+
+    def test_dump(self, mocker):
+        """Test SpanStatistics.dump() logging the slowest spans first."""
+        mock_logger = mocker.MagicMock(spec=logging.Logger)
+
+        inst = houdini_logging_tools.spans.SpanStatistics()
+        inst.record("fast", 0.001)
+        inst.record("slow", 0.5)
+        inst.record("slow", 1.5)
+
+        inst.dump(mock_logger, logging.WARNING)
+
+        fmt = "%s: count=%d total=%.3fs p50=%.3fms p95=%.3fms"
+
+        assert mock_logger.log.call_args_list == [
+            mocker.call(logging.WARNING, fmt, "slow", 2, 2.0, 500.0, 1500.0),
+            mocker.call(logging.WARNING, fmt, "fast", 1, 0.001, 1.0, 1.0),
+        ]
+
+    def test_summary(self):
+        """Test SpanStatistics.record() and SpanStatistics.summary()."""
+        inst = houdini_logging_tools.spans.SpanStatistics(max_samples=20)
+
+        # Only the most recent durations are used for the percentiles.
+        for duration in [100.0] * 5 + list(range(20, 0, -1)):
+            inst.record("span", float(duration))
+
+        assert inst.summary() == {
+            "span": houdini_logging_tools.spans.SpanSummary("span", 25, 710.0, 10.0, 19.0),
+        }
+
+
+class TestTimedSpan:
+    """Test houdini_logging_tools.spans.TimedSpan object."""
+
+    def test___call__(self, test_adapter, mock_perf_mon):
+        """Test TimedSpan.__call__() timing each call to a decorated function."""
+        statistics = houdini_logging_tools.spans.SpanStatistics()
+
+        @test_adapter.timed(statistics=statistics)
+        def func(value):
+            if value is None:
+                msg = "no value"
+                raise ValueError(msg)
+
+            return value
+
+        assert func(1) == 1
+
+        with pytest.raises(ValueError, match="no value"):
+            func(None)
+
+        name = "TestTimedSpan.test___call__.<locals>.func"
+        call_count = 2
+
+        assert statistics.summary()[name].count == call_count
+        assert mock_perf_mon.startEvent.call_args_list == [((name,),), ((name,),)]
+        assert mock_perf_mon.startEvent.return_value.stop.call_count == call_count
+
+        records = test_adapter.logger.handlers[0].records
+
+        assert [record.span for record in records] == [name, name]
+
+        # The records represent the calls to the function.
+        assert records[0].funcName == "test___call__"
+
+    def test___enter__(self, test_adapter, mock_perf_mon, mocker):
+        """Test TimedSpan.__enter__() and TimedSpan.__exit__() timing a block."""
+        start = 1.0
+        duration = 0.25
+
+        mocker.patch("time.perf_counter", side_effect=[start, start + duration])
+
+        statistics = houdini_logging_tools.spans.SpanStatistics()
+
+        with test_adapter.timed("block", level=logging.INFO, statistics=statistics) as span:
+            assert span.name == "block"
+
+            mock_perf_mon.startEvent.return_value.stop.assert_not_called()
+
+        mock_perf_mon.startEvent.assert_called_once_with("block")
+        mock_perf_mon.startEvent.return_value.stop.assert_called_once()
+
+        assert statistics.summary()["block"].total == pytest.approx(duration)
+
+        (record,) = test_adapter.logger.handlers[0].records
+
+        assert record.getMessage() == "block took 250.000ms"
+        assert record.levelno == logging.INFO
+        assert record.span == "block"
+        assert record.span_duration == pytest.approx(duration)
+        assert record.funcName == "test___enter__"
+
+    def test___enter____nested(self, test_adapter, mock_perf_mon):
+        """Test entering the same span again while it is active."""
+        span = test_adapter.timed("block")
+        span_count = 2
+
+        with span, span:
+            pass
+
+        assert mock_perf_mon.startEvent.call_count == span_count
+        assert mock_perf_mon.startEvent.return_value.stop.call_count == span_count
+        assert [record.span for record in test_adapter.logger.handlers[0].records] == ["block", "block"]
+
+    def test___enter____threads(self, test_adapter, mocker):
+        """Test the same span being active in several threads at once."""
+        mocker.patch("houdini_logging_tools.spans.is_hou_available", return_value=False)
+
+        thread_count = 2
+
+        statistics = houdini_logging_tools.spans.SpanStatistics()
+        span = test_adapter.timed("block", statistics=statistics)
+
+        entered = threading.Barrier(thread_count)
+        first_exited = threading.Event()
+
+        def run(index):
+            with span:
+                entered.wait()
+
+                # The first thread to enter sleeps while the other exits, so the
+                # spans do not exit in the order they were entered.
+                if index == 0:
+                    first_exited.wait()
+
+            first_exited.set()
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(thread_count)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert statistics.summary()["block"].count == thread_count
+        assert houdini_logging_tools.spans._ACTIVE_SPAN.get() is None
+
+    def test___exit____rate_limit(self, test_adapter, mock_perf_mon):
+        """Test that span logs are rate limited by the calling line rather than the spans module."""
+        test_adapter.rate_limit = houdini_logging_tools.filters.CallSiteRateLimitFilter(rate=0, burst=1)
+
+        for _ in range(2):
+            with test_adapter.timed("first"):
+                pass
+
+        with test_adapter.timed("second"):
+            pass
+
+        assert [record.span for record in test_adapter.logger.handlers[0].records] == ["first", "second"]
+        assert test_adapter.rate_limit.suppressed == 1
+        assert {key[1] for key in test_adapter.rate_limit._buckets} == {__file__}
+
+    def test___enter____no_name(self, test_adapter):
+        """Test TimedSpan.__enter__() without a span name."""
+        with pytest.raises(ValueError, match="needs a name"), test_adapter.timed():
+            pass
+
+    def test___enter____level_disabled(self, test_adapter, mock_perf_mon):
+        """Test timing a span when its level is disabled, which still records the event and duration."""
+        test_adapter.logger.setLevel(logging.INFO)
+
+        statistics = houdini_logging_tools.spans.SpanStatistics()
+
+        with test_adapter.timed("block", statistics=statistics):
+            pass
+
+        mock_perf_mon.startEvent.assert_called_once_with("block")
+        assert statistics.summary()["block"].count == 1
+        assert test_adapter.logger.handlers[0].records == []
+
+    def test___enter____no_hou(self, test_adapter, mock_perf_mon, mocker):
+        """Test timing a span when hou is not available."""
+        mocker.patch("houdini_logging_tools.spans.is_hou_available", return_value=False)
+
+        statistics = houdini_logging_tools.spans.SpanStatistics()
+
+        with test_adapter.timed("block", statistics=statistics):
+            pass
+
+        mock_perf_mon.startEvent.assert_not_called()
+        assert statistics.summary()["block"].count == 1
+
+    @pytest.mark.parametrize(
+        ("span_node", "context_node", "adapter_node", "expected"),
+        [
+            ("/out", "/obj", "/stage", "/out"),
+            (None, "/obj", "/stage", "/obj"),
+            (None, None, "/stage", "/stage"),
+        ],
+    )
+    def test___enter____node(self, test_adapter, mock_perf_mon, span_node, context_node, adapter_node, expected):
+        """Test the node a span's event is recorded and its duration logged for."""
+        test_adapter.node = hou.node(adapter_node)
+
+        context = houdini_logging_tools.context.LogContext(hou.node(context_node) if context_node else None)
+
+        with context, test_adapter.timed("block", node=hou.node(span_node) if span_node else None):
+            pass
+
+        mock_perf_mon.startEvent.assert_not_called()
+        mock_perf_mon.startCookEvent.assert_called_once_with("block", hou.node(expected))
+
+        (record,) = test_adapter.logger.handlers[0].records
+
+        assert record.node_path == expected
@@ -0,0 +1,291 @@
+"""Tests for houdini_logging_tools.testing.fake_hou module."""
+
+# Standard Library
+import sys
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+from houdini_logging_tools.testing import fake_hou
+
+# Fixtures
+
+
+@pytest.fixture
+def fake_module():
+    """Fixture to provide a new fake hou module."""
+    return fake_hou.create_module()
+
+
+# Tests
+
+
+class TestEnumValue:
+    """Test houdini_logging_tools.testing.fake_hou.EnumValue."""
+
+    def test_name(self):
+        """Test EnumValue.name()."""
+        assert fake_hou.severityType.Warning.name() == "Warning"
+
+
+class TestSession:
+    """Test houdini_logging_tools.testing.fake_hou.Session."""
+
+    def test_next_session_id(self):
+        """Test Session.next_session_id()."""
+        inst = fake_hou.Session()
+
+        first = inst.next_session_id()
+
+        assert first == 1
+        assert inst.next_session_id() == first + 1
+
+    def test_wait(self, mocker):
+        """Test Session.wait() busy waiting for the latency."""
+        times = (10.0, 10.0, 10.5, 11.0)
+        mock_perf_counter = mocker.patch("time.perf_counter", side_effect=times)
+
+        inst = fake_hou.Session(latency=1.0)
+
+        inst.wait()
+
+        # Waits until the last time, when the latency has passed.
+        assert mock_perf_counter.call_count == len(times)
+
+    def test_wait__no_latency(self, mocker):
+        """Test Session.wait() when there is no latency."""
+        mock_perf_counter = mocker.patch("time.perf_counter")
+
+        fake_hou.Session().wait()
+
+        mock_perf_counter.assert_not_called()
+
+
+class TestLogging:
+    """Test houdini_logging_tools.testing.fake_hou.Logging."""
+
+    def test_createSource(self, fake_module):
+        """Test Logging.createSource() only creating each source once."""
+        fake_module.logging.createSource("first")
+        fake_module.logging.createSource("second")
+        fake_module.logging.createSource("first")
+
+        assert fake_module.logging.sources() == ("first", "second")
+
+    def test_log(self):
+        """Test Logging.log() keeping the most recent entries."""
+        module = fake_hou.create_module(history_size=2)
+
+        entries = [module.logging.LogEntry(message=str(i), severity=module.severityType.Error) for i in range(3)]
+
+        for entry in entries:
+            module.logging.log(entry, "source")
+
+        assert list(module.logging.entries) == [(entries[1], "source"), (entries[2], "source")]
+        assert entries[2].severity == module.severityType.Error
+
+
+class TestNode:
+    """Test houdini_logging_tools.testing.fake_hou.Node."""
+
+    def test_createNode(self, fake_module):
+        """Test Node.createNode()."""
+        obj = fake_module.node("/obj")
+
+        first = obj.createNode("geo")
+        second = obj.createNode("geo")
+        named = obj.createNode("geo", "named")
+
+        assert first.path() == "/obj/geo1"
+        assert second.path() == "/obj/geo2"
+        assert named.name() == "named"
+        assert named.parent() is obj
+        assert obj.children() == (first, second, named)
+        assert fake_module.node("/obj/named") is named
+        assert first.sessionId() != second.sessionId()
+
+    def test_destroy(self, fake_module, mocker):
+        """Test Node.destroy() running callbacks and removing the node and its descendants."""
+        mock_callback = mocker.MagicMock()
+
+        geo = fake_module.node("/obj").createNode("geo")
+        box = geo.createNode("box")
+
+        geo.addEventCallback((fake_module.nodeEventType.BeingDeleted,), mock_callback)
+        box.addEventCallback((fake_module.nodeEventType.BeingDeleted,), mock_callback)
+
+        geo.destroy()
+
+        assert mock_callback.call_args_list == [
+            mocker.call(event_type=fake_module.nodeEventType.BeingDeleted, node=box),
+            mocker.call(event_type=fake_module.nodeEventType.BeingDeleted, node=geo),
+        ]
+        assert fake_module.node("/obj/geo1") is None
+        assert fake_module.node("/obj/geo1/box1") is None
+        assert fake_module.node("/obj").children() == ()
+
+        with pytest.raises(fake_module.ObjectWasDeleted):
+            geo.path()
+
+    def test_destroy__root(self, fake_module):
+        """Test Node.destroy() on a node without a parent."""
+        root = fake_module.node("/")
+
+        root.destroy()
+
+        assert fake_module.node("/obj") is None
+
+    def test_eventCallbacks(self, fake_module, mocker):
+        """Test adding and removing event callbacks."""
+        mock_callback = mocker.MagicMock()
+
+        obj = fake_module.node("/obj")
+        obj.addEventCallback([fake_module.nodeEventType.NameChanged], mock_callback)
+
+        assert obj.eventCallbacks() == (((fake_module.nodeEventType.NameChanged,), mock_callback),)
+
+        obj.removeEventCallback([fake_module.nodeEventType.NameChanged], mock_callback)
+
+        assert obj.eventCallbacks() == ()
+
+    def test_setName(self, fake_module, mocker):
+        """Test Node.setName() running callbacks and updating the node and descendant paths."""
+        mock_callback = mocker.MagicMock()
+
+        geo = fake_module.node("/obj").createNode("geo")
+        box = geo.createNode("box")
+
+        geo.addEventCallback((fake_module.nodeEventType.NameChanged,), mock_callback)
+        geo.addEventCallback((fake_module.nodeEventType.BeingDeleted,), mock_callback)
+
+        geo.setName("renamed")
+
+        mock_callback.assert_called_once_with(event_type=fake_module.nodeEventType.NameChanged, node=geo)
+
+        assert box.path() == "/obj/renamed/box1"
+        assert fake_module.node("/obj/renamed/box1") is box
+        assert fake_module.node("/obj/geo1") is None
+        assert fake_module.node("/obj").children() == (geo,)
+
+    def test_setName__root(self, fake_module):
+        """Test Node.setName() on a node without a parent."""
+        root = fake_module.node("/")
+
+        root.setName("root")
+
+        assert root.path() == "/"
+
+
+class TestPerfMon:
+    """Test houdini_logging_tools.testing.fake_hou.PerfMon."""
+
+    def test_startCookEvent(self, fake_module):
+        """Test starting and stopping a cook event for a node."""
+        node = fake_module.node("/obj")
+
+        event = fake_module.perfMon.startCookEvent("cook", node)
+
+        assert event.isRunning()
+
+        event.stop()
+
+        assert not event.isRunning()
+        assert event.stop_time >= event.start_time
+        assert list(fake_module.perfMon.events) == [event]
+        assert event.node is node
+
+    def test_startEvent(self, fake_module):
+        """Test starting an event."""
+        event = fake_module.perfMon.startEvent("event")
+
+        assert event.description == "event"
+        assert event.node is None
+        assert list(fake_module.perfMon.events) == [event]
+
+
+class TestShellIO:
+    """Test houdini_logging_tools.testing.fake_hou.ShellIO."""
+
+    def test___init__(self, fake_module):
+        """Test object initialization using the module's session."""
+        inst = fake_module.ShellIO()
+
+        assert inst._session is fake_module.session
+        assert isinstance(inst, fake_hou.ShellIO)
+
+    def test___init____no_module(self):
+        """Test object initialization outside a module."""
+        inst = fake_hou.ShellIO()
+
+        assert isinstance(inst._session, fake_hou.Session)
+
+    def test_write(self, fake_module):
+        """Test writing to and flushing the shell."""
+        inst = fake_module.ShellIO()
+
+        inst.write("message")
+        inst.flush()
+
+        assert list(inst.writes) == ["message"]
+        assert inst.flushes == 1
+
+
+class TestUI:
+    """Test houdini_logging_tools.testing.fake_hou.UI."""
+
+    def test_displayMessage(self, fake_module):
+        """Test UI.displayMessage()."""
+        assert fake_module.ui.displayMessage("message", title="title") == 0
+
+        assert list(fake_module.ui.messages) == [("message", {"title": "title"})]
+
+    def test_event_loop_callbacks(self, fake_module, mocker):
+        """Test adding, running and removing event loop callbacks."""
+        mock_callback = mocker.MagicMock()
+
+        fake_module.ui.addEventLoopCallback(mock_callback)
+
+        assert fake_module.ui.eventLoopCallbacks() == (mock_callback,)
+
+        fake_module.ui.process_events()
+
+        mock_callback.assert_called_once()
+
+        fake_module.ui.removeEventLoopCallback(mock_callback)
+
+        assert fake_module.ui.eventLoopCallbacks() == ()
+
+    def test_setStatusMessage(self, fake_module):
+        """Test UI.setStatusMessage()."""
+        fake_module.ui.setStatusMessage("message", severity=fake_module.severityType.Warning)
+
+        assert list(fake_module.ui.status_messages) == [("message", fake_module.severityType.Warning)]
+
+
+def test_create_module():
+    """Test houdini_logging_tools.testing.fake_hou.create_module()."""
+    latency = 1e-6
+
+    module = fake_hou.create_module(latency=latency, ui_available=False)
+
+    assert module.__name__ == "hou"
+    assert module.session.latency == pytest.approx(latency)
+    assert not module.isUIAvailable()
+
+    for path in fake_hou.DEFAULT_NODE_PATHS:
+        assert module.node(path).path() == path
+
+    assert module.node("/").parent() is None
+
+
+def test_install(monkeypatch):
+    """Test houdini_logging_tools.testing.fake_hou.install()."""
+    monkeypatch.delitem(sys.modules, "hou", raising=False)
+
+    history_size = 5
+
+    module = fake_hou.install(history_size=history_size)
+
+    assert sys.modules["hou"] is module
+    assert module.session.history_size == history_size
@@ -0,0 +1,236 @@
+"""Tests for houdini_logging_tools.ui.dialogs module."""
+
+# Standard Library
+from unittest import mock
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.ui.dialogs
+
+# Houdini
+import hou
+
+# Tests
+
+
+class TestDialogAggregator:
+    """Test houdini_logging_tools.ui.dialogs.DialogAggregator."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        window = 2
+
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator(window, title="Summary")
+
+        assert inst.window == window
+        assert inst.title == "Summary"
+        assert not inst.deferred
+        assert inst.pending == ()
+
+    # Non-Public Methods
+
+    def test__display__nothing(self, mock_hou_ui):
+        """Test DialogAggregator._display() with no messages."""
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator()
+
+        inst._display([])
+
+        mock_hou_ui.displayMessage.assert_not_called()
+
+    def test__display__single(self, mock_hou_ui):
+        """Test DialogAggregator._display() with a single message."""
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator(title="Summary")
+
+        inst._display([
+            houdini_logging_tools.ui.dialogs.DialogMessage("message", hou.severityType.Warning, "title", None)
+        ])
+
+        mock_hou_ui.displayMessage.assert_called_once_with("message", severity=hou.severityType.Warning, title="title")
+
+    def test__display__single_node(self, mock_hou_ui):
+        """Test DialogAggregator._display() with a single message for a node."""
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator(title="Summary")
+
+        inst._display([
+            houdini_logging_tools.ui.dialogs.DialogMessage("message", hou.severityType.Warning, "title", "/obj")
+        ])
+
+        mock_hou_ui.displayMessage.assert_called_once_with(
+            "/obj - message", severity=hou.severityType.Warning, title="title"
+        )
+
+    @pytest.mark.parametrize(("title", "expected_title"), [(None, "first title"), ("Summary", "Summary")])
+    def test__display__multiple(self, mock_hou_ui, title, expected_title):
+        """Test DialogAggregator._display() with multiple messages."""
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator(title=title)
+
+        messages = [
+            houdini_logging_tools.ui.dialogs.DialogMessage("warning 1", hou.severityType.Warning, None, "/obj/a"),
+            houdini_logging_tools.ui.dialogs.DialogMessage("error 1", hou.severityType.Error, "first title", "/obj/a"),
+            houdini_logging_tools.ui.dialogs.DialogMessage("error 2", hou.severityType.Error, "title", None),
+            houdini_logging_tools.ui.dialogs.DialogMessage("error 3", hou.severityType.Error, None, "/obj/a"),
+            houdini_logging_tools.ui.dialogs.DialogMessage("warning 2", hou.severityType.Warning, None, "/obj/b"),
+        ]
+
+        inst._display(messages)
+
+        summary, _, severity = houdini_logging_tools.ui.dialogs._build_summary(messages)
+
+        mock_hou_ui.displayMessage.assert_called_once_with(
+            summary,
+            severity=severity,
+            title=expected_title,
+            details=mock.ANY,
+            details_expanded=False,
+        )
+
+    def test__on_event_loop(self, mock_hou_ui, mock_monotonic):
+        """Test DialogAggregator._on_event_loop() displaying messages once the window closes."""
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator(1)
+
+        inst.add("first")
+        inst.add("second")
+
+        mock_hou_ui.addEventLoopCallback.assert_called_once_with(inst._event_loop_callback.callback)
+
+        inst._on_event_loop()
+
+        mock_hou_ui.displayMessage.assert_not_called()
+
+        mock_monotonic.return_value = 101.0
+        inst._on_event_loop()
+
+        mock_hou_ui.displayMessage.assert_called_once()
+        mock_hou_ui.removeEventLoopCallback.assert_called_once_with(inst._event_loop_callback.callback)
+
+        assert inst.pending == ()
+
+    def test__on_event_loop__deferred(self, mock_hou_ui, mock_monotonic):
+        """Test DialogAggregator._on_event_loop() not displaying messages inside a defer() scope."""
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator(1)
+
+        with inst.defer():
+            inst.add("first")
+
+            mock_monotonic.return_value = 102.0
+            inst._on_event_loop()
+
+            mock_hou_ui.displayMessage.assert_not_called()
+
+        mock_hou_ui.displayMessage.assert_called_once()
+
+    def test__on_event_loop__nothing_pending(self, mock_hou_ui):
+        """Test DialogAggregator._on_event_loop() when there are no messages."""
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator(1)
+
+        inst._on_event_loop()
+
+        mock_hou_ui.displayMessage.assert_not_called()
+
+    # Methods
+
+    def test_add__immediate(self, mock_hou_ui):
+        """Test DialogAggregator.add() without a window or defer() scope."""
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator()
+
+        inst.add("message", title="title", node_path="/obj")
+
+        mock_hou_ui.displayMessage.assert_called_once_with(
+            "/obj - message", severity=hou.severityType.Message, title="title"
+        )
+        assert inst.pending == ()
+
+    def test_add__window(self, mock_hou_ui, mock_monotonic):
+        """Test DialogAggregator.add() with a window."""
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator(1)
+
+        inst.add("first", hou.severityType.Error, node_path="/obj")
+        inst.add("second")
+
+        mock_hou_ui.displayMessage.assert_not_called()
+        mock_hou_ui.addEventLoopCallback.assert_called_once()
+
+        assert inst.pending == (
+            houdini_logging_tools.ui.dialogs.DialogMessage("first", hou.severityType.Error, None, "/obj"),
+            houdini_logging_tools.ui.dialogs.DialogMessage("second", hou.severityType.Message, None, None),
+        )
+
+    def test_defer(self, mock_hou_ui):
+        """Test DialogAggregator.defer() holding messages until the outermost scope exits."""
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator()
+
+        with inst.defer():
+            assert inst.deferred
+
+            inst.add("first")
+
+            with inst.defer():
+                inst.add("second")
+
+            mock_hou_ui.displayMessage.assert_not_called()
+
+        assert not inst.deferred
+
+        mock_hou_ui.displayMessage.assert_called_once()
+        assert inst.pending == ()
+
+    def test_defer__exception(self, mock_hou_ui):
+        """Test DialogAggregator.defer() displaying messages when an exception is raised."""
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator()
+
+        def _fail():
+            with inst.defer():
+                inst.add("first")
+
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            _fail()
+
+        mock_hou_ui.displayMessage.assert_called_once_with("first", severity=hou.severityType.Message, title=None)
+
+    def test_flush(self, mock_hou_ui, mock_monotonic):
+        """Test DialogAggregator.flush()."""
+        inst = houdini_logging_tools.ui.dialogs.DialogAggregator(10)
+
+        inst.add("first")
+
+        inst.flush()
+
+        mock_hou_ui.displayMessage.assert_called_once_with("first", severity=hou.severityType.Message, title=None)
+        mock_hou_ui.removeEventLoopCallback.assert_called_once_with(inst._event_loop_callback.callback)
+
+        assert inst.pending == ()
+
+
+def test__build_summary():
+    """Test houdini_logging_tools.ui.dialogs._build_summary()."""
+    messages = [
+        houdini_logging_tools.ui.dialogs.DialogMessage("warning 1", hou.severityType.Warning, None, "/obj/a"),
+        houdini_logging_tools.ui.dialogs.DialogMessage("error 1", hou.severityType.Error, None, "/obj/a"),
+        houdini_logging_tools.ui.dialogs.DialogMessage("error 2", hou.severityType.Error, None, None),
+        houdini_logging_tools.ui.dialogs.DialogMessage("error 3", hou.severityType.Error, None, "/obj/a"),
+        houdini_logging_tools.ui.dialogs.DialogMessage("warning 2", hou.severityType.Warning, None, "/obj/b"),
+    ]
+
+    summary, details, severity = houdini_logging_tools.ui.dialogs._build_summary(messages)
+
+    error_name = hou.severityType.Error.name()
+    warning_name = hou.severityType.Warning.name()
+
+    assert summary == f"5 messages were logged (3 {error_name}, 2 {warning_name})."
+    assert details == "\n".join([
+        f"{error_name}:",
+        "    /obj/a",
+        "        error 1",
+        "        error 3",
+        "    error 2",
+        f"{warning_name}:",
+        "    /obj/a",
+        "        warning 1",
+        "    /obj/b",
+        "        warning 2",
+    ])
+    assert severity == hou.severityType.Error
@@ -0,0 +1,205 @@
+"""Tests for houdini_logging_tools.ui.dispatch module."""
+
+# Standard Library
+import threading
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.ui.dispatch
+
+# Tests
+
+
+class TestEventLoopCallback:
+    """Test houdini_logging_tools.ui.dispatch.EventLoopCallback."""
+
+    def test___init__(self, mocker):
+        """Test object initialization."""
+        mock_callback = mocker.MagicMock()
+
+        inst = houdini_logging_tools.ui.dispatch.EventLoopCallback(mock_callback)
+
+        assert inst.callback is mock_callback
+        assert not inst.registered
+
+    # Methods
+
+    def test_register(self, mock_hou_ui, mocker):
+        """Test EventLoopCallback.register() and EventLoopCallback.unregister() on the calling thread."""
+        mock_callback = mocker.MagicMock()
+
+        inst = houdini_logging_tools.ui.dispatch.EventLoopCallback(mock_callback)
+
+        for _ in range(2):
+            inst.register()
+
+        mock_hou_ui.addEventLoopCallback.assert_called_once_with(mock_callback)
+        assert inst.registered
+
+        for _ in range(2):
+            inst.unregister()
+
+        mock_hou_ui.removeEventLoopCallback.assert_called_once_with(mock_callback)
+        assert not inst.registered
+
+    def test_register__dispatcher(self, mock_hou_ui, mocker):
+        """Test EventLoopCallback.register() from a worker thread adding the callback on the main thread."""
+        mock_callback = mocker.MagicMock()
+        dispatcher = houdini_logging_tools.ui.dispatch.MainThreadDispatcher()
+
+        inst = houdini_logging_tools.ui.dispatch.EventLoopCallback(mock_callback, dispatcher)
+
+        _run_in_thread(inst.register)
+
+        # Only the dispatcher's own callback was added by the worker thread.
+        mock_hou_ui.addEventLoopCallback.assert_called_once_with(dispatcher._event_loop_callback.callback)
+        assert not inst.registered
+
+        dispatcher.flush()
+
+        mock_hou_ui.addEventLoopCallback.assert_called_with(mock_callback)
+        assert inst.registered
+
+    def test_unregister__dispatcher(self, mock_hou_ui, mocker):
+        """Test EventLoopCallback.unregister() before a request from a worker thread has run."""
+        mock_callback = mocker.MagicMock()
+        dispatcher = houdini_logging_tools.ui.dispatch.MainThreadDispatcher()
+
+        inst = houdini_logging_tools.ui.dispatch.EventLoopCallback(mock_callback, dispatcher)
+
+        _run_in_thread(inst.register)
+
+        # The latest request wins once the posted requests run.
+        inst.unregister()
+        dispatcher.flush()
+
+        assert mocker.call(mock_callback) not in mock_hou_ui.addEventLoopCallback.call_args_list
+        mock_hou_ui.removeEventLoopCallback.assert_called_once_with(dispatcher._event_loop_callback.callback)
+        assert not inst.registered
+
+
+class TestMainThreadDispatcher:
+    """Test houdini_logging_tools.ui.dispatch.MainThreadDispatcher."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        batch_size = 5
+
+        inst = houdini_logging_tools.ui.dispatch.MainThreadDispatcher(batch_size)
+
+        assert inst.batch_size == batch_size
+        assert inst.pending == 0
+
+    def test___init____invalid_batch_size(self):
+        """Test object initialization with an invalid batch size."""
+        with pytest.raises(ValueError, match="must be at least 1"):
+            houdini_logging_tools.ui.dispatch.MainThreadDispatcher(0)
+
+    # Non-Public Methods
+
+    def test__on_event_loop(self, mock_hou_ui, mocker):
+        """Test MainThreadDispatcher._on_event_loop() running a batch of queued calls in order."""
+        mock_func = mocker.MagicMock()
+        call_count = 3
+
+        inst = houdini_logging_tools.ui.dispatch.MainThreadDispatcher(2)
+
+        _post_from_thread(inst, [((mock_func, index), {"key": index}) for index in range(call_count)])
+
+        mock_func.assert_not_called()
+        mock_hou_ui.addEventLoopCallback.assert_called_once_with(inst._event_loop_callback.callback)
+        assert inst.pending == call_count
+
+        inst._on_event_loop()
+
+        assert mock_func.call_args_list == [mocker.call(0, key=0), mocker.call(1, key=1)]
+        mock_hou_ui.removeEventLoopCallback.assert_not_called()
+
+        inst._on_event_loop()
+
+        mock_func.assert_called_with(2, key=2)
+        mock_hou_ui.removeEventLoopCallback.assert_called_once_with(inst._event_loop_callback.callback)
+        assert inst.pending == 0
+
+        # Nothing happens once the queue is empty.
+        inst._on_event_loop()
+
+        assert mock_func.call_count == call_count
+
+    def test__on_event_loop__error(self, mock_hou_ui, mocker):
+        """Test MainThreadDispatcher._on_event_loop() when a call raises an error."""
+        mock_func = mocker.MagicMock(side_effect=[ValueError("first call failed"), None])
+
+        inst = houdini_logging_tools.ui.dispatch.MainThreadDispatcher()
+
+        _post_from_thread(inst, [((mock_func, "first"), {}), ((mock_func, "second"), {})])
+
+        with pytest.raises(ValueError, match="first call failed"):
+            inst._on_event_loop()
+
+        # The remaining calls are run by the next callback.
+        assert inst.pending == 1
+
+        inst._on_event_loop()
+
+        mock_func.assert_called_with("second")
+        mock_hou_ui.removeEventLoopCallback.assert_called_once()
+
+    # Methods
+
+    def test_flush(self, mock_hou_ui, mocker):
+        """Test MainThreadDispatcher.flush()."""
+        mock_func = mocker.MagicMock()
+
+        inst = houdini_logging_tools.ui.dispatch.MainThreadDispatcher(1)
+
+        _post_from_thread(inst, [((mock_func, index), {}) for index in range(3)])
+
+        inst.flush()
+
+        assert mock_func.call_args_list == [mocker.call(0), mocker.call(1), mocker.call(2)]
+        mock_hou_ui.removeEventLoopCallback.assert_called_once_with(inst._event_loop_callback.callback)
+
+    def test_post__main_thread(self, mock_hou_ui, mocker):
+        """Test MainThreadDispatcher.post() from the main thread."""
+        mock_func = mocker.MagicMock()
+
+        inst = houdini_logging_tools.ui.dispatch.MainThreadDispatcher()
+
+        inst.post(mock_func, "first")
+
+        mock_func.assert_called_once_with("first")
+        mock_hou_ui.addEventLoopCallback.assert_not_called()
+
+        # When calls are queued the call is queued behind them to keep the order.
+        _post_from_thread(inst, [((mock_func, "second"), {})])
+
+        inst.post(mock_func, "third")
+
+        mock_func.assert_called_once_with("first")
+
+        inst.flush()
+
+        assert mock_func.call_args_list == [mocker.call("first"), mocker.call("second"), mocker.call("third")]
+
+
+# Helpers
+
+
+def _post_from_thread(dispatcher, calls):
+    """Post calls to a dispatcher from a worker thread."""
+
+    def _post():
+        for args, kwargs in calls:
+            dispatcher.post(*args, **kwargs)
+
+    _run_in_thread(_post)
+
+
+def _run_in_thread(func):
+    """Run a function in a worker thread and wait for it to finish."""
+    thread = threading.Thread(target=func)
+    thread.start()
+    thread.join()
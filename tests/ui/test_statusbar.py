@@ -0,0 +1,150 @@
+"""Tests for houdini_logging_tools.ui.statusbar module."""
+
+# Third Party
+import pytest
+
+# Houdini Logging Tools
+import houdini_logging_tools.formatting
+import houdini_logging_tools.ui.statusbar
+
+# Houdini
+import hou
+
+# Tests
+
+
+class TestStatusBarSink:
+    """Test houdini_logging_tools.ui.statusbar.StatusBarSink."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        max_rate = 4
+
+        inst = houdini_logging_tools.ui.statusbar.StatusBarSink(max_rate, prioritize_severity=False)
+
+        assert inst.max_rate == max_rate
+        assert not inst.prioritize_severity
+        assert inst.pending is None
+
+    def test___init____invalid_rate(self):
+        """Test object initialization with an invalid rate."""
+        with pytest.raises(ValueError, match="max_rate must be greater than 0"):
+            houdini_logging_tools.ui.statusbar.StatusBarSink(0)
+
+    # Non-Public Methods
+
+    def test__on_event_loop(self, mock_hou_ui, mock_monotonic):
+        """Test StatusBarSink._on_event_loop() showing the held message."""
+        inst = houdini_logging_tools.ui.statusbar.StatusBarSink(10)
+
+        inst.update("first")
+        inst.update("second", hou.severityType.Warning)
+
+        # Not enough time has passed so the message is still held.
+        mock_monotonic.return_value = 100.05
+        inst._on_event_loop()
+
+        mock_hou_ui.setStatusMessage.assert_called_once_with("first", severity=hou.severityType.Message)
+
+        mock_monotonic.return_value = 100.2
+        inst._on_event_loop()
+
+        mock_hou_ui.setStatusMessage.assert_called_with("second", severity=hou.severityType.Warning)
+        mock_hou_ui.removeEventLoopCallback.assert_called_with(inst._event_loop_callback.callback)
+
+        assert inst.pending is None
+
+    def test__on_event_loop__nothing_pending(self, mock_hou_ui):
+        """Test StatusBarSink._on_event_loop() when there is no held message."""
+        inst = houdini_logging_tools.ui.statusbar.StatusBarSink()
+        inst._event_loop_callback.register()
+
+        inst._on_event_loop()
+
+        mock_hou_ui.setStatusMessage.assert_not_called()
+        mock_hou_ui.removeEventLoopCallback.assert_called_with(inst._event_loop_callback.callback)
+
+    # Methods
+
+    def test_flush(self, mock_hou_ui, mock_monotonic):
+        """Test StatusBarSink.flush()."""
+        inst = houdini_logging_tools.ui.statusbar.StatusBarSink()
+
+        inst.update("first")
+        inst.update("second")
+
+        inst.flush()
+
+        mock_hou_ui.setStatusMessage.assert_called_with("second", severity=hou.severityType.Message)
+        mock_hou_ui.removeEventLoopCallback.assert_called_with(inst._event_loop_callback.callback)
+
+        assert inst.pending is None
+
+        # Flushing with nothing held does nothing.
+        mock_hou_ui.reset_mock()
+
+        inst.flush()
+
+        mock_hou_ui.setStatusMessage.assert_not_called()
+        mock_hou_ui.removeEventLoopCallback.assert_not_called()
+
+    def test_update(self, mock_hou_ui, mock_monotonic):
+        """Test StatusBarSink.update() only showing the latest message for the interval."""
+        inst = houdini_logging_tools.ui.statusbar.StatusBarSink(10, prioritize_severity=False)
+
+        inst.update("first", hou.severityType.Error)
+
+        mock_hou_ui.setStatusMessage.assert_called_once_with("first", severity=hou.severityType.Error)
+
+        inst.update("second", hou.severityType.Error)
+        inst.update("third", hou.severityType.Message)
+
+        assert inst.pending == ("third", hou.severityType.Message)
+
+        mock_hou_ui.setStatusMessage.assert_called_once()
+        mock_hou_ui.addEventLoopCallback.assert_called_once_with(inst._event_loop_callback.callback)
+
+    def test_update__lazy_message(self, mock_hou_ui, mock_monotonic, mocker):
+        """Test StatusBarSink.update() only interpolating lazy messages which are shown."""
+        inst = houdini_logging_tools.ui.statusbar.StatusBarSink(10, prioritize_severity=False)
+
+        mock_arg = mocker.MagicMock()
+
+        inst.update("first")
+        inst.update(houdini_logging_tools.formatting.LazyMessage("second %s", (mock_arg,)))
+        inst.update(houdini_logging_tools.formatting.LazyMessage("third %s", ("arg",)))
+
+        mock_monotonic.return_value = 100.2
+        inst._on_event_loop()
+
+        mock_arg.__str__.assert_not_called()
+        mock_hou_ui.setStatusMessage.assert_called_with("third arg", severity=hou.severityType.Message)
+
+    def test_update__prioritize_severity(self, mock_hou_ui, mock_monotonic):
+        """Test StatusBarSink.update() keeping the most severe held message."""
+        inst = houdini_logging_tools.ui.statusbar.StatusBarSink(10)
+
+        inst.update("first")
+        inst.update("second", hou.severityType.Warning)
+        inst.update("third", hou.severityType.Message)
+
+        assert inst.pending == ("second", hou.severityType.Warning)
+
+        inst.update("fourth", hou.severityType.Warning)
+
+        assert inst.pending == ("fourth", hou.severityType.Warning)
+
+    def test_update__after_interval(self, mock_hou_ui, mock_monotonic, mocker):
+        """Test StatusBarSink.update() showing messages immediately once the interval has passed."""
+        inst = houdini_logging_tools.ui.statusbar.StatusBarSink(10)
+
+        inst.update("first")
+
+        mock_monotonic.return_value = 100.2
+        inst.update("second")
+
+        assert mock_hou_ui.setStatusMessage.call_args_list == [
+            mocker.call("first", severity=mocker.ANY),
+            mocker.call("second", severity=mocker.ANY),
+        ]
+        mock_hou_ui.addEventLoopCallback.assert_not_called()